@@ -2717,6 +2717,11 @@ class MSDialect(default.DefaultDialect):
     implicit_returning = True
     full_returning = True
 
+    # SQL Server accepts at most 2100 parameters for a remote procedure
+    # call, one of which may be consumed by the driver's use of
+    # sp_prepexec
+    max_bind_parameters = 2099
+
     colspecs = {
         sqltypes.DateTime: _MSDateTime,
         sqltypes.Date: _MSDate,
@@ -3032,34 +3037,165 @@ class MSDialect(default.DefaultDialect):
         view_names = [r[0] for r in connection.execute(s)]
         return view_names
 
+    def _get_multi_reflection_names(
+        self, connection, schema, filter_names, **kw
+    ):
+        """Return the names of the tables returned by the ``get_multi_*``
+        methods, optionally limited to ``filter_names``."""
+
+        table_names = self.get_table_names(
+            connection, schema, info_cache=kw.get("info_cache")
+        )
+        if filter_names is not None:
+            filter_names = set(filter_names)
+            table_names = [
+                name for name in table_names if name in filter_names
+            ]
+        return table_names
+
+    def _multi_reflection_filter(self, filter_names):
+        """Return the table names the ``get_multi_*`` queries are limited
+        to, or None if all tables of the schema are to be queried.
+
+        Names are sent as bound parameters, so that a list which would not
+        fit within :attr:`.max_bind_parameters` is instead applied by the
+        caller once the rows are fetched.
+
+        """
+        if (
+            filter_names is None
+            or len(filter_names) > self.max_bind_parameters // 2
+        ):
+            return None
+        return list(filter_names)
+
+    def _table_name_criteria(self, name_col, tablename, filter_names):
+        """Return textual criteria against ``name_col`` along with their
+        bound parameters, limiting a reflection query to either
+        ``tablename`` or, if None, to ``filter_names``."""
+
+        if tablename is not None:
+            return " and %s = :tabname" % name_col, [
+                sql.bindparam("tabname", tablename, ischema.CoerceUnicode())
+            ]
+        filter_names = self._multi_reflection_filter(filter_names)
+        if filter_names is not None:
+            return " and %s in :filter_names" % name_col, [
+                sql.bindparam(
+                    "filter_names",
+                    filter_names,
+                    ischema.CoerceUnicode(),
+                    expanding=True,
+                )
+            ]
+        return "", []
+
+    def _group_by_table(self, rows, key="table_name"):
+        rows_by_table = util.defaultdict(list)
+        for row in rows:
+            rows_by_table[row[key]].append(row)
+        return rows_by_table
+
     @reflection.cache
     @_db_plus_owner
     def get_indexes(self, connection, tablename, dbname, owner, schema, **kw):
+        index_rows, column_rows = self._get_index_rows(
+            connection, owner, tablename=tablename
+        )
+        return self._get_indexes_from_rows(index_rows, column_rows)
+
+    @_db_plus_owner_listing
+    def get_multi_indexes(
+        self, connection, dbname, owner, schema, filter_names=None, **kw
+    ):
+        index_rows, column_rows = self._get_index_rows(
+            connection, owner, filter_names=filter_names
+        )
+        index_rows = self._group_by_table(index_rows)
+        column_rows = self._group_by_table(column_rows)
+        return [
+            (
+                (schema, table_name),
+                self._get_indexes_from_rows(
+                    index_rows.get(table_name, ()),
+                    column_rows.get(table_name, ()),
+                ),
+            )
+            for table_name in self._get_multi_reflection_names(
+                connection, schema, filter_names, **kw
+            )
+        ]
+
+    def _get_index_rows(
+        self, connection, owner, tablename=None, filter_names=None
+    ):
+        """Return the index rows and index column rows for ``tablename``,
+        or for the tables in ``filter_names`` if ``tablename`` is None.
+
+        """
         filter_definition = (
             "ind.filter_definition"
             if self.server_version_info >= MS_2008_VERSION
             else "NULL as filter_definition"
         )
-        rp = connection.execution_options(future_result=True).execute(
-            sql.text(
-                "select ind.index_id, ind.is_unique, ind.name, "
-                "%s "
-                "from sys.indexes as ind join sys.tables as tab on "
-                "ind.object_id=tab.object_id "
-                "join sys.schemas as sch on sch.schema_id=tab.schema_id "
-                "where tab.name = :tabname "
-                "and sch.name=:schname "
-                "and ind.is_primary_key=0 and ind.type != 0"
-                % filter_definition
+        criteria, params = self._table_name_criteria(
+            "tab.name", tablename, filter_names
+        )
+        index_rows = (
+            connection.execution_options(future_result=True)
+            .execute(
+                sql.text(
+                    "select ind.index_id, ind.is_unique, ind.name, "
+                    "%s, tab.name as table_name "
+                    "from sys.indexes as ind join sys.tables as tab on "
+                    "ind.object_id=tab.object_id "
+                    "join sys.schemas as sch on sch.schema_id=tab.schema_id "
+                    "where sch.name=:schname%s "
+                    "and ind.is_primary_key=0 and ind.type != 0"
+                    % (filter_definition, criteria)
+                )
+                .bindparams(
+                    sql.bindparam("schname", owner, ischema.CoerceUnicode()),
+                    *params,
+                )
+                .columns(
+                    name=sqltypes.Unicode(), table_name=sqltypes.Unicode()
+                )
             )
-            .bindparams(
-                sql.bindparam("tabname", tablename, ischema.CoerceUnicode()),
-                sql.bindparam("schname", owner, ischema.CoerceUnicode()),
+            .mappings()
+            .all()
+        )
+
+        column_rows = (
+            connection.execution_options(future_result=True)
+            .execute(
+                sql.text(
+                    "select ind_col.index_id, ind_col.object_id, col.name, "
+                    "ind_col.is_included_column, tab.name as table_name "
+                    "from sys.columns as col "
+                    "join sys.tables as tab on tab.object_id=col.object_id "
+                    "join sys.index_columns as ind_col on "
+                    "(ind_col.column_id=col.column_id and "
+                    "ind_col.object_id=tab.object_id) "
+                    "join sys.schemas as sch on sch.schema_id=tab.schema_id "
+                    "where sch.name=:schname%s" % criteria
+                )
+                .bindparams(
+                    sql.bindparam("schname", owner, ischema.CoerceUnicode()),
+                    *params,
+                )
+                .columns(
+                    name=sqltypes.Unicode(), table_name=sqltypes.Unicode()
+                )
             )
-            .columns(name=sqltypes.Unicode())
+            .mappings()
+            .all()
         )
+        return index_rows, column_rows
+
+    def _get_indexes_from_rows(self, index_rows, column_rows):
         indexes = {}
-        for row in rp.mappings():
+        for row in index_rows:
             indexes[row["index_id"]] = {
                 "name": row["name"],
                 "unique": row["is_unique"] == 1,
@@ -3072,26 +3208,7 @@ class MSDialect(default.DefaultDialect):
                     "mssql_where"
                 ] = row["filter_definition"]
 
-        rp = connection.execution_options(future_result=True).execute(
-            sql.text(
-                "select ind_col.index_id, ind_col.object_id, col.name, "
-                "ind_col.is_included_column "
-                "from sys.columns as col "
-                "join sys.tables as tab on tab.object_id=col.object_id "
-                "join sys.index_columns as ind_col on "
-                "(ind_col.column_id=col.column_id and "
-                "ind_col.object_id=tab.object_id) "
-                "join sys.schemas as sch on sch.schema_id=tab.schema_id "
-                "where tab.name=:tabname "
-                "and sch.name=:schname"
-            )
-            .bindparams(
-                sql.bindparam("tabname", tablename, ischema.CoerceUnicode()),
-                sql.bindparam("schname", owner, ischema.CoerceUnicode()),
-            )
-            .columns(name=sqltypes.Unicode())
-        )
-        for row in rp.mappings():
+        for row in column_rows:
             if row["index_id"] in indexes:
                 if row["is_included_column"]:
                     indexes[row["index_id"]]["include_columns"].append(
@@ -3182,8 +3299,6 @@ class MSDialect(default.DefaultDialect):
         else:
             columns = ischema.columns
 
-        computed_cols = ischema.computed_columns
-        identity_cols = ischema.identity_columns
         if owner:
             whereclause = sql.and_(
                 columns.c.table_name == tablename,
@@ -3194,6 +3309,60 @@ class MSDialect(default.DefaultDialect):
             whereclause = columns.c.table_name == tablename
             full_name = columns.c.table_name
 
+        s, computed_definition = self._columns_select(
+            columns, whereclause, full_name
+        )
+        c = connection.execution_options(future_result=True).execute(
+            s.order_by(columns.c.ordinal_position)
+        )
+        return self._get_columns_from_rows(
+            c.mappings(), columns, computed_definition
+        )
+
+    @_db_plus_owner_listing
+    def get_multi_columns(
+        self, connection, dbname, owner, schema, filter_names=None, **kw
+    ):
+        columns = ischema.columns
+        whereclause = columns.c.table_schema == owner
+        names = self._multi_reflection_filter(filter_names)
+        if names is not None:
+            whereclause = sql.and_(
+                whereclause, columns.c.table_name.in_(names)
+            )
+        full_name = columns.c.table_schema + "." + columns.c.table_name
+
+        s, computed_definition = self._columns_select(
+            columns, whereclause, full_name
+        )
+        c = connection.execution_options(future_result=True).execute(
+            s.order_by(columns.c.table_name, columns.c.ordinal_position)
+        )
+        rows_by_table = self._group_by_table(
+            c.mappings(), key=columns.c.table_name
+        )
+        return [
+            (
+                (schema, table_name),
+                self._get_columns_from_rows(
+                    rows_by_table.get(table_name, ()),
+                    columns,
+                    computed_definition,
+                ),
+            )
+            for table_name in self._get_multi_reflection_names(
+                connection, schema, filter_names, **kw
+            )
+        ]
+
+    def _columns_select(self, columns, whereclause, full_name):
+        """Return the SELECT for column information against the given
+        ``columns`` table, along with the computed column definition
+        expression it selects."""
+
+        computed_cols = ischema.computed_columns
+        identity_cols = ischema.identity_columns
+
         join = columns.join(
             computed_cols,
             onclause=sql.and_(
@@ -3231,13 +3400,15 @@ class MSDialect(default.DefaultDialect):
             )
             .where(whereclause)
             .select_from(join)
-            .order_by(columns.c.ordinal_position)
         )
+        return s, computed_definition
 
-        c = connection.execution_options(future_result=True).execute(s)
+    def _get_columns_from_rows(self, rows, columns, computed_definition):
+        computed_cols = ischema.computed_columns
+        identity_cols = ischema.identity_columns
 
         cols = []
-        for row in c.mappings():
+        for row in rows:
             name = row[columns.c.column_name]
             type_ = row[columns.c.data_type]
             nullable = row[columns.c.is_nullable] == "YES"
@@ -3329,28 +3500,71 @@ class MSDialect(default.DefaultDialect):
     def get_pk_constraint(
         self, connection, tablename, dbname, owner, schema, **kw
     ):
-        pkeys = []
+        c = connection.execution_options(future_result=True).execute(
+            self._pk_constraint_select(owner, tablename=tablename)
+        )
+        return self._get_pk_constraint_from_rows(c.mappings())
+
+    @_db_plus_owner_listing
+    def get_multi_pk_constraint(
+        self, connection, dbname, owner, schema, filter_names=None, **kw
+    ):
+        c = connection.execution_options(future_result=True).execute(
+            self._pk_constraint_select(owner, filter_names=filter_names)
+        )
+        rows_by_table = self._group_by_table(c.mappings(), key="TABLE_NAME")
+        return [
+            (
+                (schema, table_name),
+                self._get_pk_constraint_from_rows(
+                    rows_by_table.get(table_name, ())
+                ),
+            )
+            for table_name in self._get_multi_reflection_names(
+                connection, schema, filter_names, **kw
+            )
+        ]
+
+    def _pk_constraint_select(self, owner, tablename=None, filter_names=None):
+        """Return the SELECT for key constraint columns of ``tablename``,
+        or of the tables in ``filter_names`` if ``tablename`` is None."""
+
         TC = ischema.constraints
         C = ischema.key_constraints.alias("C")
 
+        criteria = [
+            TC.c.constraint_name == C.c.constraint_name,
+            TC.c.table_schema == C.c.table_schema,
+            C.c.table_schema == owner,
+        ]
+        if tablename is not None:
+            criteria.append(C.c.table_name == tablename)
+        else:
+            filter_names = self._multi_reflection_filter(filter_names)
+            if filter_names is not None:
+                criteria.append(C.c.table_name.in_(filter_names))
+
         # Primary key constraints
-        s = (
+        return (
             sql.select(
-                C.c.column_name, TC.c.constraint_type, C.c.constraint_name
+                C.c.column_name,
+                TC.c.constraint_type,
+                C.c.constraint_name,
+                C.c.table_name,
             )
-            .where(
-                sql.and_(
-                    TC.c.constraint_name == C.c.constraint_name,
-                    TC.c.table_schema == C.c.table_schema,
-                    C.c.table_name == tablename,
-                    C.c.table_schema == owner,
-                ),
+            .where(sql.and_(*criteria))
+            .order_by(
+                C.c.table_name, TC.c.constraint_name, C.c.ordinal_position
             )
-            .order_by(TC.c.constraint_name, C.c.ordinal_position)
         )
-        c = connection.execution_options(future_result=True).execute(s)
+
+    def _get_pk_constraint_from_rows(self, rows):
+        TC = ischema.constraints
+        C = ischema.key_constraints
+
+        pkeys = []
         constraint_name = None
-        for row in c.mappings():
+        for row in rows:
             if "PRIMARY" in row[TC.c.constraint_type.name]:
                 pkeys.append(row["COLUMN_NAME"])
                 if constraint_name is None:
@@ -3362,6 +3576,45 @@ class MSDialect(default.DefaultDialect):
     def get_foreign_keys(
         self, connection, tablename, dbname, owner, schema, **kw
     ):
+        rows = self._get_foreign_key_rows(
+            connection, owner, tablename=tablename
+        )
+        return self._get_foreign_keys_from_rows(rows, dbname, owner, schema)
+
+    @_db_plus_owner_listing
+    def get_multi_foreign_keys(
+        self, connection, dbname, owner, schema, filter_names=None, **kw
+    ):
+        rows_by_table = self._group_by_table(
+            self._get_foreign_key_rows(
+                connection, owner, filter_names=filter_names
+            ),
+            key=-1,
+        )
+        return [
+            (
+                (schema, table_name),
+                self._get_foreign_keys_from_rows(
+                    rows_by_table.get(table_name, ()), dbname, owner, schema
+                ),
+            )
+            for table_name in self._get_multi_reflection_names(
+                connection, schema, filter_names, **kw
+            )
+        ]
+
+    def _get_foreign_key_rows(
+        self, connection, owner, tablename=None, filter_names=None
+    ):
+        """Return the foreign key rows of ``tablename``, or of the tables
+        in ``filter_names`` if ``tablename`` is None.  The name of the
+        constrained table is the last column of each row.
+
+        """
+        criteria, params = self._table_name_criteria(
+            "ischema_key_col.table_name", tablename, filter_names
+        )
+
         # Foreign key constraints
         s = (
             text(
@@ -3386,8 +3639,7 @@ WITH fk_info AS (
             ischema_key_col.table_schema = ischema_ref_con.constraint_schema
             AND ischema_key_col.constraint_name =
             ischema_ref_con.constraint_name
-    WHERE ischema_key_col.table_name = :tablename
-        AND ischema_key_col.table_schema = :owner
+    WHERE ischema_key_col.table_schema = :owner%s
 ),
 constraint_info AS (
     SELECT
@@ -3435,7 +3687,8 @@ index_info AS (
         constraint_info.column_name AS referred_column,
         fk_info.match_option,
         fk_info.update_rule,
-        fk_info.delete_rule
+        fk_info.delete_rule,
+        fk_info.table_name
     FROM
         fk_info INNER JOIN constraint_info ON
             constraint_info.constraint_schema =
@@ -3454,7 +3707,8 @@ index_info AS (
         index_info.column_name AS referred_column,
         fk_info.match_option,
         fk_info.update_rule,
-        fk_info.delete_rule
+        fk_info.delete_rule,
+        fk_info.table_name
     FROM
         fk_info INNER JOIN index_info ON
             index_info.index_schema = fk_info.unique_constraint_schema
@@ -3464,10 +3718,11 @@ index_info AS (
     ORDER BY fk_info.constraint_schema, fk_info.constraint_name,
         fk_info.ordinal_position
 """
+                % criteria
             )
             .bindparams(
-                sql.bindparam("tablename", tablename, ischema.CoerceUnicode()),
                 sql.bindparam("owner", owner, ischema.CoerceUnicode()),
+                *params,
             )
             .columns(
                 constraint_schema=sqltypes.Unicode(),
@@ -3480,7 +3735,9 @@ index_info AS (
                 referred_column=sqltypes.Unicode(),
             )
         )
+        return connection.execute(s).fetchall()
 
+    def _get_foreign_keys_from_rows(self, rows, dbname, owner, schema):
         # group rows by constraint ID, to handle multi-column FKs
         fkeys = []
 
@@ -3496,7 +3753,7 @@ index_info AS (
 
         fkeys = util.defaultdict(fkey_rec)
 
-        for r in connection.execute(s).fetchall():
+        for r in rows:
             (
                 _,  # constraint schema
                 rfknm,
@@ -3511,7 +3768,7 @@ index_info AS (
                 _,  # match rule
                 fkuprule,
                 fkdelrule,
-            ) = r
+            ) = r[0:10]
 
             rec = fkeys[rfknm]
             rec["name"] = rfknm
@@ -2830,6 +2830,50 @@ class MySQLDialect(default.DefaultDialect):
         parsed_state = self._parsed_state_or_create(
             connection, table_name, schema, **kw
         )
+        fkeys = self._get_foreign_keys_from_parsed_state(
+            connection, parsed_state, schema
+        )
+
+        if self._needs_correct_for_88718_96365:
+            self._correct_for_mysql_bugs_88718_96365(fkeys, connection)
+
+        return fkeys
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        # SHOW CREATE TABLE only covers a single table, so each table is
+        # still parsed individually; the information_schema query that
+        # corrects the casing of referred names is however emitted once
+        # for all tables.
+        if filter_names is None:
+            filter_names = self.get_table_names(
+                connection, schema, info_cache=kw.get("info_cache")
+            )
+
+        result = []
+        for table_name in filter_names:
+            try:
+                parsed_state = self._parsed_state_or_create(
+                    connection, table_name, schema, **kw
+                )
+            except (exc.NoSuchTableError, exc.UnreflectableTableError):
+                continue
+            fkeys = self._get_foreign_keys_from_parsed_state(
+                connection, parsed_state, schema
+            )
+            result.append(((schema, table_name), fkeys))
+
+        if self._needs_correct_for_88718_96365:
+            self._correct_for_mysql_bugs_88718_96365(
+                [fkey for _, fkeys in result for fkey in fkeys], connection
+            )
+
+        return result
+
+    def _get_foreign_keys_from_parsed_state(
+        self, connection, parsed_state, schema
+    ):
         default_schema = None
 
         fkeys = []
@@ -2862,9 +2906,6 @@ class MySQLDialect(default.DefaultDialect):
             }
             fkeys.append(fkey_d)
 
-        if self._needs_correct_for_88718_96365:
-            self._correct_for_mysql_bugs_88718_96365(fkeys, connection)
-
         return fkeys
 
     def _correct_for_mysql_bugs_88718_96365(self, fkeys, connection):
@@ -1552,6 +1552,10 @@ class OracleDialect(default.DefaultDialect):
     implicit_returning = True
     full_returning = True
 
+    # ORA-01795: maximum number of expressions in a list is 1000
+    max_in_list_elements = 1000
+    max_bind_parameters = 65535
+
     div_is_floordiv = False
 
     supports_simple_order_by_label = False
@@ -1924,10 +1928,69 @@ class OracleDialect(default.DefaultDialect):
         )
         return [self.normalize_name(row[0]) for row in cursor]
 
+    def _multi_reflection_owner(self, schema, **kw):
+        """Return the owner whose tables are queried by the
+        ``get_multi_*`` methods, or None if the tables have to be
+        reflected individually, as is the case when resolving synonyms or
+        using a database link.
+
+        """
+        if kw.get("oracle_resolve_synonyms", False) or kw.get("dblink", ""):
+            return None
+        return self.denormalize_name(schema or self.default_schema_name)
+
+    def _get_multi_reflection_names(
+        self, connection, schema, filter_names, info_cache
+    ):
+        """Return the names of the tables returned by the ``get_multi_*``
+        methods, optionally limited to ``filter_names``."""
+
+        table_names = self.get_table_names(
+            connection, schema, info_cache=info_cache
+        )
+        if filter_names is not None:
+            filter_names = set(filter_names)
+            table_names = [
+                name for name in table_names if name in filter_names
+            ]
+        return table_names
+
+    def _get_multi_reflection_rows(
+        self, connection, query, owner_col, name_col, owner, filter_names
+    ):
+        """Run a query for the tables of ``owner`` on behalf of the
+        ``get_multi_*`` methods, returning the rows grouped on the
+        normalized table name, which is the last column of each row.
+
+        ``query`` has a ``%(criteria)s`` placeholder which receives the
+        WHERE criteria against ``owner_col`` and ``name_col``.  Tables are
+        limited to ``filter_names`` in the query if these fit in a single
+        IN list, and are otherwise filtered by the caller.
+
+        """
+        criteria = "%s = CAST(:owner AS VARCHAR2(128))" % owner_col
+        params = {"owner": owner}
+        if (
+            filter_names is not None
+            and len(filter_names) <= self.max_in_list_elements
+        ):
+            criteria += " AND %s IN :filter_names" % name_col
+            params["filter_names"] = [
+                self.denormalize_name(name) for name in filter_names
+            ]
+            s = sql.text(query % {"criteria": criteria}).bindparams(
+                sql.bindparam("filter_names", expanding=True)
+            )
+        else:
+            s = sql.text(query % {"criteria": criteria})
+
+        rows_by_table = util.defaultdict(list)
+        for row in connection.execute(s, params):
+            rows_by_table[self.normalize_name(row[-1])].append(row)
+        return rows_by_table
+
     @reflection.cache
     def get_table_options(self, connection, table_name, schema=None, **kw):
-        options = {}
-
         resolve_synonyms = kw.get("oracle_resolve_synonyms", False)
         dblink = kw.get("dblink", "")
         info_cache = kw.get("info_cache")
@@ -1943,12 +2006,6 @@ class OracleDialect(default.DefaultDialect):
 
         params = {"table_name": table_name}
 
-        columns = ["table_name"]
-        if self._supports_table_compression:
-            columns.append("compression")
-        if self._supports_table_compress_for:
-            columns.append("compress_for")
-
         text = (
             "SELECT %(columns)s "
             "FROM ALL_TABLES%(dblink)s "
@@ -1958,13 +2015,61 @@ class OracleDialect(default.DefaultDialect):
         if schema is not None:
             params["owner"] = schema
             text += " AND owner = CAST(:owner AS VARCHAR(128)) "
-        text = text % {"dblink": dblink, "columns": ", ".join(columns)}
+        text = text % {
+            "dblink": dblink,
+            "columns": self._table_options_columns(),
+        }
 
         result = connection.execute(sql.text(text), params)
 
+        return self._get_table_options_from_row(result.first())
+
+    def get_multi_table_options(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        owner = self._multi_reflection_owner(schema, **kw)
+        if owner is None:
+            return super().get_multi_table_options(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        rows_by_table = self._get_multi_reflection_rows(
+            connection,
+            "SELECT %s FROM ALL_TABLES WHERE %%(criteria)s"
+            % self._table_options_columns(),
+            "owner",
+            "table_name",
+            owner,
+            filter_names,
+        )
+        return (
+            (
+                (schema, table_name),
+                self._get_table_options_from_row(
+                    rows_by_table[table_name][0]
+                    if table_name in rows_by_table
+                    else None
+                ),
+            )
+            for table_name in self._get_multi_reflection_names(
+                connection, schema, filter_names, kw.get("info_cache")
+            )
+        )
+
+    def _table_options_columns(self):
+        columns = []
+        if self._supports_table_compression:
+            columns.append("compression")
+        if self._supports_table_compress_for:
+            columns.append("compress_for")
+        columns.append("table_name")
+        return ", ".join(columns)
+
+    def _get_table_options_from_row(self, row):
+        options = {}
+
         enabled = dict(DISABLED=False, ENABLED=True)
 
-        row = result.first()
         if row:
             if "compression" in row._fields and enabled.get(
                 row.compression, False
@@ -2000,7 +2105,52 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=info_cache,
         )
-        columns = []
+        params = {"table_name": table_name}
+        criteria = "col.table_name = CAST(:table_name AS VARCHAR2(128))"
+        if schema is not None:
+            params["owner"] = schema
+            criteria += " AND col.owner = :owner"
+
+        c = connection.execute(
+            sql.text(self._column_query(dblink, criteria)), params
+        )
+        return [self._get_column_from_row(row) for row in c]
+
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        owner = self._multi_reflection_owner(schema, **kw)
+        if owner is None:
+            return super().get_multi_columns(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        rows_by_table = self._get_multi_reflection_rows(
+            connection,
+            self._column_query("", "%(criteria)s"),
+            "col.owner",
+            "col.table_name",
+            owner,
+            filter_names,
+        )
+        return (
+            (
+                (schema, table_name),
+                [
+                    self._get_column_from_row(row)
+                    for row in rows_by_table.get(table_name, ())
+                ],
+            )
+            for table_name in self._get_multi_reflection_names(
+                connection, schema, filter_names, kw.get("info_cache")
+            )
+        )
+
+    def _column_query(self, dblink, criteria):
+        """Return the query for column information, limited by the
+        given WHERE criteria.  The table name is the last column selected.
+
+        """
         if self._supports_char_length:
             char_length_col = "char_length"
         else:
@@ -2021,8 +2171,6 @@ class OracleDialect(default.DefaultDialect):
         else:
             identity_cols = "NULL as default_on_null, NULL as identity_options"
 
-        params = {"table_name": table_name}
-
         text = """
             SELECT
                 col.column_name,
@@ -2034,106 +2182,102 @@ class OracleDialect(default.DefaultDialect):
                 col.data_default,
                 com.comments,
                 col.virtual_column,
-                %(identity_cols)s
+                %(identity_cols)s,
+                col.table_name
             FROM all_tab_cols%(dblink)s col
             LEFT JOIN all_col_comments%(dblink)s com
             ON col.table_name = com.table_name
             AND col.column_name = com.column_name
             AND col.owner = com.owner
-            WHERE col.table_name = CAST(:table_name AS VARCHAR2(128))
+            WHERE %(criteria)s
             AND col.hidden_column = 'NO'
+            ORDER BY col.table_name, col.column_id
         """
-        if schema is not None:
-            params["owner"] = schema
-            text += " AND col.owner = :owner "
-        text += " ORDER BY col.column_id"
-        text = text % {
+        return text % {
             "dblink": dblink,
             "char_length_col": char_length_col,
             "identity_cols": identity_cols,
+            "criteria": criteria,
         }
 
-        c = connection.execute(sql.text(text), params)
-
-        for row in c:
-            colname = self.normalize_name(row[0])
-            orig_colname = row[0]
-            coltype = row[1]
-            length = row[2]
-            precision = row[3]
-            scale = row[4]
-            nullable = row[5] == "Y"
-            default = row[6]
-            comment = row[7]
-            generated = row[8]
-            default_on_nul = row[9]
-            identity_options = row[10]
-
-            if coltype == "NUMBER":
-                if precision is None and scale == 0:
-                    coltype = INTEGER()
-                else:
-                    coltype = NUMBER(precision, scale)
-            elif coltype == "FLOAT":
-                # https://docs.oracle.com/cd/B14117_01/server.101/b10758/sqlqr06.htm
-                if precision == 126:
-                    # The DOUBLE PRECISION datatype is a floating-point
-                    # number with binary precision 126.
-                    coltype = DOUBLE_PRECISION()
-                elif precision == 63:
-                    # The REAL datatype is a floating-point number with a
-                    # binary precision of 63, or 18 decimal.
-                    coltype = REAL()
-                else:
-                    # non standard precision
-                    coltype = FLOAT(binary_precision=precision)
-
-            elif coltype in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
-                coltype = self.ischema_names.get(coltype)(length)
-            elif "WITH TIME ZONE" in coltype:
-                coltype = TIMESTAMP(timezone=True)
+    def _get_column_from_row(self, row):
+        colname = self.normalize_name(row[0])
+        orig_colname = row[0]
+        coltype = row[1]
+        length = row[2]
+        precision = row[3]
+        scale = row[4]
+        nullable = row[5] == "Y"
+        default = row[6]
+        comment = row[7]
+        generated = row[8]
+        default_on_nul = row[9]
+        identity_options = row[10]
+
+        if coltype == "NUMBER":
+            if precision is None and scale == 0:
+                coltype = INTEGER()
             else:
-                coltype = re.sub(r"\(\d+\)", "", coltype)
-                try:
-                    coltype = self.ischema_names[coltype]
-                except KeyError:
-                    util.warn(
-                        "Did not recognize type '%s' of column '%s'"
-                        % (coltype, colname)
-                    )
-                    coltype = sqltypes.NULLTYPE
-
-            if generated == "YES":
-                computed = dict(sqltext=default)
-                default = None
+                coltype = NUMBER(precision, scale)
+        elif coltype == "FLOAT":
+            # https://docs.oracle.com/cd/B14117_01/server.101/b10758/sqlqr06.htm
+            if precision == 126:
+                # The DOUBLE PRECISION datatype is a floating-point
+                # number with binary precision 126.
+                coltype = DOUBLE_PRECISION()
+            elif precision == 63:
+                # The REAL datatype is a floating-point number with a
+                # binary precision of 63, or 18 decimal.
+                coltype = REAL()
             else:
-                computed = None
+                # non standard precision
+                coltype = FLOAT(binary_precision=precision)
 
-            if identity_options is not None:
-                identity = self._parse_identity_options(
-                    identity_options, default_on_nul
+        elif coltype in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
+            coltype = self.ischema_names.get(coltype)(length)
+        elif "WITH TIME ZONE" in coltype:
+            coltype = TIMESTAMP(timezone=True)
+        else:
+            coltype = re.sub(r"\(\d+\)", "", coltype)
+            try:
+                coltype = self.ischema_names[coltype]
+            except KeyError:
+                util.warn(
+                    "Did not recognize type '%s' of column '%s'"
+                    % (coltype, colname)
                 )
-                default = None
-            else:
-                identity = None
-
-            cdict = {
-                "name": colname,
-                "type": coltype,
-                "nullable": nullable,
-                "default": default,
-                "autoincrement": "auto",
-                "comment": comment,
-            }
-            if orig_colname.lower() == orig_colname:
-                cdict["quote"] = True
-            if computed is not None:
-                cdict["computed"] = computed
-            if identity is not None:
-                cdict["identity"] = identity
+                coltype = sqltypes.NULLTYPE
+
+        if generated == "YES":
+            computed = dict(sqltext=default)
+            default = None
+        else:
+            computed = None
+
+        if identity_options is not None:
+            identity = self._parse_identity_options(
+                identity_options, default_on_nul
+            )
+            default = None
+        else:
+            identity = None
+
+        cdict = {
+            "name": colname,
+            "type": coltype,
+            "nullable": nullable,
+            "default": default,
+            "autoincrement": "auto",
+            "comment": comment,
+        }
+        if orig_colname.lower() == orig_colname:
+            cdict["quote"] = True
+        if computed is not None:
+            cdict["computed"] = computed
+        if identity is not None:
+            cdict["identity"] = identity
 
-            columns.append(cdict)
-        return columns
+        return cdict
 
     def _parse_identity_options(self, identity_options, default_on_nul):
         # identity_options is a string that starts with 'ALWAYS,' or
@@ -2204,6 +2348,38 @@ class OracleDialect(default.DefaultDialect):
         )
         return {"text": c.scalar()}
 
+    def get_multi_table_comment(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        owner = self._multi_reflection_owner(schema, **kw)
+        if owner is None:
+            return super().get_multi_table_comment(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        rows_by_table = self._get_multi_reflection_rows(
+            connection,
+            "SELECT comments, table_name FROM all_tab_comments "
+            "WHERE %(criteria)s",
+            "owner",
+            "table_name",
+            owner,
+            filter_names,
+        )
+        return (
+            (
+                (schema, table_name),
+                {
+                    "text": rows_by_table[table_name][0][0]
+                    if table_name in rows_by_table
+                    else None
+                },
+            )
+            for table_name in self._get_multi_reflection_names(
+                connection, schema, filter_names, kw.get("info_cache")
+            )
+        )
+
     @reflection.cache
     def get_indexes(
         self,
@@ -2224,33 +2400,15 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=info_cache,
         )
-        indexes = []
-
         params = {"table_name": table_name}
-        text = (
-            "SELECT a.index_name, a.column_name, "
-            "\nb.index_type, b.uniqueness, b.compression, b.prefix_length "
-            "\nFROM ALL_IND_COLUMNS%(dblink)s a, "
-            "\nALL_INDEXES%(dblink)s b "
-            "\nWHERE "
-            "\na.index_name = b.index_name "
-            "\nAND a.table_owner = b.table_owner "
-            "\nAND a.table_name = b.table_name "
-            "\nAND a.table_name = CAST(:table_name AS VARCHAR(128))"
-        )
+        criteria = "a.table_name = CAST(:table_name AS VARCHAR(128))"
 
         if schema is not None:
             params["schema"] = schema
-            text += "AND a.table_owner = :schema "
-
-        text += "ORDER BY a.index_name, a.column_position"
+            criteria += " AND a.table_owner = :schema"
 
-        text = text % {"dblink": dblink}
-
-        q = sql.text(text)
+        q = sql.text(self._index_query(dblink, criteria))
         rp = connection.execute(q, params)
-        indexes = []
-        last_index_name = None
         pk_constraint = self.get_pk_constraint(
             connection,
             table_name,
@@ -2260,13 +2418,75 @@ class OracleDialect(default.DefaultDialect):
             info_cache=kw.get("info_cache"),
         )
 
+        return self._get_indexes_from_rows(rp, pk_constraint)
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        owner = self._multi_reflection_owner(schema, **kw)
+        if owner is None:
+            return super().get_multi_indexes(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        return self._get_multi_indexes(
+            connection, schema, owner, filter_names, **kw
+        )
+
+    def _get_multi_indexes(
+        self, connection, schema, owner, filter_names, **kw
+    ):
+        info_cache = kw.get("info_cache")
+        rows_by_table = self._get_multi_reflection_rows(
+            connection,
+            self._index_query("", "%(criteria)s"),
+            "a.table_owner",
+            "a.table_name",
+            owner,
+            filter_names,
+        )
+        constraint_data = self._get_multi_constraint_rows(
+            connection, schema, filter_names, **kw
+        )
+        for table_name in self._get_multi_reflection_names(
+            connection, schema, filter_names, info_cache
+        ):
+            pk_constraint = self._get_pk_constraint_from_data(
+                constraint_data.get(table_name, ())
+            )
+            yield (schema, table_name), self._get_indexes_from_rows(
+                rows_by_table.get(table_name, ()), pk_constraint
+            )
+
+    def _index_query(self, dblink, criteria):
+        """Return the query for index information, limited by the given
+        WHERE criteria.  The table name is the last column selected.
+
+        """
+        return (
+            "SELECT a.index_name, a.column_name, "
+            "\nb.index_type, b.uniqueness, b.compression, b.prefix_length, "
+            "\na.table_name "
+            "\nFROM ALL_IND_COLUMNS%(dblink)s a, "
+            "\nALL_INDEXES%(dblink)s b "
+            "\nWHERE "
+            "\na.index_name = b.index_name "
+            "\nAND a.table_owner = b.table_owner "
+            "\nAND a.table_name = b.table_name "
+            "\nAND %(criteria)s "
+            "\nORDER BY a.table_name, a.index_name, a.column_position"
+        ) % {"dblink": dblink, "criteria": criteria}
+
+    def _get_indexes_from_rows(self, rows, pk_constraint):
+        indexes = []
+        last_index_name = None
+
         uniqueness = dict(NONUNIQUE=False, UNIQUE=True)
         enabled = dict(DISABLED=False, ENABLED=True)
 
         oracle_sys_col = re.compile(r"SYS_NC\d+\$", re.IGNORECASE)
 
         index = None
-        for rset in rp:
+        for rset in rows:
             index_name_normalized = self.normalize_name(rset.index_name)
 
             # skip primary key index.  This is refined as of
@@ -2312,8 +2532,36 @@ class OracleDialect(default.DefaultDialect):
     ):
 
         params = {"table_name": table_name}
+        criteria = "ac.table_name = CAST(:table_name AS VARCHAR2(128))"
 
-        text = (
+        if schema is not None:
+            params["owner"] = schema
+            criteria += "\nAND ac.owner = CAST(:owner AS VARCHAR2(128))"
+
+        text = self._constraint_query(dblink, criteria)
+        rp = connection.execute(sql.text(text), params)
+        constraint_data = rp.fetchall()
+        return constraint_data
+
+    @reflection.cache
+    def _get_multi_constraint_data(
+        self, connection, owner, filter_names=None, **kw
+    ):
+        return self._get_multi_reflection_rows(
+            connection,
+            self._constraint_query("", "%(criteria)s"),
+            "ac.owner",
+            "ac.table_name",
+            owner,
+            filter_names,
+        )
+
+    def _constraint_query(self, dblink, criteria):
+        """Return the query for constraint information, limited by the
+        given WHERE criteria.  The table name is the last column selected.
+
+        """
+        return (
             "SELECT"
             "\nac.constraint_name,"  # 0
             "\nac.constraint_type,"  # 1
@@ -2324,31 +2572,39 @@ class OracleDialect(default.DefaultDialect):
             "\nloc.position as loc_pos,"  # 6
             "\nrem.position as rem_pos,"  # 7
             "\nac.search_condition,"  # 8
-            "\nac.delete_rule"  # 9
+            "\nac.delete_rule,"  # 9
+            "\nac.table_name"  # 10
             "\nFROM all_constraints%(dblink)s ac,"
             "\nall_cons_columns%(dblink)s loc,"
             "\nall_cons_columns%(dblink)s rem"
-            "\nWHERE ac.table_name = CAST(:table_name AS VARCHAR2(128))"
+            "\nWHERE %(criteria)s"
             "\nAND ac.constraint_type IN ('R','P', 'U', 'C')"
-        )
-
-        if schema is not None:
-            params["owner"] = schema
-            text += "\nAND ac.owner = CAST(:owner AS VARCHAR2(128))"
-
-        text += (
             "\nAND ac.owner = loc.owner"
             "\nAND ac.constraint_name = loc.constraint_name"
             "\nAND ac.r_owner = rem.owner(+)"
             "\nAND ac.r_constraint_name = rem.constraint_name(+)"
             "\nAND (rem.position IS NULL or loc.position=rem.position)"
-            "\nORDER BY ac.constraint_name, loc.position"
-        )
+            "\nORDER BY ac.table_name, ac.constraint_name, loc.position"
+        ) % {"dblink": dblink, "criteria": criteria}
 
-        text = text % {"dblink": dblink}
-        rp = connection.execute(sql.text(text), params)
-        constraint_data = rp.fetchall()
-        return constraint_data
+    def _get_multi_constraint_rows(
+        self, connection, schema, filter_names, **kw
+    ):
+        """Return the constraint rows of the tables of ``schema`` grouped
+        on table name, or None if the tables have to be reflected
+        individually."""
+
+        owner = self._multi_reflection_owner(schema, **kw)
+        if owner is None:
+            return None
+        if filter_names is not None:
+            filter_names = tuple(filter_names)
+        return self._get_multi_constraint_data(
+            connection,
+            owner,
+            filter_names=filter_names,
+            info_cache=kw.get("info_cache"),
+        )
 
     @reflection.cache
     def get_pk_constraint(self, connection, table_name, schema=None, **kw):
@@ -2364,8 +2620,6 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=info_cache,
         )
-        pkeys = []
-        constraint_name = None
         constraint_data = self._get_constraint_data(
             connection,
             table_name,
@@ -2373,6 +2627,33 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=kw.get("info_cache"),
         )
+        return self._get_pk_constraint_from_data(constraint_data)
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        rows_by_table = self._get_multi_constraint_rows(
+            connection, schema, filter_names, **kw
+        )
+        if rows_by_table is None:
+            return super().get_multi_pk_constraint(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        return (
+            (
+                (schema, table_name),
+                self._get_pk_constraint_from_data(
+                    rows_by_table.get(table_name, ())
+                ),
+            )
+            for table_name in self._get_multi_reflection_names(
+                connection, schema, filter_names, kw.get("info_cache")
+            )
+        )
+
+    def _get_pk_constraint_from_data(self, constraint_data):
+        pkeys = []
+        constraint_name = None
 
         for row in constraint_data:
             (
@@ -2421,7 +2702,52 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=kw.get("info_cache"),
         )
+        return self._get_foreign_keys_from_data(
+            connection,
+            constraint_data,
+            requested_schema,
+            schema,
+            resolve_synonyms,
+            dblink,
+        )
 
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        rows_by_table = self._get_multi_constraint_rows(
+            connection, schema, filter_names, **kw
+        )
+        if rows_by_table is None:
+            return super().get_multi_foreign_keys(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        owner = self._multi_reflection_owner(schema, **kw)
+        return (
+            (
+                (schema, table_name),
+                self._get_foreign_keys_from_data(
+                    connection,
+                    rows_by_table.get(table_name, ()),
+                    schema,
+                    owner,
+                    False,
+                    "",
+                ),
+            )
+            for table_name in self._get_multi_reflection_names(
+                connection, schema, filter_names, kw.get("info_cache")
+            )
+        )
+
+    def _get_foreign_keys_from_data(
+        self,
+        connection,
+        constraint_data,
+        requested_schema,
+        schema,
+        resolve_synonyms,
+        dblink,
+    ):
         def fkey_rec():
             return {
                 "name": None,
@@ -2525,13 +2851,47 @@ class OracleDialect(default.DefaultDialect):
             info_cache=kw.get("info_cache"),
         )
 
-        unique_keys = filter(lambda x: x[1] == "U", constraint_data)
-        uniques_group = groupby(unique_keys, lambda x: x[0])
-
         index_names = {
             ix["name"]
             for ix in self.get_indexes(connection, table_name, schema=schema)
         }
+        return self._get_unique_constraints_from_data(
+            constraint_data, index_names
+        )
+
+    def get_multi_unique_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        rows_by_table = self._get_multi_constraint_rows(
+            connection, schema, filter_names, **kw
+        )
+        if rows_by_table is None:
+            return super().get_multi_unique_constraints(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        owner = self._multi_reflection_owner(schema, **kw)
+        indexes = dict(
+            self._get_multi_indexes(
+                connection, schema, owner, filter_names, **kw
+            )
+        )
+        return (
+            (
+                (schema, table_name),
+                self._get_unique_constraints_from_data(
+                    rows_by_table.get(table_name, ()),
+                    {ix["name"] for ix in indexes[(schema, table_name)]},
+                ),
+            )
+            for table_name in self._get_multi_reflection_names(
+                connection, schema, filter_names, kw.get("info_cache")
+            )
+        )
+
+    def _get_unique_constraints_from_data(self, constraint_data, index_names):
+        unique_keys = filter(lambda x: x[1] == "U", constraint_data)
+        uniques_group = groupby(unique_keys, lambda x: x[0])
+
         return [
             {
                 "name": name,
@@ -2605,6 +2965,42 @@ class OracleDialect(default.DefaultDialect):
             info_cache=kw.get("info_cache"),
         )
 
+        return self._get_check_constraints_from_data(
+            constraint_data, include_all
+        )
+
+    def get_multi_check_constraints(
+        self,
+        connection,
+        schema=None,
+        filter_names=None,
+        include_all=False,
+        **kw,
+    ):
+        rows_by_table = self._get_multi_constraint_rows(
+            connection, schema, filter_names, **kw
+        )
+        if rows_by_table is None:
+            return super().get_multi_check_constraints(
+                connection,
+                schema=schema,
+                filter_names=filter_names,
+                include_all=include_all,
+                **kw,
+            )
+        return (
+            (
+                (schema, table_name),
+                self._get_check_constraints_from_data(
+                    rows_by_table.get(table_name, ()), include_all
+                ),
+            )
+            for table_name in self._get_multi_reflection_names(
+                connection, schema, filter_names, kw.get("info_cache")
+            )
+        )
+
+    def _get_check_constraints_from_data(self, constraint_data, include_all):
         check_constraints = filter(lambda x: x[1] == "C", constraint_data)
 
         return [
@@ -50,6 +50,10 @@ from .dml import Insert
 from .dml import insert
 from .ext import aggregate_order_by
 from .ext import array_agg
+from .ext import copy_from
+from .ext import copy_to
+from .ext import CopyFrom
+from .ext import CopyTo
 from .ext import ExcludeConstraint
 from .hstore import HSTORE
 from .hstore import hstore
@@ -118,6 +122,10 @@ __all__ = (
     "ExcludeConstraint",
     "aggregate_order_by",
     "array_agg",
+    "copy_from",
+    "copy_to",
+    "CopyFrom",
+    "CopyTo",
     "insert",
     "Insert",
 )
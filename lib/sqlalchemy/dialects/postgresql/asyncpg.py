@@ -121,12 +121,15 @@ client using this setting passed to :func:`_asyncio.create_async_engine`::
 
 import collections
 import collections.abc as collections_abc
+import datetime
 import decimal
 import json as _py_json
 import re
 import time
+import uuid
 
 from . import json
+from .base import _CopyTextParser
 from .base import _DECIMAL_TYPES
 from .base import _FLOAT_TYPES
 from .base import _INT_TYPES
@@ -156,6 +159,53 @@ except ImportError:
     _python_UUID = None
 
 
+_copy_time_re = re.compile(
+    r"(\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?(?:([-+])(\d\d)(?::(\d\d))?)?$"
+)
+
+
+def _copy_time(value):
+    """Convert a time from the COPY text format, in which trailing zeros
+    of fractional seconds and of UTC offsets are omitted."""
+
+    m = _copy_time_re.match(value)
+    if m is None or m.group(1) == "24":
+        # 24:00:00 is accepted by PostgreSQL
+        return value
+    hour, minute, second, fraction, sign, tzhour, tzminute = m.groups()
+    if sign:
+        offset = datetime.timedelta(
+            hours=int(tzhour), minutes=int(tzminute or 0)
+        )
+        tzinfo = datetime.timezone(-offset if sign == "-" else offset)
+    else:
+        tzinfo = None
+    return datetime.time(
+        int(hour),
+        int(minute),
+        int(second),
+        int((fraction or "0").ljust(6, "0")),
+        tzinfo,
+    )
+
+
+def _copy_date(value):
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        # infinity, BC dates
+        return value
+
+
+def _copy_timestamp(value):
+    date, _, time_ = value.partition(" ")
+    date = _copy_date(date)
+    time_ = _copy_time(time_)
+    if isinstance(date, str) or isinstance(time_, str):
+        return value
+    return datetime.datetime.combine(date, time_)
+
+
 class AsyncpgString(sqltypes.String):
     render_bind_cast = True
 
@@ -450,11 +500,109 @@ class AsyncAdapt_asyncpg_cursor:
             except Exception as error:
                 self._handle_exception(error)
 
+    async def _copy_records_to_table(
+        self, table_name, records, columns, schema_name
+    ):
+        adapt_connection = self._adapt_connection
+
+        async with adapt_connection._execute_mutex:
+            if not adapt_connection._started:
+                await adapt_connection._start_transaction()
+
+            try:
+                status = await self._connection.copy_records_to_table(
+                    table_name,
+                    records=records,
+                    columns=columns,
+                    schema_name=schema_name,
+                )
+            except Exception as error:
+                self._handle_exception(error)
+
+            reg = re.match(r"COPY (\d+)", status)
+            if reg:
+                self.rowcount = int(reg.group(1))
+            else:
+                self.rowcount = -1
+
     def execute(self, operation, parameters=None):
         self._adapt_connection.await_(
             self._prepare_and_execute(operation, parameters)
         )
 
+    def copy_from_query(self, query, parser, batch_size=1000):
+        """Run ``COPY (<query>) TO STDOUT``, yielding the rows parsed from
+        its output in text format as they're consumed.
+
+        The COPY is run as a separate task, which passes batches of rows
+        to the consumer through a queue of limited size, and so is paused
+        while the consumer falls behind.  When closed early, the remaining
+        output is discarded.
+
+        """
+        adapt_connection = self._adapt_connection
+        await_ = adapt_connection.await_
+        queue = asyncio.Queue(2)
+        batch = []
+        discard = False
+
+        async def output(data):
+            nonlocal batch
+            if discard:
+                return
+            batch.extend(parser.parse(data))
+            if len(batch) >= batch_size:
+                await queue.put(batch)
+                batch = []
+
+        async def copy():
+            # the last item put on the queue is None, or the exception
+            # raised
+            async with adapt_connection._execute_mutex:
+                try:
+                    if not adapt_connection._started:
+                        await adapt_connection._start_transaction()
+                    await self._connection.copy_from_query(
+                        query, output=output
+                    )
+                except Exception as error:
+                    await queue.put(error)
+                else:
+                    if batch and not discard:
+                        await queue.put(batch)
+                    await queue.put(None)
+
+        async def start():
+            return asyncio.ensure_future(copy())
+
+        task = await_(start())
+        done = False
+        try:
+            while not done:
+                item = await_(queue.get())
+                if isinstance(item, list):
+                    yield from item
+                else:
+                    done = True
+                    if item is not None:
+                        self._handle_exception(item)
+        finally:
+            if not done:
+                discard = True
+                while isinstance(await_(queue.get()), list):
+                    pass
+            await_(task)
+
+    def copy_records_to_table(
+        self, table_name, records, columns=None, schema_name=None
+    ):
+        self._adapt_connection.await_(
+            self._copy_records_to_table(
+                table_name, records, columns, schema_name
+            )
+        )
+        return self.rowcount
+
     def executemany(self, operation, seq_of_parameters):
         return self._adapt_connection.await_(
             self._executemany(operation, seq_of_parameters)
@@ -494,14 +642,21 @@ class AsyncAdapt_asyncpg_ss_cursor(AsyncAdapt_asyncpg_cursor):
 
     def __init__(self, adapt_connection):
         super(AsyncAdapt_asyncpg_ss_cursor, self).__init__(adapt_connection)
-        self._rowbuffer = None
+        self._rowbuffer = collections.deque()
 
     def close(self):
         self._cursor = None
         self._rowbuffer = None
 
+    async def _fetch(self, size):
+        # guard against the fetch overlapping with a statement executed
+        # on the same connection, as is possible when rows are being
+        # prefetched on a separate task
+        async with self._adapt_connection._execute_mutex:
+            return await self._cursor.fetch(size)
+
     def _buffer_rows(self):
-        new_rows = self._adapt_connection.await_(self._cursor.fetch(50))
+        new_rows = self._adapt_connection.await_(self._fetch(50))
         self._rowbuffer = collections.deque(new_rows)
 
     def __aiter__(self):
@@ -531,13 +686,15 @@ class AsyncAdapt_asyncpg_ss_cursor(AsyncAdapt_asyncpg_cursor):
             return self.fetchall()
 
         if not self._rowbuffer:
-            self._buffer_rows()
+            # fetch only the number of rows requested, which may have been
+            # limited by the caller based on the size of rows
+            return self._adapt_connection.await_(self._fetch(size))
 
         buf = list(self._rowbuffer)
         lb = len(buf)
         if size > lb:
             buf.extend(
-                self._adapt_connection.await_(self._cursor.fetch(size - lb))
+                self._adapt_connection.await_(self._fetch(size - lb))
             )
 
         result = buf[0:size]
@@ -557,7 +714,7 @@ class AsyncAdapt_asyncpg_ss_cursor(AsyncAdapt_asyncpg_cursor):
         # TODO: looks like we have to hand-roll some kind of batching here.
         # hardcoding for the moment but this should be improved.
         while True:
-            batch = await self._cursor.fetch(1000)
+            batch = await self._fetch(1000)
             if batch:
                 rows.extend(batch)
                 continue
@@ -827,6 +984,12 @@ class PGDialect_asyncpg(PGDialect):
 
     default_paramstyle = "format"
     supports_sane_multi_rowcount = False
+
+    # parameters are bound server side; the wire protocol sends the
+    # count of parameters as a 16 bit integer, which may be treated
+    # as signed
+    max_bind_parameters = 32767
+
     execution_ctx_cls = PGExecutionContext_asyncpg
     statement_compiler = PGCompiler_asyncpg
     preparer = PGIdentifierPreparer_asyncpg
@@ -860,11 +1023,15 @@ class PGDialect_asyncpg(PGDialect):
         },
     )
     is_async = True
+    _supports_native_async_execute = True
     _invalidate_schema_cache_asof = 0
 
     def _invalidate_schema_cache(self):
         self._invalidate_schema_cache_asof = time.time()
 
+    async def _do_execute_async(self, cursor, statement, parameters, context):
+        await cursor._prepare_and_execute(statement, parameters)
+
     @util.memoized_property
     def _dbapi_version(self):
         if self.dbapi and hasattr(self.dbapi, "__version__"):
@@ -1014,6 +1181,77 @@ class PGDialect_asyncpg(PGDialect):
 
         return connect
 
+    def do_copy_from(
+        self, cursor, statement, rows, table_name, column_names, schema
+    ):
+        return cursor.copy_records_to_table(
+            table_name, rows, columns=column_names, schema_name=schema
+        )
+
+    @util.memoized_property
+    def _copy_text_casters(self):
+        """Converters from the COPY text format to the values which asyncpg
+        returns, by type OID, for the types where these are the same;
+        ``None`` indicates a string."""
+
+        deserializer = self._json_deserializer or _py_json.loads
+        return {
+            16: lambda value: value == "t",
+            17: lambda value: bytes.fromhex(value[2:]),
+            18: None,
+            19: None,
+            20: int,
+            21: int,
+            23: int,
+            25: None,
+            26: int,
+            114: deserializer,
+            700: float,
+            701: float,
+            1042: None,
+            1043: None,
+            1082: _copy_date,
+            1083: _copy_time,
+            1114: _copy_timestamp,
+            1184: _copy_timestamp,
+            1266: _copy_time,
+            1700: decimal.Decimal,
+            2950: uuid.UUID,
+            3802: deserializer,
+        }
+
+    def do_copy_to(
+        self, cursor, statement, select_statement, describe_statement
+    ):
+        cursor.execute(describe_statement)
+        description = cursor.description
+        casters = self._copy_text_casters
+        if all(col[1] in casters for col in description):
+            parser = _CopyTextParser([casters[col[1]] for col in description])
+            return description, cursor.copy_from_query(
+                select_statement, parser
+            )
+
+        # asyncpg doesn't expose its decoders for the COPY binary format.
+        # for other types, such as arrays, intervals, enums and network
+        # types, run the SELECT using a server side cursor, so that values
+        # are the same as when the SELECT is executed directly
+        return description, self._copy_to_server_side(
+            cursor, select_statement
+        )
+
+    def _copy_to_server_side(self, cursor, select_statement, batch_size=1000):
+        ss_cursor = cursor._adapt_connection.cursor(server_side=True)
+        try:
+            ss_cursor.execute(select_statement)
+            while True:
+                rows = ss_cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            ss_cursor.close()
+
     def get_driver_connection(self, connection):
         return connection._connection
 
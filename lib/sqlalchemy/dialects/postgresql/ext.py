@@ -15,6 +15,7 @@ from ...sql import expression
 from ...sql import functions
 from ...sql import roles
 from ...sql import schema
+from ...sql.base import Executable
 from ...sql.schema import ColumnCollectionConstraint
 
 
@@ -277,3 +278,165 @@ def array_agg(*arg, **kw):
     """
     kw["_default_array_type"] = ARRAY
     return functions.func.array_agg(*arg, **kw)
+
+
+class CopyFrom(Executable, elements.ClauseElement):
+    """Represent a PostgreSQL ``COPY <table> FROM STDIN`` operation.
+
+    The :class:`.CopyFrom` construct is normally created using the
+    :func:`_postgresql.copy_from` function.
+
+    .. versionadded:: 2.0
+
+    """
+
+    __visit_name__ = "copy_from"
+
+    stringify_dialect = "postgresql"
+    inherit_cache = False
+
+    def __init__(self, table, rows, columns=None):
+        self.table = coercions.expect(roles.DMLTableRole, table)
+        if columns is None:
+            self.columns = list(self.table.c)
+        else:
+            self.columns = [
+                self.table.c[col if isinstance(col, str) else col.key]
+                for col in columns
+            ]
+        self.rows = rows
+
+    def _execute_on_connection(
+        self, connection, distilled_params, execution_options
+    ):
+        dialect = connection.dialect
+        return dialect._execute_copy(
+            connection,
+            self,
+            distilled_params,
+            execution_options,
+            dialect._execute_copy_from,
+        )
+
+
+class CopyTo(Executable, elements.ClauseElement):
+    """Represent a PostgreSQL ``COPY (<select>) TO STDOUT`` operation.
+
+    The :class:`.CopyTo` construct is normally created using the
+    :func:`_postgresql.copy_to` function.
+
+    .. versionadded:: 2.0
+
+    """
+
+    __visit_name__ = "copy_to"
+
+    stringify_dialect = "postgresql"
+    inherit_cache = False
+
+    def __init__(self, select):
+        self.select = coercions.expect(roles.SelectStatementRole, select)
+
+    def _execute_on_connection(
+        self, connection, distilled_params, execution_options
+    ):
+        dialect = connection.dialect
+        return dialect._execute_copy(
+            connection,
+            self,
+            distilled_params,
+            execution_options,
+            dialect._execute_copy_to,
+        )
+
+
+def copy_from(table, rows, columns=None):
+    """Construct a PostgreSQL ``COPY .. FROM STDIN`` bulk load.
+
+    When executed with :meth:`_engine.Connection.execute`, the given
+    iterable of rows is streamed into the table using the driver's native
+    COPY support::
+
+        from sqlalchemy.dialects.postgresql import copy_from
+
+        with engine.begin() as conn:
+            result = conn.execute(
+                copy_from(
+                    my_table,
+                    ({"id": i, "data": f"d{i}"} for i in range(100000)),
+                )
+            )
+            print(result.rowcount)
+
+    Each row may be a tuple, in the order of the target columns, or a
+    mapping keyed on column key; keys missing from a mapping are sent as
+    NULL.  Values are passed through the bind processors of the column
+    types, in the same way as for an INSERT statement.  The iterable is
+    consumed lazily and is not materialized in memory.  Column defaults
+    are **not** applied.
+
+    Supported drivers are psycopg2, psycopg (sync and async) and asyncpg.
+
+    :param table: the target :class:`_schema.Table`.
+
+    :param rows: iterable of tuples or mappings.
+
+    :param columns: optional sequence of column keys or
+     :class:`_schema.Column` objects to load; defaults to all columns
+     of the table.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :func:`_postgresql.copy_to`
+
+    """
+    return CopyFrom(table, rows, columns=columns)
+
+
+def copy_to(select):
+    """Construct a PostgreSQL ``COPY (<select>) TO STDOUT`` bulk export.
+
+    When executed with :meth:`_engine.Connection.execute`, returns a
+    :class:`_engine.Result` whose rows are those of the given SELECT,
+    with values passed through the result processors of its column
+    types::
+
+        from sqlalchemy.dialects.postgresql import copy_to
+
+        with engine.connect() as conn:
+            for row in conn.execute(copy_to(select(my_table))):
+                print(row.id, row.data)
+
+    As COPY does not accept parameters, any bound values within the
+    SELECT are rendered inline, and therefore must be of types that
+    support literal rendering.
+
+    Rows are received from the server as they are consumed, so that the
+    full output is not held in memory; the connection should not be used
+    to invoke other statements until all rows have been fetched or the
+    result is closed.  With the psycopg2 driver, the COPY is run on a
+    separate thread which parses rows ahead of the consumer.  When using
+    :ref:`asyncio <asyncio_toplevel>`, rows are streamed when the construct
+    is invoked using :meth:`_asyncio.AsyncConnection.stream`, and are
+    fetched up front when using :meth:`_asyncio.AsyncConnection.execute`.
+
+    Supported drivers are psycopg2, psycopg (sync and async) and asyncpg.
+    As asyncpg doesn't expose its type decoders, COPY is used with asyncpg
+    only when all columns are of types whose text representation is
+    converted to the same values asyncpg returns, including string,
+    numeric, date and time, boolean, bytea, UUID and JSON types; for
+    other types, such as arrays, the SELECT is run using a server side
+    cursor instead.
+
+    :param select: a :class:`_sql.Select` construct.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :func:`_postgresql.copy_from`
+
+    """
+    return CopyTo(select)
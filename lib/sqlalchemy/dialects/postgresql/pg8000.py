@@ -365,6 +365,12 @@ class PGDialect_pg8000(PGDialect):
 
     default_paramstyle = "format"
     supports_sane_multi_rowcount = True
+
+    # parameters are bound server side; the wire protocol sends the
+    # count of parameters as a 16 bit integer, which may be treated
+    # as signed
+    max_bind_parameters = 32767
+
     execution_ctx_cls = PGExecutionContext_pg8000
     statement_compiler = PGCompiler_pg8000
     preparer = PGIdentifierPreparer_pg8000
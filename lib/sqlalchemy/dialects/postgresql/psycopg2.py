@@ -446,11 +446,15 @@ which may be more performant.
 
 """  # noqa
 import collections.abc as collections_abc
+import datetime
 import logging
+import queue
 import re
+import threading
 
 from ._psycopg_common import _PGDialect_common_psycopg
 from ._psycopg_common import _PGExecutionContext_common_psycopg
+from .base import _CopyTextParser
 from .base import PGCompiler
 from .base import PGIdentifierPreparer
 from .json import JSON
@@ -523,6 +527,148 @@ class PGIdentifierPreparer_psycopg2(PGIdentifierPreparer):
     pass
 
 
+_COPY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+
+def _copy_text(value):
+    if value is True:
+        return "t"
+    elif value is False:
+        return "f"
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    elif isinstance(value, datetime.timedelta):
+        return "%d days %d seconds %d microseconds" % (
+            value.days,
+            value.seconds,
+            value.microseconds,
+        )
+    elif isinstance(value, (list, tuple)):
+        return "{%s}" % ",".join(
+            "NULL"
+            if elem is None
+            else _copy_text(elem)
+            if isinstance(elem, (list, tuple))
+            else '"%s"'
+            % _copy_text(elem).replace("\\", "\\\\").replace('"', '\\"')
+            for elem in value
+        )
+    else:
+        return str(value)
+
+
+class _CopyFromStream:
+    """File-like object passed to ``cursor.copy_expert()``, which renders
+    rows in COPY text format as psycopg2 reads from it."""
+
+    def __init__(self, rows):
+        self._lines = (
+            "\t".join(
+                "\\N" if value is None else _copy_text(value).translate(
+                    _COPY_ESCAPES
+                )
+                for value in row
+            )
+            + "\n"
+            for row in rows
+        )
+        self._buffer = ""
+
+    def read(self, size=-1):
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        if size < 0 or length < size:
+            for line in self._lines:
+                chunks.append(line)
+                length += len(line)
+                if size >= 0 and length >= size:
+                    break
+        data = "".join(chunks)
+        if size >= 0:
+            data, self._buffer = data[:size], data[size:]
+        else:
+            self._buffer = ""
+        return data
+
+
+class _CopyToStream:
+    """File-like object passed to ``cursor.copy_expert()``, which parses
+    COPY text format output into rows using psycopg2's typecasters.
+
+    ``copy_expert()`` writes the whole COPY output to the file object
+    before returning, so it's run on a separate thread, with batches of
+    parsed rows passed to the consuming thread through a queue of limited
+    size; the COPY is then paused while the consumer falls behind.
+
+    """
+
+    batch_size = 1000
+    max_batches = 2
+
+    def __init__(self, cursor, casters, encoding):
+        self._parser = _CopyTextParser(
+            [
+                (lambda value, caster=caster: caster(value, cursor))
+                if caster is not None
+                else None
+                for caster in casters
+            ],
+            encoding,
+        )
+        self._queue = queue.Queue(self.max_batches)
+        self._batch = []
+        self._discard = False
+
+    def write(self, data):
+        if self._discard:
+            return
+        self._batch.extend(self._parser.parse(data))
+        if len(self._batch) >= self.batch_size:
+            self._queue.put(self._batch)
+            self._batch = []
+
+    def _copy(self, cursor, statement):
+        # the last item put on the queue is None, or the exception raised
+        try:
+            cursor.copy_expert(statement, self)
+        except BaseException as err:
+            self._queue.put(err)
+        else:
+            if self._batch and not self._discard:
+                self._queue.put(self._batch)
+            self._queue.put(None)
+
+    def rows(self, cursor, statement):
+        """Run the COPY on a separate thread, yielding rows as they're
+        parsed.  When closed early, the remaining output is discarded."""
+
+        thread = threading.Thread(
+            target=self._copy,
+            args=(cursor, statement),
+            name="sqlalchemy-copy-to",
+            daemon=True,
+        )
+        thread.start()
+        done = False
+        try:
+            while not done:
+                batch = self._queue.get()
+                if isinstance(batch, list):
+                    yield from batch
+                else:
+                    done = True
+                    if batch is not None:
+                        raise batch
+        finally:
+            if not done:
+                self._discard = True
+                while isinstance(self._queue.get(), list):
+                    pass
+            thread.join()
+
+
 class ExecutemanyMode(FastIntFlag):
     EXECUTEMANY_PLAIN = 0
     EXECUTEMANY_BATCH = 1
@@ -587,6 +733,9 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
 
         if self.executemany_mode & EXECUTEMANY_VALUES:
             self.insert_executemany_returning = True
+            # psycopg2's execute_values() helper is used to batch INSERT
+            # statements in place of the generic "insertmanyvalues" approach
+            self.use_insertmanyvalues = False
 
         self.executemany_batch_page_size = executemany_batch_page_size
         self.executemany_values_page_size = executemany_values_page_size
@@ -761,6 +910,35 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
         else:
             cursor.executemany(statement, parameters)
 
+    def do_copy_from(
+        self, cursor, statement, rows, table_name, column_names, schema
+    ):
+        cursor.copy_expert(statement, _CopyFromStream(rows))
+        return cursor.rowcount
+
+    def do_copy_to(
+        self, cursor, statement, select_statement, describe_statement
+    ):
+        extensions = self._psycopg2_extensions
+
+        cursor.execute(describe_statement)
+        description = cursor.description
+
+        # look up typecasters the same way psycopg2 does, i.e. those
+        # registered on the connection take precedence over global ones
+        dbapi_connection = cursor.connection
+        casters = [
+            dbapi_connection.string_types.get(
+                col[1], extensions.string_types.get(col[1])
+            )
+            for col in description
+        ]
+
+        stream = _CopyToStream(
+            cursor, casters, extensions.encodings[dbapi_connection.encoding]
+        )
+        return description, stream.rows(cursor, statement)
+
     def do_begin_twophase(self, connection, xid):
         connection.connection.tpc_begin(xid)
 
@@ -801,6 +979,11 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
         else:
             return None
 
+    def is_dbapi_transaction_active(self, dbapi_connection):
+        # compare to psycopg2.extensions.STATUS_READY, indicating no
+        # transaction in progress, without importing the extensions module
+        return dbapi_connection.status != 1
+
     def is_disconnect(self, e, connection, cursor):
         if isinstance(e, self.dbapi.Error):
             # check the "closed" flag.  this might not be
@@ -75,27 +75,30 @@ class AsyncAdapt_aiosqlite_cursor:
         self._rows[:] = []
 
     def execute(self, operation, parameters=None):
+        self.await_(self._execute_async(operation, parameters))
+
+    async def _execute_async(self, operation, parameters=None):
         try:
-            _cursor = self.await_(self._connection.cursor())
+            _cursor = await self._connection.cursor()
 
             if parameters is None:
-                self.await_(_cursor.execute(operation))
+                await _cursor.execute(operation)
             else:
-                self.await_(_cursor.execute(operation, parameters))
+                await _cursor.execute(operation, parameters)
 
             if _cursor.description:
                 self.description = _cursor.description
                 self.lastrowid = self.rowcount = -1
 
                 if not self.server_side:
-                    self._rows = self.await_(_cursor.fetchall())
+                    self._rows = await _cursor.fetchall()
             else:
                 self.description = None
                 self.lastrowid = _cursor.lastrowid
                 self.rowcount = _cursor.rowcount
 
             if not self.server_side:
-                self.await_(_cursor.close())
+                await _cursor.close()
             else:
                 self._cursor = _cursor
         except Exception as error:
@@ -304,6 +307,7 @@ class SQLiteDialect_aiosqlite(SQLiteDialect_pysqlite):
     supports_statement_cache = True
 
     is_async = True
+    _supports_native_async_execute = True
 
     supports_server_side_cursors = True
 
@@ -330,6 +334,12 @@ class SQLiteDialect_aiosqlite(SQLiteDialect_pysqlite):
 
         return super().is_disconnect(e, connection, cursor)
 
+    def is_dbapi_transaction_active(self, dbapi_connection):
+        return None
+
+    async def _do_execute_async(self, cursor, statement, parameters, context):
+        await cursor._execute_async(statement, parameters)
+
     def get_driver_connection(self, connection):
         return connection._connection
 
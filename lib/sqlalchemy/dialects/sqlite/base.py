@@ -253,6 +253,27 @@ workarounds are required.
     See the section :ref:`pysqlite_serializable`
     for techniques to work around this behavior.
 
+.. _sqlite_returning:
+
+RETURNING Support
+-----------------
+
+SQLite supports RETURNING for INSERT, UPDATE and DELETE statements as of
+SQLite version 3.35.  When the SQLite library in use is of this version or
+greater, SQLAlchemy's :meth:`_dml.Insert.returning`,
+:meth:`_dml.Update.returning` and :meth:`_dml.Delete.returning` constructs
+are supported, and the "insertmanyvalues" feature is used so that an INSERT
+of many rows which needs server-generated primary key values back, as is the
+case for the ORM unit of work, may be batched into multi-row
+``INSERT..VALUES (...), (...) RETURNING`` statements rather than one INSERT
+per row.  An INSERT of a single row with an autoincrementing primary key
+continues to make use of ``cursor.lastrowid``.
+
+As SQLite does not accept qualified column names within the RETURNING
+clause, columns are rendered using their name alone.
+
+.. versionadded:: 2.0  Added support for SQLite RETURNING
+
 .. _sqlite_foreign_keys:
 
 Foreign Key Support
@@ -824,6 +845,7 @@ from ... import schema as sa_schema
 from ... import sql
 from ... import types as sqltypes
 from ... import util
+from ...engine import cursor as _cursor
 from ...engine import default
 from ...engine import processors
 from ...engine import reflection
@@ -831,6 +853,7 @@ from ...sql import coercions
 from ...sql import ColumnElement
 from ...sql import compiler
 from ...sql import elements
+from ...sql import expression
 from ...sql import roles
 from ...sql import schema
 from ...types import BLOB  # noqa
@@ -1296,6 +1319,24 @@ class SQLiteCompiler(compiler.SQLCompiler):
         # sqlite has no "FOR UPDATE" AFAICT
         return ""
 
+    def returning_clause(
+        self, stmt, returning_cols, *, populate_result_map, **kw
+    ):
+        # SQLite rejects schema-qualified column names inside of RETURNING;
+        # as RETURNING may only refer to the target table, render plain
+        # column names
+        columns = [
+            self._label_returning_column(
+                stmt,
+                c,
+                populate_result_map,
+                column_clause_args={"include_table": False},
+            )
+            for c in expression._select_iterables(returning_cols)
+        ]
+
+        return "RETURNING " + ", ".join(columns)
+
     def visit_is_distinct_from_binary(self, binary, operator, **kw):
         return "%s IS NOT %s" % (
             self.process(binary.left),
@@ -1801,6 +1842,24 @@ class SQLiteIdentifierPreparer(compiler.IdentifierPreparer):
 
 
 class SQLiteExecutionContext(default.DefaultExecutionContext):
+    def post_exec(self):
+        if (
+            (self.isinsert or self.isupdate or self.isdelete)
+            and self._insertmanyvalues_rows is None
+            and self.compiled.effective_returning
+        ):
+            # SQLite keeps an INSERT, UPDATE or DELETE that has a RETURNING
+            # clause open until all of its rows are fetched, which leaves
+            # the table locked; fetch the rows up front so that the
+            # statement is complete
+            self.cursor_fetch_strategy = (
+                _cursor.FullyBufferedCursorFetchStrategy(
+                    self.cursor,
+                    self.cursor.description,
+                    self.cursor.fetchall(),
+                )
+            )
+
     @util.memoized_property
     def _preserve_raw_colnames(self):
         return (
@@ -1838,6 +1897,17 @@ class SQLiteDialect(default.DefaultDialect):
     supports_statement_cache = True
     insert_null_pk_still_autoincrements = True
 
+    # default SQLITE_MAX_VARIABLE_NUMBER
+    max_bind_parameters = 32766
+    implicit_returning = True
+    full_returning = True
+    use_insertmanyvalues = True
+
+    # a single-row INSERT acquires the new primary key from
+    # cursor.lastrowid; RETURNING is used for executemany and for
+    # other server-generated values
+    favor_returning_over_lastrowid = False
+
     default_paramstyle = "qmark"
     execution_ctx_cls = SQLiteExecutionContext
     statement_compiler = SQLiteCompiler
@@ -1944,6 +2014,16 @@ class SQLiteDialect(default.DefaultDialect):
                 14,
             )
 
+            if self.dbapi.sqlite_version_info < (3, 35):
+                # https://www.sqlite.org/releaselog/3_35_0.html
+                self.implicit_returning = self.full_returning = False
+                self.insert_executemany_returning = False
+
+            if self.dbapi.sqlite_version_info < (3, 32):
+                # default SQLITE_MAX_VARIABLE_NUMBER prior to
+                # https://www.sqlite.org/releaselog/3_32_0.html
+                self.max_bind_parameters = 999
+
     _isolation_lookup = util.immutabledict(
         {"READ UNCOMMITTED": 1, "SERIALIZABLE": 0}
     )
@@ -2228,8 +2308,11 @@ class SQLiteDialect(default.DefaultDialect):
             result = re.search(PK_PATTERN, table_data, re.I)
             constraint_name = result.group(1) if result else None
 
-        cols = self.get_columns(connection, table_name, schema, **kw)
-        cols.sort(key=lambda col: col.get("primary_key"))
+        # sort a copy; the list returned by get_columns() may be cached
+        cols = sorted(
+            self.get_columns(connection, table_name, schema, **kw),
+            key=lambda col: col.get("primary_key"),
+        )
         pkeys = []
         for col in cols:
             if col["primary_key"]:
@@ -599,6 +599,9 @@ class SQLiteDialect_pysqlite(SQLiteDialect):
 
         return ([filename], pysqlite_opts)
 
+    def is_dbapi_transaction_active(self, dbapi_connection):
+        return dbapi_connection.in_transaction
+
     def is_disconnect(self, e, connection, cursor):
         return isinstance(
             e, self.dbapi.ProgrammingError
@@ -30,11 +30,13 @@ from .cursor import ResultProxy as ResultProxy
 from .interfaces import AdaptedConnection as AdaptedConnection
 from .interfaces import BindTyping as BindTyping
 from .interfaces import Compiled as Compiled
+from .interfaces import CompiledCacheStats as CompiledCacheStats
 from .interfaces import ConnectArgsType as ConnectArgsType
 from .interfaces import CreateEnginePlugin as CreateEnginePlugin
 from .interfaces import Dialect as Dialect
 from .interfaces import ExceptionContext as ExceptionContext
 from .interfaces import ExecutionContext as ExecutionContext
+from .interfaces import ExecuteStyle as ExecuteStyle
 from .interfaces import TypeCompiler as TypeCompiler
 from .mock import create_mock_engine as create_mock_engine
 from .reflection import Inspector as Inspector
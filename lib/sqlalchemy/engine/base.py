@@ -6,12 +6,18 @@
 # the MIT License: https://www.opensource.org/licenses/mit-license.php
 from __future__ import annotations
 
+import bisect
+import collections
 import contextlib
+import functools
 import sys
+import threading
+from time import perf_counter
 import typing
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Mapping
@@ -19,6 +25,7 @@ from typing import MutableMapping
 from typing import NoReturn
 from typing import Optional
 from typing import overload
+from typing import Sequence
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
@@ -26,9 +33,12 @@ from typing import Union
 
 from .interfaces import _IsolationLevel
 from .interfaces import BindTyping
+from .interfaces import CacheStats
+from .interfaces import CompiledCacheStats
 from .interfaces import ConnectionEventsTarget
 from .interfaces import DBAPICursor
 from .interfaces import ExceptionContext
+from .interfaces import ExecuteStyle
 from .interfaces import ExecutionContext
 from .util import _distill_params_20
 from .util import _distill_raw_params
@@ -66,9 +76,11 @@ if typing.TYPE_CHECKING:
     from ..sql import Executable
     from ..sql._typing import _InfoType
     from ..sql.compiler import Compiled
+    from ..sql.compiler import SQLCompiler
     from ..sql.ddl import ExecutableDDLElement
     from ..sql.ddl import SchemaDropper
     from ..sql.ddl import SchemaGenerator
+    from ..sql.elements import BindParameter
     from ..sql.functions import FunctionElement
     from ..sql.schema import DefaultGenerator
     from ..sql.schema import HasSchemaAttr
@@ -155,6 +167,11 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         self.__savepoint_seq = 0
         self.__in_begin = False
 
+        # tracks that this Connection has not used the DBAPI connection
+        # outside of a transaction which it subsequently ended, allowing
+        # the pool's reset-on-return to be skipped
+        self.__transaction_clean = connection is None
+
         self.__can_reconnect = _allow_revalidate
         self._allow_autobegin = _allow_autobegin
         self._echo = self.engine._should_log_info()
@@ -367,6 +384,19 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
             :ref:`engine_stream_results`
 
+        :param insertmanyvalues_page_size: Available on:
+          :class:`_engine.Connection`, :class:`_engine.Engine`,
+          :class:`_sql.Executable`.
+
+          Number of rows to format into an INSERT statement when the statement
+          uses "insertmanyvalues" mode, which is a paged form of bulk insert
+          that is used for many backends when using :term:`executemany`
+          execution typically in conjunction with RETURNING. Defaults to 1000.
+          May also be modified on a per-engine basis using the
+          :paramref:`_sa.create_engine.insertmanyvalues_page_size` parameter.
+
+          .. versionadded:: 2.0
+
         :param schema_translate_map: Available on: :class:`_engine.Connection`,
           :class:`_engine.Engine`, :class:`_sql.Executable`.
 
@@ -463,6 +493,9 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
         """
 
+        # the DBAPI connection may be used directly
+        self.__transaction_clean = False
+
         if self._dbapi_connection is None:
             try:
                 return self._revalidate_connection()
@@ -855,6 +888,55 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             xid = self.engine.dialect.create_xid()
         return TwoPhaseTransaction(self, xid)
 
+    @contextlib.contextmanager
+    def pipeline(self) -> Iterator[Connection]:
+        """Return a context manager within which statements may be sent
+        to the database without waiting for the results of previous
+        statements, if supported by the dialect in use.
+
+        E.g.::
+
+            with engine.begin() as conn:
+                with conn.pipeline():
+                    conn.execute(table_one.insert(), {"id": 1})
+                    conn.execute(table_two.insert(), {"id": 2})
+                    conn.execute(table_three.update().values(x=5))
+
+        Within the block, a statement whose results aren't needed, such as
+        an INSERT without RETURNING, is sent without waiting for the
+        database to respond, and is followed by the next statement in the
+        same round trip.  Statements whose rows or rowcount are needed wait
+        for all outstanding results before returning.  As a result, an error
+        raised by a statement that was not waited upon is raised by a
+        subsequent statement within the block, or when the block ends.
+
+        The ORM makes use of this method for each connection used by the
+        unit of work flush process.
+
+        For a dialect which doesn't support pipelining, as indicated by the
+        :attr:`.Dialect.supports_pipeline` attribute, this method has no
+        effect, and statements are invoked normally.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`psycopg_pipeline`
+
+        """
+        if not self.dialect.supports_pipeline:
+            yield self
+            return
+
+        dbapi_connection = self.connection
+        try:
+            with self.dialect.do_pipeline(dbapi_connection):
+                yield self
+        except self.dialect.loaded_dbapi.Error as err:
+            # raised for a statement that was not waited upon, when the end
+            # of the block waits for all outstanding results
+            self._handle_dbapi_exception(err, None, None, None, None)
+
     def commit(self) -> None:
         """Commit the transaction that is currently in progress.
 
@@ -983,6 +1065,8 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         if self._has_events or self.engine._has_events:
             self.dispatch.begin(self)
 
+        self.__transaction_clean = False
+
         try:
             self.engine.dialect.do_begin(self.connection)
         except BaseException as e:
@@ -1007,6 +1091,8 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 self.engine.dialect.do_rollback(self.connection)
             except BaseException as e:
                 self._handle_dbapi_exception(e, None, None, None, None)
+            else:
+                self.__transaction_clean = True
 
     def _commit_impl(self) -> None:
 
@@ -1025,6 +1111,8 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             self.engine.dialect.do_commit(self.connection)
         except BaseException as e:
             self._handle_dbapi_exception(e, None, None, None, None)
+        else:
+            self.__transaction_clean = True
 
     def _savepoint_impl(self, name: Optional[str] = None) -> str:
         if self._has_events or self.engine._has_events:
@@ -1132,6 +1220,11 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             # pool connection without doing an additional reset
             if skip_reset:
                 cast("_ConnectionFairy", conn)._close_no_reset()
+            elif self.__transaction_clean:
+                # no transaction was begun since the last commit or
+                # rollback; the pool may skip the reset if it knows the
+                # connection was also clean at checkout
+                cast("_ConnectionFairy", conn)._close_no_transaction()
             else:
                 conn.close()
 
@@ -1349,6 +1442,8 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         else:
             event_multiparams = event_params = None
 
+        self.__transaction_clean = False
+
         try:
             conn = self._dbapi_connection
             if conn is None:
@@ -1497,32 +1592,10 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 elem, distilled_parameters, execution_options
             )
 
-        if distilled_parameters:
-            # ensure we don't retain a link to the view object for keys()
-            # which links to the values, which we don't want to cache
-            keys = sorted(distilled_parameters[0])
-            for_executemany = len(distilled_parameters) > 1
-        else:
-            keys = []
-            for_executemany = False
-
         dialect = self.dialect
 
-        schema_translate_map = execution_options.get(
-            "schema_translate_map", None
-        )
-
-        compiled_cache: Optional[_CompiledCacheType] = execution_options.get(
-            "compiled_cache", self.engine._compiled_cache
-        )
-
-        compiled_sql, extracted_params, cache_hit = elem._compile_w_cache(
-            dialect=dialect,
-            compiled_cache=compiled_cache,
-            column_keys=keys,
-            for_executemany=for_executemany,
-            schema_translate_map=schema_translate_map,
-            linting=self.dialect.compiler_linting | compiler.WARN_LINTING,
+        compiled_sql, extracted_params, cache_hit = self._compile_w_cache(
+            elem, distilled_parameters, execution_options
         )
         ret = self._execute_context(
             dialect,
@@ -1547,6 +1620,62 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             )
         return ret
 
+    def _compile_w_cache(
+        self,
+        elem: Executable,
+        distilled_parameters: _CoreMultiExecuteParams,
+        execution_options: _ExecuteOptionsParameter,
+    ) -> Tuple[Compiled, Optional[Sequence[BindParameter[Any]]], CacheStats]:
+        """Compile a sql.ClauseElement for execution, making use of the
+        compiled cache."""
+
+        if distilled_parameters:
+            # ensure we don't retain a link to the view object for keys()
+            # which links to the values, which we don't want to cache
+            keys = sorted(distilled_parameters[0])
+            for_executemany = len(distilled_parameters) > 1
+        else:
+            keys = []
+            for_executemany = False
+
+        schema_translate_map = execution_options.get(
+            "schema_translate_map", None
+        )
+
+        compiled_cache: Optional[_CompiledCacheType] = execution_options.get(
+            "compiled_cache", self.engine._compiled_cache
+        )
+
+        start = perf_counter()
+        compiled_sql, extracted_params, cache_hit = elem._compile_w_cache(
+            dialect=self.dialect,
+            compiled_cache=compiled_cache,
+            column_keys=keys,
+            for_executemany=for_executemany,
+            schema_translate_map=schema_translate_map,
+            linting=self.dialect.compiler_linting | compiler.WARN_LINTING,
+        )
+
+        stats = self.engine._compiled_cache_stats
+        if cache_hit is _CACHE_HIT:
+            stats.hits += 1
+        else:
+            compile_time = perf_counter() - start
+            stats._record_compile(compiled_sql, cache_hit, compile_time)
+
+            if (
+                cache_hit is _CACHE_MISS or cache_hit is _NO_CACHE_KEY
+            ) and (self._has_events or self.engine._has_events):
+                self.dispatch.compiled_cache_miss(
+                    self,
+                    elem,
+                    compiled_sql,
+                    cache_hit is _CACHE_MISS,
+                    compile_time,
+                )
+
+        return compiled_sql, extracted_params, cache_hit
+
     def _execute_compiled(
         self,
         compiled: Compiled,
@@ -1713,9 +1842,17 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
         if self._transaction is None:
             self._autobegin()
+            if self._transaction is None:
+                # executing without autobegin
+                self.__transaction_clean = False
 
         context.pre_exec()
 
+        if context.execute_style is ExecuteStyle.INSERTMANYVALUES:
+            return self._exec_insertmany_context(dialect, context)
+        elif context._split_batches is not None:
+            return self._exec_split_context(dialect, context)
+
         if dialect.bind_typing is BindTyping.SETINPUTSIZES:
             context._set_input_sizes()
 
@@ -1744,26 +1881,7 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 )
 
         if self._echo:
-
-            self._log_info(str_statement)
-
-            stats = context._get_cache_stats()
-
-            if not self.engine.hide_parameters:
-                self._log_info(
-                    "[%s] %r",
-                    stats,
-                    sql_util._repr_params(
-                        effective_parameters,
-                        batches=10,
-                        ismulti=context.executemany,
-                    ),
-                )
-            else:
-                self._log_info(
-                    "[%s] [SQL parameters hidden due to hide_parameters=True]"
-                    % (stats,)
-                )
+            self._log_execute(context, str_statement, effective_parameters)
 
         evt_handled: bool = False
         try:
@@ -1835,6 +1953,388 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
         return result
 
+    def _log_execute(
+        self,
+        context: ExecutionContext,
+        str_statement: str,
+        effective_parameters: Optional[_AnyExecuteParams],
+    ) -> None:
+        self._log_info(str_statement)
+
+        stats = context._get_cache_stats()
+
+        if not self.engine.hide_parameters:
+            self._log_info(
+                "[%s] %r",
+                stats,
+                sql_util._repr_params(
+                    effective_parameters,
+                    batches=10,
+                    ismulti=context.executemany,
+                ),
+            )
+        else:
+            self._log_info(
+                "[%s] [SQL parameters hidden due to hide_parameters=True]"
+                % (stats,)
+            )
+
+    def _prepare_native_execute(
+        self,
+        elem: Executable,
+        distilled_parameters: _CoreMultiExecuteParams,
+        execution_options: _ExecuteOptionsParameter,
+    ) -> Union[
+        None,
+        Tuple[ExecutionContext, Optional[_DBAPISingleExecuteParams]],
+        Callable[[], CursorResult[Any]],
+    ]:
+        """Prepare a sql.ClauseElement object for execution by the
+        dialect's ``_do_execute_async()`` coroutine, rather than within
+        a greenlet.
+
+        This is used by the asyncio extension for the common case of a
+        single statement execution with no events.  Returns None, having
+        done nothing, if the statement needs to be executed by
+        :meth:`.Connection._execute_clauseelement` instead; this is
+        decided before the compiled cache is consulted.  Otherwise returns
+        the execution context and the parameters to be passed to the
+        cursor, and the statement is completed by
+        :meth:`.Connection._finish_native_execute`.
+
+        Once the statement has been compiled, the remaining cases which
+        can't be executed natively, such as pre-executed defaults or a
+        statement that is split into batches, return a callable to be
+        run within a greenlet, which continues the execution using the
+        statement already compiled.
+
+        """
+        dialect = self.dialect
+
+        # a single parameter set without server side cursors will always
+        # use ExecuteStyle.EXECUTE with a plain cursor
+        if (
+            self._dbapi_connection is None
+            or self._has_events
+            or self.engine._has_events
+            or dialect._has_events
+            or dialect.server_side_cursors
+            or len(distilled_parameters) > 1
+            or (
+                self._trans_context_manager is not None
+                and not self._trans_context_manager._transaction_is_active()
+            )
+            or (
+                self._transaction is not None
+                and not self._transaction.is_active
+            )
+            or (
+                self._nested_transaction is not None
+                and not self._nested_transaction.is_active
+            )
+        ):
+            return None
+
+        execution_options = elem._execution_options.merge_with(
+            self._execution_options, execution_options
+        )
+        if execution_options.get("stream_results", False):
+            return None
+
+        compiled_sql, extracted_params, cache_hit = self._compile_w_cache(
+            elem, distilled_parameters, execution_options
+        )
+
+        # defaults that are pre-executed may themselves invoke SQL
+        if isinstance(compiled_sql, compiler.SQLCompiler) and (
+            compiled_sql.insert_prefetch or compiled_sql.update_prefetch
+        ):
+            return functools.partial(
+                self._execute_context,
+                dialect,
+                dialect.execution_ctx_cls._init_compiled,
+                compiled_sql,
+                distilled_parameters,
+                execution_options,
+                compiled_sql,
+                distilled_parameters,
+                elem,
+                extracted_params,
+                cache_hit=cache_hit,
+            )
+
+        try:
+            context = dialect.execution_ctx_cls._init_compiled(
+                dialect,
+                self,
+                self._dbapi_connection,
+                execution_options,
+                compiled_sql,
+                distilled_parameters,
+                elem,
+                extracted_params,
+                cache_hit=cache_hit,
+            )
+        except (exc.PendingRollbackError, exc.ResourceClosedError):
+            raise
+        except BaseException as e:
+            # reported as in _execute_context(), within a greenlet as
+            # invalidating the connection may need to await
+            return functools.partial(
+                self._handle_native_execute_error,
+                e,
+                str(compiled_sql),
+                distilled_parameters,
+                None,
+            )
+
+        if self._transaction is None:
+            self._autobegin()
+            if self._transaction is None:
+                # executing without autobegin
+                self.__transaction_clean = False
+
+        context.pre_exec()
+
+        if context._split_batches is not None:
+            return functools.partial(
+                self._exec_split_context, dialect, context
+            )
+
+        if dialect.bind_typing is BindTyping.SETINPUTSIZES:
+            context._set_input_sizes()
+
+        effective_parameters: Optional[_DBAPISingleExecuteParams]
+        if not context.parameters[0] and context.no_parameters:
+            effective_parameters = None
+        else:
+            effective_parameters = context.parameters[0]
+
+        if self._echo:
+            self._log_execute(
+                context, context.statement, context.parameters[0]
+            )
+
+        return context, effective_parameters
+
+    def _finish_native_execute(
+        self, context: ExecutionContext
+    ) -> CursorResult[Any]:
+        """Complete a statement prepared by
+        :meth:`.Connection._prepare_native_execute`, once the dialect's
+        ``_do_execute_async()`` coroutine has executed it."""
+
+        context.post_exec()
+
+        return context._setup_result_proxy()
+
+    def _handle_native_execute_error(
+        self,
+        e: BaseException,
+        statement: Optional[str],
+        parameters: Optional[_AnyExecuteParams],
+        context: Optional[ExecutionContext],
+    ) -> NoReturn:
+        """Handle an error raised while preparing or executing a statement
+        by way of :meth:`.Connection._prepare_native_execute`.
+
+        This is run within a greenlet, as invalidating the connection may
+        need to await.
+
+        """
+        try:
+            # establish the exception as the one being handled within
+            # the greenlet
+            raise e
+        except BaseException:
+            self._handle_dbapi_exception(
+                e,
+                statement,
+                parameters,
+                context.cursor if context is not None else None,
+                context,
+            )
+
+    def _exec_insertmany_context(
+        self,
+        dialect: Dialect,
+        context: ExecutionContext,
+    ) -> CursorResult[Any]:
+        """continue the _execute_context() method for an "insertmanyvalues"
+        operation, which will invoke DBAPI
+        cursor.execute() one or more times with individual log and
+        event hook calls.
+
+        """
+
+        compiled = cast("SQLCompiler", context.compiled)
+
+        page_size = context.execution_options.get(
+            "insertmanyvalues_page_size", dialect.insertmanyvalues_page_size
+        )
+
+        return self._exec_batched_context(
+            dialect,
+            context,
+            compiled._deliver_insertmanyvalues_batches(
+                context.statement,
+                context.parameters,
+                page_size,
+                dialect.insertmanyvalues_max_parameters,
+            ),
+            "insertmanyvalues",
+        )
+
+    def _exec_split_context(
+        self,
+        dialect: Dialect,
+        context: ExecutionContext,
+    ) -> CursorResult[Any]:
+        """continue the _execute_context() method for a statement that
+        was split into several statements in order to stay within the
+        dialect's limits on bound parameters or IN list elements.
+
+        """
+        return self._exec_batched_context(
+            dialect,
+            context,
+            context._iter_split_batches(),
+            "split for parameter limits",
+        )
+
+    def _exec_batched_context(
+        self,
+        dialect: Dialect,
+        context: ExecutionContext,
+        batches: Iterable[Tuple[str, Any, int, int]],
+        batch_label: str,
+    ) -> CursorResult[Any]:
+        """invoke DBAPI cursor.execute() for each of the given statement
+        batches with individual log and event hook calls, assembling
+        fetched rows and rowcounts into a single result.
+
+        """
+
+        cursor = context.cursor
+
+        engine_events = self._has_events or self.engine._has_events
+        if self.dialect._has_events:
+            do_execute_dispatch: Iterable[
+                Any
+            ] = self.dialect.dispatch.do_execute
+        else:
+            do_execute_dispatch = ()
+
+        if self._echo:
+            stats = context._get_cache_stats() + " (%s)" % batch_label
+
+        rows: List[Any] = []
+        rowcount: Optional[int] = 0
+
+        for (
+            sub_stmt,
+            sub_params,
+            batchnum,
+            total_batches,
+        ) in batches:
+
+            if engine_events:
+                for fn in self.dispatch.before_cursor_execute:
+                    sub_stmt, sub_params = fn(
+                        self,
+                        cursor,
+                        sub_stmt,
+                        sub_params,
+                        context,
+                        False,
+                    )
+
+            if self._echo:
+                self._log_info(sub_stmt)
+
+                if total_batches > 1:
+                    batch_stats = " batch %d of %d" % (
+                        batchnum,
+                        total_batches,
+                    )
+                else:
+                    batch_stats = ""
+
+                if not self.engine.hide_parameters:
+                    self._log_info(
+                        "[%s%s] %r",
+                        stats,
+                        batch_stats,
+                        sql_util._repr_params(
+                            sub_params,
+                            batches=10,
+                            ismulti=False,
+                        ),
+                    )
+                else:
+                    self._log_info(
+                        "[%s%s] [SQL parameters hidden due to "
+                        "hide_parameters=True]" % (stats, batch_stats)
+                    )
+
+            try:
+                for fn in do_execute_dispatch:
+                    if fn(
+                        cursor,
+                        sub_stmt,
+                        sub_params,
+                        context,
+                    ):
+                        break
+                else:
+                    dialect.do_execute(cursor, sub_stmt, sub_params, context)
+
+                if engine_events:
+                    self.dispatch.after_cursor_execute(
+                        self,
+                        cursor,
+                        sub_stmt,
+                        sub_params,
+                        context,
+                        False,
+                    )
+
+                if cursor.description is not None:
+                    rows.extend(cursor.fetchall())
+
+                if rowcount is not None:
+                    if cursor.rowcount < 0:
+                        rowcount = None
+                    else:
+                        rowcount += cursor.rowcount
+
+            except BaseException as e:
+                self._handle_dbapi_exception(
+                    e,
+                    sub_stmt,
+                    sub_params,
+                    cursor,
+                    context,
+                )
+
+        try:
+            context._insertmanyvalues_rows = rows
+
+            context.post_exec()
+
+            # post_exec() may have established a rowcount from the
+            # final batch only
+            if rowcount is not None:
+                context._rowcount = rowcount
+
+            result = context._setup_result_proxy()
+        except BaseException as e:
+            self._handle_dbapi_exception(
+                e, context.statement, context.parameters, cursor, context
+            )
+
+        return result
+
     def _cursor_execute(
         self,
         cursor: DBAPICursor,
@@ -2551,6 +3051,101 @@ class TwoPhaseTransaction(RootTransaction):
         self.connection._commit_twophase_impl(self.xid, self._is_prepared)
 
 
+_CACHE_HIT = CacheStats.CACHE_HIT
+_CACHE_MISS = CacheStats.CACHE_MISS
+_NO_CACHE_KEY = CacheStats.NO_CACHE_KEY
+
+
+class _CompiledCacheStatsCollector:
+    """Accumulates compiled cache statistics on behalf of an
+    :class:`_engine.Engine`.
+
+    Hits are counted without locking, so counts may be approximate when
+    many threads execute statements at once; the less frequent compile
+    path is synchronized.
+
+    """
+
+    __slots__ = (
+        "hits",
+        "misses",
+        "no_key",
+        "caching_disabled",
+        "evictions",
+        "_compile_times",
+        "_compiled_statements",
+        "_mutex",
+    )
+
+    compile_time_buckets = (
+        0.0001,
+        0.0005,
+        0.001,
+        0.005,
+        0.01,
+        0.05,
+        0.1,
+        0.5,
+        1.0,
+        float("inf"),
+    )
+
+    max_tracked_statements = 1000
+
+    def __init__(self) -> None:
+        self.hits = self.misses = self.no_key = self.caching_disabled = 0
+        self.evictions = 0
+        self._compile_times = [0] * len(self.compile_time_buckets)
+        self._compiled_statements: typing.Counter[str] = (
+            collections.Counter()
+        )
+        self._mutex = threading.Lock()
+
+    def _record_compile(
+        self, compiled: Compiled, cache_hit: CacheStats, compile_time: float
+    ) -> None:
+        with self._mutex:
+            if cache_hit is _CACHE_MISS:
+                self.misses += 1
+            elif cache_hit is _NO_CACHE_KEY:
+                self.no_key += 1
+            else:
+                self.caching_disabled += 1
+                return
+
+            self._compile_times[
+                bisect.bisect_left(self.compile_time_buckets, compile_time)
+            ] += 1
+
+            compiled_statements = self._compiled_statements
+            compiled_statements[compiled.string] += 1
+            if len(compiled_statements) > self.max_tracked_statements:
+                # keep the least frequently compiled statements from
+                # accumulating without bound
+                for key, _ in compiled_statements.most_common()[
+                    self.max_tracked_statements // 2 :
+                ]:
+                    del compiled_statements[key]
+
+    def _snapshot(
+        self, cache: Optional[_CompiledCacheType], top: int
+    ) -> CompiledCacheStats:
+        with self._mutex:
+            return CompiledCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                no_key=self.no_key,
+                caching_disabled=self.caching_disabled,
+                evictions=self.evictions,
+                size=len(cache) if cache is not None else 0,
+                capacity=getattr(cache, "capacity", None),
+                compile_time_histogram=tuple(
+                    zip(self.compile_time_buckets, self._compile_times)
+                ),
+                top_misses=tuple(self._compiled_statements.most_common(top)),
+            )
+
+
 class Engine(
     ConnectionEventsTarget, log.Identified, inspection.Inspectable["Inspector"]
 ):
@@ -2577,6 +3172,7 @@ class Engine(
     dispatch: dispatcher[ConnectionEventsTarget]
 
     _compiled_cache: Optional[_CompiledCacheType]
+    _compiled_cache_stats: _CompiledCacheStatsCollector
 
     _execution_options: _ExecuteOptions = _EMPTY_EXECUTION_OPTS
     _has_events: bool = False
@@ -2616,11 +3212,13 @@ class Engine(
             )
         else:
             self._compiled_cache = None
+        self._compiled_cache_stats = _CompiledCacheStatsCollector()
         log.instance_logger(self, echoflag=echo)
         if execution_options:
             self.update_execution_options(**execution_options)
 
     def _lru_size_alert(self, cache: util.LRUCache[Any, Any]) -> None:
+        self._compiled_cache_stats.evictions += len(cache) - cache.capacity
         if self._should_log_info:
             self.logger.info(
                 "Compiled cache size pruning from %d items to %d.  "
@@ -2653,6 +3251,40 @@ class Engine(
         if self._compiled_cache:
             self._compiled_cache.clear()
 
+    def compiled_cache_stats(self, top: int = 10) -> CompiledCacheStats:
+        """Return statistics for the compiled statement cache of this
+        :class:`_engine.Engine`.
+
+        The returned :class:`_engine.CompiledCacheStats` includes the number
+        of statement executions that were served from the cache, that
+        compiled and cached a new statement, or that compiled a statement
+        which can't be cached, as well as the number of cache entries
+        evicted due to size, a histogram of compilation times and the
+        statements that were most frequently compiled::
+
+            stats = engine.compiled_cache_stats()
+            print(f"hit ratio: {stats.hits / (stats.hits + stats.misses)}")
+            for sql, count in stats.top_misses:
+                print(count, sql)
+
+        Executions which use a cache passed via the
+        :paramref:`.Connection.execution_options.compiled_cache` option are
+        counted as well.  See the
+        :meth:`_events.ConnectionEvents.compiled_cache_miss` event to
+        receive each compilation as it occurs.
+
+        .. versionadded:: 2.0
+
+        :param top: number of entries to include in
+         :attr:`_engine.CompiledCacheStats.top_misses`.
+
+        .. seealso::
+
+            :ref:`sql_caching`
+
+        """
+        return self._compiled_cache_stats._snapshot(self._compiled_cache, top)
+
     def update_execution_options(self, **opt: Any) -> None:
         r"""Update the default execution_options dictionary
         of this :class:`_engine.Engine`.
@@ -2828,8 +3460,77 @@ class Engine(
         if close:
             self.pool.dispose()
         self.pool = self.pool.recreate()
+        self.pool.start()
         self.dispatch.engine_disposed(self)
 
+    def precompile(
+        self,
+        statement: Executable,
+        parameters: Optional[_CoreAnyExecuteParams] = None,
+        *,
+        execution_options: Optional[_ExecuteOptionsParameter] = None,
+    ) -> None:
+        """Compile a statement into this :class:`_engine.Engine`'s compiled
+        cache, without executing it.
+
+        The statement is compiled in the same way as it would be by
+        :meth:`_engine.Connection.execute` given the same parameters and
+        execution options, so that a subsequent execution of an equivalent
+        statement will find it in the cache.  The parameter values
+        themselves are not used; only their keys, and whether a single
+        parameter set or a list of them is passed, affect the form of the
+        compiled statement.
+
+        The primary use is to warm the cache in the parent process of a
+        pre-forking server, so that child processes start out with all
+        commonly used statements already compiled::
+
+            engine = create_engine("postgresql+psycopg2://...")
+
+            for stmt in commonly_used_statements():
+                engine.precompile(stmt)
+
+            # the compiled cache is inherited by child processes
+            engine.dispose()
+            start_worker_processes()
+
+        A connection is procured in order to ensure the dialect has been
+        initialized with the database's server version information and
+        capabilities, which may affect how statements are compiled.
+
+        Statements which are altered by
+        :meth:`_events.ConnectionEvents.before_execute` hooks are compiled
+        as given, as these hooks are not invoked.
+
+        .. versionadded:: 2.0
+
+        :param statement: statement to compile, such as a :func:`_sql.select`,
+         :func:`_sql.insert` or :func:`_sql.text` construct.
+
+        :param parameters: parameters as would be passed to
+         :meth:`_engine.Connection.execute`.
+
+        :param execution_options: execution options as would be passed to
+         :meth:`_engine.Connection.execute`; options that affect compilation
+         include ``schema_translate_map`` and ``compiled_cache``.
+
+        .. seealso::
+
+            :ref:`pooling_multiprocessing`
+
+        """
+        if not hasattr(statement, "_compile_w_cache"):
+            raise exc.ObjectNotExecutableError(statement)
+
+        with self.connect() as conn:
+            conn._compile_w_cache(
+                statement,
+                _distill_params_20(parameters),
+                statement._execution_options.merge_with(
+                    conn._execution_options, execution_options
+                ),
+            )
+
     @contextlib.contextmanager
     def _optional_conn_ctx_manager(
         self, connection: Optional[Connection] = None
@@ -2935,6 +3636,7 @@ class OptionEngineMixin(log.Identified):
 
     dispatch: dispatcher[ConnectionEventsTarget]
     _compiled_cache: Optional[_CompiledCacheType]
+    _compiled_cache_stats: _CompiledCacheStatsCollector
     dialect: Dialect
     pool: Pool
     url: URL
@@ -2950,6 +3652,7 @@ class OptionEngineMixin(log.Identified):
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
         self._compiled_cache = proxied._compiled_cache
+        self._compiled_cache_stats = proxied._compiled_cache_stats
         self.hide_parameters = proxied.hide_parameters
         log.instance_logger(self, echoflag=self.echo)
 
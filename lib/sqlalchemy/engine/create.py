@@ -41,6 +41,7 @@ if typing.TYPE_CHECKING:
     from ..pool import _CreatorWRecFnType
     from ..pool import _ResetStyleArgType
     from ..pool import Pool
+    from ..pool import PoolMetrics
     from ..util.typing import Literal
 
 
@@ -58,6 +59,7 @@ def create_engine(
     future: Literal[True],
     hide_parameters: bool = ...,
     implicit_returning: bool = ...,
+    insertmanyvalues_page_size: int = ...,
     isolation_level: _IsolationLevel = ...,
     json_deserializer: Callable[..., Any] = ...,
     json_serializer: Callable[..., Any] = ...,
@@ -70,10 +72,17 @@ def create_engine(
     paramstyle: Optional[_ParamStyle] = ...,
     pool: Optional[Pool] = ...,
     poolclass: Optional[Type[Pool]] = ...,
+    pool_idle_timeout: float = ...,
     pool_logging_name: str = ...,
+    pool_maintenance_interval: float = ...,
+    pool_max_connecting: Optional[int] = ...,
+    pool_metrics: Union[bool, PoolMetrics] = ...,
+    pool_min_idle: int = ...,
     pool_pre_ping: bool = ...,
+    pool_pre_warm: bool = ...,
     pool_size: int = ...,
     pool_recycle: int = ...,
+    pool_recycle_jitter: float = ...,
     pool_reset_on_return: Optional[_ResetStyleArgType] = ...,
     pool_timeout: float = ...,
     pool_use_lifo: bool = ...,
@@ -279,6 +288,20 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
            should **always be set to True**.  Some SQLAlchemy features will
            fail to function properly if this flag is set to ``False``.
 
+    :param insertmanyvalues_page_size: number of rows to format into an
+        INSERT statement when the statement uses "insertmanyvalues" mode,
+        which is a paged form of bulk insert that is used for many backends
+        when using :term:`executemany` execution typically in conjunction
+        with RETURNING.  Defaults to 1000, but may also be subject to
+        dialect-specific limiting factors which may override this value on a
+        per-statement basis.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :paramref:`_engine.Connection.execution_options.insertmanyvalues_page_size`
+
     :param isolation_level: optional string name of an isolation level
         which will be set on all new connections unconditionally.
         Isolation levels are typically some subset of the string names
@@ -408,6 +431,17 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
         instantiate the pool in this case, you just indicate what type
         of pool to be used.
 
+    :param pool_idle_timeout=-1: number of seconds after which an idle
+        connection is closed by the background maintenance task of
+        :class:`~sqlalchemy.pool.QueuePool`.  Requires that
+        :paramref:`_sa.create_engine.pool_maintenance_interval` is set.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_maintenance`
+
     :param pool_logging_name:  String identifier which will be used within
        the "name" field of logging records generated within the
        "sqlalchemy.pool" logger. Defaults to a hexstring of the object's
@@ -418,6 +452,51 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
             :ref:`dbengine_logging` - further detail on how to configure
             logging.
 
+    :param pool_maintenance_interval=-1: number of seconds between runs
+        of the background maintenance task of
+        :class:`~sqlalchemy.pool.QueuePool`, which pre-warms the pool,
+        keeps :paramref:`_sa.create_engine.pool_min_idle` connections
+        available, closes idle connections and recycles aged connections
+        ahead of checkout.  Defaults to -1, indicating no background
+        maintenance.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_maintenance`
+
+    :param pool_max_connecting=None: the maximum number of new
+        connections :class:`~sqlalchemy.pool.QueuePool` will establish at
+        the same time; checkouts which would open additional connections
+        instead wait for a connection to be returned or for a connection
+        attempt to complete.  Defaults to None, meaning no limit.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_max_connecting`
+
+    :param pool_metrics=False: if True, the connection pool collects
+        statistics on checkout wait times, connection hold times, connect
+        times, overflow, timeouts and invalidations, available from
+        :attr:`_pool.Pool.metrics`.  A :class:`.PoolMetrics` object may
+        also be passed in order to share statistics among engines.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_metrics`
+
+    :param pool_min_idle=0: number of idle connections the background
+        maintenance task of :class:`~sqlalchemy.pool.QueuePool` keeps
+        open.  Requires that
+        :paramref:`_sa.create_engine.pool_maintenance_interval` is set.
+
+        .. versionadded:: 2.0
+
     :param pool_pre_ping: boolean, if True will enable the connection pool
         "pre-ping" feature that tests connections for liveness upon
         each checkout.
@@ -428,6 +507,13 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
 
             :ref:`pool_disconnects_pessimistic`
 
+    :param pool_pre_warm=False: if True, the background maintenance task
+        of :class:`~sqlalchemy.pool.QueuePool` opens ``pool_size``
+        connections as soon as the engine is created.  Requires that
+        :paramref:`_sa.create_engine.pool_maintenance_interval` is set.
+
+        .. versionadded:: 2.0
+
     :param pool_size=5: the number of connections to keep open
         inside the connection pool. This used with
         :class:`~sqlalchemy.pool.QueuePool` as
@@ -449,6 +535,14 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
 
             :ref:`pool_setting_recycle`
 
+    :param pool_recycle_jitter=0: number of seconds up to which the
+        background maintenance task of :class:`~sqlalchemy.pool.QueuePool`
+        may recycle a connection ahead of
+        :paramref:`_sa.create_engine.pool_recycle`, so that connections
+        opened together are not all replaced at once.
+
+        .. versionadded:: 2.0
+
     :param pool_reset_on_return='rollback': set the
         :paramref:`_pool.Pool.reset_on_return` parameter of the underlying
         :class:`_pool.Pool` object, which can be set to the values
@@ -635,6 +729,13 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
             "reset_on_return": "pool_reset_on_return",
             "pre_ping": "pool_pre_ping",
             "use_lifo": "pool_use_lifo",
+            "maintenance_interval": "pool_maintenance_interval",
+            "min_idle": "pool_min_idle",
+            "idle_timeout": "pool_idle_timeout",
+            "pre_warm": "pool_pre_warm",
+            "recycle_jitter": "pool_recycle_jitter",
+            "metrics": "pool_metrics",
+            "max_connecting": "pool_max_connecting",
         }
         for k in util.get_cls_kwargs(poolclass):
             tk = translate.get(k, k)
@@ -747,6 +848,9 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
     for plugin in plugins:
         plugin.engine_created(engine)
 
+    # start background pool work only once all event listeners are set up
+    pool.start()
+
     return engine
 
 
@@ -12,8 +12,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import collections
 import functools
+import itertools
+import queue
+import sys
+import threading
 import typing
 from typing import Any
 from typing import cast
@@ -28,6 +33,7 @@ from typing import Tuple
 from typing import TYPE_CHECKING
 from typing import TypeVar
 from typing import Union
+import weakref
 
 from .result import MergedResult
 from .result import Result
@@ -48,6 +54,9 @@ from ..sql.compiler import RM_RENDERED_NAME
 from ..sql.compiler import RM_TYPE
 from ..sql.type_api import TypeEngine
 from ..util import compat
+from ..util.concurrency import await_only
+from ..util.concurrency import greenlet_spawn
+from ..util.concurrency import in_greenlet
 from ..util.typing import Literal
 
 _UNPICKLED = util.symbol("unpickled")
@@ -800,6 +809,15 @@ class ResultFetchStrategy:
     ) -> None:
         return
 
+    def capped_fetch_size(self, size: int) -> int:
+        """Return the given number of rows to be fetched, reduced where
+        the strategy limits the size of its buffer in bytes.
+
+        A size less than one indicates all remaining rows.
+
+        """
+        return size
+
     def fetchone(
         self,
         result: CursorResult[Any],
@@ -997,6 +1015,21 @@ class CursorFetchStrategy(ResultFetchStrategy):
 _DEFAULT_FETCH = CursorFetchStrategy()
 
 
+def _estimate_row_bytes(rows: Sequence[Any]) -> int:
+    """Estimate the average size in bytes of the given DBAPI rows.
+
+    The estimate is based on ``sys.getsizeof()`` of each row and of its
+    values, for a sample of up to ten of the rows.
+
+    """
+    step = max(1, len(rows) // 10)
+    total = count = 0
+    for row in itertools.islice(rows, 0, None, step):
+        total += sys.getsizeof(row) + sum(map(sys.getsizeof, row))
+        count += 1
+    return total // count if count else 0
+
+
 class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
     """A cursor fetch strategy with row buffering behavior.
 
@@ -1018,14 +1051,31 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
                 stream_results=True, max_row_buffer=50
                 ).execute(text("select * from table"))
 
+    The ``max_buffer_bytes`` execution option additionally limits the
+    number of rows buffered at once based on the estimated size of the
+    rows most recently fetched, so that a buffer of wide rows stays within
+    the given number of bytes.
+
     .. versionadded:: 1.4 ``max_row_buffer`` may now exceed 1000 rows.
 
+    .. versionadded:: 2.0 Added ``max_buffer_bytes``.
+
     .. seealso::
 
         :ref:`psycopg2_execution_options`
+
+        :ref:`engine_stream_buffer_bytes`
     """
 
-    __slots__ = ("_max_row_buffer", "_rowbuffer", "_bufsize", "_growth_factor")
+    __slots__ = (
+        "_max_row_buffer",
+        "_rowbuffer",
+        "_bufsize",
+        "_growth_factor",
+        "_max_buffer_bytes",
+        "_row_size",
+        "_peak_bytes",
+    )
 
     def __init__(
         self,
@@ -1036,6 +1086,7 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
     ):
 
         self._max_row_buffer = execution_options.get("max_row_buffer", 1000)
+        self._max_buffer_bytes = execution_options.get("max_buffer_bytes")
 
         if initial_buffer is not None:
             self._rowbuffer = initial_buffer
@@ -1048,6 +1099,10 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
         else:
             self._bufsize = self._max_row_buffer
 
+        if self._max_buffer_bytes:
+            self._row_size = _estimate_row_bytes(self._rowbuffer)
+            self._peak_bytes = self._row_size * len(self._rowbuffer)
+
     @classmethod
     def create(cls, result):
         return BufferedRowCursorFetchStrategy(
@@ -1055,10 +1110,30 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
             result.context.execution_options,
         )
 
+    def _measure(self, result, new_rows, buffered):
+        """Update the estimated row size from newly fetched rows, and
+        the peak size of the buffer given the number of rows now
+        buffered."""
+
+        if new_rows:
+            self._row_size = _estimate_row_bytes(new_rows)
+        nbytes = self._row_size * buffered
+        if nbytes > self._peak_bytes:
+            self._peak_bytes = nbytes
+        result.context._peak_buffered_bytes = self._peak_bytes
+
+    def capped_fetch_size(self, size):
+        if self._max_buffer_bytes and self._row_size:
+            limit = max(1, self._max_buffer_bytes // self._row_size)
+            if size < 1 or size > limit:
+                return limit
+        return size
+
     def _buffer_rows(self, result, dbapi_cursor):
         """this is currently used only by fetchone()."""
 
-        size = self._bufsize
+        size = self.capped_fetch_size(self._bufsize)
+
         try:
             if size < 1:
                 new_rows = dbapi_cursor.fetchall()
@@ -1067,6 +1142,9 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
         except BaseException as e:
             self.handle_exception(result, dbapi_cursor, e)
 
+        if self._max_buffer_bytes:
+            self._measure(result, new_rows, len(new_rows))
+
         if not new_rows:
             return
         self._rowbuffer = collections.deque(new_rows)
@@ -1114,6 +1192,8 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
             except BaseException as e:
                 self.handle_exception(result, dbapi_cursor, e)
             else:
+                if self._max_buffer_bytes:
+                    self._measure(result, new, lb + len(new))
                 if not new:
                     result._soft_close()
                 else:
@@ -1126,6 +1206,8 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
     def fetchall(self, result, dbapi_cursor):
         try:
             ret = list(self._rowbuffer) + list(dbapi_cursor.fetchall())
+            if self._max_buffer_bytes:
+                self._measure(result, ret, len(ret))
             self._rowbuffer.clear()
             result._soft_close()
             return ret
@@ -1133,6 +1215,346 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
             self.handle_exception(result, dbapi_cursor, e)
 
 
+class _PrefetchCursorFetchStrategy(CursorFetchStrategy):
+    """Base for cursor fetch strategies which fetch batches of rows
+    from the DBAPI cursor ahead of the consumer.
+
+    Subclasses run a producer which calls ``cursor.fetchmany()``
+    repeatedly with the size given by :meth:`._fetch_size`, placing each
+    batch in a bounded queue; an empty batch indicates the rows are
+    exhausted, and an exception raised by the cursor is placed in the
+    queue in place of a batch.
+
+    """
+
+    __slots__ = (
+        "_rowbuffer",
+        "_bufsize",
+        "_exhausted",
+        "_max_buffer_bytes",
+        "_row_size",
+        "_peak_bytes",
+    )
+
+    def __init__(self, execution_options):
+        self._rowbuffer = collections.deque()
+        self._bufsize = execution_options.get("max_row_buffer", 1000)
+        self._exhausted = False
+        self._max_buffer_bytes = execution_options.get("max_buffer_bytes")
+        self._row_size = self._peak_bytes = 0
+
+    def capped_fetch_size(self, size):
+        if self._max_buffer_bytes and self._row_size:
+            limit = max(1, self._max_buffer_bytes // self._row_size)
+            if size < 1 or size > limit:
+                return limit
+        return size
+
+    def _fetch_size(self):
+        """Return the number of rows the producer should fetch next, where
+        a value less than one indicates all remaining rows."""
+
+        return self.capped_fetch_size(self._bufsize)
+
+    def _next_batch(self):
+        """Return the next item from the queue, waiting for the producer
+        if necessary."""
+        raise NotImplementedError()
+
+    def _stop(self):
+        """Stop the producer and wait for any fetch in progress to
+        complete, so that the cursor may be closed."""
+        raise NotImplementedError()
+
+    def _buffer_rows(self, result, dbapi_cursor):
+        if self._exhausted:
+            return False
+
+        batch = self._next_batch()
+        if isinstance(batch, BaseException):
+            self._exhausted = True
+            try:
+                raise batch
+            except BaseException as e:
+                self.handle_exception(result, dbapi_cursor, e)
+        elif not batch:
+            self._exhausted = True
+            return False
+
+        self._rowbuffer.extend(batch)
+
+        if self._max_buffer_bytes:
+            # the estimate includes batches waiting in the queue, assumed
+            # to be of the same size as this one
+            self._row_size = _estimate_row_bytes(batch)
+            nbytes = self._row_size * (
+                len(self._rowbuffer) + self._queue.qsize() * len(batch)
+            )
+            if nbytes > self._peak_bytes:
+                self._peak_bytes = nbytes
+            result.context._peak_buffered_bytes = self._peak_bytes
+        return True
+
+    def yield_per(self, result, dbapi_cursor, num):
+        self._bufsize = num
+
+    def soft_close(self, result, dbapi_cursor):
+        self._stop()
+        self._rowbuffer.clear()
+        super(_PrefetchCursorFetchStrategy, self).soft_close(
+            result, dbapi_cursor
+        )
+
+    def hard_close(self, result, dbapi_cursor):
+        self._stop()
+        self._rowbuffer.clear()
+        super(_PrefetchCursorFetchStrategy, self).hard_close(
+            result, dbapi_cursor
+        )
+
+    def fetchone(self, result, dbapi_cursor, hard_close=False):
+        if not self._rowbuffer and not self._buffer_rows(
+            result, dbapi_cursor
+        ):
+            try:
+                result._soft_close(hard=hard_close)
+            except BaseException as e:
+                self.handle_exception(result, dbapi_cursor, e)
+            return None
+        return self._rowbuffer.popleft()
+
+    def fetchmany(self, result, dbapi_cursor, size=None):
+        if size is None:
+            return self.fetchall(result, dbapi_cursor)
+
+        rowbuffer = self._rowbuffer
+        while len(rowbuffer) < size and self._buffer_rows(
+            result, dbapi_cursor
+        ):
+            pass
+
+        if len(rowbuffer) <= size:
+            ret = list(rowbuffer)
+            rowbuffer.clear()
+        else:
+            ret = [rowbuffer.popleft() for _ in range(size)]
+
+        if self._exhausted and not rowbuffer:
+            result._soft_close()
+        return ret
+
+    def fetchall(self, result, dbapi_cursor):
+        while self._buffer_rows(result, dbapi_cursor):
+            pass
+
+        ret = list(self._rowbuffer)
+        self._rowbuffer.clear()
+        result._soft_close()
+        return ret
+
+
+class AsyncPrefetchCursorFetchStrategy(_PrefetchCursorFetchStrategy):
+    """A cursor fetch strategy which fetches rows from a server side
+    cursor on a background asyncio task.
+
+    This strategy is used with asyncio dialects when the ``prefetch``
+    execution option is set along with ``stream_results``, typically
+    via :meth:`_asyncio.AsyncConnection.stream`.  The task fetches
+    batches of ``max_row_buffer`` rows, or the size given to
+    :meth:`_engine.Result.yield_per`, holding up to ``prefetch``
+    batches in a queue; when the queue is full, the task waits for
+    the consumer to catch up.  This allows the database round trip for
+    the next batch to take place while the consumer awaits on other
+    work.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`asyncio_stream_prefetch`
+
+    """
+
+    __slots__ = ("_queue", "_task", "_closing")
+
+    def __init__(self, dbapi_cursor, execution_options):
+        super(AsyncPrefetchCursorFetchStrategy, self).__init__(
+            execution_options
+        )
+        self._closing = False
+        self._queue = asyncio.Queue(execution_options["prefetch"])
+        self._task = asyncio.get_running_loop().create_task(
+            self._produce(dbapi_cursor)
+        )
+
+    async def _produce(self, dbapi_cursor):
+        queue = self._queue
+        try:
+            while True:
+                size = self._fetch_size()
+                if size < 1:
+                    batch = await greenlet_spawn(dbapi_cursor.fetchall)
+                else:
+                    batch = await greenlet_spawn(dbapi_cursor.fetchmany, size)
+                if self._closing:
+                    return
+                await queue.put(batch)
+                if not batch:
+                    return
+        except Exception as err:
+            if not self._closing:
+                await queue.put(err)
+
+    def _next_batch(self):
+        return await_only(self._queue.get())
+
+    def _stop(self):
+        task = self._task
+        if task.done():
+            return
+
+        self._closing = True
+
+        # discard waiting batches so that a producer blocked on a full
+        # queue may proceed
+        self._drain()
+
+        if in_greenlet():
+            await_only(asyncio.wait((task,)))
+            self._drain()
+        else:
+            task.cancel()
+
+    def _drain(self):
+        q = self._queue
+        while not q.empty():
+            q.get_nowait()
+
+
+class ThreadedPrefetchCursorFetchStrategy(_PrefetchCursorFetchStrategy):
+    """A cursor fetch strategy which fetches rows from a server side
+    cursor on a background thread.
+
+    This strategy is used with non-asyncio dialects when the ``prefetch``
+    execution option is set along with ``stream_results``, including
+    when using the ORM ``yield_per`` option.  A worker thread calls
+    ``cursor.fetchmany()`` for batches of ``max_row_buffer`` rows, or the
+    size given to :meth:`_engine.Result.yield_per`, holding up to
+    ``prefetch`` batches in a queue; when the queue is full, the thread
+    waits for the consumer to catch up.  For drivers which release the
+    GIL while waiting on the network and decoding rows, this allows the
+    fetching of rows to proceed in parallel with their processing in
+    Python, such as ORM object loading.
+
+    The DBAPI must allow the cursor to be used from a thread other than
+    the one which created it; the strategy is only used when the DBAPI
+    module reports a ``threadsafety`` level of 2 or greater.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`engine_stream_prefetch`
+
+    """
+
+    __slots__ = ("_queue", "_thread", "_stop_event", "__weakref__")
+
+    def __init__(self, dbapi_cursor, execution_options):
+        super(ThreadedPrefetchCursorFetchStrategy, self).__init__(
+            execution_options
+        )
+        self._queue = queue.Queue(execution_options["prefetch"])
+        self._stop_event = threading.Event()
+
+        # fetch the first row in the calling thread, as some DBAPIs
+        # don't provide cursor.description until rows are fetched
+        self._rowbuffer.extend(dbapi_cursor.fetchmany(1))
+        if self._max_buffer_bytes:
+            self._row_size = self._peak_bytes = _estimate_row_bytes(
+                self._rowbuffer
+            )
+        if not self._rowbuffer:
+            self._exhausted = True
+            self._thread = None
+            return
+
+        self._thread = threading.Thread(
+            target=_threaded_prefetch,
+            args=(
+                weakref.ref(self),
+                dbapi_cursor,
+                self._queue,
+                self._stop_event,
+            ),
+            name="sqlalchemy-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _next_batch(self):
+        return self._queue.get()
+
+    def _stop(self):
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+
+        self._stop_event.set()
+
+        # discard waiting batches so that a worker blocked on a full
+        # queue may proceed, then any batch it placed before stopping
+        self._drain()
+        thread.join()
+        self._drain()
+
+    def _drain(self):
+        q = self._queue
+        try:
+            while True:
+                q.get_nowait()
+        except queue.Empty:
+            pass
+
+
+def _threaded_prefetch(
+    strategy_ref: weakref.ref[ThreadedPrefetchCursorFetchStrategy],
+    dbapi_cursor: DBAPICursor,
+    q: queue.Queue[Any],
+    stop: threading.Event,
+) -> None:
+    def put(item: Any) -> bool:
+        # wait for room in the queue, giving up if the strategy is
+        # stopped or was garbage collected without being closed
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+            except queue.Full:
+                if strategy_ref() is None:
+                    return False
+            else:
+                return True
+        return False
+
+    try:
+        while not stop.is_set():
+            strategy = strategy_ref()
+            if strategy is None:
+                return
+            size = strategy._fetch_size()
+
+            # don't hold onto the strategy while fetching
+            del strategy
+            if size < 1:
+                batch = dbapi_cursor.fetchall()
+            else:
+                batch = dbapi_cursor.fetchmany(size)
+            if not put(batch) or not batch:
+                return
+    except BaseException as err:
+        put(err)
+
+
 class FullyBufferedCursorFetchStrategy(CursorFetchStrategy):
     """A cursor strategy that buffers rows fully upon creation.
 
@@ -1225,6 +1647,43 @@ class _NoResultMetaData(ResultMetaData):
 _NO_RESULT_METADATA = _NoResultMetaData()
 
 
+def _columnar_kind(result_column: ResultColumnsEntry) -> Optional[str]:
+    """Return the kind of value delivered by a result column, which
+    selects an array buffer for columnar fetching.
+
+    Only columns declared NOT NULL are given a kind, so that each chunk
+    of a result delivers a column in the same form.
+
+    """
+    if not any(
+        getattr(
+            obj.element if isinstance(obj, elements.Label) else obj,
+            "nullable",
+            True,
+        )
+        is False
+        for obj in result_column[RM_OBJECTS]
+    ):
+        return None
+
+    type_ = result_column[RM_TYPE]
+    if isinstance(type_, sqltypes.TypeDecorator):
+        return None
+    elif isinstance(type_, sqltypes.Integer):
+        # unsigned 64 bit integers may exceed an int64 array
+        if isinstance(type_, sqltypes.BigInteger) and getattr(
+            type_, "unsigned", False
+        ):
+            return None
+        return "int"
+    elif isinstance(type_, sqltypes.Numeric) and not type_.asdecimal:
+        return "float"
+    elif isinstance(type_, sqltypes.Boolean):
+        return "bool"
+    else:
+        return None
+
+
 SelfCursorResult = TypeVar("SelfCursorResult", bound="CursorResult[Any]")
 
 
@@ -1679,6 +2138,21 @@ class CursorResult(Result[_T]):
 
         return self.dialect.supports_sane_multi_rowcount
 
+    @util.memoized_property
+    def _columnar_kinds(self) -> Optional[Sequence[Optional[str]]]:
+        if not self.context.result_column_struct:
+            return None
+
+        result_columns, cols_are_ordered = self.context.result_column_struct[
+            0:2
+        ]
+        if not cols_are_ordered or len(result_columns) != len(
+            self._metadata._processors
+        ):
+            return None
+
+        return [_columnar_kind(rec) for rec in result_columns]
+
     @util.memoized_property
     def rowcount(self) -> int:
         """Return the 'rowcount' for this result.
@@ -1732,6 +2206,27 @@ class CursorResult(Result[_T]):
             self.cursor_strategy.handle_exception(self, self.cursor, e)
             raise  # not called
 
+    @property
+    def peak_buffered_bytes(self) -> Optional[int]:
+        """Return the largest estimated size in bytes of the rows buffered
+        at once from a server side cursor.
+
+        The value is tracked only when the ``max_buffer_bytes`` execution
+        option is used along with ``stream_results``, and is otherwise
+        ``None``; it is also ``None`` until rows are first fetched.  Sizes
+        are estimated using ``sys.getsizeof()`` of sampled rows and their
+        values, so that the memory used by nested structures such as
+        dictionaries within a value is not included.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`engine_stream_buffer_bytes`
+
+        """
+        return self.context._peak_buffered_bytes
+
     @property
     def lastrowid(self):
         """Return the 'lastrowid' accessor on the DBAPI cursor.
@@ -1815,9 +2310,17 @@ class CursorResult(Result[_T]):
     def _raw_row_iterator(self):
         return self._fetchiter_impl()
 
+    def _fetchmany_capped(self, size: int) -> Sequence[Row[Any]]:
+        return self.fetchmany(self.cursor_strategy.capped_fetch_size(size))
+
     def merge(self, *others: Result[Any]) -> MergedResult[Any]:
         merged_result = super().merge(*others)
-        setup_rowcounts = not self._metadata.returns_rows
+        # UPDATE / DELETE with RETURNING still has a meaningful rowcount
+        setup_rowcounts = (
+            not self._metadata.returns_rows
+            or self.context.isupdate
+            or self.context.isdelete
+        )
         if setup_rowcounts:
             merged_result.rowcount = sum(
                 cast("CursorResult[Any]", result).rowcount
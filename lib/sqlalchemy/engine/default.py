@@ -16,7 +16,9 @@ as the base class for their own corresponding classes.
 
 from __future__ import annotations
 
+import collections.abc as collections_abc
 import functools
+import itertools
 import random
 import re
 from time import perf_counter
@@ -25,6 +27,7 @@ from typing import Any
 from typing import Callable
 from typing import cast
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Mapping
 from typing import MutableMapping
@@ -45,6 +48,7 @@ from .interfaces import CacheStats
 from .interfaces import DBAPICursor
 from .interfaces import Dialect
 from .interfaces import ExecutionContext
+from .interfaces import ExecuteStyle
 from .. import event
 from .. import exc
 from .. import pool
@@ -57,6 +61,7 @@ from ..sql.compiler import DDLCompiler
 from ..sql.compiler import SQLCompiler
 from ..sql.elements import quoted_name
 from ..sql.schema import default_is_scalar
+from ..util.concurrency import in_greenlet
 
 if typing.TYPE_CHECKING:
     from types import ModuleType
@@ -138,8 +143,17 @@ class DefaultDialect(Dialect):
     insert_null_pk_still_autoincrements = False
     implicit_returning = False
     full_returning = False
+    favor_returning_over_lastrowid = True
     insert_executemany_returning = False
 
+    use_insertmanyvalues: bool = False
+
+    insertmanyvalues_page_size: int = 1000
+    insertmanyvalues_max_parameters = 32700
+
+    max_bind_parameters: Optional[int] = None
+    max_in_list_elements: Optional[int] = None
+
     cte_follows_insert = False
 
     supports_native_enum = False
@@ -210,6 +224,8 @@ class DefaultDialect(Dialect):
 
     supports_server_side_cursors = False
 
+    supports_pipeline = False
+
     server_side_cursors = False
 
     # extra record-level locking features (#4860)
@@ -228,6 +244,8 @@ class DefaultDialect(Dialect):
 
     is_async = False
 
+    _supports_native_async_execute = False
+
     # TODO: this is not to be part of 2.0.  implement rudimentary binary
     # literals for SQLite, PostgreSQL, MySQL only within
     # _Binary.literal_processor
@@ -265,6 +283,7 @@ class DefaultDialect(Dialect):
         # Linting.NO_LINTING constant
         compiler_linting: Linting = int(compiler.NO_LINTING),  # type: ignore
         server_side_cursors: bool = False,
+        insertmanyvalues_page_size: Optional[int] = None,
         **kwargs: Any,
     ):
         if server_side_cursors:
@@ -323,6 +342,16 @@ class DefaultDialect(Dialect):
         self.label_length = label_length
         self.compiler_linting = compiler_linting
 
+        if insertmanyvalues_page_size is not None:
+            self.insertmanyvalues_page_size = insertmanyvalues_page_size
+
+        if (
+            self.use_insertmanyvalues
+            and self.implicit_returning
+            and self.supports_multivalues_insert
+        ):
+            self.insert_executemany_returning = True
+
     @util.memoized_property
     def loaded_dbapi(self) -> ModuleType:
         if self.dbapi is None:
@@ -336,6 +365,13 @@ class DefaultDialect(Dialect):
     def _bind_typing_render_casts(self):
         return self.bind_typing is interfaces.BindTyping.RENDER_CASTS
 
+    @property
+    def _has_parameter_limits(self):
+        return (
+            self.max_bind_parameters is not None
+            or self.max_in_list_elements is not None
+        )
+
     def _ensure_has_table_connection(self, arg):
 
         if not isinstance(arg, Connection):
@@ -503,6 +539,71 @@ class DefaultDialect(Dialect):
         else:
             return False
 
+    def _default_multi_reflect(
+        self,
+        single_tbl_method,
+        connection,
+        schema=None,
+        filter_names=None,
+        **kw,
+    ):
+        """Default implementation of the ``get_multi_*`` methods, which
+        invokes the given single-table method for each table name.
+
+        Tables that raise :class:`.NoSuchTableError` or
+        :class:`.UnreflectableTableError` are omitted from the result, so
+        that the caller can report the error for that table individually.
+
+        """
+        if filter_names is None:
+            filter_names = self.get_table_names(
+                connection, schema, info_cache=kw.get("info_cache")
+            )
+        for table_name in filter_names:
+            try:
+                value = single_tbl_method(
+                    connection, table_name, schema=schema, **kw
+                )
+            except (exc.NoSuchTableError, exc.UnreflectableTableError):
+                continue
+            yield (schema, table_name), value
+
+    def get_multi_columns(self, connection, **kw):
+        return self._default_multi_reflect(self.get_columns, connection, **kw)
+
+    def get_multi_pk_constraint(self, connection, **kw):
+        return self._default_multi_reflect(
+            self.get_pk_constraint, connection, **kw
+        )
+
+    def get_multi_foreign_keys(self, connection, **kw):
+        return self._default_multi_reflect(
+            self.get_foreign_keys, connection, **kw
+        )
+
+    def get_multi_indexes(self, connection, **kw):
+        return self._default_multi_reflect(self.get_indexes, connection, **kw)
+
+    def get_multi_unique_constraints(self, connection, **kw):
+        return self._default_multi_reflect(
+            self.get_unique_constraints, connection, **kw
+        )
+
+    def get_multi_check_constraints(self, connection, **kw):
+        return self._default_multi_reflect(
+            self.get_check_constraints, connection, **kw
+        )
+
+    def get_multi_table_options(self, connection, **kw):
+        return self._default_multi_reflect(
+            self.get_table_options, connection, **kw
+        )
+
+    def get_multi_table_comment(self, connection, **kw):
+        return self._default_multi_reflect(
+            self.get_table_comment, connection, **kw
+        )
+
     def validate_identifier(self, ident):
         if len(ident) > self.max_identifier_length:
             raise exc.IdentifierError(
@@ -617,6 +718,9 @@ class DefaultDialect(Dialect):
         else:
             return True
 
+    def is_dbapi_transaction_active(self, dbapi_connection):
+        return None
+
     def create_xid(self):
         """Create a random two-phase transaction ID.
 
@@ -770,6 +874,7 @@ class DefaultExecutionContext(ExecutionContext):
     is_text = False
     isddl = False
 
+    execute_style: ExecuteStyle = ExecuteStyle.EXECUTE
     executemany = False
     compiled: Optional[Compiled] = None
     result_column_struct: Optional[
@@ -789,6 +894,23 @@ class DefaultExecutionContext(ExecutionContext):
 
     _soft_closed = False
 
+    _insertmanyvalues_rows: Optional[List[Tuple[Any, ...]]] = None
+    """rows fetched by a batched execution, i.e. "insertmanyvalues" or
+    a statement split for parameter limits"""
+
+    _split_batches: Optional[
+        List[Tuple[str, Any, Mapping[str, List[str]]]]
+    ] = None
+    """statement, parameters and parameter expansion for each statement
+    to be invoked when the statement was split in order to stay within
+    the dialect's parameter limits"""
+
+    _rowcount: Optional[int] = None
+
+    _peak_buffered_bytes: Optional[int] = None
+    """largest estimated size of rows buffered from a server side cursor,
+    tracked when the ``max_buffer_bytes`` execution option is used"""
+
     # a hook for SQLite's translation of
     # result column names
     # NOTE: pyhive is using this hook, can't remove it :(
@@ -925,6 +1047,16 @@ class DefaultExecutionContext(ExecutionContext):
                 for grp, m in enumerate(parameters)
             ]
 
+            if len(parameters) > 1:
+                if (
+                    compiled._insertmanyvalues is not None
+                    and dialect.bind_typing
+                    is not interfaces.BindTyping.SETINPUTSIZES
+                ):
+                    self.execute_style = ExecuteStyle.INSERTMANYVALUES
+                else:
+                    self.execute_style = ExecuteStyle.EXECUTEMANY
+
             self.executemany = len(parameters) > 1
 
         self.unicode_statement = compiled.string
@@ -943,6 +1075,8 @@ class DefaultExecutionContext(ExecutionContext):
             str, _BindProcessorType[Any]
         ] = processors  # type: ignore[assignment]
 
+        split_in_parameters = None
+
         if compiled.literal_execute_params or compiled.post_compile_params:
             if self.executemany:
                 raise exc.InvalidRequestError(
@@ -950,6 +1084,15 @@ class DefaultExecutionContext(ExecutionContext):
                     "used with executemany()"
                 )
 
+            if (
+                dialect._has_parameter_limits
+                and compiled._split_in_params
+                and not self._is_server_side
+            ):
+                # retain the parameters before IN lists are expanded
+                # in case the statement needs to be split
+                split_in_parameters = dict(self.compiled_parameters[0])
+
             expanded_state = compiled._process_parameters_for_postcompile(
                 self.compiled_parameters[0]
             )
@@ -1014,8 +1157,238 @@ class DefaultExecutionContext(ExecutionContext):
 
             self.parameters = core_dict_parameters
 
+        if split_in_parameters is not None:
+            self._split_batches = self._split_expanding_in(
+                split_in_parameters
+            )
+        elif (
+            compiled._multi_values_insert is not None
+            and not self._is_server_side
+            and dialect.bind_typing is not interfaces.BindTyping.SETINPUTSIZES
+        ):
+            self._split_batches = self._split_multi_values_insert(
+                compiled._multi_values_insert
+            )
+
         return self
 
+    def _split_multi_values_insert(
+        self, multi_values: compiler._MultiValuesInsert
+    ) -> Optional[List[Tuple[str, Any, Mapping[str, List[str]]]]]:
+        """Split a multi-row INSERT..VALUES into several statements if
+        its bound parameters exceed the dialect's limit."""
+
+        compiled = cast(SQLCompiler, self.compiled)
+        max_params = self.dialect.max_bind_parameters
+        parameters = self.parameters[0]
+
+        if max_params is None or len(parameters) <= max_params:
+            return None
+
+        row_bind_names = multi_values.row_bind_names
+        row_width = len(row_bind_names[0])
+        if not row_width:
+            return None
+
+        escaped_names = compiled.escaped_bind_names
+        all_row_names = {
+            escaped_names.get(name, name)
+            for row in row_bind_names
+            for name in row
+        }
+        fixed = len(parameters) - len(all_row_names)
+        rows_per_batch = (max_params - fixed) // row_width
+        if rows_per_batch < 1:
+            return None
+
+        num_rows = len(row_bind_names)
+        batches = []
+        for start in range(0, num_rows, rows_per_batch):
+            end = start + rows_per_batch
+            omit = all_row_names.difference(
+                escaped_names.get(name, name)
+                for row in row_bind_names[start:end]
+                for name in row
+            )
+            statement = (
+                multi_values.statement_prefix
+                + ", ".join(multi_values.row_expressions[start:end])
+                + multi_values.statement_suffix
+            )
+            if compiled.positional:
+                assert compiled.positiontup is not None
+                sub_params: Any = self.dialect.execute_sequence_format(
+                    [
+                        value
+                        for name, value in zip(
+                            compiled.positiontup, parameters
+                        )
+                        if name not in omit
+                    ]
+                )
+            else:
+                sub_params = {
+                    key: value
+                    for key, value in parameters.items()
+                    if key not in omit
+                }
+            batches.append(
+                (
+                    self._translate_split_statement(statement),
+                    sub_params,
+                    util.EMPTY_DICT,
+                )
+            )
+        return batches
+
+    def _split_expanding_in(
+        self, parameters: _MutableCoreSingleExecuteParams
+    ) -> Optional[List[Tuple[str, Any, Mapping[str, List[str]]]]]:
+        """Split the values of expanding IN parameters across several
+        executions of the statement, if the IN lists or the overall number
+        of bound parameters exceed the dialect's limits.
+
+        Each IN list that needs to be split is divided into chunks, and
+        the statement is invoked for every combination of chunks; as the
+        IN comparisons are AND-ed together, each row matches exactly one
+        combination.
+
+        """
+
+        compiled = cast(SQLCompiler, self.compiled)
+        dialect = self.dialect
+        max_params = dialect.max_bind_parameters
+        max_in = dialect.max_in_list_elements
+
+        # [name, values, width, chunksize] for each IN parameter
+        in_params = []
+        for name, bindparam in compiled._split_in_params:
+            values = parameters[name]
+            if not values:
+                continue
+
+            typ = bindparam.type._unwrapped_dialect_impl(dialect)
+            if typ._is_tuple_type or (
+                typ._isnull
+                and isinstance(values[0], collections_abc.Sequence)
+                and not isinstance(values[0], (str, bytes))
+            ):
+                width = len(values[0])
+            else:
+                width = 1
+
+            chunksize = len(values)
+            if max_in is not None:
+                chunksize = min(chunksize, max_in)
+            in_params.append([name, values, width, chunksize])
+
+        if not in_params:
+            return None
+
+        if max_params is not None:
+            fixed = len(self.parameters[0]) - sum(
+                len(values) * width for _, values, width, _ in in_params
+            )
+            chunked_size = sum(
+                chunksize * width for _, _, width, chunksize in in_params
+            )
+            if fixed + chunked_size > max_params:
+                # reduce all IN lists in proportion so that the statement
+                # fits within the limit
+                available = max_params - fixed
+                for in_param in in_params:
+                    in_param[3] = max(
+                        1, in_param[3] * available // chunked_size
+                    )
+                chunked_size = sum(
+                    chunksize * width for _, _, width, chunksize in in_params
+                )
+                if fixed + chunked_size > max_params:
+                    return None
+
+        chunks = []
+        for name, values, width, chunksize in in_params:
+            if chunksize >= len(values):
+                continue
+
+            # a value repeated in two chunks would otherwise match the same
+            # row twice
+            try:
+                values = list(dict.fromkeys(values))
+            except TypeError:
+                return None
+            chunks.append(
+                [
+                    (name, values[start : start + chunksize])
+                    for start in range(0, len(values), chunksize)
+                ]
+            )
+
+        if not chunks:
+            return None
+
+        processors = compiled._bind_processors
+        batches = []
+        for combination in itertools.product(*chunks):
+            sub_parameters = dict(parameters)
+            sub_parameters.update(combination)
+            expanded_state = compiled._process_parameters_for_postcompile(
+                sub_parameters
+            )
+            flattened_processors = dict(processors)
+            flattened_processors.update(expanded_state.processors)
+            compiled_params = expanded_state.additional_parameters
+
+            if compiled.positional:
+                assert expanded_state.positiontup is not None
+                sub_params: Any = dialect.execute_sequence_format(
+                    [
+                        flattened_processors[key](compiled_params[key])
+                        if key in flattened_processors
+                        else compiled_params[key]
+                        for key in expanded_state.positiontup
+                    ]
+                )
+            else:
+                sub_params = {
+                    key: flattened_processors[key](compiled_params[key])
+                    if key in flattened_processors
+                    else compiled_params[key]
+                    for key in compiled_params
+                }
+            batches.append(
+                (
+                    self._translate_split_statement(expanded_state.statement),
+                    sub_params,
+                    expanded_state.parameter_expansion,
+                )
+            )
+        return batches
+
+    def _translate_split_statement(self, statement: str) -> str:
+        compiled = cast(SQLCompiler, self.compiled)
+        if compiled.schema_translate_map:
+            schema_translate_map = self.execution_options.get(
+                "schema_translate_map", {}
+            )
+            rst = compiled.preparer._render_schema_translates
+            statement = rst(statement, schema_translate_map)
+        return statement
+
+    def _iter_split_batches(self) -> Iterator[Tuple[str, Any, int, int]]:
+        assert self._split_batches is not None
+        total_batches = len(self._split_batches)
+        use_setinputsizes = (
+            self.dialect.bind_typing is interfaces.BindTyping.SETINPUTSIZES
+        )
+        for batchnum, (statement, parameters, expanded) in enumerate(
+            self._split_batches, 1
+        ):
+            if use_setinputsizes:
+                self._expanded_parameters = expanded
+                self._set_input_sizes()
+            yield statement, parameters, batchnum, total_batches
+
     @classmethod
     def _init_statement(
         cls,
@@ -1050,6 +1423,9 @@ class DefaultExecutionContext(ExecutionContext):
                 dialect.execute_sequence_format(p) for p in parameters
             ]
 
+        if len(parameters) > 1:
+            self.execute_style = ExecuteStyle.EXECUTEMANY
+
         self.executemany = len(parameters) > 1
 
         self.statement = self.unicode_statement = statement
@@ -1288,6 +1664,8 @@ class DefaultExecutionContext(ExecutionContext):
 
     @util.non_memoized_property
     def rowcount(self) -> int:
+        if self._rowcount is not None:
+            return self._rowcount
         return self.cursor.rowcount
 
     def supports_sane_rowcount(self):
@@ -1296,15 +1674,41 @@ class DefaultExecutionContext(ExecutionContext):
     def supports_sane_multi_rowcount(self):
         return self.dialect.supports_sane_multi_rowcount
 
+    def _server_side_fetch_strategy(self) -> _cursor.CursorFetchStrategy:
+        if self.execution_options.get("prefetch"):
+            if not self.dialect.is_async:
+                # the worker thread uses the cursor while the calling
+                # thread may run other statements on the same connection,
+                # which requires connections to be shareable among threads
+                if getattr(self.dialect.dbapi, "threadsafety", 0) >= 2:
+                    return _cursor.ThreadedPrefetchCursorFetchStrategy(
+                        self.cursor, self.execution_options
+                    )
+            elif in_greenlet():
+                return _cursor.AsyncPrefetchCursorFetchStrategy(
+                    self.cursor, self.execution_options
+                )
+
+        return _cursor.BufferedRowCursorFetchStrategy(
+            self.cursor, self.execution_options
+        )
+
     def _setup_result_proxy(self):
         if self.is_crud or self.is_text:
             result = self._setup_dml_or_text_result()
         else:
             strategy = self.cursor_fetch_strategy
-            if self._is_server_side and strategy is _cursor._DEFAULT_FETCH:
-                strategy = _cursor.BufferedRowCursorFetchStrategy(
-                    self.cursor, self.execution_options
+            if (
+                self._insertmanyvalues_rows is not None
+                and strategy is _cursor._DEFAULT_FETCH
+            ):
+                # rows from all statements of a split execution were
+                # already fetched as each statement completed
+                strategy = _cursor.FullyBufferedCursorFetchStrategy(
+                    self.cursor, initial_buffer=self._insertmanyvalues_rows
                 )
+            elif self._is_server_side and strategy is _cursor._DEFAULT_FETCH:
+                strategy = self._server_side_fetch_strategy()
             cursor_description: _DBAPICursorDescription = (
                 strategy.alternate_cursor_description
                 or self.cursor.description
@@ -1369,10 +1773,17 @@ class DefaultExecutionContext(ExecutionContext):
             # return an "empty" primary key collection when accessed.
 
         strategy = self.cursor_fetch_strategy
-        if self._is_server_side and strategy is _cursor._DEFAULT_FETCH:
-            strategy = _cursor.BufferedRowCursorFetchStrategy(
-                self.cursor, self.execution_options
+        if (
+            self._insertmanyvalues_rows is not None
+            and strategy is _cursor._DEFAULT_FETCH
+        ):
+            # rows from all batches of an "insertmanyvalues" execution
+            # were already fetched as each batch completed
+            strategy = _cursor.FullyBufferedCursorFetchStrategy(
+                self.cursor, initial_buffer=self._insertmanyvalues_rows
             )
+        elif self._is_server_side and strategy is _cursor._DEFAULT_FETCH:
+            strategy = self._server_side_fetch_strategy()
         cursor_description = (
             strategy.alternate_cursor_description or self.cursor.description
         )
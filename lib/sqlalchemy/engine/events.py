@@ -38,6 +38,7 @@ if typing.TYPE_CHECKING:
     from .result import Result
     from ..pool import ConnectionPoolEntry
     from ..sql import Executable
+    from ..sql.compiler import Compiled
     from ..sql.elements import BindParameter
 
 
@@ -295,6 +296,48 @@ class ConnectionEvents(event.Events[ConnectionEventsTarget]):
 
         """
 
+    def compiled_cache_miss(
+        self,
+        conn: Connection,
+        clauseelement: Executable,
+        compiled: Compiled,
+        cacheable: bool,
+        compile_time: float,
+    ) -> None:
+        """Intercept the compilation of a statement that was not found in
+        the compiled cache.
+
+        This event is invoked when a SQL expression construct is executed
+        and its compiled form is not present in the compiled cache, either
+        because it was not yet compiled or was since evicted from the cache,
+        or because the construct can't be cached at all.  It may be used to
+        export cache metrics, or to locate statements that defeat caching::
+
+            from sqlalchemy import event
+
+            @event.listens_for(engine, "compiled_cache_miss")
+            def receive_miss(
+                conn, clauseelement, compiled, cacheable, compile_time
+            ):
+                if not cacheable:
+                    log.warning("uncacheable statement: %s", compiled)
+
+        :param conn: :class:`_engine.Connection` object
+        :param clauseelement: SQL expression construct being executed.
+        :param compiled: the newly generated :class:`.Compiled` object.
+        :param cacheable: True if the compiled form was placed in the cache,
+         False if the construct does not support caching.
+        :param compile_time: time in seconds spent generating the cache key
+         and compiling the statement.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_engine.Engine.compiled_cache_stats`
+
+        """
+
     def before_cursor_execute(
         self,
         conn: Connection,
@@ -15,10 +15,13 @@ from typing import Any
 from typing import Awaitable
 from typing import Callable
 from typing import ClassVar
+from typing import ContextManager
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Mapping
 from typing import MutableMapping
+from typing import NamedTuple
 from typing import Optional
 from typing import Sequence
 from typing import Set
@@ -78,6 +81,56 @@ class CacheStats(Enum):
     NO_DIALECT_SUPPORT = 4
 
 
+class CompiledCacheStats(NamedTuple):
+    """Statistics for the compiled statement cache of an
+    :class:`_engine.Engine`, as returned by
+    :meth:`_engine.Engine.compiled_cache_stats`.
+
+    Counts are cumulative since the :class:`_engine.Engine` was created.
+
+    .. versionadded:: 2.0
+
+    """
+
+    hits: int
+    """number of statement executions that found their compiled form in
+    the cache"""
+
+    misses: int
+    """number of statement executions that compiled a statement and
+    placed it in the cache"""
+
+    no_key: int
+    """number of statement executions that compiled a statement which
+    could not be cached, as it or an element within it does not support
+    generating a cache key"""
+
+    caching_disabled: int
+    """number of statement executions that compiled a statement because
+    no cache was in use, or the dialect does not support caching"""
+
+    evictions: int
+    """number of entries pruned from the engine's cache due to it
+    exceeding its size"""
+
+    size: int
+    """current number of entries in the engine's cache"""
+
+    capacity: Optional[int]
+    """the configured size of the engine's cache, or None if caching is
+    disabled"""
+
+    compile_time_histogram: Tuple[Tuple[float, int], ...]
+    """tuple of ``(upper bound in seconds, count)`` pairs, counting
+    statement compilations by the time taken to generate the cache key and
+    compile the statement"""
+
+    top_misses: Tuple[Tuple[str, int], ...]
+    """tuple of ``(SQL string, count)`` pairs for the statements that
+    were most often compiled rather than retrieved from the cache, most
+    frequent first"""
+
+
 class DBAPIConnection(Protocol):
     """protocol representing a :pep:`249` database connection.
 
@@ -495,6 +548,11 @@ class ReflectedTableComment(TypedDict):
     """text of the comment"""
 
 
+_ReflectedTableKey = Tuple[Optional[str], str]
+"""The key under which the ``get_multi_*`` reflection methods return
+per-table information, a tuple of ``(schema, table_name)``."""
+
+
 class BindTyping(Enum):
     """Define different methods of passing typing information for
     bound parameters in a statement to the database driver.
@@ -543,6 +601,33 @@ class BindTyping(Enum):
     """
 
 
+class ExecuteStyle(Enum):
+    """indicates the :term:`DBAPI` cursor method that will be used to invoke
+    a statement.
+
+    .. versionadded:: 2.0
+
+    """
+
+    EXECUTE = 0
+    """indicates cursor.execute() will be used"""
+
+    EXECUTEMANY = 1
+    """indicates cursor.executemany() will be used."""
+
+    INSERTMANYVALUES = 2
+    """indicates cursor.execute() will be used with an INSERT where the
+    VALUES expression will be expanded to accommodate for multiple
+    parameter sets, invoking the statement once per batch of parameter
+    sets.
+
+    .. seealso::
+
+        :attr:`.Dialect.use_insertmanyvalues`
+
+    """
+
+
 VersionInfoType = Tuple[Union[int, str], ...]
 
 
@@ -707,6 +792,15 @@ class Dialect(EventTarget):
     """deprecated; indicates if the dialect should attempt to use server
     side cursors by default"""
 
+    supports_pipeline: bool
+    """indicates if the dialect supports sending statements to the database
+    without waiting for the results of previous statements, as used by
+    :meth:`_engine.Connection.pipeline`.
+
+    .. versionadded:: 2.0
+
+    """
+
     supports_sane_rowcount: bool
     """Indicate whether the dialect properly implements rowcount for
       ``UPDATE`` and ``DELETE`` statements.
@@ -748,6 +842,20 @@ class Dialect(EventTarget):
 
     """
 
+    favor_returning_over_lastrowid: bool
+    """for dialects that support both RETURNING and ``cursor.lastrowid``,
+    indicate that RETURNING should be used to fetch the newly generated
+    primary key of a single-row INSERT.
+
+    Defaults to True.  When False, ``cursor.lastrowid`` is used for this
+    case, and RETURNING is used only when other server-generated values are
+    requested, such as with :meth:`.UpdateBase.return_defaults`, or when
+    many rows are INSERTed at once.  The SQLite dialect sets this to False.
+
+    .. versionadded:: 2.0
+
+    """
+
     colspecs: MutableMapping[Type["TypeEngine[Any]"], Type["TypeEngine[Any]"]]
     """A dictionary of TypeEngine classes from sqlalchemy.types mapped
       to subclasses that are specific to the dialect class.  This
@@ -890,6 +998,11 @@ class Dialect(EventTarget):
     is_async: bool
     """Whether or not this dialect is intended for asyncio use."""
 
+    _supports_native_async_execute: bool
+    """Whether or not this dialect implements
+    :meth:`.Dialect._do_execute_async`, allowing the asyncio extension to
+    execute simple statements without the use of a greenlet."""
+
     engine_config_types: Mapping[str, Any]
     """a mapping of string keys that can be in an engine config linked to
     type conversion functions.
@@ -927,6 +1040,8 @@ class Dialect(EventTarget):
 
     _bind_typing_render_casts: bool
 
+    _has_parameter_limits: bool
+
     supports_identity_columns: bool
     """target database supports IDENTITY"""
 
@@ -940,6 +1055,79 @@ class Dialect(EventTarget):
 
     """
 
+    use_insertmanyvalues: bool
+    """if True, indicates "insertmanyvalues" functionality should be used
+    to allow for ``insert_executemany_returning`` behavior, if possible.
+
+    In practice, setting this to True means:
+
+    if ``supports_multivalues_insert``, ``implicit_returning`` and
+    ``use_insertmanyvalues`` are all True, the SQL compiler will produce
+    an INSERT that will be interpreted by the :class:`.DefaultDialect`
+    as an :attr:`.ExecuteStyle.INSERTMANYVALUES` execution that allows
+    for INSERT of many rows with RETURNING by rewriting a single-row
+    INSERT statement to have multiple VALUES clauses, also executing
+    the statement multiple times for a series of batches when large numbers
+    of rows are given.
+
+    .. versionadded:: 2.0
+
+    """
+
+    insertmanyvalues_page_size: int
+    """Number of rows to render into an individual INSERT..VALUES() statement
+    for :attr:`.ExecuteStyle.INSERTMANYVALUES` executions.
+
+    The default dialect defaults this to 1000.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :paramref:`_engine.Connection.execution_options.insertmanyvalues_page_size` -
+        execution option available on :class:`_engine.Connection`, statements
+
+    """  # noqa: E501
+
+    insertmanyvalues_max_parameters: int
+    """Alternate to insertmanyvalues_page_size, will additionally limit
+    page size based on number of parameters total in the statement.
+
+    .. versionadded:: 2.0
+
+    """
+
+    max_bind_parameters: Optional[int]
+    """The maximum number of bound parameters the database or driver
+    accepts within a single statement, or None if there is no such limit.
+
+    When set, a multi-row INSERT..VALUES statement, as produced by
+    :meth:`_dml.Insert.values` when passed a list of parameter sets, whose
+    bound parameters exceed this number is invoked as several statements,
+    each within the limit.  Similarly, a SELECT, or a DELETE without
+    RETURNING, whose WHERE clause includes "expanding" IN comparisons that
+    would exceed this number of parameters is invoked once per chunk of IN
+    values, where the statement's form permits this.  An UPDATE is not
+    split, as its SET clause may cause rows to match a later chunk.
+
+    .. versionadded:: 2.0
+
+    """
+
+    max_in_list_elements: Optional[int]
+    """The maximum number of elements the database accepts within a
+    single IN list, or None if there is no such limit.
+
+    A SELECT, or a DELETE without RETURNING, whose WHERE clause includes
+    "expanding" IN comparisons with more values than this is invoked once
+    per combination of chunks of each IN list, where the statement's form
+    permits this; rows from each execution are combined into a single
+    :class:`.CursorResult` and the rowcounts summed.
+
+    .. versionadded:: 2.0
+
+    """
+
     _type_memos: MutableMapping[TypeEngine[Any], "_TypeMemoDict"]
 
     def _builtin_onconnect(self) -> Optional[_ListenerFnType]:
@@ -1239,6 +1427,192 @@ class Dialect(EventTarget):
 
         raise NotImplementedError()
 
+    def get_multi_columns(
+        self,
+        connection: "Connection",
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Iterable[Tuple[_ReflectedTableKey, List[ReflectedColumn]]]:
+        """Return column information for all tables in ``schema``.
+
+        This is the multi-table version of
+        :meth:`.Dialect.get_columns`.  The return value is an
+        iterable of ``((schema, table_name), value)`` tuples, where
+        ``value`` is the same structure returned by the single-table
+        method.
+        ``filter_names`` optionally limits the tables returned to those
+        with the given names.
+
+        .. versionadded:: 2.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_pk_constraint(
+        self,
+        connection: "Connection",
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Iterable[Tuple[_ReflectedTableKey, ReflectedPrimaryKeyConstraint]]:
+        """Return primary key information for all tables in ``schema``.
+
+        This is the multi-table version of
+        :meth:`.Dialect.get_pk_constraint`.  The return value is an
+        iterable of ``((schema, table_name), value)`` tuples, where
+        ``value`` is the same structure returned by the single-table
+        method.
+        ``filter_names`` optionally limits the tables returned to those
+        with the given names.
+
+        .. versionadded:: 2.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_foreign_keys(
+        self,
+        connection: "Connection",
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Iterable[
+        Tuple[_ReflectedTableKey, List[ReflectedForeignKeyConstraint]]
+    ]:
+        """Return foreign key information for all tables in ``schema``.
+
+        This is the multi-table version of
+        :meth:`.Dialect.get_foreign_keys`.  The return value is an
+        iterable of ``((schema, table_name), value)`` tuples, where
+        ``value`` is the same structure returned by the single-table
+        method.
+        ``filter_names`` optionally limits the tables returned to those
+        with the given names.
+
+        .. versionadded:: 2.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_indexes(
+        self,
+        connection: "Connection",
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Iterable[Tuple[_ReflectedTableKey, List[ReflectedIndex]]]:
+        """Return index information for all tables in ``schema``.
+
+        This is the multi-table version of
+        :meth:`.Dialect.get_indexes`.  The return value is an
+        iterable of ``((schema, table_name), value)`` tuples, where
+        ``value`` is the same structure returned by the single-table
+        method.
+        ``filter_names`` optionally limits the tables returned to those
+        with the given names.
+
+        .. versionadded:: 2.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_unique_constraints(
+        self,
+        connection: "Connection",
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Iterable[Tuple[_ReflectedTableKey, List[ReflectedUniqueConstraint]]]:
+        """Return unique constraint information for all tables in ``schema``.
+
+        This is the multi-table version of
+        :meth:`.Dialect.get_unique_constraints`.  The return value is an
+        iterable of ``((schema, table_name), value)`` tuples, where
+        ``value`` is the same structure returned by the single-table
+        method.
+        ``filter_names`` optionally limits the tables returned to those
+        with the given names.
+
+        .. versionadded:: 2.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_check_constraints(
+        self,
+        connection: "Connection",
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Iterable[Tuple[_ReflectedTableKey, List[ReflectedCheckConstraint]]]:
+        """Return check constraint information for all tables in ``schema``.
+
+        This is the multi-table version of
+        :meth:`.Dialect.get_check_constraints`.  The return value is an
+        iterable of ``((schema, table_name), value)`` tuples, where
+        ``value`` is the same structure returned by the single-table
+        method.
+        ``filter_names`` optionally limits the tables returned to those
+        with the given names.
+
+        .. versionadded:: 2.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_table_options(
+        self,
+        connection: "Connection",
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Iterable[Tuple[_ReflectedTableKey, Optional[Dict[str, Any]]]]:
+        """Return table options for all tables in ``schema``.
+
+        This is the multi-table version of
+        :meth:`.Dialect.get_table_options`.  The return value is an
+        iterable of ``((schema, table_name), value)`` tuples, where
+        ``value`` is the same structure returned by the single-table
+        method.
+        ``filter_names`` optionally limits the tables returned to those
+        with the given names.
+
+        .. versionadded:: 2.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_table_comment(
+        self,
+        connection: "Connection",
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Iterable[Tuple[_ReflectedTableKey, ReflectedTableComment]]:
+        """Return table comment information for all tables in ``schema``.
+
+        This is the multi-table version of
+        :meth:`.Dialect.get_table_comment`.  The return value is an
+        iterable of ``((schema, table_name), value)`` tuples, where
+        ``value`` is the same structure returned by the single-table
+        method.
+        ``filter_names`` optionally limits the tables returned to those
+        with the given names.
+
+        .. versionadded:: 2.0
+
+        """
+
+        raise NotImplementedError()
+
     def normalize_name(self, name: str) -> str:
         """convert the given name to lowercase if it is detected as
         case insensitive.
@@ -1414,6 +1788,47 @@ class Dialect(EventTarget):
         usable."""
         raise NotImplementedError()
 
+    def is_dbapi_transaction_active(
+        self, dbapi_connection: DBAPIConnection
+    ) -> Optional[bool]:
+        """Return whether or not the given DBAPI connection is within a
+        transaction, without communicating with the database.
+
+        Returns ``False`` only if the DBAPI is known to have no transaction
+        in progress, in which case the connection pool skips the "reset on
+        return" step when the connection is returned to the pool.
+        Returns ``None`` if the DBAPI does not provide this information.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_reset_on_return`
+
+        """
+        raise NotImplementedError()
+
+    def do_pipeline(
+        self, dbapi_connection: PoolProxiedConnection
+    ) -> ContextManager[Any]:
+        """Return a context manager which places the given DBAPI connection
+        in pipeline mode for its duration.
+
+        This hook is only called if :attr:`.Dialect.supports_pipeline` is
+        True.  While in pipeline mode, the dialect's execution methods may
+        send statements whose results aren't needed without waiting for the
+        database to respond; leaving the context waits for all outstanding
+        results, raising the DBAPI exception of any statement that failed.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_engine.Connection.pipeline`
+
+        """
+        raise NotImplementedError()
+
     def do_set_input_sizes(
         self,
         cursor: DBAPICursor,
@@ -1592,6 +2007,25 @@ class Dialect(EventTarget):
 
         raise NotImplementedError()
 
+    async def _do_execute_async(
+        self,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Optional[_DBAPISingleExecuteParams],
+        context: ExecutionContext,
+    ) -> None:
+        """Coroutine form of :meth:`.Dialect.do_execute` for dialects where
+        :attr:`.Dialect._supports_native_async_execute` is True, which
+        awaits the driver directly rather than from within a greenlet.
+
+        ``parameters`` is None if the parameter collection should not be
+        sent.  Once complete, all rows must be buffered on the cursor, such
+        that fetching rows from and closing the cursor doesn't await.
+
+        """
+
+        raise NotImplementedError()
+
     def is_disconnect(
         self,
         e: Exception,
@@ -2352,6 +2786,14 @@ class ExecutionContext:
     executemany: bool
     """True if the parameters have determined this to be an executemany"""
 
+    execute_style: ExecuteStyle
+    """the style of DBAPI cursor method that will be used to execute
+    a statement.
+
+    .. versionadded:: 2.0
+
+    """
+
     prefetch_cols: util.generic_fn_descriptor[Optional[Sequence[Column[Any]]]]
     """a list of Column objects for which a client-side default
       was fired off.  Applies to inserts and updates."""
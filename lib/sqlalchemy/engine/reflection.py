@@ -27,12 +27,22 @@ methods such as get_table_names, get_columns, etc.
 from __future__ import annotations
 
 import contextlib
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
 
 from .base import Connection
 from .base import Engine
+from .interfaces import _ReflectedTableKey
+from .interfaces import ReflectedCheckConstraint
 from .interfaces import ReflectedColumn
+from .interfaces import ReflectedForeignKeyConstraint
+from .interfaces import ReflectedIndex
+from .interfaces import ReflectedPrimaryKeyConstraint
+from .interfaces import ReflectedTableComment
+from .interfaces import ReflectedUniqueConstraint
 from .. import exc
 from .. import inspection
 from .. import sql
@@ -60,6 +70,74 @@ def cache(fn, self, con, *args, **kw):
     return ret
 
 
+class _ReflectionInfo:
+    """Reflection data for a group of tables, as returned by the
+    ``get_multi_*`` family of methods and keyed on ``(schema, table_name)``.
+
+    Used by :meth:`_schema.MetaData.reflect` to fetch information for all
+    tables at once, which is then consumed by
+    :meth:`_reflection.Inspector.reflect_table`.  Each collection is loaded
+    on first access, so that information which is never asked for is
+    never queried.  Tables not present in a given collection are reflected
+    individually.
+
+    """
+
+    _collections = {
+        "columns": "get_multi_columns",
+        "pk_constraint": "get_multi_pk_constraint",
+        "foreign_keys": "get_multi_foreign_keys",
+        "indexes": "get_multi_indexes",
+        "unique_constraints": "get_multi_unique_constraints",
+        "check_constraints": "get_multi_check_constraints",
+        "table_options": "get_multi_table_options",
+        "table_comment": "get_multi_table_comment",
+    }
+
+    columns: Dict[_ReflectedTableKey, List[ReflectedColumn]]
+    pk_constraint: Dict[_ReflectedTableKey, ReflectedPrimaryKeyConstraint]
+    foreign_keys: Dict[
+        _ReflectedTableKey, List[ReflectedForeignKeyConstraint]
+    ]
+    indexes: Dict[_ReflectedTableKey, List[ReflectedIndex]]
+    unique_constraints: Dict[
+        _ReflectedTableKey, List[ReflectedUniqueConstraint]
+    ]
+    check_constraints: Dict[_ReflectedTableKey, List[ReflectedCheckConstraint]]
+    table_options: Dict[_ReflectedTableKey, Optional[Dict[str, Any]]]
+    table_comment: Dict[_ReflectedTableKey, ReflectedTableComment]
+
+    def __init__(
+        self,
+        inspector: Inspector,
+        schema: Optional[str],
+        filter_names: Optional[Sequence[str]],
+        kw: Dict[str, Any],
+    ):
+        self.inspector = inspector
+        self.schema = schema
+        self.filter_names = filter_names
+        self.kw = kw
+
+    def __getattr__(self, key: str) -> Any:
+        try:
+            method_name = self._collections[key]
+        except KeyError:
+            raise AttributeError(key)
+
+        # optional dialect features that raise NotImplementedError
+        # produce an empty collection, in which case reflect_table()
+        # falls back to the single-table methods
+        try:
+            data = getattr(self.inspector, method_name)(
+                schema=self.schema, filter_names=self.filter_names, **self.kw
+            )
+        except NotImplementedError:
+            data = {}
+        self.__dict__[key] = data
+        return data
+
+
 @inspection._self_inspects
 class Inspector(inspection.Inspectable["Inspector"]):
     """Performs database schema inspection.
@@ -686,6 +764,217 @@ class Inspector(inspection.Inspectable["Inspector"]):
                 conn, table_name, schema, info_cache=self.info_cache, **kw
             )
 
+    def _get_multi(self, method_name, schema, filter_names, kw):
+        if filter_names is not None:
+            filter_names = tuple(filter_names)
+        with self._operation_context() as conn:
+            return dict(
+                getattr(self.dialect, method_name)(
+                    conn,
+                    schema=schema,
+                    filter_names=filter_names,
+                    info_cache=self.info_cache,
+                    **kw,
+                )
+            )
+
+    def get_multi_columns(
+        self,
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Dict[_ReflectedTableKey, List[ReflectedColumn]]:
+        """Return information about columns in all tables in the
+        given schema.
+
+        The result is a dictionary keyed on ``(schema, table_name)``, where
+        each value is the list of column dictionaries as returned by
+        :meth:`_reflection.Inspector.get_columns`.  Dialects that support
+        it will load the information for all tables using a single query.
+
+        :param schema: string schema name; if omitted, uses the default schema
+         of the database connection.  For special quoting,
+         use :class:`.quoted_name`.
+
+        :param filter_names: optional list of table names; if given, only
+         these tables are returned.
+
+        .. versionadded:: 2.0
+
+        """
+
+        table_col_defs = self._get_multi(
+            "get_multi_columns", schema, filter_names, kw
+        )
+        for col_defs in table_col_defs.values():
+            for col_def in col_defs:
+                # make this easy and only return instances for coltype
+                coltype = col_def["type"]
+                if not isinstance(coltype, TypeEngine):
+                    col_def["type"] = coltype()
+        return table_col_defs
+
+    def get_multi_pk_constraint(
+        self,
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Dict[_ReflectedTableKey, ReflectedPrimaryKeyConstraint]:
+        """Return information about primary key constraints in all tables
+        in the given schema.
+
+        The result is a dictionary keyed on ``(schema, table_name)``; see
+        :meth:`_reflection.Inspector.get_pk_constraint` for the
+        structure of each value and
+        :meth:`_reflection.Inspector.get_multi_columns` for a description
+        of the parameters.
+
+        .. versionadded:: 2.0
+
+        """
+        return self._get_multi(
+            "get_multi_pk_constraint", schema, filter_names, kw
+        )
+
+    def get_multi_foreign_keys(
+        self,
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Dict[_ReflectedTableKey, List[ReflectedForeignKeyConstraint]]:
+        """Return information about foreign keys in all tables in the
+        given schema.
+
+        The result is a dictionary keyed on ``(schema, table_name)``; see
+        :meth:`_reflection.Inspector.get_foreign_keys` for the
+        structure of each value and
+        :meth:`_reflection.Inspector.get_multi_columns` for a description
+        of the parameters.
+
+        .. versionadded:: 2.0
+
+        """
+        return self._get_multi(
+            "get_multi_foreign_keys", schema, filter_names, kw
+        )
+
+    def get_multi_indexes(
+        self,
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Dict[_ReflectedTableKey, List[ReflectedIndex]]:
+        """Return information about indexes in all tables in the
+        given schema.
+
+        The result is a dictionary keyed on ``(schema, table_name)``; see
+        :meth:`_reflection.Inspector.get_indexes` for the
+        structure of each value and
+        :meth:`_reflection.Inspector.get_multi_columns` for a description
+        of the parameters.
+
+        .. versionadded:: 2.0
+
+        """
+        return self._get_multi("get_multi_indexes", schema, filter_names, kw)
+
+    def get_multi_unique_constraints(
+        self,
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Dict[_ReflectedTableKey, List[ReflectedUniqueConstraint]]:
+        """Return information about unique constraints in all tables in the
+        given schema.
+
+        The result is a dictionary keyed on ``(schema, table_name)``; see
+        :meth:`_reflection.Inspector.get_unique_constraints` for the
+        structure of each value and
+        :meth:`_reflection.Inspector.get_multi_columns` for a description
+        of the parameters.
+
+        .. versionadded:: 2.0
+
+        """
+        return self._get_multi(
+            "get_multi_unique_constraints", schema, filter_names, kw
+        )
+
+    def get_multi_check_constraints(
+        self,
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Dict[_ReflectedTableKey, List[ReflectedCheckConstraint]]:
+        """Return information about check constraints in all tables in the
+        given schema.
+
+        The result is a dictionary keyed on ``(schema, table_name)``; see
+        :meth:`_reflection.Inspector.get_check_constraints` for the
+        structure of each value and
+        :meth:`_reflection.Inspector.get_multi_columns` for a description
+        of the parameters.
+
+        .. versionadded:: 2.0
+
+        """
+        return self._get_multi(
+            "get_multi_check_constraints", schema, filter_names, kw
+        )
+
+    def get_multi_table_options(
+        self,
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Dict[_ReflectedTableKey, Optional[Dict[str, Any]]]:
+        """Return the table options for all tables in the given schema.
+
+        The result is a dictionary keyed on ``(schema, table_name)``; see
+        :meth:`_reflection.Inspector.get_table_options` for the
+        structure of each value and
+        :meth:`_reflection.Inspector.get_multi_columns` for a description
+        of the parameters.
+
+        .. versionadded:: 2.0
+
+        """
+        return self._get_multi(
+            "get_multi_table_options", schema, filter_names, kw
+        )
+
+    def get_multi_table_comment(
+        self,
+        schema: Optional[str] = None,
+        filter_names: Optional[Sequence[str]] = None,
+        **kw: Any,
+    ) -> Dict[_ReflectedTableKey, ReflectedTableComment]:
+        """Return the table comments for all tables in the given schema.
+
+        The result is a dictionary keyed on ``(schema, table_name)``; see
+        :meth:`_reflection.Inspector.get_table_comment` for the
+        structure of each value and
+        :meth:`_reflection.Inspector.get_multi_columns` for a description
+        of the parameters.
+
+        Raises ``NotImplementedError`` for a dialect that does not support
+        comments.
+
+        .. versionadded:: 2.0
+
+        """
+        return self._get_multi(
+            "get_multi_table_comment", schema, filter_names, kw
+        )
+
+    def _get_reflection_info(self, schema=None, filter_names=None, **kw):
+        """Return a :class:`._ReflectionInfo` for the given tables, which
+        loads each collection using the ``get_multi_*`` methods the first
+        time it is accessed.
+
+        """
+        return _ReflectionInfo(self, schema, filter_names, kw)
+
     def reflect_table(
         self,
         table,
@@ -693,6 +982,7 @@ class Inspector(inspection.Inspectable["Inspector"]):
         exclude_columns=(),
         resolve_fks=True,
         _extend_on=None,
+        _reflect_info=None,
     ):
         """Given a :class:`_schema.Table` object, load its internal
         constructs based on introspection.
@@ -741,9 +1031,20 @@ class Inspector(inspection.Inspectable["Inspector"]):
             if k in table.dialect_kwargs
         )
 
+        table_key = (schema, table_name)
+
+        def _prefetched(collection, fn, *arg, **kw):
+            # use information loaded up front by the get_multi_* methods
+            # if present, else load it for this table individually
+            if _reflect_info is not None:
+                data = getattr(_reflect_info, collection)
+                if table_key in data:
+                    return data[table_key]
+            return fn(table_name, schema, *arg, **kw)
+
         # reflect table options, like mysql_engine
-        tbl_opts = self.get_table_options(
-            table_name, schema, **table.dialect_kwargs
+        tbl_opts = _prefetched(
+            "table_options", self.get_table_options, **table.dialect_kwargs
         )
         if tbl_opts:
             # add additional kwargs to the Table if the dialect
@@ -753,8 +1054,8 @@ class Inspector(inspection.Inspectable["Inspector"]):
         found_table = False
         cols_by_orig_name = {}
 
-        for col_d in self.get_columns(
-            table_name, schema, **table.dialect_kwargs
+        for col_d in _prefetched(
+            "columns", self.get_columns, **table.dialect_kwargs
         ):
             found_table = True
 
@@ -771,7 +1072,12 @@ class Inspector(inspection.Inspectable["Inspector"]):
             raise exc.NoSuchTableError(table_name)
 
         self._reflect_pk(
-            table_name, schema, table, cols_by_orig_name, exclude_columns
+            table_name,
+            schema,
+            table,
+            cols_by_orig_name,
+            exclude_columns,
+            _prefetched,
         )
 
         self._reflect_fk(
@@ -783,6 +1089,8 @@ class Inspector(inspection.Inspectable["Inspector"]):
             resolve_fks,
             _extend_on,
             reflection_options,
+            _prefetched,
+            _reflect_info,
         )
 
         self._reflect_indexes(
@@ -793,6 +1101,7 @@ class Inspector(inspection.Inspectable["Inspector"]):
             include_columns,
             exclude_columns,
             reflection_options,
+            _prefetched,
         )
 
         self._reflect_unique_constraints(
@@ -803,6 +1112,7 @@ class Inspector(inspection.Inspectable["Inspector"]):
             include_columns,
             exclude_columns,
             reflection_options,
+            _prefetched,
         )
 
         self._reflect_check_constraints(
@@ -813,10 +1123,11 @@ class Inspector(inspection.Inspectable["Inspector"]):
             include_columns,
             exclude_columns,
             reflection_options,
+            _prefetched,
         )
 
         self._reflect_table_comment(
-            table_name, schema, table, reflection_options
+            table_name, schema, table, reflection_options, _prefetched
         )
 
     def _reflect_column(
@@ -897,10 +1208,16 @@ class Inspector(inspection.Inspectable["Inspector"]):
             colargs.append(sequence)
 
     def _reflect_pk(
-        self, table_name, schema, table, cols_by_orig_name, exclude_columns
+        self,
+        table_name,
+        schema,
+        table,
+        cols_by_orig_name,
+        exclude_columns,
+        _prefetched,
     ):
-        pk_cons = self.get_pk_constraint(
-            table_name, schema, **table.dialect_kwargs
+        pk_cons = _prefetched(
+            "pk_constraint", self.get_pk_constraint, **table.dialect_kwargs
         )
         if pk_cons:
             pk_cols = [
@@ -926,9 +1243,11 @@ class Inspector(inspection.Inspectable["Inspector"]):
         resolve_fks,
         _extend_on,
         reflection_options,
+        _prefetched,
+        _reflect_info,
     ):
-        fkeys = self.get_foreign_keys(
-            table_name, schema, **table.dialect_kwargs
+        fkeys = _prefetched(
+            "foreign_keys", self.get_foreign_keys, **table.dialect_kwargs
         )
         for fkey_d in fkeys:
             conname = fkey_d["name"]
@@ -954,6 +1273,7 @@ class Inspector(inspection.Inspectable["Inspector"]):
                         schema=referred_schema,
                         autoload_with=self.bind,
                         _extend_on=_extend_on,
+                        _reflect_info=_reflect_info,
                         **reflection_options,
                     )
                 for column in referred_columns:
@@ -968,6 +1288,7 @@ class Inspector(inspection.Inspectable["Inspector"]):
                         autoload_with=self.bind,
                         schema=sa_schema.BLANK_SCHEMA,
                         _extend_on=_extend_on,
+                        _reflect_info=_reflect_info,
                         **reflection_options,
                     )
                 for column in referred_columns:
@@ -1002,9 +1323,10 @@ class Inspector(inspection.Inspectable["Inspector"]):
         include_columns,
         exclude_columns,
         reflection_options,
+        _prefetched,
     ):
         # Indexes
-        indexes = self.get_indexes(table_name, schema)
+        indexes = _prefetched("indexes", self.get_indexes)
         for index_d in indexes:
             name = index_d["name"]
             columns = index_d["column_names"]
@@ -1060,11 +1382,14 @@ class Inspector(inspection.Inspectable["Inspector"]):
         include_columns,
         exclude_columns,
         reflection_options,
+        _prefetched,
     ):
 
         # Unique Constraints
         try:
-            constraints = self.get_unique_constraints(table_name, schema)
+            constraints = _prefetched(
+                "unique_constraints", self.get_unique_constraints
+            )
         except NotImplementedError:
             # optional dialect feature
             return
@@ -1111,9 +1436,12 @@ class Inspector(inspection.Inspectable["Inspector"]):
         include_columns,
         exclude_columns,
         reflection_options,
+        _prefetched,
     ):
         try:
-            constraints = self.get_check_constraints(table_name, schema)
+            constraints = _prefetched(
+                "check_constraints", self.get_check_constraints
+            )
         except NotImplementedError:
             # optional dialect feature
             return
@@ -1122,10 +1450,10 @@ class Inspector(inspection.Inspectable["Inspector"]):
             table.append_constraint(sa_schema.CheckConstraint(**const_d))
 
     def _reflect_table_comment(
-        self, table_name, schema, table, reflection_options
+        self, table_name, schema, table, reflection_options, _prefetched
     ):
         try:
-            comment_dict = self.get_table_comment(table_name, schema)
+            comment_dict = _prefetched("table_comment", self.get_table_comment)
         except NotImplementedError:
             return
         else:
@@ -9,6 +9,7 @@
 
 from __future__ import annotations
 
+from array import array
 from enum import Enum
 import functools
 import itertools
@@ -344,6 +345,44 @@ def result_tuple(
     )
 
 
+def _column_buffer(
+    values: Sequence[Any], kind: Optional[str], key: Any, use_numpy: bool
+) -> Sequence[Any]:
+    """Return a column of values as an ``array.array`` or NumPy array for
+    the kind of value the column delivers, as determined once for each
+    column of a result, otherwise as a list or NumPy ``object`` array."""
+
+    if kind is not None and None in values:
+        raise exc.InvalidRequestError(
+            "Column %r received a NULL value, which can't be stored in an "
+            "array of %s values; use type_coerce() with the NullType type "
+            "to receive this column as a list" % (key, kind)
+        )
+
+    try:
+        if use_numpy:
+            import numpy
+
+            if kind == "int":
+                return numpy.array(values, dtype=numpy.int64)
+            elif kind == "float":
+                return numpy.array(values, dtype=numpy.float64)
+            elif kind == "bool":
+                return numpy.array(values, dtype=numpy.bool_)
+            return numpy.fromiter(values, dtype=object, count=len(values))
+
+        if kind == "int":
+            return array("q", values)
+        elif kind == "float":
+            return array("d", values)
+        return list(values)
+    except OverflowError as err:
+        raise exc.InvalidRequestError(
+            "Column %r received a value which can't be stored in an array "
+            "of %s values: %s" % (key, kind, err)
+        ) from err
+
+
 # a symbol that indicates to internal Result methods that
 # "no row is returned".  We can't use None for those cases where a scalar
 # filter is applied to rows.
@@ -461,6 +500,52 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
 
         return make_row
 
+    def _columnar_rows(
+        self, rows: List[Any], use_numpy: bool
+    ) -> Tuple[Sequence[Any], ...]:
+        if self._unique_filter_state:
+            raise exc.InvalidRequestError(
+                "Columnar fetching can't be combined with Result.unique()"
+            )
+
+        real_result: Result[Any] = (
+            self._real_result
+            if self._real_result
+            else cast("Result[Any]", self)
+        )
+
+        metadata = self._metadata
+        keys = list(metadata.keys)
+        kinds = real_result._columnar_kinds
+
+        if real_result._source_supports_scalars:
+            columns: Sequence[Sequence[Any]] = [rows]
+            processors = None
+            kinds = None
+        else:
+            columns = list(zip(*rows)) if rows else [() for _ in keys]
+            processors = metadata._processors
+            tf = metadata._tuplefilter
+            if tf:
+                if rows:
+                    columns = tf(columns)
+                if processors:
+                    processors = tf(processors)
+                if kinds:
+                    kinds = tf(kinds)
+
+        if processors and rows:
+            columns = [
+                list(map(proc, column)) if proc is not None else column
+                for proc, column in zip(processors, columns)
+            ]
+        if not kinds:
+            kinds = [None] * len(columns)
+        return tuple(
+            _column_buffer(column, kind, key, use_numpy)
+            for column, kind, key in zip(columns, kinds, keys)
+        )
+
     @HasMemoized_ro_memoized_attribute
     def _iterator_getter(self) -> Callable[..., Iterator[_R]]:
 
@@ -907,6 +992,10 @@ class Result(_WithKeys, ResultInternal[Row[_TP]]):
 
     _attributes: util.immutabledict[Any, Any] = util.immutabledict()
 
+    # for each column of a raw row, the kind of value used to select the
+    # buffer for columnar fetching, where known from the column's type
+    _columnar_kinds: Optional[Sequence[Optional[str]]] = None
+
     def __init__(self, cursor_metadata: ResultMetaData):
         self._metadata = cursor_metadata
 
@@ -1232,6 +1321,99 @@ class Result(_WithKeys, ResultInternal[Row[_TP]]):
             else:
                 break
 
+    def columns_as_arrays(
+        self, use_numpy: bool = False
+    ) -> Tuple[Sequence[Any], ...]:
+        """Return all remaining rows as a tuple of columns.
+
+        The columns are returned in the same order as
+        :meth:`_engine.Result.keys`.  Rows are not converted into
+        :class:`_engine.Row` objects; instead, the raw rows are transposed
+        and result processors are applied to each column as a whole.
+        The result object is closed afterwards.
+
+        The form of each column is determined from its type, once for the
+        result, so that it is the same for each chunk delivered by
+        :meth:`_engine.Result.partitions_columnar`.  Columns of a
+        statement against :class:`_schema.Column` objects which are
+        declared NOT NULL, such as primary key columns, are returned as
+        ``array.array`` objects for :class:`.Integer` types and for
+        :class:`.Float` or :class:`.Numeric` types with ``asdecimal=False``;
+        all other columns, including those of results that don't carry
+        SQL type information, are returned as lists.  If such a column
+        nonetheless receives NULL, as may be the case for the right side of
+        an OUTER JOIN, :class:`.InvalidRequestError` is raised; the column
+        may be fetched as a list by applying :func:`_sql.type_coerce`
+        with :class:`.NullType`.
+
+        E.g.::
+
+            ids, names = conn.execute(
+                select(user_table.c.id, user_table.c.name)
+            ).columns_as_arrays()
+
+        .. versionadded:: 2.0
+
+        :param use_numpy: when True, each column is returned as a NumPy
+         array, using an ``int64``, ``float64`` or ``bool`` dtype for the
+         NOT NULL columns described above, including those of the
+         :class:`.Boolean` type, and the ``object`` dtype otherwise.  NumPy
+         must be installed.
+
+        .. seealso::
+
+            :meth:`_engine.Result.partitions_columnar`
+
+        """
+        return self._columnar_rows(self._fetchall_impl(), use_numpy)
+
+    def partitions_columnar(
+        self, size: Optional[int] = None, use_numpy: bool = False
+    ) -> Iterator[Tuple[Sequence[Any], ...]]:
+        """Iterate through chunks of rows of the size given, each delivered
+        as a tuple of columns.
+
+        This is the columnar form of :meth:`_engine.Result.partitions`;
+        each chunk is delivered in the same form as that of
+        :meth:`_engine.Result.columns_as_arrays`.  As with
+        :meth:`_engine.Result.partitions`, the
+        :paramref:`.Connection.execution_options.stream_results` execution
+        option should be used to keep the driver from buffering the full
+        result.
+
+        .. versionadded:: 2.0
+
+        :param size: maximum number of rows in each chunk.  If None, makes
+         use of the value set by :meth:`_engine.Result.yield_per`, if
+         present, otherwise uses the :meth:`_engine.Result.fetchmany`
+         default which may be backend specific.
+
+        :param use_numpy: when True, columns are returned as NumPy arrays;
+         see :meth:`_engine.Result.columns_as_arrays`.
+
+        :return: iterator of tuples of columns
+
+        """
+        if size is None:
+            size = self._yield_per
+
+        while True:
+            rows = self._fetchmany_impl(size)
+            if not rows:
+                break
+            yield self._columnar_rows(rows, use_numpy)
+
+    def _fetchmany_capped(self, size: int) -> Sequence[Row[_TP]]:
+        """Fetch up to the given number of rows, or fewer where the
+        result limits the number of rows it buffers at once, as with the
+        ``max_buffer_bytes`` execution option; an empty list indicates
+        the rows are exhausted.
+
+        Used by the ORM when loading rows in chunks for ``yield_per``.
+
+        """
+        return self.fetchmany(size)
+
     def fetchall(self) -> Sequence[Row[_TP]]:
         """A synonym for the :meth:`_engine.Result.all` method."""
 
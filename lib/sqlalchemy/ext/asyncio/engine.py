@@ -32,6 +32,8 @@ from ...engine import create_engine as _create_engine
 from ...engine import Engine
 from ...engine.base import NestedTransaction
 from ...engine.base import Transaction
+from ...engine.util import _distill_params_20
+from ...sql.elements import ClauseElement
 from ...util.concurrency import greenlet_spawn
 from ...util.typing import Protocol
 
@@ -528,15 +530,77 @@ class AsyncConnection(
         :return: a :class:`_engine.Result` object.
 
         """
-        result = await greenlet_spawn(
-            self._proxied.execute,
-            statement,
-            parameters,
-            execution_options=execution_options,
-            _require_await=True,
+        result = await self._execute_native(
+            statement, parameters, execution_options
         )
+        if result is None:
+            result = await greenlet_spawn(
+                self._proxied.execute,
+                statement,
+                parameters,
+                execution_options=execution_options,
+                _require_await=True,
+            )
         return await _ensure_sync_result(result, self.execute)
 
+    async def _execute_native(
+        self,
+        statement: Executable,
+        parameters: Optional[_CoreAnyExecuteParams],
+        execution_options: Optional[_ExecuteOptionsParameter],
+    ) -> Optional[CursorResult[Any]]:
+        """Execute a statement by awaiting the driver directly, rather
+        than by running :meth:`_engine.Connection.execute` within a
+        greenlet.
+
+        Used for single executions of Core statements, where the dialect
+        supports it and no events are present; returns None if the
+        statement needs to be executed within a greenlet instead.  A
+        statement that turns out to need a greenlet once compiled is
+        continued within one, without being compiled again.
+
+        """
+        conn = self._proxied
+        dialect = conn.dialect
+
+        if (
+            not dialect._supports_native_async_execute
+            or getattr(type(statement), "_execute_on_connection", None)
+            is not ClauseElement._execute_on_connection
+            or not statement.supports_execution
+        ):
+            return None
+
+        prepared = conn._prepare_native_execute(
+            statement,
+            _distill_params_20(parameters),
+            execution_options or util.EMPTY_DICT,
+        )
+        if prepared is None:
+            return None
+        elif not isinstance(prepared, tuple):
+            # compiled, but needs to continue within a greenlet
+            return await greenlet_spawn(prepared)
+
+        context, effective_parameters = prepared
+        try:
+            await dialect._do_execute_async(
+                context.cursor,
+                context.statement,
+                effective_parameters,
+                context,
+            )
+            return conn._finish_native_execute(context)
+        except BaseException as e:
+            # invalidation upon disconnect may need to await
+            return await greenlet_spawn(
+                conn._handle_native_execute_error,
+                e,
+                context.statement,
+                context.parameters[0],
+                context,
+            )
+
     @overload
     async def scalar(
         self,
@@ -9,6 +9,7 @@ from __future__ import annotations
 import operator
 from typing import Any
 from typing import AsyncIterator
+from typing import cast
 from typing import Optional
 from typing import overload
 from typing import Sequence
@@ -94,6 +95,27 @@ class AsyncResult(AsyncCommon[Row[_TP]]):
                 "_row_getter", real_result.__dict__["_row_getter"]
             )
 
+    @property
+    def peak_buffered_bytes(self) -> Optional[int]:
+        """Return the largest estimated size in bytes of the rows buffered
+        at once from the server side cursor.
+
+        This is the value of :attr:`_engine.CursorResult.peak_buffered_bytes`
+        for the underlying result, tracked when the ``max_buffer_bytes``
+        execution option is used.
+
+        .. versionadded:: 2.0
+
+        """
+        real_result = self._real_result
+        if not real_result._is_cursor:
+            # ORM results are delivered by an IteratorResult that
+            # consumes the CursorResult
+            real_result = getattr(real_result, "raw", None)
+            if real_result is None:
+                return None
+        return cast("CursorResult[Any]", real_result).peak_buffered_bytes
+
     @property
     def t(self) -> AsyncTupleResult[_TP]:
         """Apply a "typed tuple" typing filter to returned rows.
@@ -192,6 +214,52 @@ class AsyncResult(AsyncCommon[Row[_TP]]):
             else:
                 break
 
+    async def columns_as_arrays(
+        self, use_numpy: bool = False
+    ) -> Tuple[Sequence[Any], ...]:
+        """Return all remaining rows as a tuple of columns.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_engine.Result.columns_as_arrays`
+
+        """
+        rows = await greenlet_spawn(self._fetchall_impl)
+        return self._columnar_rows(rows, use_numpy)
+
+    async def partitions_columnar(
+        self, size: Optional[int] = None, use_numpy: bool = False
+    ) -> AsyncIterator[Tuple[Sequence[Any], ...]]:
+        """Iterate through chunks of rows of the size given, each delivered
+        as a tuple of columns.
+
+        An async iterator is returned::
+
+            async def scroll_columns(connection):
+                result = await connection.stream(select(users_table))
+
+                async for ids, names in result.partitions_columnar(1000):
+                    print("%d rows" % len(ids))
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_engine.Result.partitions_columnar`
+
+        """
+        if size is None:
+            size = self._real_result._yield_per
+
+        while True:
+            rows = await greenlet_spawn(self._fetchmany_impl, size)
+            if rows:
+                yield self._columnar_rows(rows, use_numpy)
+            else:
+                break
+
     async def fetchall(self) -> Sequence[Row[_TP]]:
         """A synonym for the :meth:`.AsyncResult.all` method.
 
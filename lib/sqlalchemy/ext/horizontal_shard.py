@@ -16,12 +16,19 @@ the source distribution.
 
 """
 
+import asyncio
+from concurrent import futures
+import itertools
+
 from .. import event
 from .. import exc
 from .. import inspect
 from .. import util
+from ..engine.result import MergedResult
 from ..orm.query import Query
 from ..orm.session import Session
+from ..util.concurrency import await_only
+from ..util.concurrency import greenlet_spawn
 
 __all__ = ["ShardedSession", "ShardedQuery"]
 
@@ -60,6 +67,7 @@ class ShardedSession(Session):
         execute_chooser=None,
         shards=None,
         query_cls=ShardedQuery,
+        max_shard_workers=None,
         **kwargs,
     ):
         """Construct a ShardedSession.
@@ -84,7 +92,42 @@ class ShardedSession(Session):
              supersedes the ``query_chooser`` parameter.
 
         :param shards: A dictionary of string shard names
-          to :class:`~sqlalchemy.engine.Engine` objects.
+          to :class:`~sqlalchemy.engine.Engine` objects.  When the
+          :class:`.ShardedSession` is used as the
+          :paramref:`_asyncio.AsyncSession.sync_session_class` of an
+          :class:`_asyncio.AsyncSession`, pass the
+          :attr:`_asyncio.AsyncEngine.sync_engine` of each
+          :class:`_asyncio.AsyncEngine`.
+
+        :param max_shard_workers: when set to an integer greater than one,
+          SELECT statements that are invoked against more than one shard are
+          executed against the shards concurrently, using at most this many
+          concurrent executions, rather than one shard after another.  For
+          synchronous engines a thread pool is used for each number of
+          workers, which is shared by all statements invoked by the
+          :class:`.ShardedSession` until it is closed; for engines that use
+          an asyncio driver, the shard executions are run concurrently
+          on the event loop.  Shards that share the same database
+          connection are always executed serially.  ORM-enabled UPDATE and
+          DELETE statements are always executed against one shard after
+          another, as synchronizing their results with the
+          :class:`.Session` modifies the identity map, as are statements
+          for which further :meth:`.SessionEvents.do_orm_execute` handlers
+          follow that of the :class:`.ShardedSession`.  Connections are
+          established and ORM results are produced in the calling thread,
+          and only :meth:`_engine.Connection.execute` is invoked from worker
+          threads, so connections must be usable from a
+          thread other than the one that checked them out; this excludes
+          SQLite ``:memory:`` databases that use
+          :class:`.SingletonThreadPool`, unless all shards share the same
+          connection.  Results are merged in
+          the order of shard ids returned by ``execute_chooser``, unless
+          the ``shard_merge_as_completed`` execution option is set to
+          ``True``, in which case rows from each shard are delivered as
+          soon as that shard's statement completes.   May also be set
+          per-statement using the ``max_shard_workers`` execution option.
+
+          .. versionadded:: 2.0
 
         """
         query_chooser = kwargs.pop("query_chooser", None)
@@ -115,6 +158,8 @@ class ShardedSession(Session):
         else:
             self.execute_chooser = execute_chooser
         self.query_chooser = query_chooser
+        self.max_shard_workers = max_shard_workers
+        self._shard_executors = {}
         self.__binds = {}
         if shards is not None:
             for k in shards:
@@ -206,6 +251,30 @@ class ShardedSession(Session):
     def bind_shard(self, shard_id, bind):
         self.__binds[shard_id] = bind
 
+    def close(self):
+        super(ShardedSession, self).close()
+        executors, self._shard_executors = self._shard_executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=False)
+
+    def _get_shard_executor(self, max_workers):
+        """Return the thread pool used to execute statements against
+        shards concurrently with the given number of workers, creating it
+        if needed.
+
+        An executor is never replaced while the session is open, as it may
+        still be in use by a statement whose rows have not been consumed.
+
+        """
+
+        try:
+            return self._shard_executors[max_workers]
+        except KeyError:
+            executor = self._shard_executors[
+                max_workers
+            ] = futures.ThreadPoolExecutor(max_workers=max_workers)
+            return executor
+
 
 def execute_and_instances(orm_context):
     if orm_context.is_select:
@@ -248,10 +317,231 @@ def execute_and_instances(orm_context):
 
     if shard_id is not None:
         return iter_for_shard(shard_id, load_options, update_options)
-    else:
+
+    shard_ids = list(session.execute_chooser(orm_context))
+    max_workers = orm_context.execution_options.get(
+        "max_shard_workers", session.max_shard_workers
+    )
+
+    if (
+        not orm_context.is_select
+        or max_workers is None
+        or max_workers < 2
+        or len(shard_ids) < 2
+        # do_orm_execute handlers following this one are only invoked
+        # by invoke_statement()
+        or orm_context._remaining_events()
+    ):
         partial = []
-        for shard_id in session.execute_chooser(orm_context):
+        for shard_id in shard_ids:
             result_ = iter_for_shard(shard_id, load_options, update_options)
             partial.append(result_)
 
         return partial[0].merge(*partial[1:])
+
+    return _execute_concurrently(
+        orm_context, shard_ids, max_workers, load_options
+    )
+
+
+def _execute_concurrently(orm_context, shard_ids, max_workers, load_options):
+    """Execute the SELECT against each shard id concurrently, returning a
+    merged result.
+
+    The :class:`.Session` is only used from the calling thread; the
+    statement, parameters and connection for each shard are set up here
+    and only :meth:`_engine.Connection.execute` is run concurrently, after
+    which ORM results are produced from each cursor result in the calling
+    thread.
+
+    """
+
+    session = orm_context.session
+    compile_state_cls = orm_context._compile_state_cls
+    statement = orm_context.statement
+    params = orm_context.parameters or {}
+
+    # shards that share a DBAPI connection are grouped together and
+    # executed serially within a single task.
+    groups = {}
+    prepared = {}
+    is_async = False
+    for shard_id in shard_ids:
+        bind_arguments = dict(orm_context.bind_arguments)
+        bind_arguments["shard_id"] = shard_id
+        execution_options = orm_context.local_execution_options.union(
+            {
+                "_sa_orm_load_options": load_options
+                + {"_refresh_identity_token": shard_id}
+            }
+        )
+        conn = session.connection(bind_arguments=bind_arguments)
+        prepared[shard_id] = (conn, execution_options, bind_arguments)
+        is_async = is_async or conn.dialect.is_async
+        groups.setdefault(
+            id(conn.connection.dbapi_connection), []
+        ).append(shard_id)
+
+    def run_group(group_shard_ids):
+        results = []
+        try:
+            for shard_id in group_shard_ids:
+                conn, execution_options, _ = prepared[shard_id]
+                results.append(
+                    conn.execute(
+                        statement, params, execution_options=execution_options
+                    )
+                )
+        except BaseException:
+            with util.safe_reraise():
+                for result in results:
+                    result._soft_close(hard=True)
+        return results
+
+    def orm_results(group_shard_ids, results):
+        return [
+            compile_state_cls.orm_setup_cursor_result(
+                session,
+                statement,
+                params,
+                prepared[shard_id][1],
+                prepared[shard_id][2],
+                result,
+            )
+            for shard_id, result in zip(group_shard_ids, results)
+        ]
+
+    if len(groups) == 1:
+        # all shards share a single connection; nothing to run concurrently
+        partial = orm_results(shard_ids, run_group(shard_ids))
+        return partial[0].merge(*partial[1:])
+
+    groups = list(groups.values())
+    if is_async:
+        tasks = _spawn_async(run_group, groups, max_workers)
+    else:
+        # the thread pool is shared with other statements, so limit the
+        # number of concurrent executions for this statement by running
+        # each task's groups of shards serially
+        num_tasks = min(max_workers, len(groups))
+        groups = [
+            list(itertools.chain.from_iterable(groups[idx::num_tasks]))
+            for idx in range(num_tasks)
+        ]
+        executor = session._get_shard_executor(num_tasks)
+        tasks = [
+            executor.submit(run_group, group_shard_ids)
+            for group_shard_ids in groups
+        ]
+
+    group_for_task = dict(zip(tasks, groups))
+
+    if orm_context.execution_options.get("shard_merge_as_completed", False):
+        if is_async:
+            completed = _as_completed_async(tasks)
+            if orm_context.execution_options.get("prebuffer_rows", False):
+                # rows are consumed outside of the greenlet once the
+                # statement returns, so wait for all shards here, retaining
+                # the order in which they complete
+                try:
+                    completed = list(completed)
+                except BaseException:
+                    with util.safe_reraise():
+                        _close_results(tasks)
+        else:
+            completed = futures.as_completed(tasks)
+        return _StreamingMergedResult(
+            itertools.chain.from_iterable(
+                orm_results(group_for_task[task], task.result())
+                for task in completed
+            ),
+            tasks,
+        )
+
+    if is_async:
+        await_only(asyncio.wait(tasks))
+    else:
+        futures.wait(tasks)
+
+    results = {}
+    try:
+        for group_shard_ids, task in zip(groups, tasks):
+            partial = orm_results(group_shard_ids, task.result())
+            results.update(zip(group_shard_ids, partial))
+    except BaseException:
+        with util.safe_reraise():
+            _close_results(tasks)
+
+    partial = [results[shard_id] for shard_id in shard_ids]
+    return partial[0].merge(*partial[1:])
+
+
+def _spawn_async(run_group, groups, max_workers):
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(group_shard_ids):
+        async with semaphore:
+            return await greenlet_spawn(run_group, group_shard_ids)
+
+    return [asyncio.ensure_future(run(group)) for group in groups]
+
+
+def _as_completed_async(tasks):
+    pending = set(tasks)
+    while pending:
+        done, pending = await_only(
+            asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        )
+        yield from done
+
+
+def _close_results(tasks):
+    """Close the results of all successful tasks, waiting for any that
+    are still in progress."""
+
+    for task in tasks:
+        if not task.done():
+            if isinstance(task, futures.Future):
+                futures.wait([task])
+            else:
+                await_only(asyncio.wait([task]))
+        if not task.cancelled() and task.exception() is None:
+            for result in task.result():
+                result._soft_close(hard=True)
+
+
+class _StreamingMergedResult(MergedResult):
+    """A :class:`.MergedResult` that delivers rows from each shard's result
+    as soon as that shard's statement has completed, rather than in the
+    order of shard ids.
+
+    """
+
+    def __init__(self, completed_results, tasks):
+        self._tasks = tasks
+        self._completed_results = completed_results
+
+        try:
+            first = next(completed_results)
+        except BaseException:
+            with util.safe_reraise():
+                _close_results(tasks)
+
+        super().__init__(first._metadata, [first])
+        self.iterator = itertools.chain(
+            self.iterator, self._iterate_remaining()
+        )
+
+    def _iterate_remaining(self):
+        try:
+            for result in self._completed_results:
+                self._results.append(result)
+                yield from result._raw_row_iterator()
+        except BaseException:
+            with util.safe_reraise():
+                _close_results(self._tasks)
+
+    def _soft_close(self, hard=False, **kw):
+        if hard:
+            _close_results(self._tasks)
+        super()._soft_close(hard=hard, **kw)
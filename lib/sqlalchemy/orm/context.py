@@ -26,6 +26,8 @@ from . import attributes
 from . import interfaces
 from . import loading
 from .base import _is_aliased_class
+from .identity import IdentityMap
+from .identity import WeakInstanceDict
 from .interfaces import ORMColumnDescription
 from .interfaces import ORMColumnsClauseRole
 from .path_registry import PathRegistry
@@ -75,6 +77,7 @@ if TYPE_CHECKING:
     from .session import Session
     from ..engine.interfaces import _CoreSingleExecuteParams
     from ..engine.interfaces import _ExecuteOptionsParameter
+    from ..engine.interfaces import ExecutionContext
     from ..sql._typing import _ColumnsClauseArgument
     from ..sql.compiler import SQLCompiler
     from ..sql.dml import _DMLTableElement
@@ -103,6 +106,7 @@ class QueryContext:
         "load_options",
         "bind_arguments",
         "execution_options",
+        "execution_context",
         "session",
         "autoflush",
         "populate_existing",
@@ -117,11 +121,14 @@ class QueryContext:
         "post_load_paths",
         "identity_token",
         "yield_per",
+        "readonly_identity_map",
         "loaders_require_buffering",
         "loaders_require_uniquing",
     )
 
     runid: int
+    execution_context: Optional[ExecutionContext]
+    readonly_identity_map: Optional[IdentityMap]
     post_load_paths: Dict[PathRegistry, PostLoad]
     compile_state: ORMCompileState
 
@@ -133,6 +140,8 @@ class QueryContext:
         _autoflush = True
         _refresh_identity_token = None
         _yield_per = None
+        _readonly_load = False
+        _readonly_identity_map = None
         _refresh_state = None
         _lazy_loaded_from = None
         _legacy_uniquing = False
@@ -153,6 +162,7 @@ class QueryContext:
         self.load_options = load_options
         self.execution_options = execution_options or _EMPTY_DICT
         self.bind_arguments = bind_arguments or _EMPTY_DICT
+        self.execution_context = None
         self.compile_state = compile_state
         self.query = statement
         self.session = session
@@ -194,6 +204,30 @@ class QueryContext:
         self.yield_per = load_options._yield_per
         self.identity_token = load_options._refresh_identity_token
 
+        if not load_options._readonly_load:
+            self.readonly_identity_map = None
+        elif load_options._readonly_identity_map is not None:
+            # loaders that emit additional queries pass along the
+            # identity map of the parent load
+            self.readonly_identity_map = load_options._readonly_identity_map
+        else:
+            self.readonly_identity_map = WeakInstanceDict()
+
+    def _eager_load_execution_options(self) -> _ExecuteOptionsParameter:
+        """Return execution options for an additional query emitted by an
+        eager loader, so that a "readonly_load" shares its identity map.
+
+        """
+        if self.readonly_identity_map is None:
+            return _EMPTY_DICT
+        return {
+            "_sa_orm_load_options": self.default_load_options
+            + {
+                "_readonly_load": True,
+                "_readonly_identity_map": self.readonly_identity_map,
+            }
+        }
+
 
 _orm_load_exec_options = util.immutabledict(
     {"_result_disable_adapt_to_context": True, "future_result": True}
@@ -327,7 +361,7 @@ class ORMCompileState(CompileState):
             execution_options,
         ) = QueryContext.default_load_options.from_execution_options(
             "_sa_orm_load_options",
-            {"populate_existing", "autoflush", "yield_per"},
+            {"populate_existing", "autoflush", "yield_per", "readonly_load"},
             execution_options,
             statement._execution_options,
         )
@@ -381,6 +415,28 @@ class ORMCompileState(CompileState):
 
         return statement, execution_options
 
+    @classmethod
+    def orm_execute_statement(
+        cls,
+        session,
+        statement,
+        params,
+        execution_options,
+        bind_arguments,
+        conn,
+    ):
+        result = conn.execute(
+            statement, params or {}, execution_options=execution_options
+        )
+        return cls.orm_setup_cursor_result(
+            session,
+            statement,
+            params,
+            execution_options,
+            bind_arguments,
+            result,
+        )
+
     @classmethod
     def orm_setup_cursor_result(
         cls,
@@ -412,6 +468,7 @@ class ORMCompileState(CompileState):
             execution_options,
             bind_arguments,
         )
+        querycontext.execution_context = execution_context
         return loading.instances(result, querycontext)
 
     @property
@@ -715,6 +772,10 @@ class FromStatement(GroupedElement, Generative, TypedReturnsRows[_TP]):
     def _inline(self):
         return self.element._inline if is_insert_update(self.element) else None
 
+    @property
+    def _return_defaults(self):
+        return self.element._return_defaults if is_dml(self.element) else None
+
 
 @sql.base.CompileState.plugin_for("orm", "select")
 class ORMSelectCompileState(ORMCompileState, SelectState):
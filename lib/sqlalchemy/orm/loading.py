@@ -17,6 +17,7 @@ as well as some of the attribute loading strategies.
 
 from __future__ import annotations
 
+from time import perf_counter
 from typing import Any
 from typing import Dict
 from typing import Iterable
@@ -37,6 +38,8 @@ from .base import _DEFER_FOR_STATE
 from .base import _RAISE_FOR_STATE
 from .base import _SET_DEFERRED_EXPIRED
 from .base import PassiveFlag
+from .state import _DeferredCollectionsInstanceState
+from .state import InstanceState
 from .util import _none_set
 from .util import state_str
 from .. import exc as sa_exc
@@ -59,7 +62,6 @@ if TYPE_CHECKING:
     from .mapper import Mapper
     from .query import Query
     from .session import Session
-    from .state import InstanceState
     from ..engine.cursor import CursorResult
     from ..engine.interfaces import _ExecuteOptions
     from ..engine.result import Result
@@ -69,6 +71,13 @@ _T = TypeVar("_T", bound=Any)
 _O = TypeVar("_O", bound=object)
 _new_runid = util.counter()
 
+_SELECTIN_CHUNKSIZE = 500
+"""default number of primary keys rendered into each SELECT..IN
+emitted by selectin eager and polymorphic loading"""
+
+_ADAPTIVE_MIN_CHUNKSIZE = 50
+_ADAPTIVE_TARGET_TIME = 0.25
+
 
 _PopulatorDict = Dict[str, List[Tuple[str, Any]]]
 
@@ -175,7 +184,7 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
             context.partials = {}
 
             if yield_per:
-                fetch = cursor.fetchmany(yield_per)
+                fetch = cursor._fetchmany_capped(yield_per)
 
                 if not fetch:
                     break
@@ -850,17 +859,27 @@ def _instance_processor(
         else path
     )
 
-    session_identity_map = context.session.identity_map
-
     populate_existing = context.populate_existing or mapper.always_refresh
     load_evt = bool(mapper.class_manager.dispatch.load)
     refresh_evt = bool(mapper.class_manager.dispatch.refresh)
-    persistent_evt = bool(context.session.dispatch.loaded_as_persistent)
+
+    if context.readonly_identity_map is not None:
+        # "readonly_load"; objects are uniqued against an identity map
+        # local to this load and are returned in the detached state
+        session_identity_map = context.readonly_identity_map
+        session_id = None
+        persistent_evt = False
+        new_instance = _readonly_new_instance(mapper.class_manager)
+    else:
+        session_identity_map = context.session.identity_map
+        session_id = context.session.hash_key
+        persistent_evt = bool(context.session.dispatch.loaded_as_persistent)
+        new_instance = mapper.class_manager.new_instance
+
     if persistent_evt:
         loaded_as_persistent = context.session.dispatch.loaded_as_persistent
     instance_state = attributes.instance_state
     instance_dict = attributes.instance_dict
-    session_id = context.session.hash_key
     runid = context.runid
     identity_token = context.identity_token
 
@@ -879,14 +898,17 @@ def _instance_processor(
         if key in context.attributes and context.attributes[key].strategy == (
             ("selectinload_polymorphic", True),
         ):
+            local_opts = context.attributes[key].local_opts
             selectin_load_via = mapper._should_selectin_load(
-                context.attributes[key].local_opts["entities"],
+                local_opts["entities"],
                 _polymorphic_from,
             )
+            selectin_chunksize = local_opts.get("chunksize")
         else:
             selectin_load_via = mapper._should_selectin_load(
                 None, _polymorphic_from
             )
+            selectin_chunksize = None
 
         if selectin_load_via and selectin_load_via is not _polymorphic_from:
             # only_load_props goes w/ refresh_state only, and in a refresh
@@ -894,7 +916,9 @@ def _instance_processor(
             # loading does not apply
             assert only_load_props is None
 
-            callable_ = _load_subclass_via_in(context, path, selectin_load_via)
+            callable_ = _load_subclass_via_in(
+                context, path, selectin_load_via, selectin_chunksize
+            )
 
             PostLoad.callable_for_path(
                 context,
@@ -974,7 +998,7 @@ def _instance_processor(
                 currentload = True
                 loaded_instance = True
 
-                instance = mapper.class_manager.new_instance()
+                instance = new_instance()
 
                 dict_ = instance_dict(instance)
                 state = instance_state(instance)
@@ -982,7 +1006,8 @@ def _instance_processor(
                 state.identity_token = identity_token
 
                 # attach instance to session.
-                state.session_id = session_id
+                if session_id is not None:
+                    state.session_id = session_id
                 session_identity_map._add_unpresent(state, identitykey)
 
         effective_populate_existing = populate_existing
@@ -1116,7 +1141,96 @@ def _instance_processor(
     return _instance
 
 
-def _load_subclass_via_in(context, path, entity):
+def _readonly_new_instance(manager):
+    """Return a callable producing new instances for a "readonly_load",
+    using an :class:`.InstanceState` that defers creating its collections.
+
+    """
+    state_constructor = manager._state_constructor
+    if state_constructor is not InstanceState:
+        # custom instrumentation
+        return manager.new_instance
+
+    class_ = manager.class_
+    state_setter = manager._state_setter
+
+    def new_instance():
+        instance = class_.__new__(class_)
+        state_setter(
+            instance, _DeferredCollectionsInstanceState(instance, manager)
+        )
+        return instance
+
+    return new_instance
+
+
+def _selectin_chunks(context, items, chunksize, num_params):
+    """Yield successive slices of ``items`` to be loaded via SELECT..IN.
+
+    ``chunksize`` is the value given to the loader option; if None,
+    the ``selectin_chunksize`` execution option is consulted, which
+    may be established at the engine, connection or statement level.
+    The string ``"adaptive"`` scales each chunk after the first by how
+    long the consumer took to process the previous one, aiming at a round
+    trip of roughly a quarter of a second.
+
+    Chunks are additionally capped so that ``num_params`` bound parameters
+    per item stay within the dialect's
+    :attr:`.Dialect.max_bind_parameters` and
+    :attr:`.Dialect.max_in_list_elements` limits.
+
+    """
+    execution_context = context.execution_context
+    if chunksize is None:
+        if execution_context is not None:
+            execution_options = execution_context.execution_options
+        else:
+            execution_options = context.execution_options
+        chunksize = execution_options.get(
+            "selectin_chunksize", _SELECTIN_CHUNKSIZE
+        )
+
+    adaptive = chunksize == "adaptive"
+    if adaptive:
+        chunksize = _SELECTIN_CHUNKSIZE
+
+    ceiling = None
+    if execution_context is not None:
+        dialect = execution_context.dialect
+        if dialect.max_bind_parameters is not None:
+            ceiling = max(1, dialect.max_bind_parameters // num_params)
+        if dialect.max_in_list_elements is not None:
+            ceiling = min(
+                ceiling or dialect.max_in_list_elements,
+                dialect.max_in_list_elements,
+            )
+        if ceiling is not None:
+            chunksize = min(chunksize, ceiling)
+
+    start = 0
+    total = len(items)
+    while start < total:
+        chunk = items[start : start + chunksize]
+        start += chunksize
+
+        if not adaptive:
+            yield chunk
+            continue
+
+        now = perf_counter()
+        yield chunk
+        elapsed = perf_counter() - now
+
+        if elapsed > 0:
+            # move toward the target time, at most doubling or halving
+            # the size for each round trip
+            factor = min(2.0, max(0.5, _ADAPTIVE_TARGET_TIME / elapsed))
+            chunksize = max(_ADAPTIVE_MIN_CHUNKSIZE, int(chunksize * factor))
+            if ceiling is not None:
+                chunksize = min(chunksize, ceiling)
+
+
+def _load_subclass_via_in(context, path, entity, chunksize=None):
     mapper = entity.mapper
 
     zero_idx = len(mapper.base_mapper.primary_key) == 1
@@ -1137,16 +1251,21 @@ def _load_subclass_via_in(context, path, entity):
 
         if context.populate_existing:
             q2 = q2.execution_options(populate_existing=True)
+        execution_options = context._eager_load_execution_options()
 
-        context.session.execute(
-            q2,
-            dict(
-                primary_keys=[
-                    state.key[1][0] if zero_idx else state.key[1]
-                    for state, load_attrs in states
-                ]
-            ),
-        ).unique().scalars().all()
+        for chunk in _selectin_chunks(
+            context, states, chunksize, len(mapper.base_mapper.primary_key)
+        ):
+            context.session.execute(
+                q2,
+                dict(
+                    primary_keys=[
+                        state.key[1][0] if zero_idx else state.key[1]
+                        for state, load_attrs in chunk
+                    ]
+                ),
+                execution_options=execution_options,
+            ).unique().scalars().all()
 
     return do_load
 
@@ -24,6 +24,8 @@ import operator
 from typing import Any
 from typing import Dict
 from typing import Iterable
+from typing import List
+from typing import Optional
 from typing import TYPE_CHECKING
 from typing import TypeVar
 from typing import Union
@@ -35,6 +37,9 @@ from . import loading
 from . import sync
 from .base import NO_VALUE
 from .base import state_str
+from .context import _orm_load_exec_options
+from .context import FromStatement
+from .context import ORMFromStatementCompileState
 from .. import exc as sa_exc
 from .. import future
 from .. import sql
@@ -59,6 +64,10 @@ if TYPE_CHECKING:
     from .mapper import Mapper
     from .session import SessionTransaction
     from .state import InstanceState
+    from ..engine import Connection
+    from ..engine import CursorResult
+    from ..engine.interfaces import _ExecuteOptions
+    from ..sql.base import Executable
 
 _O = TypeVar("_O", bound=object)
 
@@ -66,14 +75,17 @@ _O = TypeVar("_O", bound=object)
 def _bulk_insert(
     mapper: Mapper[_O],
     mappings: Union[Iterable[InstanceState[_O]], Iterable[Dict[str, Any]]],
-    session_transaction: SessionTransaction,
+    session_transaction: Optional[SessionTransaction],
     isstates: bool,
     return_defaults: bool,
     render_nulls: bool,
-) -> None:
+    connection: Optional[Connection] = None,
+    use_orm_insert_stmt: Optional[Executable] = None,
+    execution_options: Optional[_ExecuteOptions] = None,
+) -> Optional[List[CursorResult[Any]]]:
     base_mapper = mapper.base_mapper
 
-    if session_transaction.session.connection_callable:
+    if connection is None and session_transaction.session.connection_callable:
         raise NotImplementedError(
             "connection_callable / per-instance sharding "
             "not supported in bulk_insert()"
@@ -88,7 +100,11 @@ def _bulk_insert(
     else:
         mappings = list(mappings)
 
-    connection = session_transaction.connection(base_mapper)
+    if connection is None:
+        connection = session_transaction.connection(base_mapper)
+
+    return_result = None
+
     for table, super_mapper in base_mapper._sorted_tables.items():
         if not mapper.isa(super_mapper):
             continue
@@ -121,14 +137,20 @@ def _bulk_insert(
                 render_nulls=render_nulls,
             )
         )
-        _emit_insert_statements(
+        result = _emit_insert_statements(
             base_mapper,
             None,
             super_mapper,
             table,
             records,
             bookkeeping=return_defaults,
+            use_orm_insert_stmt=use_orm_insert_stmt
+            if table is mapper.local_table
+            else None,
+            execution_options=execution_options,
         )
+        if use_orm_insert_stmt is not None and table is mapper.local_table:
+            return_result = result
 
     if return_defaults and isstates:
         identity_cls = mapper._identity_class
@@ -139,14 +161,18 @@ def _bulk_insert(
                 tuple([dict_[key] for key in identity_props]),
             )
 
+    return return_result
+
 
 def _bulk_update(
     mapper: Mapper[Any],
     mappings: Union[Iterable[InstanceState[_O]], Iterable[Dict[str, Any]]],
-    session_transaction: SessionTransaction,
+    session_transaction: Optional[SessionTransaction],
     isstates: bool,
     update_changed_only: bool,
-) -> None:
+    connection: Optional[Connection] = None,
+    execution_options: Optional[_ExecuteOptions] = None,
+) -> List[CursorResult[Any]]:
     base_mapper = mapper.base_mapper
 
     search_keys = mapper._primary_key_propkeys
@@ -168,13 +194,16 @@ def _bulk_update(
     else:
         mappings = list(mappings)
 
-    if session_transaction.session.connection_callable:
-        raise NotImplementedError(
-            "connection_callable / per-instance sharding "
-            "not supported in bulk_update()"
-        )
+    if connection is None:
+        if session_transaction.session.connection_callable:
+            raise NotImplementedError(
+                "connection_callable / per-instance sharding "
+                "not supported in bulk_update()"
+            )
+
+        connection = session_transaction.connection(base_mapper)
 
-    connection = session_transaction.connection(base_mapper)
+    return_results: List[CursorResult[Any]] = []
 
     for table, super_mapper in base_mapper._sorted_tables.items():
         if not mapper.isa(super_mapper):
@@ -200,15 +229,26 @@ def _bulk_update(
             bulk=True,
         )
 
-        _emit_update_statements(
+        results = _emit_update_statements(
             base_mapper,
             None,
             super_mapper,
             table,
             records,
             bookkeeping=False,
+            execution_options=execution_options,
         )
 
+        # report on the first table, in dependency order, that received
+        # an UPDATE; for a multi-table mapping this is the base-most
+        # table with values present, which is documented as the source
+        # of the rowcount.  Adding up the tables instead would count a
+        # row that's updated in more than one table more than once
+        if not return_results:
+            return_results = results
+
+    return return_results
+
 
 def save_obj(base_mapper, states, uowtransaction, single=False):
     """Issue ``INSERT`` and/or ``UPDATE`` statements for a list
@@ -871,16 +911,23 @@ def _emit_update_statements(
     table,
     update,
     bookkeeping=True,
+    execution_options=None,
 ):
     """Emit UPDATE statements corresponding to value lists collected
-    by _collect_update_commands()."""
+    by _collect_update_commands().
+
+    Returns the list of :class:`.CursorResult` objects produced.
+
+    """
 
     needs_version_id = (
         mapper.version_id_col is not None
         and mapper.version_id_col in mapper._cols_by_table[table]
     )
 
-    execution_options = {"compiled_cache": base_mapper._compiled_cache}
+    execution_options = _persistence_execution_options(
+        base_mapper, execution_options
+    )
 
     def update_stmt():
         clauses = BooleanClauseList._construct_raw(operators.and_)
@@ -904,6 +951,8 @@ def _emit_update_statements(
 
     cached_stmt = base_mapper._memo(("update", table), update_stmt)
 
+    return_results = []
+
     for (
         (connection, paramkeys, hasvalue, has_all_defaults, has_all_pks),
         records,
@@ -965,6 +1014,7 @@ def _emit_update_statements(
                     params,
                     execution_options=execution_options,
                 )
+                return_results.append(c)
                 if bookkeeping:
                     _postfetch(
                         mapper,
@@ -996,6 +1046,7 @@ def _emit_update_statements(
                     c = connection.execute(
                         statement, params, execution_options=execution_options
                     )
+                    return_results.append(c)
 
                     # TODO: why with bookkeeping=False?
                     if bookkeeping:
@@ -1022,6 +1073,7 @@ def _emit_update_statements(
                 c = connection.execute(
                     statement, multiparams, execution_options=execution_options
                 )
+                return_results.append(c)
 
                 rows += c.rowcount
 
@@ -1066,6 +1118,8 @@ def _emit_update_statements(
                 % c.dialect.dialect_description
             )
 
+    return return_results
+
 
 def _emit_insert_statements(
     base_mapper,
@@ -1074,13 +1128,31 @@ def _emit_insert_statements(
     table,
     insert,
     bookkeeping=True,
+    use_orm_insert_stmt=None,
+    execution_options=None,
 ):
     """Emit INSERT statements corresponding to value lists collected
-    by _collect_insert_commands()."""
+    by _collect_insert_commands().
 
-    cached_stmt = base_mapper._memo(("insert", table), table.insert)
+    When ``use_orm_insert_stmt`` is passed, it is executed in place of
+    the plain table INSERT for every group of records, with
+    ``return_defaults()`` applied to it where generated values need to be
+    fetched for bookkeeping.  The list of :class:`.CursorResult` objects
+    produced is returned so that any RETURNING rows and rowcounts can be
+    delivered to the caller.
 
-    execution_options = {"compiled_cache": base_mapper._compiled_cache}
+    """
+
+    return_results = []
+
+    if use_orm_insert_stmt is not None:
+        cached_stmt = use_orm_insert_stmt
+    else:
+        cached_stmt = base_mapper._memo(("insert", table), table.insert)
+
+    execution_options = _persistence_execution_options(
+        base_mapper, execution_options
+    )
 
     for (
         (connection, pkeys, hasvalue, has_all_pks, has_all_defaults),
@@ -1118,6 +1190,7 @@ def _emit_insert_statements(
             c = connection.execute(
                 statement, multiparams, execution_options=execution_options
             )
+            return_results.append(c)
 
             if bookkeeping:
                 for (
@@ -1300,6 +1373,20 @@ def _emit_insert_statements(
                         else:
                             _postfetch_bulk_save(mapper_rec, state_dict, table)
 
+    return return_results
+
+
+def _persistence_execution_options(base_mapper, execution_options):
+    """Combine the mapper's compiled cache with execution options passed
+    along from :meth:`.Session.execute`, if any."""
+
+    if execution_options:
+        return util.immutabledict(
+            {"compiled_cache": base_mapper._compiled_cache}
+        ).union(execution_options)
+    else:
+        return {"compiled_cache": base_mapper._compiled_cache}
+
 
 def _emit_post_update_statements(
     base_mapper, uowtransaction, mapper, table, update
@@ -1756,11 +1843,13 @@ def _connections_for_states(base_mapper, uowtransaction, states):
         connection_callable = uowtransaction.session.connection_callable
     else:
         connection = uowtransaction.transaction.connection(base_mapper)
+        uowtransaction._pipeline_connection(connection)
         connection_callable = None
 
     for state in _sort_states(base_mapper, states):
         if connection_callable:
             connection = connection_callable(base_mapper, state.obj())
+            uowtransaction._pipeline_connection(connection)
 
         mapper = state.manager.mapper
 
@@ -1801,6 +1890,7 @@ class BulkUDCompileState(CompileState):
         _matched_objects = None
         _matched_rows = None
         _refresh_identity_token = None
+        _dml_strategy = "auto"
 
     @classmethod
     def orm_pre_session_exec(
@@ -1820,7 +1910,7 @@ class BulkUDCompileState(CompileState):
             execution_options,
         ) = BulkUDCompileState.default_update_options.from_execution_options(
             "_sa_orm_update_options",
-            {"synchronize_session"},
+            {"synchronize_session", "dml_strategy"},
             execution_options,
             statement._execution_options,
         )
@@ -1833,6 +1923,20 @@ class BulkUDCompileState(CompileState):
                     "are 'evaluate', 'fetch', False"
                 )
 
+        dml_strategy = update_options._dml_strategy
+        if dml_strategy not in ("auto", "bulk", "orm"):
+            raise sa_exc.ArgumentError(
+                "Valid strategies for ORM UPDATE and DELETE strategy "
+                "are 'auto', 'bulk', 'orm'"
+            )
+        elif dml_strategy == "auto":
+            dml_strategy = (
+                "bulk" if cls._use_bulk_strategy(statement, params) else "orm"
+            )
+        elif dml_strategy == "bulk":
+            cls._validate_bulk_strategy(statement, params)
+        update_options += {"_dml_strategy": dml_strategy}
+
         bind_arguments["clause"] = statement
         try:
             plugin_subject = statement._propagate_attrs["plugin_subject"]
@@ -1846,6 +1950,16 @@ class BulkUDCompileState(CompileState):
         if update_options._autoflush:
             session._autoflush()
 
+        if dml_strategy == "bulk":
+            # rows are located by primary key within each parameter
+            # dictionary, so there is no criteria to evaluate up front
+            return (
+                statement,
+                util.immutabledict(execution_options).union(
+                    {"_sa_orm_update_options": update_options}
+                ),
+            )
+
         statement = statement._annotate(
             {"synchronize_session": update_options._synchronize_session}
         )
@@ -1910,6 +2024,20 @@ class BulkUDCompileState(CompileState):
 
         return result
 
+    @classmethod
+    def _use_bulk_strategy(cls, statement, params):
+        """Return True if an ORM-enabled statement given the ``"auto"``
+        DML strategy should be run as a bulk statement by primary key."""
+
+        return False
+
+    @classmethod
+    def _validate_bulk_strategy(cls, statement, params):
+        raise sa_exc.InvalidRequestError(
+            "dml_strategy='bulk' is not supported for ORM-enabled %s "
+            "statements" % statement.__visit_name__.upper()
+        )
+
     @classmethod
     def _adjust_for_extra_criteria(cls, global_attributes, ext_info):
         """Apply extra criteria filtering.
@@ -2154,6 +2282,40 @@ class BulkUDCompileState(CompileState):
 
 
 class ORMDMLState:
+    @classmethod
+    def orm_execute_statement(
+        cls,
+        session,
+        statement,
+        params,
+        execution_options,
+        bind_arguments,
+        conn,
+    ):
+        result = conn.execute(
+            statement, params or {}, execution_options=execution_options
+        )
+        return cls.orm_setup_cursor_result(
+            session,
+            statement,
+            params,
+            execution_options,
+            bind_arguments,
+            result,
+        )
+
+    @classmethod
+    def _merge_bulk_results(cls, results):
+        """Return a single result for the statements emitted by a bulk
+        INSERT or UPDATE, reporting the total rowcount."""
+
+        if not results:
+            return _result.null_result()
+        elif len(results) == 1:
+            return results[0]
+        else:
+            return results[0].merge(*results[1:])
+
     @classmethod
     def get_entity_description(cls, statement):
         ext_info = statement.table._annotations["parententity"]
@@ -2201,6 +2363,9 @@ class ORMDMLState:
 
 @CompileState.plugin_for("orm", "insert")
 class ORMInsert(ORMDMLState, InsertDMLState):
+    class default_insert_options(Options):
+        _dml_strategy = "auto"
+
     @classmethod
     def orm_pre_session_exec(
         cls,
@@ -2211,6 +2376,16 @@ class ORMInsert(ORMDMLState, InsertDMLState):
         bind_arguments,
         is_reentrant_invoke,
     ):
+        (
+            insert_options,
+            execution_options,
+        ) = ORMInsert.default_insert_options.from_execution_options(
+            "_sa_orm_insert_options",
+            {"dml_strategy"},
+            execution_options,
+            statement._execution_options,
+        )
+
         bind_arguments["clause"] = statement
         try:
             plugin_subject = statement._propagate_attrs["plugin_subject"]
@@ -2219,11 +2394,165 @@ class ORMInsert(ORMDMLState, InsertDMLState):
         else:
             bind_arguments["mapper"] = plugin_subject.mapper
 
+        dml_strategy = insert_options._dml_strategy
+        if dml_strategy not in ("auto", "bulk", "raw"):
+            raise sa_exc.ArgumentError(
+                "Valid strategies for ORM insert strategy "
+                "are 'auto', 'bulk', 'raw'"
+            )
+
+        has_values = bool(
+            statement._values
+            or statement._multi_values
+            or statement.select is not None
+        )
+
+        if dml_strategy == "auto":
+            if isinstance(params, list) and params and not has_values:
+                dml_strategy = "bulk"
+            else:
+                dml_strategy = "raw"
+            insert_options += {"_dml_strategy": dml_strategy}
+        elif dml_strategy == "bulk":
+            if not isinstance(params, list) or not params:
+                raise sa_exc.InvalidRequestError(
+                    "dml_strategy='bulk' for ORM INSERT requires a list "
+                    "of parameter dictionaries"
+                )
+            elif has_values:
+                raise sa_exc.InvalidRequestError(
+                    "Bulk ORM INSERT does not support the values() or "
+                    "from_select() methods; pass the rows to be inserted "
+                    "as a list of parameter dictionaries"
+                )
+
         return (
             statement,
-            util.immutabledict(execution_options),
+            util.immutabledict(execution_options).union(
+                {"_sa_orm_insert_options": insert_options}
+            ),
+        )
+
+    @classmethod
+    def orm_execute_statement(
+        cls,
+        session,
+        statement,
+        params,
+        execution_options,
+        bind_arguments,
+        conn,
+    ):
+        insert_options = execution_options.get(
+            "_sa_orm_insert_options", cls.default_insert_options
+        )
+
+        if insert_options._dml_strategy != "bulk":
+            return super().orm_execute_statement(
+                session,
+                statement,
+                params,
+                execution_options,
+                bind_arguments,
+                conn,
+            )
+
+        mapper = statement._propagate_attrs["plugin_subject"].mapper
+
+        # joined inheritance needs primary key values generated by the
+        # base table INSERT to be carried along to the remaining tables
+        is_multi_table = mapper.local_table is not mapper.persist_selectable
+
+        if statement._returning:
+            if (
+                is_multi_table
+                or mapper.local_table not in mapper.base_mapper._sorted_tables
+            ):
+                raise sa_exc.InvalidRequestError(
+                    "Bulk ORM INSERT with RETURNING is not supported for "
+                    "%s, which is mapped to more than one table" % mapper
+                )
+            if (
+                len(params) > 1
+                and not conn.dialect.insert_executemany_returning
+            ):
+                raise sa_exc.InvalidRequestError(
+                    "Dialect %s does not support RETURNING for an INSERT "
+                    "statement that is given more than one parameter set"
+                    % conn.dialect.name
+                )
+            orm_stmt = FromStatement(statement._returning, statement)
+            execution_options = execution_options.union(
+                _orm_load_exec_options
+            )
+        else:
+            orm_stmt = statement
+
+        mappings = cls._bulk_insert_mappings(mapper, params, is_multi_table)
+
+        results = _bulk_insert(
+            mapper,
+            mappings,
+            None,
+            False,
+            is_multi_table,
+            False,
+            connection=conn,
+            use_orm_insert_stmt=orm_stmt,
+            execution_options=execution_options,
         )
 
+        if not statement._returning:
+            return cls._merge_bulk_results(results)
+
+        orm_results = [
+            ORMFromStatementCompileState.orm_setup_cursor_result(
+                session,
+                orm_stmt,
+                params,
+                execution_options,
+                bind_arguments,
+                result,
+            )
+            for result in results
+        ]
+        if len(orm_results) == 1:
+            return orm_results[0]
+        else:
+            return orm_results[0].merge(*orm_results[1:])
+
+    @classmethod
+    def _bulk_insert_mappings(cls, mapper, params, copy):
+        """Prepare parameter dictionaries for a bulk INSERT, supplying
+        the polymorphic identity of the mapper where not present.
+
+        Dictionaries are copied when they would otherwise be modified,
+        so that the caller's parameters are left unchanged.
+
+        """
+        polymorphic_key = None
+        if (
+            mapper.polymorphic_on is not None
+            and mapper.polymorphic_identity is not None
+            and mapper.polymorphic_on in mapper._columntoproperty
+        ):
+            polymorphic_key = mapper._columntoproperty[
+                mapper.polymorphic_on
+            ].key
+
+        if polymorphic_key is not None:
+            identity = mapper.polymorphic_identity
+            return [
+                dict(mapping)
+                if polymorphic_key in mapping
+                else dict(mapping, **{polymorphic_key: identity})
+                for mapping in params
+            ]
+        elif copy:
+            return [dict(mapping) for mapping in params]
+        else:
+            return params
+
     @classmethod
     def orm_setup_cursor_result(
         cls,
@@ -2298,6 +2627,127 @@ class BulkORMUpdate(ORMDMLState, UpdateDMLState, BulkUDCompileState):
 
         return self
 
+    @classmethod
+    def _use_bulk_strategy(cls, statement, params):
+        return bool(
+            isinstance(params, list)
+            and params
+            and not statement._where_criteria
+            and not statement._values
+            and not statement._ordered_values
+        )
+
+    @classmethod
+    def _validate_bulk_strategy(cls, statement, params):
+        if not isinstance(params, list) or not params:
+            raise sa_exc.InvalidRequestError(
+                "dml_strategy='bulk' for ORM UPDATE requires a list "
+                "of parameter dictionaries"
+            )
+        elif (
+            statement._where_criteria
+            or statement._values
+            or statement._ordered_values
+        ):
+            raise sa_exc.InvalidRequestError(
+                "Bulk ORM UPDATE locates rows using the primary key values "
+                "in each parameter dictionary, and does not support "
+                "WHERE criteria or the values() method"
+            )
+
+    @classmethod
+    def orm_execute_statement(
+        cls,
+        session,
+        statement,
+        params,
+        execution_options,
+        bind_arguments,
+        conn,
+    ):
+        update_options = execution_options.get(
+            "_sa_orm_update_options", cls.default_update_options
+        )
+
+        if update_options._dml_strategy != "bulk":
+            return super().orm_execute_statement(
+                session,
+                statement,
+                params,
+                execution_options,
+                bind_arguments,
+                conn,
+            )
+
+        mapper = update_options._subject_mapper
+
+        results = _bulk_update(
+            mapper,
+            params,
+            None,
+            False,
+            False,
+            connection=conn,
+            execution_options=execution_options,
+        )
+
+        if update_options._synchronize_session is not False:
+            cls._do_post_synchronize_bulk(
+                session, mapper, params, update_options
+            )
+
+        return cls._merge_bulk_results(results)
+
+    @classmethod
+    def _do_post_synchronize_bulk(
+        cls, session, mapper, params, update_options
+    ):
+        """Apply the values of a bulk UPDATE by primary key to those
+        objects already present in the :class:`.Session`."""
+
+        identity_map = session.identity_map
+        pk_keys = [prop.key for prop in mapper._identity_key_props]
+        version_key = (
+            mapper._version_id_prop.key if mapper._version_id_prop else None
+        )
+
+        states = set()
+        for mapping in params:
+            identity_key = mapper.identity_key_from_primary_key(
+                [mapping[key] for key in pk_keys],
+                identity_token=update_options._refresh_identity_token,
+            )
+            obj = identity_map.get(identity_key)
+            if obj is None:
+                continue
+
+            state, dict_ = (
+                attributes.instance_state(obj),
+                attributes.instance_dict(obj),
+            )
+
+            to_evaluate = state.unmodified.intersection(mapping).difference(
+                [version_key]
+            )
+            for key in to_evaluate:
+                if key in dict_:
+                    dict_[key] = mapping[key]
+
+            state.manager.dispatch.refresh(state, None, to_evaluate)
+
+            state._commit(dict_, list(to_evaluate))
+
+            to_expire = (
+                set(mapping).intersection(dict_).difference(to_evaluate)
+            )
+            if version_key is not None and version_key in dict_:
+                to_expire.add(version_key)
+            if to_expire:
+                state._expire_attributes(dict_, to_expire)
+
+            states.add(state)
+        session._register_altered(states)
+
     @classmethod
     def _get_crud_kv_pairs(cls, statement, kv_iterator):
         plugin_subject = statement._propagate_attrs["plugin_subject"]
@@ -97,6 +97,7 @@ if TYPE_CHECKING:
     from ._typing import _EntityType
     from ._typing import _ExternalEntityType
     from ._typing import _InternalEntityType
+    from .identity import IdentityMap
     from .mapper import Mapper
     from .path_registry import PathRegistry
     from .session import _PKIdentityArgument
@@ -364,6 +365,16 @@ class Query(
         self.load_options += {"_lazy_loaded_from": state}
         return self
 
+    @_generative
+    def _set_readonly_identity_map(
+        self: SelfQuery, identity_map: IdentityMap
+    ) -> SelfQuery:
+        self.load_options += {
+            "_readonly_load": True,
+            "_readonly_identity_map": identity_map,
+        }
+        return self
+
     def _get_condition(self) -> None:
         """used by legacy BakedQuery"""
         self._no_criterion_condition("get", order_by=False, distinct=False)
@@ -1005,6 +1005,57 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
             state._strong_obj = None
 
 
+_committed_state_slot = InstanceState.committed_state  # type: ignore
+_expired_attributes_slot = InstanceState.expired_attributes  # type: ignore
+
+
+class _DeferredCollectionsInstanceState(InstanceState[_O]):
+    """An :class:`.InstanceState` that creates its ``committed_state``
+    and ``expired_attributes`` collections on first access.
+
+    Used for objects loaded with the ``readonly_load`` execution option,
+    which are typically discarded without ever being modified; the
+    collections are otherwise the largest part of an unmodified state.
+    Once created, the state behaves identically to a plain
+    :class:`.InstanceState`, including after the object is added to a
+    :class:`.Session`.
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, obj: _O, manager: ClassManager[_O]):
+        self.class_ = obj.__class__
+        self.manager = manager
+        self.obj = weakref.ref(obj, self._cleanup)
+
+    @property  # type: ignore[override]
+    def committed_state(self) -> Dict[str, Any]:
+        try:
+            return _committed_state_slot.__get__(self)  # type: ignore
+        except AttributeError:
+            committed_state: Dict[str, Any] = {}
+            _committed_state_slot.__set__(self, committed_state)
+            return committed_state
+
+    @committed_state.setter
+    def committed_state(self, value: Dict[str, Any]) -> None:
+        _committed_state_slot.__set__(self, value)
+
+    @property  # type: ignore[override]
+    def expired_attributes(self) -> Set[str]:
+        try:
+            return _expired_attributes_slot.__get__(self)  # type: ignore
+        except AttributeError:
+            expired_attributes: Set[str] = set()
+            _expired_attributes_slot.__set__(self, expired_attributes)
+            return expired_attributes
+
+    @expired_attributes.setter
+    def expired_attributes(self, value: Set[str]) -> None:
+        _expired_attributes_slot.__set__(self, value)
+
+
 class AttributeState:
     """Provide an inspection interface corresponding
     to a particular attribute on a particular mapped object.
@@ -1598,6 +1598,7 @@ class SubqueryLoader(PostLoader):
             "session",
             "execution_options",
             "load_options",
+            "readonly_identity_map",
             "params",
             "subq",
             "_data",
@@ -1609,6 +1610,7 @@ class SubqueryLoader(PostLoader):
             self.session = context.session
             self.execution_options = context.execution_options
             self.load_options = context.load_options
+            self.readonly_identity_map = context.readonly_identity_map
             self.params = context.params or {}
             self.subq = subq
             self._data = None
@@ -1628,6 +1630,8 @@ class SubqueryLoader(PostLoader):
 
             if self.load_options._populate_existing:
                 q = q.populate_existing()
+            if self.readonly_identity_map is not None:
+                q = q._set_readonly_identity_map(self.readonly_identity_map)
             # to work with baked query, the parameters may have been
             # updated since this query was created, so take these into account
 
@@ -2676,8 +2680,6 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         ],
     )
 
-    _chunksize = 500
-
     def __init__(self, parent, strategy_key):
         super(SelectInLoader, self).__init__(parent, strategy_key)
         self.join_depth = self.parent_property.join_depth
@@ -3033,21 +3035,29 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                     _setup_outermost_orderby, self.parent_property
                 )
 
+        chunksize = loadopt.local_opts.get("chunksize") if loadopt else None
+
         if query_info.load_only_child:
             self._load_via_child(
-                our_states, none_states, query_info, q, context
+                our_states, none_states, query_info, q, context, chunksize
             )
         else:
-            self._load_via_parent(our_states, query_info, q, context)
+            self._load_via_parent(
+                our_states, query_info, q, context, chunksize
+            )
 
-    def _load_via_child(self, our_states, none_states, query_info, q, context):
+    def _load_via_child(
+        self, our_states, none_states, query_info, q, context, chunksize
+    ):
         uselist = self.uselist
 
+        execution_options = context._eager_load_execution_options()
+
         # this sort is really for the benefit of the unit tests
         our_keys = sorted(our_states)
-        while our_keys:
-            chunk = our_keys[0 : self._chunksize]
-            our_keys = our_keys[self._chunksize :]
+        for chunk in loading._selectin_chunks(
+            context, our_keys, chunksize, len(query_info.pk_cols)
+        ):
             data = {
                 k: v
                 for k, v in context.session.execute(
@@ -3058,6 +3068,7 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                             for key in chunk
                         ]
                     },
+                    execution_options=execution_options,
                 ).unique()
             }
 
@@ -3086,14 +3097,14 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             # collection will be populated
             state.get_impl(self.key).set_committed_value(state, dict_, None)
 
-    def _load_via_parent(self, our_states, query_info, q, context):
+    def _load_via_parent(self, our_states, query_info, q, context, chunksize):
         uselist = self.uselist
         _empty_result = () if uselist else None
+        execution_options = context._eager_load_execution_options()
 
-        while our_states:
-            chunk = our_states[0 : self._chunksize]
-            our_states = our_states[self._chunksize :]
-
+        for chunk in loading._selectin_chunks(
+            context, our_states, chunksize, len(query_info.pk_cols)
+        ):
             primary_keys = [
                 key[0] if query_info.zero_idx else key
                 for key, state, state_dict, overwrite in chunk
@@ -3102,7 +3113,9 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             data = collections.defaultdict(list)
             for k, v in itertools.groupby(
                 context.session.execute(
-                    q, params={"primary_keys": primary_keys}
+                    q,
+                    params={"primary_keys": primary_keys},
+                    execution_options=execution_options,
                 ).unique(),
                 lambda x: x[0],
             ):
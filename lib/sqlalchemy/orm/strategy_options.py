@@ -344,7 +344,9 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
         return self._set_relationship_strategy(attr, {"lazy": "subquery"})
 
     def selectinload(
-        self: Self_AbstractLoad, attr: _AttrType
+        self: Self_AbstractLoad,
+        attr: _AttrType,
+        chunksize: Optional[Union[int, Literal["adaptive"]]] = None,
     ) -> Self_AbstractLoad:
         """Indicate that the given attribute should be loaded using
         SELECT IN eager loading.
@@ -366,6 +368,21 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
             query(Order).options(
                 lazyload(Order.items).selectinload(Item.keywords))
 
+            # load Order.items for 5000 orders at a time
+            query(Order).options(selectinload(Order.items, chunksize=5000))
+
+        :param chunksize: the number of parent primary key values to render
+         into each SELECT.  When omitted, the ``selectin_chunksize``
+         execution option is used if present, which may be set at the
+         :class:`_engine.Engine`, :class:`_engine.Connection` or statement
+         level, else the default of 500.  The value ``"adaptive"`` starts
+         from that size and then grows or shrinks each subsequent chunk
+         based on how long the previous one took to load.  In all cases the
+         size is limited to what fits within the dialect's bound parameter
+         limit.
+
+         .. versionadded:: 2.0
+
         .. versionadded:: 1.2
 
         .. seealso::
@@ -375,7 +392,13 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
             :ref:`selectin_eager_loading`
 
         """
-        return self._set_relationship_strategy(attr, {"lazy": "selectin"})
+        return self._set_relationship_strategy(
+            attr,
+            {"lazy": "selectin"},
+            opts={"chunksize": _coerce_chunksize(chunksize)}
+            if chunksize is not None
+            else util.EMPTY_DICT,
+        )
 
     def lazyload(
         self: Self_AbstractLoad, attr: _AttrType
@@ -707,7 +730,9 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
         )
 
     def selectin_polymorphic(
-        self: Self_AbstractLoad, classes: Iterable[Type[Any]]
+        self: Self_AbstractLoad,
+        classes: Iterable[Type[Any]],
+        chunksize: Optional[Union[int, Literal["adaptive"]]] = None,
     ) -> Self_AbstractLoad:
         """Indicate an eager load should take place for all attributes
         specific to a subclass.
@@ -716,6 +741,13 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
         key values, and is the per-query analogue to the ``"selectin"``
         setting on the :paramref:`.mapper.polymorphic_load` parameter.
 
+        :param chunksize: the number of primary key values to render into
+         each SELECT; accepts the same values as the
+         :paramref:`_orm.selectinload.chunksize` parameter of
+         :func:`_orm.selectinload`.
+
+         .. versionadded:: 2.0
+
         .. versionadded:: 1.2
 
         .. seealso::
@@ -723,13 +755,16 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
             :ref:`polymorphic_selectin`
 
         """
+        opts: Dict[str, Any] = {
+            "entities": tuple(
+                sorted((inspect(cls) for cls in classes), key=id)
+            )
+        }
+        if chunksize is not None:
+            opts["chunksize"] = _coerce_chunksize(chunksize)
         self = self._set_class_strategy(
             {"selectinload_polymorphic": True},
-            opts={
-                "entities": tuple(
-                    sorted((inspect(cls) for cls in classes), key=id)
-                )
-            },
+            opts=opts,
         )
         return self
 
@@ -2292,6 +2327,21 @@ def _parse_attr_argument(
     return insp, lead_entity, prop
 
 
+def _coerce_chunksize(
+    chunksize: Union[int, Literal["adaptive"]]
+) -> Union[int, Literal["adaptive"]]:
+    if chunksize == "adaptive" or (
+        isinstance(chunksize, int)
+        and not isinstance(chunksize, bool)
+        and chunksize > 0
+    ):
+        return chunksize
+    raise sa_exc.ArgumentError(
+        "chunksize must be a positive integer or the string 'adaptive'; "
+        "got %r" % (chunksize,)
+    )
+
+
 def loader_unbound_fn(fn: _FN) -> _FN:
     """decorator that applies docstrings between standalone loader functions
     and the loader methods on :class:`._AbstractLoad`.
@@ -2338,8 +2388,8 @@ def subqueryload(*keys: _AttrType) -> _AbstractLoad:
 
 
 @loader_unbound_fn
-def selectinload(*keys: _AttrType) -> _AbstractLoad:
-    return _generate_from_keys(Load.selectinload, keys, False, {})
+def selectinload(*keys: _AttrType, **kw: Any) -> _AbstractLoad:
+    return _generate_from_keys(Load.selectinload, keys, False, kw)
 
 
 @loader_unbound_fn
@@ -2408,7 +2458,9 @@ def with_expression(
 
 @loader_unbound_fn
 def selectin_polymorphic(
-    base_cls: _EntityType[Any], classes: Iterable[Type[Any]]
+    base_cls: _EntityType[Any],
+    classes: Iterable[Type[Any]],
+    chunksize: Optional[Union[int, Literal["adaptive"]]] = None,
 ) -> _AbstractLoad:
     ul = Load(base_cls)
-    return ul.selectin_polymorphic(classes)
+    return ul.selectin_polymorphic(classes, chunksize=chunksize)
@@ -17,6 +17,7 @@ organizes them in order of dependency, and executes.
 
 from __future__ import annotations
 
+import contextlib
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -38,6 +39,7 @@ if TYPE_CHECKING:
     from .session import Session
     from .session import SessionTransaction
     from .state import InstanceState
+    from ..engine import Connection
 
 
 def track_cascade_events(descriptor, prop):
@@ -199,6 +201,11 @@ class UOWTransaction:
         # columns which should be included in the update.
         self.post_update_states = util.defaultdict(lambda: (set(), set()))
 
+        # while the flush is executing, an ExitStack holding the
+        # Connection.pipeline() contexts of the connections in use
+        self._pipelines: Optional[contextlib.ExitStack] = None
+        self._pipelined_connections: Set[Connection] = set()
+
     @property
     def has_work(self):
         return bool(self.states)
@@ -446,17 +453,40 @@ class UOWTransaction:
         # print "\nCOUNT OF POSTSORT ACTIONS", len(postsort_actions)
 
         # execute
-        if self.cycles:
-            for subset in topological.sort_as_subsets(
-                self.dependencies, postsort_actions
-            ):
-                set_ = set(subset)
-                while set_:
-                    n = set_.pop()
-                    n.execute_aggregate(self, set_)
-        else:
-            for rec in topological.sort(self.dependencies, postsort_actions):
-                rec.execute(self)
+        with contextlib.ExitStack() as self._pipelines:
+            try:
+                if self.cycles:
+                    for subset in topological.sort_as_subsets(
+                        self.dependencies, postsort_actions
+                    ):
+                        set_ = set(subset)
+                        while set_:
+                            n = set_.pop()
+                            n.execute_aggregate(self, set_)
+                else:
+                    for rec in topological.sort(
+                        self.dependencies, postsort_actions
+                    ):
+                        rec.execute(self)
+            finally:
+                self._pipelines = None
+
+    def _pipeline_connection(self, connection: Connection) -> None:
+        """Place the given connection in pipeline mode for the remainder of
+        the flush, if supported by its dialect.
+
+        Statements whose results aren't needed may then be sent without
+        waiting for the results of previous statements; leaving pipeline
+        mode at the end of the flush waits for all outstanding results.
+
+        """
+        if (
+            self._pipelines is not None
+            and connection.dialect.supports_pipeline
+            and connection not in self._pipelined_connections
+        ):
+            self._pipelined_connections.add(connection)
+            self._pipelines.enter_context(connection.pipeline())
 
     def finalize_flush_changes(self) -> None:
         """Mark processed objects as clean / deleted after a successful
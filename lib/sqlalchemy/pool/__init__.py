@@ -41,3 +41,6 @@ from .impl import NullPool as NullPool
 from .impl import QueuePool as QueuePool
 from .impl import SingletonThreadPool as SingletonThreadPool
 from .impl import StaticPool as StaticPool
+from .metrics import HistogramSnapshot as HistogramSnapshot
+from .metrics import PoolMetrics as PoolMetrics
+from .metrics import PoolMetricsSnapshot as PoolMetricsSnapshot
@@ -29,6 +29,7 @@ from typing import TYPE_CHECKING
 from typing import Union
 import weakref
 
+from .metrics import PoolMetrics
 from .. import event
 from .. import exc
 from .. import log
@@ -91,6 +92,11 @@ class _ConnDialect:
     def get_driver_connection(self, connection: DBAPIConnection) -> Any:
         return connection
 
+    def is_dbapi_transaction_active(
+        self, dbapi_connection: DBAPIConnection
+    ) -> Optional[bool]:
+        return None
+
 
 class _AsyncConnDialect(_ConnDialect):
     is_async = True
@@ -119,6 +125,18 @@ class Pool(log.Identified, event.EventTarget):
     _invoke_creator: _CreatorWRecFnType
     _invalidate_time: float
 
+    metrics: Optional[PoolMetrics] = None
+    """The :class:`.PoolMetrics` collecting statistics for this pool, or
+    ``None`` if metrics are not enabled.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :paramref:`_pool.Pool.metrics`
+
+    """
+
     def __init__(
         self,
         creator: Union[_CreatorFnType, _CreatorWRecFnType],
@@ -129,6 +147,7 @@ class Pool(log.Identified, event.EventTarget):
         events: Optional[List[Tuple[_ListenerFnType, str]]] = None,
         dialect: Optional[Union[_ConnDialect, Dialect]] = None,
         pre_ping: bool = False,
+        metrics: Union[bool, PoolMetrics] = False,
         _dispatch: Optional[_DispatchCommon[Pool]] = None,
     ):
         """
@@ -222,6 +241,20 @@ class Pool(log.Identified, event.EventTarget):
 
          .. versionadded:: 1.2
 
+        :param metrics: if True, the pool will collect statistics on
+         checkout wait times, connection hold times, connect times,
+         overflow, timeouts and invalidations, made available via the
+         :attr:`_pool.Pool.metrics` attribute.  An existing
+         :class:`.PoolMetrics` object may also be passed, so that
+         statistics are accumulated across several pools.  Defaults to
+         False.
+
+         .. versionadded:: 2.0
+
+         .. seealso::
+
+            :ref:`pool_metrics`
+
         """
         if logging_name:
             self.logging_name = self._orig_logging_name = logging_name
@@ -233,6 +266,10 @@ class Pool(log.Identified, event.EventTarget):
         self._recycle = recycle
         self._invalidate_time = 0
         self._pre_ping = pre_ping
+        if metrics is True:
+            self.metrics = PoolMetrics()
+        else:
+            self.metrics = metrics or None
         self._reset_on_return = util.parse_user_argument_for_enum(
             reset_on_return,
             {
@@ -346,6 +383,18 @@ class Pool(log.Identified, event.EventTarget):
         if _checkin and getattr(connection, "is_valid", False):
             connection.invalidate(exception)
 
+    def start(self) -> None:
+        """Start any background work this pool performs, such as the
+        maintenance task of :class:`.QueuePool`.
+
+        This is called by :func:`_sa.create_engine` and
+        :meth:`_engine.Engine.dispose` once the pool's event listeners are
+        in place.  It does nothing for pools which have no background work.
+
+        .. versionadded:: 2.0
+
+        """
+
     def recreate(self) -> Pool:
         """Return a new :class:`_pool.Pool`, of the same class as this one
         and configured with identical creation arguments.
@@ -392,6 +441,14 @@ class Pool(log.Identified, event.EventTarget):
         """
         self._do_return_conn(record)
 
+    def _acquire_connect_slot(self) -> None:
+        """Called before a new DBAPI connection is established, supplied
+        by subclasses which limit concurrent connection attempts."""
+
+    def _release_connect_slot(self) -> None:
+        """Called after an attempt to establish a new DBAPI connection
+        has completed."""
+
     def _do_get(self) -> ConnectionPoolEntry:
         """Implementation for :meth:`get`, supplied by subclasses."""
 
@@ -630,6 +687,9 @@ class _ConnectionRecord(ConnectionPoolEntry):
         return self.dbapi_connection
 
     _soft_invalidate_time: float = 0
+    _checkin_time: float = 0
+    _checkout_time: float = 0
+    _transaction_clean: bool = False
 
     @util.ro_memoized_property
     def info(self) -> _InfoType:
@@ -641,11 +701,19 @@ class _ConnectionRecord(ConnectionPoolEntry):
 
     @classmethod
     def checkout(cls, pool: Pool) -> _ConnectionFairy:
+        metrics = pool.metrics
+        if metrics is not None:
+            start = time.perf_counter()
+
         if TYPE_CHECKING:
             rec = cast(_ConnectionRecord, pool._do_get())
         else:
             rec = pool._do_get()
 
+        if metrics is not None:
+            rec._checkout_time = now = time.perf_counter()
+            metrics._observe_checkout_wait(now - start)
+
         try:
             dbapi_connection = rec.get_connection()
         except Exception as err:
@@ -698,6 +766,12 @@ class _ConnectionRecord(ConnectionPoolEntry):
         if pool.dispatch.checkin:
             pool.dispatch.checkin(connection, self)
 
+        if pool.metrics is not None and self._checkout_time:
+            pool.metrics._observe_hold_time(
+                time.perf_counter() - self._checkout_time
+            )
+            self._checkout_time = 0
+
         pool._return_conn(self)
 
     @property
@@ -718,6 +792,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
         # already invalidated
         if self.dbapi_connection is None:
             return
+        if self.__pool.metrics is not None:
+            self.__pool.metrics._invalidate(soft)
         if soft:
             self.__pool.dispatch.soft_invalidate(
                 self.dbapi_connection, self, e
@@ -819,10 +895,23 @@ class _ConnectionRecord(ConnectionPoolEntry):
         # creator fails, this attribute stays None
         self.dbapi_connection = None
         try:
-            self.starttime = time.time()
-            self.dbapi_connection = connection = pool._invoke_creator(self)
+            pool._acquire_connect_slot()
+            try:
+                self.starttime = time.time()
+                if pool.metrics is not None:
+                    start = time.perf_counter()
+                self.dbapi_connection = connection = pool._invoke_creator(
+                    self
+                )
+                if pool.metrics is not None:
+                    pool.metrics._observe_connect_time(
+                        time.perf_counter() - start
+                    )
+            finally:
+                pool._release_connect_slot()
             pool.logger.debug("Created new connection %r", connection)
             self.fresh = True
+            self._transaction_clean = False
         except Exception as e:
             with util.safe_reraise():
                 pool.logger.debug("Error on connect(): %s", e)
@@ -1190,6 +1279,9 @@ class _ConnectionFairy(PoolProxiedConnection):
         ) or fairy._counter != 1:
             return fairy
 
+        # pre-ping and checkout handlers may begin a transaction
+        fairy._connection_record._transaction_clean = False
+
         # Pool listeners can trigger a reconnection on checkout, as well
         # as the pre-pinger.
         # there are three attempts made here, but note that if the database
@@ -1210,6 +1302,8 @@ class _ConnectionFairy(PoolProxiedConnection):
                             )
                         result = pool._dialect.do_ping(fairy.dbapi_connection)
                         if not result:
+                            if pool.metrics is not None:
+                                pool.metrics._pre_ping_failure()
                             if fairy._echo:
                                 pool.logger.debug(
                                     "Pool pre-ping on connection %s failed, "
@@ -1292,7 +1386,23 @@ class _ConnectionFairy(PoolProxiedConnection):
     def _reset(self, pool: Pool) -> None:
         if pool.dispatch.reset:
             pool.dispatch.reset(self.dbapi_connection, self._connection_record)
-        if pool._reset_on_return is reset_rollback:
+        if pool._reset_on_return is reset_none:
+            self._set_transaction_clean(False)
+            return
+
+        if (
+            pool._dialect.is_dbapi_transaction_active(self.dbapi_connection)
+            is False
+        ):
+            if self._echo:
+                pool.logger.debug(
+                    "Connection %s has no transaction in progress, "
+                    "skipping reset-on-return",
+                    self.dbapi_connection,
+                )
+            if pool.metrics is not None:
+                pool.metrics._reset_skipped()
+        elif pool._reset_on_return is reset_rollback:
             if self._echo:
                 pool.logger.debug(
                     "Connection %s rollback-on-return", self.dbapi_connection
@@ -1305,6 +1415,11 @@ class _ConnectionFairy(PoolProxiedConnection):
                     self.dbapi_connection,
                 )
             pool._dialect.do_commit(self)
+        self._set_transaction_clean(True)
+
+    def _set_transaction_clean(self, clean: bool) -> None:
+        if self._connection_record is not None:
+            self._connection_record._transaction_clean = clean
 
     @property
     def _logger(self) -> log._IdentifiedLoggerType:
@@ -1381,4 +1496,28 @@ class _ConnectionFairy(PoolProxiedConnection):
     def _close_no_reset(self) -> None:
         self._counter -= 1
         if self._counter == 0:
+            self._set_transaction_clean(True)
             self._checkin(reset=False)
+
+    def _close_no_transaction(self) -> None:
+        """Close this connection, where the caller has not begun a
+        transaction on it since checkout.
+
+        The reset-on-return is skipped if the connection was also known
+        to have no transaction in progress when it was checked out, and
+        no "reset" event handlers are present.
+
+        """
+        rec = self._connection_record
+        if (
+            self._counter == 1
+            and rec is not None
+            and rec._transaction_clean
+            and self._pool._reset_on_return is not reset_none
+            and not self._pool.dispatch.reset
+        ):
+            if self._pool.metrics is not None:
+                self._pool.metrics._reset_skipped()
+            self._close_no_reset()
+        else:
+            self.close()
@@ -11,12 +11,17 @@
 """
 from __future__ import annotations
 
+import asyncio
+import random
 import threading
+import time
 import traceback
 import typing
 from typing import Any
+from typing import Callable
 from typing import cast
 from typing import List
+from typing import NoReturn
 from typing import Optional
 from typing import Set
 from typing import Type
@@ -36,6 +41,7 @@ from .. import exc
 from .. import util
 from ..util import chop_traceback
 from ..util import queue as sqla_queue
+from ..util.concurrency import greenlet_spawn
 from ..util.typing import Literal
 
 if typing.TYPE_CHECKING:
@@ -67,6 +73,12 @@ class QueuePool(Pool):
         max_overflow: int = 10,
         timeout: float = 30.0,
         use_lifo: bool = False,
+        maintenance_interval: float = -1,
+        min_idle: int = 0,
+        idle_timeout: float = -1,
+        pre_warm: bool = False,
+        recycle_jitter: float = 0,
+        max_connecting: Optional[int] = None,
         **kw: Any,
     ):
         r"""
@@ -123,14 +135,46 @@ class QueuePool(Pool):
           :class:`_pool.Pool` constructor.
 
         """
+        if pool_size > 0 and min_idle > pool_size:
+            raise exc.ArgumentError(
+                "min_idle of %d may not exceed pool_size of %d"
+                % (min_idle, pool_size)
+            )
+        if max_connecting is not None and max_connecting < 1:
+            raise exc.ArgumentError("max_connecting must be at least 1")
         Pool.__init__(self, creator, **kw)
         self._pool = self._queue_class(pool_size, use_lifo=use_lifo)
         self._overflow = 0 - pool_size
         self._max_overflow = max_overflow
         self._timeout = timeout
         self._overflow_lock = threading.Lock()
+        self._maintenance_interval = maintenance_interval
+        self._min_idle = min_idle
+        self._idle_timeout = idle_timeout
+        self._pre_warm = pre_warm
+        self._recycle_jitter = recycle_jitter
+        self._maintenance_lock = threading.Lock()
+        self._maintenance_pending = maintenance_interval > 0
+        self._stop_maintenance: Optional[Callable[[], None]] = None
+        self._max_connecting = max_connecting
+        self._connect_slots: Optional[
+            sqla_queue.QueueCommon[Literal[True]]
+        ] = None
+        self._connect_slots_created = 0
+        if max_connecting is not None:
+            self._connect_slots = self._queue_class(max_connecting)
+        # reentrant, as a connection may be returned to the pool by a
+        # weakref callback while a waiting thread holds the condition
+        self._connect_cond = threading.Condition()
 
     def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        if self._idle_timeout > -1:
+            cast(_ConnectionRecord, record)._checkin_time = time.time()
+        self._put_conn(record)
+        if self._connect_slots is not None:
+            self._notify_connect_waiters()
+
+    def _put_conn(self, record: ConnectionPoolEntry) -> None:
         try:
             self._pool.put(record, False)
         except sqla_queue.Full:
@@ -140,6 +184,9 @@ class QueuePool(Pool):
                 self._dec_overflow()
 
     def _do_get(self) -> ConnectionPoolEntry:
+        if self._maintenance_pending:
+            self._start_maintenance()
+
         use_overflow = self._max_overflow > -1
 
         wait = use_overflow and self._overflow >= self._max_overflow
@@ -154,6 +201,8 @@ class QueuePool(Pool):
             if not wait:
                 return self._do_get()
             else:
+                if self.metrics is not None:
+                    self.metrics._timeout()
                 raise exc.TimeoutError(
                     "QueuePool limit of size %d overflow %d reached, "
                     "connection timed out, timeout %0.2f"
@@ -161,16 +210,94 @@ class QueuePool(Pool):
                     code="3o7r",
                 )
 
+        if (
+            self._connect_slots is not None
+            and self._connect_slots_exhausted()
+        ):
+            return self._wait_for_connection()
+
         if self._inc_overflow():
             try:
-                return self._create_connection()
+                rec = self._create_connection()
             except:
                 with util.safe_reraise():
                     self._dec_overflow()
                 raise
+            if (
+                self.metrics is not None
+                and self._overflow > 0
+                and self._pool.maxsize > 0
+            ):
+                self.metrics._overflow()
+            return rec
         else:
             return self._do_get()
 
+    def _connect_slots_exhausted(self) -> bool:
+        assert self._connect_slots is not None
+        return (
+            self._connect_slots_created == self._max_connecting
+            and self._connect_slots.empty()
+        )
+
+    def _wait_for_connection(self) -> ConnectionPoolEntry:
+        # all connect slots are in use; rather than queueing up another
+        # connection attempt, wait to be notified that a connection was
+        # returned to the pool or that a connect slot was released
+        deadline = time.time() + self._timeout
+        with self._connect_cond:
+            while True:
+                try:
+                    return self._pool.get(False)
+                except sqla_queue.Empty:
+                    pass
+                if not self._connect_slots_exhausted():
+                    break
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    self._raise_connect_timeout()
+                self._connect_cond.wait(remaining)
+        return self._do_get()
+
+    def _notify_connect_waiters(self) -> None:
+        with self._connect_cond:
+            self._connect_cond.notify()
+
+    def _acquire_connect_slot(self) -> None:
+        slots = self._connect_slots
+        if slots is None:
+            return
+        try:
+            slots.get(False)
+            return
+        except sqla_queue.Empty:
+            pass
+        with self._overflow_lock:
+            if self._connect_slots_created < cast(int, self._max_connecting):
+                self._connect_slots_created += 1
+                return
+        try:
+            slots.get(True, self._timeout)
+            return
+        except sqla_queue.Empty:
+            pass
+        self._raise_connect_timeout()
+
+    def _release_connect_slot(self) -> None:
+        if self._connect_slots is not None:
+            self._connect_slots.put(True, False)
+            self._notify_connect_waiters()
+
+    def _raise_connect_timeout(self) -> NoReturn:
+        if self.metrics is not None:
+            self.metrics._timeout()
+        raise exc.TimeoutError(
+            "QueuePool limit of %d concurrent connection attempts reached, "
+            "connection timed out, timeout %0.2f"
+            % (self._max_connecting, self._timeout),
+            code="3o7r",
+        )
+
     def _inc_overflow(self) -> bool:
         if self._max_overflow == -1:
             self._overflow += 1
@@ -190,6 +317,161 @@ class QueuePool(Pool):
             self._overflow -= 1
             return True
 
+    def start(self) -> None:
+        """Start the background maintenance task, if a maintenance
+        interval is set; see :ref:`pool_maintenance`.
+
+        The task's first run opens the connections requested by
+        :paramref:`_sa.create_engine.pool_pre_warm` and
+        :paramref:`_sa.create_engine.pool_min_idle` right away, rather
+        than when the pool is first used.  If this method is not called,
+        the task is started by the first checkout.  When using asyncio,
+        the task can only be started while an event loop is running;
+        otherwise it is likewise started by the first checkout.
+
+        .. versionadded:: 2.0
+
+        """
+        if self._maintenance_pending:
+            self._start_maintenance()
+
+    def _start_maintenance(self) -> None:
+        with self._maintenance_lock:
+            if not self._maintenance_pending:
+                return
+
+            pool_ref = weakref.ref(self)
+            if self._is_asyncio:
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    # no event loop running yet; try again on the
+                    # next checkout
+                    return
+                task = loop.create_task(
+                    _async_pool_maintenance(
+                        pool_ref, self._maintenance_interval
+                    )
+                )
+                self._stop_maintenance = task.cancel
+            else:
+                stop = threading.Event()
+                thread = threading.Thread(
+                    target=_pool_maintenance,
+                    args=(pool_ref, self._maintenance_interval, stop),
+                    name="sqlalchemy-pool-maintenance",
+                    daemon=True,
+                )
+                thread.start()
+                self._stop_maintenance = stop.set
+            self._maintenance_pending = False
+
+    def _end_maintenance(self) -> None:
+        with self._maintenance_lock:
+            if self._stop_maintenance is not None:
+                self._stop_maintenance()
+                self._stop_maintenance = None
+            self._maintenance_pending = self._maintenance_interval > 0
+
+    def _run_maintenance(self, pre_warm: bool = False) -> None:
+        """Run one pass of background maintenance over the idle
+        connections in the pool.
+
+        Idle connections are taken out of the pool one at a time to be
+        inspected.  Those which are still usable are placed back, and
+        those which are to be closed or reconnected give up their slot in
+        the pool, before any connections are closed or opened; a
+        connection being reconnected then has to acquire a new slot,
+        so that maintenance never holds up checkouts nor causes the pool
+        to exceed its size.
+
+        """
+        now = time.time()
+        use_lifo = self._pool.use_lifo
+        evictable = self._pool.qsize() - self._min_idle
+        keep = []
+        evict = []
+        stale = []
+        for _ in range(self._pool.qsize()):
+            try:
+                rec = cast(_ConnectionRecord, self._pool.get(False))
+            except sqla_queue.Empty:
+                break
+
+            if (
+                evictable > 0
+                and self._idle_timeout > -1
+                and now - max(rec.starttime, rec._checkin_time)
+                > self._idle_timeout
+            ):
+                evictable -= 1
+                self._dec_overflow()
+                evict.append(rec)
+            elif rec._is_hard_or_soft_invalidated() or (
+                self._recycle > -1
+                and now - rec.starttime
+                > self._recycle - random.uniform(0, self._recycle_jitter)
+            ):
+                self._dec_overflow()
+                stale.append(rec)
+            elif use_lifo:
+                # a record put back onto the stack would be the next one
+                # returned; hold onto it until the others are inspected
+                keep.append(rec)
+            else:
+                self._put_conn(rec)
+
+        # restore the original stack order
+        for rec in reversed(keep):
+            self._put_conn(rec)
+
+        for rec in evict:
+            self.logger.info(
+                "Connection %r exceeded idle timeout; closing",
+                rec.dbapi_connection,
+            )
+            rec.close()
+
+        for rec in stale:
+            self.logger.info(
+                "Connection %r due for recycle; reconnecting",
+                rec.dbapi_connection,
+            )
+            rec.close()
+            if not self._inc_overflow():
+                # the slot was taken by a checkout in the meantime
+                continue
+            try:
+                rec.get_connection()
+            except Exception:
+                self.logger.warning(
+                    "Error reconnecting during pool maintenance",
+                    exc_info=True,
+                )
+                self._dec_overflow()
+            else:
+                self._put_conn(rec)
+
+        target = self._min_idle
+        if pre_warm:
+            target = max(target, self._pool.maxsize)
+        while (
+            self._pool.qsize() < target
+            and (self._pool.maxsize == 0 or self._overflow < 0)
+            and self._inc_overflow()
+        ):
+            try:
+                rec = self._create_connection()
+            except Exception:
+                self.logger.warning(
+                    "Error connecting during pool maintenance",
+                    exc_info=True,
+                )
+                self._dec_overflow()
+                break
+            else:
+                self._put_conn(rec)
+
     def recreate(self) -> QueuePool:
         self.logger.info("Pool recreating")
         return self.__class__(
@@ -199,15 +481,24 @@ class QueuePool(Pool):
             pre_ping=self._pre_ping,
             use_lifo=self._pool.use_lifo,
             timeout=self._timeout,
+            maintenance_interval=self._maintenance_interval,
+            min_idle=self._min_idle,
+            idle_timeout=self._idle_timeout,
+            pre_warm=self._pre_warm,
+            recycle_jitter=self._recycle_jitter,
+            max_connecting=self._max_connecting,
             recycle=self._recycle,
             echo=self.echo,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
+            metrics=self.metrics,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
 
     def dispose(self) -> None:
+        self._end_maintenance()
+
         while True:
             try:
                 conn = self._pool.get(False)
@@ -247,6 +538,53 @@ class QueuePool(Pool):
         return self._pool.maxsize - self._pool.qsize() + self._overflow
 
 
+def _pool_maintenance(
+    pool_ref: weakref.ref[QueuePool],
+    interval: float,
+    stop: threading.Event,
+) -> None:
+    pre_warm = True
+    while True:
+        pool = pool_ref()
+        if pool is None:
+            return
+        try:
+            pool._run_maintenance(pre_warm=pre_warm and pool._pre_warm)
+        except Exception:
+            pool.logger.error(
+                "Exception during pool maintenance", exc_info=True
+            )
+        pre_warm = False
+
+        # don't hold onto the pool while waiting
+        del pool
+        if stop.wait(interval):
+            return
+
+
+async def _async_pool_maintenance(
+    pool_ref: weakref.ref[QueuePool], interval: float
+) -> None:
+    pre_warm = True
+    while True:
+        pool = pool_ref()
+        if pool is None:
+            return
+        try:
+            await greenlet_spawn(
+                pool._run_maintenance, pre_warm=pre_warm and pool._pre_warm
+            )
+        except Exception:
+            pool.logger.error(
+                "Exception during pool maintenance", exc_info=True
+            )
+        pre_warm = False
+
+        # don't hold onto the pool while waiting
+        del pool
+        await asyncio.sleep(interval)
+
+
 class AsyncAdaptedQueuePool(QueuePool):
     _is_asyncio = True  # type: ignore[assignment]
     _queue_class: Type[
@@ -255,6 +593,42 @@ class AsyncAdaptedQueuePool(QueuePool):
 
     _dialect = _AsyncConnDialect()
 
+    _connect_waiter: Optional[asyncio.Event] = None
+
+    def _wait_for_connection(self) -> ConnectionPoolEntry:
+        # as QueuePool._wait_for_connection(), waiting on an event
+        # instead of blocking the event loop on a threading.Condition
+        pool = cast(
+            sqla_queue.AsyncAdaptedQueue[ConnectionPoolEntry], self._pool
+        )
+        deadline = time.time() + self._timeout
+        while True:
+            try:
+                return pool.get(False)
+            except sqla_queue.Empty:
+                pass
+            if not self._connect_slots_exhausted():
+                break
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                self._raise_connect_timeout()
+            if self._connect_waiter is None:
+                # created here so that it is bound to the running loop
+                self._connect_waiter = asyncio.Event()
+            try:
+                pool.await_(
+                    asyncio.wait_for(self._connect_waiter.wait(), remaining)
+                )
+            except asyncio.TimeoutError:
+                pass
+        return self._do_get()
+
+    def _notify_connect_waiters(self) -> None:
+        waiter = self._connect_waiter
+        if waiter is not None:
+            self._connect_waiter = None
+            waiter.set()
+
 
 class FallbackAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
     _queue_class = sqla_queue.FallbackAsyncAdaptedQueue
@@ -292,6 +666,7 @@ class NullPool(Pool):
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
             pre_ping=self._pre_ping,
+            metrics=self.metrics,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -355,6 +730,7 @@ class SingletonThreadPool(Pool):
             pre_ping=self._pre_ping,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
+            metrics=self.metrics,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -455,6 +831,7 @@ class StaticPool(Pool):
             pre_ping=self._pre_ping,
             echo=self.echo,
             logging_name=self._orig_logging_name,
+            metrics=self.metrics,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -528,6 +905,7 @@ class AssertionPool(Pool):
             recycle=self._recycle,
             reset_on_return=self._reset_on_return,
             logging_name=self._orig_logging_name,
+            metrics=self.metrics,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -0,0 +1,240 @@
+# sqlalchemy/pool/metrics.py
+# Copyright (C) 2005-2022 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+
+
+"""Cumulative statistics collected by a connection pool.
+
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import List
+from typing import NamedTuple
+from typing import Sequence
+from typing import Tuple
+
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+"""Default histogram bucket upper bounds, in seconds."""
+
+
+class HistogramSnapshot(NamedTuple):
+    """A point-in-time copy of a histogram collected by
+    :class:`.PoolMetrics`.
+
+    .. versionadded:: 2.0
+
+    """
+
+    count: int
+    """Total number of observations."""
+
+    sum: float
+    """Sum of all observations, in seconds."""
+
+    max: float
+    """Largest observation, in seconds."""
+
+    buckets: Tuple[Tuple[float, int], ...]
+    """Tuple of ``(upper_bound, count)`` pairs, where ``count`` is the
+    number of observations greater than the previous bucket's upper bound
+    and less than or equal to ``upper_bound``.  The final bucket has an
+    upper bound of ``float("inf")``."""
+
+
+class PoolMetricsSnapshot(NamedTuple):
+    """A point-in-time copy of the statistics collected by
+    :class:`.PoolMetrics`, as returned by :meth:`.PoolMetrics.snapshot`.
+
+    .. versionadded:: 2.0
+
+    """
+
+    checkout_wait: HistogramSnapshot
+    """Time spent waiting for the pool to supply a connection on
+    checkout, including the time to open a new connection."""
+
+    hold_time: HistogramSnapshot
+    """Time between checkout and checkin of connections."""
+
+    connect_time: HistogramSnapshot
+    """Time taken to open new DBAPI connections."""
+
+    pre_ping_failures: int
+    """Number of checkouts where the pre-ping detected a disconnect."""
+
+    overflow_created: int
+    """Number of connections opened beyond the ``pool_size`` of
+    a :class:`.QueuePool`."""
+
+    timeouts: int
+    """Number of checkouts which gave up waiting for a connection."""
+
+    invalidations: int
+    """Number of connections invalidated."""
+
+    soft_invalidations: int
+    """Number of connections soft-invalidated."""
+
+    resets_skipped: int
+    """Number of times the reset-on-return of a connection was skipped, as
+    the connection was known to have no transaction in progress."""
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            self.count,
+            self.sum,
+            self.max,
+            tuple(zip(self.bounds + (float("inf"),), self.counts)),
+        )
+
+
+class PoolMetrics:
+    """Collects cumulative statistics about the use of a
+    :class:`_pool.Pool`.
+
+    Metrics collection is enabled using the :paramref:`_pool.Pool.metrics`
+    parameter, or :paramref:`_sa.create_engine.pool_metrics` when using
+    :func:`_sa.create_engine`, after which the collector is available
+    as :attr:`_pool.Pool.metrics`.  A :class:`.PoolMetrics` object may
+    also be passed directly, in which case it can be shared among
+    several pools.  Statistics are retrieved using :meth:`.snapshot`::
+
+        engine = create_engine("postgresql://...", pool_metrics=True)
+
+        snapshot = engine.pool.metrics.snapshot()
+        print(snapshot.checkout_wait.count, snapshot.timeouts)
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`pool_metrics`
+
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Construct a new :class:`.PoolMetrics`.
+
+        :param buckets: sequence of ascending upper bounds, in seconds,
+         for the buckets of the checkout wait, hold time and connect time
+         histograms.  An additional bucket with no upper bound is always
+         present.
+
+        """
+        self._lock = threading.Lock()
+        self._checkout_wait = _Histogram(buckets)
+        self._hold_time = _Histogram(buckets)
+        self._connect_time = _Histogram(buckets)
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self._pre_ping_failures = 0
+        self._overflow_created = 0
+        self._timeouts = 0
+        self._invalidations = 0
+        self._soft_invalidations = 0
+        self._resets_skipped = 0
+
+    def _observe_checkout_wait(self, value: float) -> None:
+        with self._lock:
+            self._checkout_wait.observe(value)
+
+    def _observe_hold_time(self, value: float) -> None:
+        with self._lock:
+            self._hold_time.observe(value)
+
+    def _observe_connect_time(self, value: float) -> None:
+        with self._lock:
+            self._connect_time.observe(value)
+
+    def _pre_ping_failure(self) -> None:
+        with self._lock:
+            self._pre_ping_failures += 1
+
+    def _overflow(self) -> None:
+        with self._lock:
+            self._overflow_created += 1
+
+    def _timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def _invalidate(self, soft: bool) -> None:
+        with self._lock:
+            if soft:
+                self._soft_invalidations += 1
+            else:
+                self._invalidations += 1
+
+    def _reset_skipped(self) -> None:
+        with self._lock:
+            self._resets_skipped += 1
+
+    def snapshot(self) -> PoolMetricsSnapshot:
+        """Return a :class:`.PoolMetricsSnapshot` with a copy of the
+        statistics collected so far."""
+
+        with self._lock:
+            return PoolMetricsSnapshot(
+                self._checkout_wait.snapshot(),
+                self._hold_time.snapshot(),
+                self._connect_time.snapshot(),
+                self._pre_ping_failures,
+                self._overflow_created,
+                self._timeouts,
+                self._invalidations,
+                self._soft_invalidations,
+                self._resets_skipped,
+            )
+
+    def reset(self) -> None:
+        """Reset all statistics to zero."""
+
+        with self._lock:
+            self._checkout_wait.reset()
+            self._hold_time.reset()
+            self._connect_time.reset()
+            self._reset_counters()
@@ -396,6 +396,52 @@ class ExpandedState(NamedTuple):
     parameter_expansion: Mapping[str, List[str]]
 
 
+class _InsertManyValues(NamedTuple):
+    """represents state to use for executing an "insertmanyvalues" statement,
+    that is, an INSERT with RETURNING invoked against many parameter sets
+    which is rewritten into batches of multi-row INSERT..VALUES statements.
+
+    .. versionadded:: 2.0
+
+    """
+
+    is_default_expr: bool
+    """if True, the statement is of the form
+    ``INSERT INTO TABLE (col) VALUES (DEFAULT)``"""
+
+    single_values_expr: str
+    """the rendered "values" portion of the INSERT, e.g. ``(?, ?, ?)`` is
+    rendered as ``?, ?, ?``"""
+
+    batch_values_template: Optional[str]
+    """for non-positional paramstyles, the single values expression
+    with each bound parameter name rewritten to include an
+    ``EXECMANY_INDEX__`` token, which is replaced with the index of each
+    parameter set within a batch"""
+
+
+class _MultiValuesInsert(NamedTuple):
+    """represents state used to split a multi-row INSERT..VALUES statement
+    into several statements, so that each stays within the dialect's
+    :attr:`.Dialect.max_bind_parameters` limit.
+
+    .. versionadded:: 2.0
+
+    """
+
+    statement_prefix: str
+    """the rendered statement up to and including the VALUES keyword"""
+
+    row_expressions: Sequence[str]
+    """the rendered, parenthesized VALUES expression for each row"""
+
+    statement_suffix: str
+    """the rendered statement following the final VALUES expression"""
+
+    row_bind_names: Sequence[Sequence[str]]
+    """the names of the bound parameters rendered within each row"""
+
+
 class Linting(IntEnum):
     NO_LINTING = 0
     "Disable all linting."
@@ -822,6 +868,37 @@ class SQLCompiler(Compiled):
 
     """
 
+    _insertmanyvalues: Optional[_InsertManyValues] = None
+    """When an INSERT with RETURNING is compiled for executemany against
+    a dialect that supports "insertmanyvalues", state used to rewrite
+    the statement into batched multi-row VALUES statements at execution time.
+
+    .. versionadded:: 2.0
+
+    """
+
+    _multi_values_insert: Optional[_MultiValuesInsert] = None
+    """When a multi-row INSERT..VALUES is compiled for a dialect which
+    specifies :attr:`.Dialect.max_bind_parameters`, state used to split
+    the statement into several statements at execution time.
+
+    .. versionadded:: 2.0
+
+    """
+
+    _multi_values_bind_counts: Optional[List[int]] = None
+    """the running count of bound parameters following each row of a
+    multi-row INSERT..VALUES, populated by crud.py"""
+
+    _split_in_candidates: Tuple[BindParameter[Any], ...] = ()
+    """expanding IN parameters which are direct members of the WHERE clause
+    of a toplevel SELECT, UPDATE or DELETE, for which the statement may be
+    invoked once per chunk of values with the results combined.
+
+    .. versionadded:: 2.0
+
+    """
+
     literal_execute_params: FrozenSet[BindParameter[Any]] = frozenset()
     """bindparameter objects that are rendered as literal values at statement
     execution time.
@@ -1170,6 +1247,84 @@ class SQLCompiler(Compiled):
             if value is not None
         )
 
+    @util.memoized_property
+    def _split_in_params(self) -> Sequence[Tuple[str, BindParameter[Any]]]:
+        """the (escaped name, bindparam) pairs for expanding IN parameters
+        whose values may be split across several executions of the
+        statement.
+
+        Parameters rendered more than once within the statement are
+        excluded, as only one of the renderings was established as being
+        safe to split.
+
+        """
+        result = []
+        for bindparam in self._split_in_candidates:
+            name = self.bind_names.get(bindparam)
+            if name is None or bindparam in self.literal_execute_params:
+                continue
+            escaped_name = self.escaped_bind_names.get(name, name)
+            pattern = r"__\[POSTCOMPILE_%s(?:\]|~~)" % re.escape(escaped_name)
+            if len(re.findall(pattern, self.string)) == 1:
+                result.append((escaped_name, bindparam))
+        return result
+
+    def _collect_split_in_candidates(
+        self, where_criteria: Sequence[ColumnElement[Any]]
+    ) -> Tuple[BindParameter[Any], ...]:
+        """locate expanding parameters within positive IN comparisons that
+        are direct members of the given WHERE criteria, i.e. not nested
+        inside of OR, NOT or a subquery.
+
+        Used for SELECT and DELETE only; an UPDATE is never split, as its
+        SET clause may change rows such that they match a later batch.
+
+        """
+
+        if not self.dialect._has_parameter_limits:
+            return ()
+
+        candidates = []
+        stack = list(where_criteria)
+        while stack:
+            crit = stack.pop(0)
+            if (
+                isinstance(crit, elements.BooleanClauseList)
+                and crit.operator is operators.and_
+            ):
+                stack.extend(crit.clauses)
+            elif (
+                isinstance(crit, elements.BinaryExpression)
+                and crit.operator is operators.in_op
+                and isinstance(crit.right, elements.BindParameter)
+                and crit.right.expanding
+            ):
+                candidates.append(crit.right)
+        return tuple(candidates)
+
+    def _select_is_splittable(self, select: Select[Any]) -> bool:
+        """return True if the rows of the given SELECT may be produced
+        by invoking it several times against disjoint sets of IN values
+        and concatenating the results."""
+
+        if (
+            select._group_by_clauses
+            or select._having_criteria
+            or select._order_by_clauses
+            or select._has_row_limiting_clause
+            or select._distinct
+        ):
+            return False
+
+        # aggregates, window functions, scalar subqueries etc. in the
+        # columns clause would produce per-chunk results
+        for col in select._all_selected_columns:
+            if isinstance(col, elements.Label):
+                col = col.element
+            if not isinstance(col, elements.ColumnClause) or col.is_literal:
+                return False
+        return True
+
     def is_subquery(self):
         return len(self.stack) > 1
 
@@ -4063,6 +4218,10 @@ class SQLCompiler(Compiled):
             text += self.default_from()
 
         if select._where_criteria:
+            if toplevel and self._select_is_splittable(select):
+                self._split_in_candidates = (
+                    self._collect_split_in_candidates(select._where_criteria)
+                )
             t = self._generate_delimited_and_list(
                 select._where_criteria, from_linter=from_linter, **kwargs
             )
@@ -4368,11 +4527,21 @@ class SQLCompiler(Compiled):
             }
         )
 
+        positional_before_crud = (
+            len(self.positiontup) if self.positiontup is not None else 0
+        )
+        binds_before_crud = len(self.binds)
+        multi_values_prefix = row_expressions = None
+
         crud_params_struct = crud._get_crud_params(
             self, insert_stmt, compile_state, toplevel, **kw
         )
         crud_params_single = crud_params_struct.single_params
 
+        positional_after_crud = (
+            len(self.positiontup) if self.positiontup is not None else 0
+        )
+
         if (
             not crud_params_single
             and not self.dialect.supports_default_values
@@ -4454,13 +4623,13 @@ class SQLCompiler(Compiled):
         elif not crud_params_single and supports_default_values:
             text += " DEFAULT VALUES"
         elif compile_state._has_multi_parameters:
-            text += " VALUES %s" % (
-                ", ".join(
-                    "(%s)"
-                    % (", ".join(value for _, _, value in crud_param_set))
-                    for crud_param_set in crud_params_struct.all_multi_params
-                )
-            )
+            row_expressions = [
+                "(%s)" % (", ".join(value for _, _, value in crud_param_set))
+                for crud_param_set in crud_params_struct.all_multi_params
+            ]
+            text += " VALUES "
+            multi_values_prefix = text
+            text += ", ".join(row_expressions)
         else:
             insert_single_values_expr = ", ".join(
                 [
@@ -4493,10 +4662,224 @@ class SQLCompiler(Compiled):
                 + text
             )
 
+        if (
+            toplevel
+            and compile_state._has_multi_parameters
+            and self.dialect.max_bind_parameters is not None
+            and not self.ctes
+            and not self._numeric_binds
+            and self._multi_values_bind_counts is not None
+            and multi_values_prefix is not None
+        ):
+            self._multi_values_insert = self._setup_multi_values_insert(
+                text, multi_values_prefix, row_expressions, binds_before_crud
+            )
+
+        if (
+            toplevel
+            and returning_clause
+            and self.for_executemany
+            and self.dialect.use_insertmanyvalues
+            and self.insert_single_values_expr is not None
+            and not self.ctes
+        ):
+            self._insertmanyvalues = self._setup_insertmanyvalues(
+                text,
+                crud_params_single,
+                positional_before_crud,
+                positional_after_crud,
+            )
+
         self.stack.pop(-1)
 
         return text
 
+    def _setup_multi_values_insert(
+        self,
+        text: str,
+        statement_prefix: str,
+        row_expressions: Sequence[str],
+        binds_before_crud: int,
+    ) -> Optional[_MultiValuesInsert]:
+        bind_counts = [binds_before_crud] + list(
+            self._multi_values_bind_counts or ()
+        )
+        # self.binds may also link an anonymous bound parameter under its
+        # unresolved name; use the final name of each parameter just once
+        binds = list(self.binds.values())
+        row_bind_names = [
+            list(
+                dict.fromkeys(
+                    self.bind_names[bindparam]
+                    for bindparam in binds[start:end]
+                )
+            )
+            for start, end in zip(bind_counts, bind_counts[1:])
+        ]
+
+        # a bound parameter shared among rows is only counted for the
+        # first row in which it appears, so that rows would not be
+        # independent of each other
+        if len({len(row) for row in row_bind_names}) > 1:
+            return None
+
+        return _MultiValuesInsert(
+            statement_prefix,
+            row_expressions,
+            text[len(statement_prefix) + len(", ".join(row_expressions)) :],
+            row_bind_names,
+        )
+
+    def _setup_insertmanyvalues(
+        self,
+        text: str,
+        crud_params_single: Sequence[Tuple[Any, Any, str]],
+        positional_before_crud: int,
+        positional_after_crud: int,
+    ) -> Optional[_InsertManyValues]:
+        """Determine if the INSERT just compiled may be rewritten into
+        batches of multi-row VALUES at execution time, returning the
+        :class:`._InsertManyValues` structure if so.
+
+        The rewrite is only safe if every bound parameter in the statement
+        is located within the VALUES clause, as the remaining parameters
+        would otherwise need to be shared among all parameter sets.
+
+        """
+        single_values_expr = self.insert_single_values_expr
+        assert single_values_expr is not None
+
+        if self.literal_execute_params or self.post_compile_params:
+            return None
+
+        is_default_expr = (
+            len(crud_params_single) == 1
+            and crud_params_single[0][2] == "DEFAULT"
+        )
+
+        if self.positional:
+            if self._numeric_binds:
+                return None
+
+            assert self.positiontup is not None
+            if positional_before_crud or positional_after_crud != len(
+                self.positiontup
+            ):
+                return None
+
+            return _InsertManyValues(
+                is_default_expr, single_values_expr, None
+            )
+
+        names = [
+            self.escaped_bind_names.get(name, name)
+            for name in self.bind_names.values()
+        ]
+        if names:
+            bind_re = re.compile(
+                r"(%s)(?![\w\$])"
+                % "|".join(
+                    re.escape(self.bindtemplate % {"name": name})
+                    for name in sorted(names, key=len, reverse=True)
+                )
+            )
+
+            if len(bind_re.findall(text)) != len(
+                bind_re.findall(single_values_expr)
+            ):
+                return None
+
+            templates = {
+                self.bindtemplate % {"name": name}: self.bindtemplate
+                % {"name": "%s__EXECMANY_INDEX__" % name}
+                for name in names
+            }
+            batch_values_template = bind_re.sub(
+                lambda m: templates[m.group(1)], single_values_expr
+            )
+        else:
+            batch_values_template = single_values_expr
+
+        return _InsertManyValues(
+            is_default_expr, single_values_expr, batch_values_template
+        )
+
+    def _deliver_insertmanyvalues_batches(
+        self,
+        statement: str,
+        parameters: Sequence[Any],
+        batch_size: int,
+        max_parameters: Optional[int] = None,
+    ) -> Iterable[Tuple[str, Any, int, int]]:
+        """Given a statement and list of DBAPI parameter sets as prepared
+        for executemany(), yield tuples of
+        ``(statement, parameters, batchnum, total_batches)`` where each
+        statement is a multi-row INSERT..VALUES that covers up to
+        ``batch_size`` of the given parameter sets.
+
+        .. versionadded:: 2.0
+
+        """
+        imv = self._insertmanyvalues
+        assert imv is not None
+
+        values_clause = " VALUES (%s)" % imv.single_values_expr
+
+        if values_clause not in statement:
+            # statement was modified from what we compiled, such as via
+            # schema translate map or dialect-level rewriting that
+            # we can't account for; run each parameter set individually
+            total = len(parameters)
+            for batchnum, param in enumerate(parameters, 1):
+                yield statement, param, batchnum, total
+            return
+
+        head, _, tail = statement.partition(values_clause)
+
+        if max_parameters and parameters:
+            num_params = len(parameters[0])
+            if num_params:
+                batch_size = max(
+                    1, min(batch_size, max_parameters // num_params)
+                )
+
+        batches = [
+            parameters[idx : idx + batch_size]
+            for idx in range(0, len(parameters), batch_size)
+        ]
+        total_batches = len(batches)
+
+        positional = self.positional
+        single_values = "(%s)" % imv.single_values_expr
+
+        for batchnum, batch in enumerate(batches, 1):
+            if positional:
+                expanded_values = ", ".join([single_values] * len(batch))
+                replaced_parameters: Any = (
+                    self.dialect.execute_sequence_format(
+                        itertools.chain.from_iterable(batch)
+                    )
+                )
+            else:
+                template = imv.batch_values_template
+                assert template is not None
+                expanded_values = ", ".join(
+                    "(%s)" % template.replace("EXECMANY_INDEX__", str(i))
+                    for i in range(len(batch))
+                )
+                replaced_parameters = {
+                    "%s__%d" % (key, i): value
+                    for i, param in enumerate(batch)
+                    for key, value in param.items()
+                }
+
+            yield (
+                "%s VALUES %s%s" % (head, expanded_values, tail),
+                replaced_parameters,
+                batchnum,
+                total_batches,
+            )
+
     def update_limit_clause(self, update_stmt):
         """Provide a hook for MySQL to add LIMIT to the UPDATE"""
         return None
@@ -4727,6 +5110,15 @@ class SQLCompiler(Compiled):
                 text += " " + extra_from_text
 
         if delete_stmt._where_criteria:
+            # split only when no rows are returned
+            if toplevel and not (
+                self.implicit_returning or delete_stmt._returning
+            ):
+                self._split_in_candidates = (
+                    self._collect_split_in_candidates(
+                        delete_stmt._where_criteria
+                    )
+                )
             t = self._generate_delimited_and_list(
                 delete_stmt._where_criteria, **kw
             )
@@ -283,22 +283,35 @@ def _get_crud_params(
             kw,
         )
         return _CrudParams(values, multi_extended_values)
-    elif (
-        not values
-        and compiler.for_executemany
-        and compiler.dialect.supports_default_metavalue
-    ):
-        # convert an "INSERT DEFAULT VALUES"
-        # into INSERT (firstcol) VALUES (DEFAULT) which can be turned
-        # into an in-place multi values.  This supports
-        # insert_executemany_returning mode :)
-        values = [
-            (
-                _as_dml_column(stmt.table.columns[0]),
-                compiler.preparer.format_column(stmt.table.columns[0]),
-                "DEFAULT",
-            )
-        ]
+    elif not values and compiler.for_executemany:
+        if compiler.dialect.supports_default_metavalue:
+            # convert an "INSERT DEFAULT VALUES"
+            # into INSERT (firstcol) VALUES (DEFAULT) which can be turned
+            # into an in-place multi values.  This supports
+            # insert_executemany_returning mode :)
+            values = [
+                (
+                    _as_dml_column(stmt.table.columns[0]),
+                    compiler.preparer.format_column(stmt.table.columns[0]),
+                    "DEFAULT",
+                )
+            ]
+        elif (
+            compiler.dialect.insert_null_pk_still_autoincrements
+            and stmt.table._autoincrement_column is not None
+        ):
+            # for backends such as SQLite that don't support the DEFAULT
+            # keyword, but which will generate a new autoincrement value
+            # when NULL is inserted, use INSERT (pk) VALUES (NULL) for the
+            # same purpose
+            autoinc_col = stmt.table._autoincrement_column
+            values = [
+                (
+                    _as_dml_column(autoinc_col),
+                    compiler.preparer.format_column(autoinc_col),
+                    "NULL",
+                )
+            ]
 
     return _CrudParams(values, [])
 
@@ -657,7 +670,10 @@ def _append_param_parameter(
         ):
             # support use case for #7998, fetch autoincrement cols
             # even if value was given
-            if implicit_returning:
+            if implicit_returning and (
+                compiler.dialect.favor_returning_over_lastrowid
+                or not compiler.dialect.postfetch_lastrowid
+            ):
                 compiler.implicit_returning.append(c)
             elif compiler.dialect.postfetch_lastrowid:
                 compiler.postfetch_lastrowid = True
@@ -681,7 +697,10 @@ def _append_param_parameter(
         ):
             # support use case for #7998, fetch autoincrement cols
             # even if value was given
-            if implicit_returning:
+            if implicit_returning and (
+                compiler.dialect.favor_returning_over_lastrowid
+                or not compiler.dialect.postfetch_lastrowid
+            ):
                 compiler.implicit_returning.append(c)
             elif compiler.dialect.postfetch_lastrowid:
                 compiler.postfetch_lastrowid = True
@@ -1187,6 +1206,12 @@ def _extend_values_for_multiparams(
     values_0 = initial_values
     values = [initial_values]
 
+    # running count of bound parameters at the end of each row, which
+    # allows the statement to be split into several statements at
+    # execution time if the dialect limits the number of parameters
+    row_bind_counts = [len(compiler.binds)]
+    compiler._multi_values_bind_counts = row_bind_counts
+
     mp = compile_state._multi_parameters
     assert mp is not None
     for i, row in enumerate(mp[1:]):
@@ -1222,6 +1247,7 @@ def _extend_values_for_multiparams(
             extension.append((col, col_expr, new_param))
 
         values.append(extension)
+        row_bind_counts.append(len(compiler.binds))
 
     return values
 
@@ -1284,10 +1310,21 @@ def _get_returning_modifiers(compiler, stmt, compile_state, toplevel):
         and not stmt._returning
         and not compile_state._has_multi_parameters
     )
+    postfetch_lastrowid = need_pks and compiler.dialect.postfetch_lastrowid
+
+    # for a single row INSERT where only the primary key is needed,
+    # dialects may prefer cursor.lastrowid over RETURNING, provided
+    # lastrowid is able to deliver the primary key
     implicit_returning = (
         need_pks
         and compiler.dialect.implicit_returning
         and stmt.table.implicit_returning
+        and (
+            not postfetch_lastrowid
+            or compiler.dialect.favor_returning_over_lastrowid
+            or stmt._return_defaults
+            or stmt.table._autoincrement_column is None
+        )
     )
 
     if compile_state.isinsert:
@@ -1309,7 +1346,6 @@ def _get_returning_modifiers(compiler, stmt, compile_state, toplevel):
         else:
             implicit_return_defaults = set(stmt._return_defaults_columns)
 
-    postfetch_lastrowid = need_pks and compiler.dialect.postfetch_lastrowid
     return (
         need_pks,
         implicit_returning,
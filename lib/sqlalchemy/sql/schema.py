@@ -99,6 +99,7 @@ if typing.TYPE_CHECKING:
     from ..engine.interfaces import _ExecuteOptionsParameter
     from ..engine.interfaces import ExecutionContext
     from ..engine.mock import MockConnection
+    from ..engine.reflection import _ReflectionInfo
     from ..sql.selectable import FromClause
 
 _T = TypeVar("_T", bound="Any")
@@ -503,6 +504,7 @@ class Table(
         prefixes: Optional[_typing_Sequence[str]] = None,
         # used internally in the metadata.reflect() process
         _extend_on: Optional[Set[Table]] = None,
+        _reflect_info: Optional[_ReflectionInfo] = None,
         # used by __new__ to bypass __init__
         _no_init: bool = True,
         # dialect-specific keyword args
@@ -849,6 +851,7 @@ class Table(
                 autoload_with,
                 include_columns,
                 _extend_on=_extend_on,
+                _reflect_info=_reflect_info,
                 resolve_fks=resolve_fks,
             )
 
@@ -870,6 +873,7 @@ class Table(
         exclude_columns: Iterable[str] = (),
         resolve_fks: bool = True,
         _extend_on: Optional[Set[Table]] = None,
+        _reflect_info: Optional[_ReflectionInfo] = None,
     ) -> None:
         insp = inspection.inspect(autoload_with)
         with insp._inspection_context() as conn_insp:
@@ -879,6 +883,7 @@ class Table(
                 exclude_columns,
                 resolve_fks,
                 _extend_on=_extend_on,
+                _reflect_info=_reflect_info,
             )
 
     @property
@@ -921,6 +926,7 @@ class Table(
         autoload_replace = kwargs.pop("autoload_replace", True)
         schema = kwargs.pop("schema", None)
         _extend_on = kwargs.pop("_extend_on", None)
+        _reflect_info = kwargs.pop("_reflect_info", None)
         # these arguments are only used with _init()
         kwargs.pop("extend_existing", False)
         kwargs.pop("keep_existing", False)
@@ -969,6 +975,7 @@ class Table(
                 exclude_columns,
                 resolve_fks,
                 _extend_on=_extend_on,
+                _reflect_info=_reflect_info,
             )
 
         self._extra_kwargs(**kwargs)
@@ -5245,6 +5252,13 @@ class MetaData(HasSchemaAttr):
                     if extend_existing or name not in current
                 ]
 
+            if load:
+                # load reflection information for all tables up front,
+                # using the dialect's multi-table queries where available
+                reflect_opts["_reflect_info"] = insp._get_reflection_info(
+                    schema=schema, filter_names=load, **dialect_kwargs
+                )
+
             for name in load:
                 try:
                     Table(name, self, **reflect_opts)
@@ -390,6 +390,21 @@ class SuiteRequirements(Requirements):
             "multiple rows with INSERT executemany'",
         )
 
+    @property
+    def insertmanyvalues(self):
+        """target platform supports the "insertmanyvalues" feature, where
+        INSERT..RETURNING with many parameter sets is rewritten into
+        batched multi-row INSERT..VALUES statements.
+
+        """
+
+        return exclusions.only_if(
+            lambda config: config.db.dialect.supports_multivalues_insert
+            and config.db.dialect.implicit_returning
+            and config.db.dialect.use_insertmanyvalues,
+            "%(database)s %(does_support)s 'insertmanyvalues functionality'",
+        )
+
     @property
     def returning(self):
         """target platform supports RETURNING for at least one row.
@@ -491,6 +491,13 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
     generally its not safe to do an "in" check first as the dictionary
     can change subsequent to that call.
 
+    Recency is tracked as an "epoch" which advances only when a new
+    item is added.  A read stamps the item with the current epoch only
+    if it isn't stamped already, so that a cache which is mostly
+    serving hits from many threads at once does not write to any shared
+    state; items read since the last insert are considered as recent
+    as that insert.
+
     """
 
     __slots__ = (
@@ -536,16 +543,25 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
     ) -> Optional[Union[_VT, _T]]:
         item = self._data.get(key, default)
         if item is not default and item is not None:
-            item[2][0] = self._inc_counter()
+            epoch = self._counter
+            stamp = item[2]
+            if stamp[0] != epoch:
+                stamp[0] = epoch
             return item[1]
         else:
             return default
 
     def __getitem__(self, key: _KT) -> _VT:
         item = self._data[key]
-        item[2][0] = self._inc_counter()
+        epoch = self._counter
+        stamp = item[2]
+        if stamp[0] != epoch:
+            stamp[0] = epoch
         return item[1]
 
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
     def __iter__(self) -> Iterator[_KT]:
         return iter(self._data)
 
@@ -127,6 +127,13 @@ def await_fallback(awaitable: Awaitable[_T]) -> _T:
     return current.driver.switch(awaitable)  # type: ignore[no-any-return]
 
 
+def in_greenlet() -> bool:
+    """Return True if called within a :func:`greenlet_spawn` context,
+    where :func:`await_only` may be used."""
+
+    return isinstance(getcurrent(), _AsyncIoGreenlet)
+
+
 async def greenlet_spawn(
     fn: Callable[..., _T],
     *args: Any,
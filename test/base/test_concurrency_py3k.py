@@ -14,6 +14,7 @@ from sqlalchemy.util import await_fallback
 from sqlalchemy.util import await_only
 from sqlalchemy.util import greenlet_spawn
 from sqlalchemy.util import queue
+from sqlalchemy.util.concurrency import in_greenlet
 
 try:
     from greenlet import greenlet
@@ -41,6 +42,11 @@ class TestAsyncioCompat(fixtures.TestBase):
 
         eq_(await greenlet_spawn(go, run1, run2), 3)
 
+    @async_test
+    async def test_in_greenlet(self):
+        eq_(in_greenlet(), False)
+        eq_(await greenlet_spawn(in_greenlet), True)
+
     @async_test
     async def test_async_error(self):
         async def err():
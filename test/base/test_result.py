@@ -1,3 +1,5 @@
+from array import array
+
 from sqlalchemy import exc
 from sqlalchemy import testing
 from sqlalchemy.engine import result
@@ -676,6 +678,101 @@ class ResultTest(fixtures.TestBase):
 
         eq_(result.all(), [])
 
+    def test_columns_as_arrays(self):
+        result = self._fixture(
+            data=[(1, 1.5, "a"), (2, 2.5, None), (3, 3.5, "c")]
+        )
+
+        # no type information; columns are lists
+        a, b, c = result.columns_as_arrays()
+        eq_(a, [1, 2, 3])
+        eq_(b, [1.5, 2.5, 3.5])
+        eq_(c, ["a", None, "c"])
+
+        eq_(result.all(), [])
+
+    def _kinds_fixture(self, kinds, data):
+        res = result.IteratorResult(
+            result.SimpleResultMetaData(["a", "b", "c"]), iter(data)
+        )
+        res._columnar_kinds = kinds
+        return res
+
+    def test_columns_as_arrays_kinds(self):
+        res = self._kinds_fixture(
+            ["int", "float", None],
+            [(1, 1.5, "a"), (2, 2.5, None), (3, 3.5, "c")],
+        )
+        eq_(
+            res.columns_as_arrays(),
+            (
+                array("q", [1, 2, 3]),
+                array("d", [1.5, 2.5, 3.5]),
+                ["a", None, "c"],
+            ),
+        )
+
+    def test_columns_as_arrays_processors_and_columns(self):
+        res = result.IteratorResult(
+            result.SimpleResultMetaData(
+                ["a", "b", "c"], _processors=[None, str, lambda v: v * 2]
+            ),
+            iter([(1, 1, 1), (2, 1, 2), (1, 3, 2)]),
+        )
+        res._columnar_kinds = ["int", None, "int"]
+        eq_(
+            res.columns("c", "b").columns_as_arrays(),
+            (array("q", [2, 4, 4]), ["1", "1", "3"]),
+        )
+
+    def test_columns_as_arrays_no_rows(self):
+        result = self._fixture(num_rows=0)
+        eq_(result.columns_as_arrays(), ([], [], []))
+
+        res = self._kinds_fixture(["int", None, "float"], [])
+        eq_(
+            res.columns_as_arrays(),
+            (array("q"), [], array("d")),
+        )
+
+    @testing.combinations(
+        ((None, 2, 3), "received a NULL value"),
+        ((2**70, 2, 3), "received a value which can't be stored"),
+        argnames="row, message",
+    )
+    def test_columns_as_arrays_doesnt_fit(self, row, message):
+        res = self._kinds_fixture(["int", None, None], [(1, 2, 3), row])
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Column 'a' %s" % message,
+            res.columns_as_arrays,
+        )
+
+    def test_columns_as_arrays_unique(self):
+        result = self._fixture().unique()
+        assert_raises_message(
+            exc.InvalidRequestError,
+            r"Columnar fetching can't be combined with Result.unique\(\)",
+            result.columns_as_arrays,
+        )
+
+    def test_partitions_columnar(self):
+        res = self._kinds_fixture(
+            ["int", None, None],
+            [(1, 1, 1), (2, None, 2), (1, 3, 2), (4, 1, 2)],
+        )
+
+        # the form of each column is the same in each partition,
+        # regardless of the values received
+        eq_(
+            list(res.yield_per(3).partitions_columnar()),
+            [
+                (array("q", [1, 2, 1]), [1, None, 3], [1, 2, 2]),
+                (array("q", [4]), [1], [2]),
+            ],
+        )
+        eq_(res.all(), [])
+
     def test_columns(self):
         result = self._fixture()
 
@@ -1285,6 +1285,35 @@ class LRUTest(fixtures.TestBase):
         assert 25 in lru
         assert lru[25] is i2
 
+    def test_lru_read_doesnt_advance_epoch(self):
+        lru = util.LRUCache(10, threshold=0.2)
+
+        for id_ in range(1, 11):
+            lru[id_] = id_
+
+        epoch = lru._counter
+        for i in range(5):
+            eq_(lru[3], 3)
+            eq_(lru.get(4), 4)
+        eq_(lru.get(50), None)
+
+        # reads stamp items with the current epoch, they don't advance it
+        eq_(lru._counter, epoch)
+        eq_(lru._data[3][2], [epoch])
+        eq_(lru._data[4][2], [epoch])
+
+        # membership is not a "use"
+        assert 1 in lru
+        eq_(lru._data[1][2], [1])
+
+        for id_ in range(11, 14):
+            lru[id_] = id_
+
+        for id_ in (1, 2, 5):
+            assert id_ not in lru
+        for id_ in (3, 4, 6, 7, 8, 9, 10, 11, 12, 13):
+            assert id_ in lru
+
 
 class ImmutableSubclass(str):
     pass
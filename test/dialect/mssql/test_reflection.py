@@ -597,6 +597,55 @@ class ReflectionTest(fixtures.TestBase, ComparesTables, AssertsCompiledSQL):
             is_(col["type"].length, None)
             in_("max", str(col["type"].compile(dialect=connection.dialect)))
 
+    def _multi_reflection_fixture(self, metadata, connection, count):
+        names = ["msmulti_%d" % i for i in range(count)]
+        for i, name in enumerate(names):
+            cols = [
+                Column("id", Integer, primary_key=True),
+                Column("data", types.String(30), index=True),
+            ]
+            if i:
+                cols.append(
+                    Column("parent_id", ForeignKey("%s.id" % names[i - 1]))
+                )
+            Table(name, metadata, *cols)
+        metadata.create_all(connection)
+        return names
+
+    def test_multi_reflection_matches_single(self, metadata, connection):
+        names = self._multi_reflection_fixture(metadata, connection, 3)
+
+        insp = inspect(connection)
+        for multi, single in [
+            (insp.get_multi_columns, insp.get_columns),
+            (insp.get_multi_pk_constraint, insp.get_pk_constraint),
+            (insp.get_multi_foreign_keys, insp.get_foreign_keys),
+            (insp.get_multi_indexes, insp.get_indexes),
+        ]:
+            result = multi(filter_names=names)
+            eq_(set(result), {(None, name) for name in names})
+            for name in names:
+                eq_(repr(result[(None, name)]), repr(single(name)))
+
+    def test_multi_reflection_query_count(self, metadata, connection):
+        def count_statements(names):
+            statements = []
+
+            @event.listens_for(connection, "before_cursor_execute")
+            def go(conn, cursor, statement, *arg):
+                statements.append(statement)
+
+            try:
+                MetaData().reflect(connection, only=names)
+            finally:
+                event.remove(connection, "before_cursor_execute", go)
+            return len(statements)
+
+        names = self._multi_reflection_fixture(metadata, connection, 6)
+
+        # the number of queries doesn't depend on the number of tables
+        eq_(count_statements(names[0:3]), count_statements(names))
+
 
 class InfoCoerceUnicodeTest(fixtures.TestBase, AssertsCompiledSQL):
     def test_info_unicode_cast_no_2000(self):
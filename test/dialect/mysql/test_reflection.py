@@ -1013,6 +1013,44 @@ class ReflectionTest(fixtures.TestBase, AssertsCompiledSQL):
                 ],
             )
 
+    def test_multi_foreign_keys(self, metadata, connection):
+        names = ["mymulti_%d" % i for i in range(3)]
+        for i, name in enumerate(names):
+            cols = [Column("id", Integer, primary_key=True)]
+            if i:
+                cols.append(
+                    Column("parent_id", ForeignKey("%s.id" % names[i - 1]))
+                )
+            Table(name, metadata, *cols, mysql_engine="InnoDB")
+        metadata.create_all(connection)
+
+        statements = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def go(conn, cursor, statement, *arg):
+            statements.append(statement)
+
+        insp = inspect(connection)
+        try:
+            result = insp.get_multi_foreign_keys(filter_names=names)
+        finally:
+            event.remove(connection, "before_cursor_execute", go)
+
+        for name in names:
+            eq_(result[(None, name)], insp.get_foreign_keys(name))
+
+        # referred names are corrected using one query for all tables
+        eq_(
+            len(
+                [
+                    stmt
+                    for stmt in statements
+                    if "information_schema.columns" in stmt
+                ]
+            ),
+            1 if connection.dialect._needs_correct_for_88718_96365 else 0,
+        )
+
     def test_get_foreign_key_name_w_foreign_key_in_name(
         self, metadata, connection
     ):
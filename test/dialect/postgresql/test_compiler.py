@@ -38,6 +38,8 @@ from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
 from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.dialects.postgresql import array_agg as pg_array_agg
+from sqlalchemy.dialects.postgresql import copy_from
+from sqlalchemy.dialects.postgresql import copy_to
 from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.dialects.postgresql import TSRANGE
@@ -55,6 +57,7 @@ from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import assert_raises_message
 from sqlalchemy.testing.assertions import AssertsCompiledSQL
+from sqlalchemy.testing.assertions import eq_
 from sqlalchemy.testing.assertions import expect_warnings
 from sqlalchemy.testing.assertions import is_
 from sqlalchemy.util import OrderedDict
@@ -100,6 +103,34 @@ class CompileTest(fixtures.TestBase, AssertsCompiledSQL):
 
     __dialect__ = postgresql.dialect()
 
+    def test_copy_from(self):
+        m = MetaData()
+        t = Table(
+            "t",
+            m,
+            Column("id", Integer),
+            Column("data", String, key="d"),
+            schema="s",
+        )
+        self.assert_compile(
+            copy_from(t, []), "COPY s.t (id, data) FROM STDIN"
+        )
+        self.assert_compile(
+            copy_from(t, [], columns=["d"]), "COPY s.t (data) FROM STDIN"
+        )
+        self.assert_compile(
+            copy_from(t, [], columns=[t.c.d, t.c.id]),
+            "COPY s.t (data, id) FROM STDIN",
+        )
+
+    def test_copy_to(self):
+        t = table("t", column("id", Integer), column("data", String))
+        self.assert_compile(
+            copy_to(select(t).where(t.c.id == 5, t.c.data.like("a%"))),
+            "COPY (SELECT t.id, t.data FROM t "
+            "WHERE t.id = 5 AND t.data LIKE 'a%%') TO STDOUT",
+        )
+
     def test_update_returning(self):
         dialect = postgresql.dialect()
         table1 = table(
@@ -3361,3 +3392,108 @@ class RegexpTest(fixtures.TestBase, testing.AssertsCompiledSQL):
             "SELECT 1 " + exp,
             checkparams=params,
         )
+
+
+class InAsAnyTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = postgresql.dialect(render_in_as_any=True)
+
+    def setup_test(self):
+        self.table = table(
+            "mytable",
+            column("myid", Integer),
+            column("name", String(50)),
+            column("data", postgresql.JSONB),
+        )
+
+    def test_in(self):
+        self.assert_compile(
+            self.table.c.myid.in_([1, 2, 3]),
+            "mytable.myid = ANY(%(myid_1)s::INTEGER[])",
+            checkparams={"myid_1": [1, 2, 3]},
+        )
+
+    def test_not_in(self):
+        self.assert_compile(
+            self.table.c.name.not_in(["a", "b"]),
+            "mytable.name != ALL(%(name_1)s::VARCHAR(50)[])",
+            checkparams={"name_1": ["a", "b"]},
+        )
+
+    def test_empty_in(self):
+        self.assert_compile(
+            self.table.c.myid.in_([]),
+            "mytable.myid = ANY(%(myid_1)s::INTEGER[])",
+            checkparams={"myid_1": []},
+        )
+
+    def test_in_bindparam(self):
+        stmt = select(self.table.c.myid).where(
+            self.table.c.myid.in_(bindparam("ids"))
+        )
+        self.assert_compile(
+            stmt,
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.myid = ANY(%(ids)s::INTEGER[])",
+            params={"ids": [5, 6]},
+            checkparams={"ids": [5, 6]},
+        )
+
+    def test_same_string_for_any_length(self):
+        stmts = [
+            select(self.table.c.myid).where(
+                self.table.c.myid.in_(list(range(num)))
+            )
+            for num in (1, 5, 50)
+        ]
+        dialect = self.__dialect__
+        eq_(len({str(stmt.compile(dialect=dialect)) for stmt in stmts}), 1)
+
+    def test_cached_statement_new_values(self):
+        s1 = select(self.table.c.myid).where(self.table.c.myid.in_([1, 2]))
+        s2 = select(self.table.c.myid).where(
+            self.table.c.myid.in_([3, 4, 5])
+        )
+        ck1 = s1._generate_cache_key()
+        ck2 = s2._generate_cache_key()
+        eq_(ck1, ck2)
+
+        compiled = s1.compile(dialect=self.__dialect__, cache_key=ck1)
+        eq_(
+            compiled.construct_params(extracted_parameters=ck2[1]),
+            {"myid_1": [3, 4, 5]},
+        )
+
+    def test_positional(self):
+        dialect = postgresql.dialect(
+            paramstyle="format", render_in_as_any=True
+        )
+        self.assert_compile(
+            self.table.c.myid.in_([1, 2, 3]),
+            "mytable.myid = ANY(%s::INTEGER[])",
+            checkpositional=([1, 2, 3],),
+            dialect=dialect,
+        )
+
+    @testing.combinations(
+        (lambda t: tuple_(t.c.myid, t.c.name).in_([(1, "a")]),),
+        (lambda t: t.c.myid.in_(bindparam("q", literal_execute=True)),),
+        (lambda t: t.c.data.in_([{"a": "b"}]),),
+        (lambda t: t.c.myid.in_(select(t.c.myid)),),
+    )
+    def test_renders_in(self, expr):
+        expr = testing.resolve_lambda(expr, t=self.table)
+        assert " IN " in str(expr.compile(dialect=self.__dialect__))
+
+    def test_literal_binds(self):
+        self.assert_compile(
+            self.table.c.myid.in_([1, 2, 3]),
+            "mytable.myid IN (1, 2, 3)",
+            literal_binds=True,
+        )
+
+    def test_not_enabled_by_default(self):
+        self.assert_compile(
+            self.table.c.myid.in_([1, 2, 3]),
+            "mytable.myid IN (__[POSTCOMPILE_myid_1])",
+            dialect=postgresql.dialect(),
+        )
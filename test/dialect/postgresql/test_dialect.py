@@ -1,8 +1,11 @@
 # coding: utf-8
 import datetime
+import decimal
 import itertools
 import logging
 import logging.handlers
+import threading
+import uuid
 
 from sqlalchemy import BigInteger
 from sqlalchemy import bindparam
@@ -29,17 +32,23 @@ from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy import text
 from sqlalchemy import TypeDecorator
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import asyncpg as asyncpg_dialect
 from sqlalchemy.dialects.postgresql import base as postgresql
+from sqlalchemy.dialects.postgresql import copy_from as pg_copy_from
+from sqlalchemy.dialects.postgresql import copy_to as pg_copy_to
 from sqlalchemy.dialects.postgresql import HSTORE
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import psycopg as psycopg_dialect
 from sqlalchemy.dialects.postgresql import psycopg2 as psycopg2_dialect
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.dialects.postgresql.psycopg2 import EXECUTEMANY_BATCH
 from sqlalchemy.dialects.postgresql.psycopg2 import EXECUTEMANY_PLAIN
 from sqlalchemy.dialects.postgresql.psycopg2 import EXECUTEMANY_VALUES
 from sqlalchemy.engine import cursor as _cursor
 from sqlalchemy.engine import url
+from sqlalchemy.engine.interfaces import CacheStats
 from sqlalchemy.sql.selectable import LABEL_STYLE_TABLENAME_PLUS_COL
 from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
@@ -54,6 +63,8 @@ from sqlalchemy.testing.assertions import AssertsCompiledSQL
 from sqlalchemy.testing.assertions import AssertsExecutionResults
 from sqlalchemy.testing.assertions import eq_
 from sqlalchemy.testing.assertions import eq_regex
+from sqlalchemy.testing.assertions import expect_raises
+from sqlalchemy.testing.assertions import expect_raises_message
 from sqlalchemy.testing.assertions import ne_
 
 if True:
@@ -255,6 +266,220 @@ $$ LANGUAGE plpgsql;"""
 
         eq_(dialect.is_disconnect("not an error", None, None), False)
 
+    def test_psycopg2_copy_text_format(self):
+        rows = [
+            (1, "a\tb\\c\n", None, True, b"\x01\xff"),
+            (2, ["x", None, 'y"z'], False, datetime.timedelta(1, 2), "é"),
+        ]
+        stream = psycopg2_dialect._CopyFromStream(iter(rows))
+
+        chunks = []
+        while True:
+            chunk = stream.read(7)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        data = "".join(chunks)
+        eq_(
+            data,
+            "1\ta\\tb\\\\c\\n\t\\N\tt\t\\\\x01ff\n"
+            '2\t{"x",NULL,"y\\\\"z"}\tf\t'
+            "1 days 2 seconds 0 microseconds\té\n",
+        )
+
+        parser = postgresql._CopyTextParser([None] * 5, "utf-8")
+        encoded = data.encode("utf-8")
+        # split within a multibyte character and a row
+        eq_(
+            parser.parse(encoded[:-3]) + parser.parse(encoded[-3:]),
+            [
+                ("1", "a\tb\\c\n", None, "t", "\\x01ff"),
+                (
+                    "2",
+                    '{"x",NULL,"y\\"z"}',
+                    "f",
+                    "1 days 2 seconds 0 microseconds",
+                    "é",
+                ),
+            ],
+        )
+
+
+    def _copy_to_stream(self, copy_expert):
+        cursor = mock.Mock(copy_expert=copy_expert)
+        stream = psycopg2_dialect._CopyToStream(
+            cursor, [lambda value, cursor: int(value), None], "utf-8"
+        )
+        return stream.rows(cursor, "COPY (SELECT x, y FROM t) TO STDOUT")
+
+    @testing.fixture
+    def copy_to_batch_size(self):
+        with mock.patch.object(
+            psycopg2_dialect._CopyToStream, "batch_size", 2
+        ):
+            yield
+
+    def test_psycopg2_copy_to_streams(self, copy_to_batch_size):
+        written = threading.Event()
+        consumed = threading.Event()
+
+        def copy_expert(statement, file):
+            file.write(b"1\ta\n2\tb\n3")
+            written.set()
+            # the remaining output is not sent until rows are consumed
+            assert consumed.wait(5)
+            file.write(b"\tc\n4\t\\N\n")
+
+        rows = self._copy_to_stream(copy_expert)
+        eq_([next(rows), next(rows)], [(1, "a"), (2, "b")])
+        assert written.is_set()
+        consumed.set()
+        eq_(list(rows), [(3, "c"), (4, None)])
+
+    def test_psycopg2_copy_to_close_discards(self, copy_to_batch_size):
+        def copy_expert(statement, file):
+            for i in range(100):
+                file.write(b"%d\tx\n" % i)
+
+        rows = self._copy_to_stream(copy_expert)
+        eq_(next(rows), (0, "x"))
+
+        # the COPY completes on the thread without blocking on the queue
+        rows.close()
+        eq_(
+            [
+                t
+                for t in threading.enumerate()
+                if t.name == "sqlalchemy-copy-to"
+            ],
+            [],
+        )
+
+    def test_psycopg2_copy_to_error(self):
+        class Error(Exception):
+            pass
+
+        def copy_expert(statement, file):
+            file.write(b"1\ta\n")
+            raise Error("copy failed")
+
+        rows = self._copy_to_stream(copy_expert)
+        with expect_raises_message(Error, "copy failed"):
+            list(rows)
+
+    def test_asyncpg_copy_text_casters(self):
+        casters = asyncpg_dialect.PGDialect_asyncpg()._copy_text_casters
+        tz = datetime.timezone(-datetime.timedelta(hours=3, minutes=30))
+
+        for oid, text_value, value in [
+            (16, "t", True),
+            (17, "\\x01ff", b"\x01\xff"),
+            (20, "5", 5),
+            (114, '{"x": [1, 2]}', {"x": [1, 2]}),
+            (1082, "2022-05-10", datetime.date(2022, 5, 10)),
+            (1082, "infinity", "infinity"),
+            (1083, "12:15:00.5", datetime.time(12, 15, 0, 500000)),
+            (
+                1114,
+                "2022-05-10 12:15:00",
+                datetime.datetime(2022, 5, 10, 12, 15),
+            ),
+            (
+                1184,
+                "2022-05-10 12:15:00.123-03:30",
+                datetime.datetime(2022, 5, 10, 12, 15, 0, 123000, tz),
+            ),
+            (1700, "5.25", decimal.Decimal("5.25")),
+        ]:
+            eq_(casters[oid](text_value), value)
+        is_(casters[1043], None)
+
+    @testing.combinations(
+        ([23, 1700, 2950], True),
+        ([23, 1007], False),
+        ([23, 1186], False),
+        argnames="oids, use_copy",
+    )
+    def test_asyncpg_copy_to_type_fallback(self, oids, use_copy):
+        dialect = asyncpg_dialect.PGDialect_asyncpg()
+        cursor = mock.Mock(
+            description=[("c%d" % i, oid) for i, oid in enumerate(oids)]
+        )
+        ss_cursor = cursor._adapt_connection.cursor.return_value
+        ss_cursor.fetchmany.side_effect = [[(1,), (2,)], []]
+
+        description, rows = dialect.do_copy_to(
+            cursor, "COPY (stmt) TO STDOUT", "stmt", "describe"
+        )
+        eq_(cursor.execute.mock_calls, [mock.call("describe")])
+        if use_copy:
+            is_(rows, cursor.copy_from_query.return_value)
+        else:
+            # types which can't be converted from the COPY text format
+            # as asyncpg would are fetched with a server side cursor
+            eq_(list(rows), [(1,), (2,)])
+            eq_(
+                cursor._adapt_connection.cursor.mock_calls[0],
+                mock.call(server_side=True),
+            )
+            eq_(ss_cursor.execute.mock_calls, [mock.call("stmt")])
+            eq_(ss_cursor.close.call_count, 1)
+
+    @testing.combinations(
+        ("copy_from",), ("copy_to",), argnames="construct"
+    )
+    def test_copy_events(self, construct):
+        dbapi = mock.Mock(paramstyle="pyformat", __version__="2.9.3")
+        engine = create_engine(
+            "postgresql+psycopg2://", module=dbapi, _initialize=False
+        )
+        t = Table("t", MetaData(), Column("x", Integer))
+
+        canary = mock.Mock()
+        for name in (
+            "before_execute",
+            "after_execute",
+            "before_cursor_execute",
+            "after_cursor_execute",
+        ):
+            event.listen(engine, name, getattr(canary, name))
+
+        if construct == "copy_from":
+            stmt = pg_copy_from(t, [(1,), (2,)])
+            patch = mock.patch.object(
+                engine.dialect, "do_copy_from", return_value=2
+            )
+            statement = "COPY t (x) FROM STDIN"
+        else:
+            stmt = pg_copy_to(select(t))
+            patch = mock.patch.object(
+                engine.dialect,
+                "do_copy_to",
+                return_value=([("x", 23)], iter([(1,), (2,)])),
+            )
+            statement = "COPY (SELECT t.x \nFROM t) TO STDOUT"
+
+        with patch, engine.connect() as conn:
+            result = conn.execute(stmt, execution_options={"foo": "bar"})
+            if construct == "copy_to":
+                eq_(result.all(), [(1,), (2,)])
+
+        eq_(
+            [c[0] for c in canary.mock_calls],
+            [
+                "before_execute",
+                "before_cursor_execute",
+                "after_cursor_execute",
+                "after_execute",
+            ],
+        )
+        is_(canary.before_execute.mock_calls[0][1][1], stmt)
+        eq_(
+            canary.before_execute.mock_calls[0][1][4],
+            {"foo": "bar"},
+        )
+        eq_(canary.before_cursor_execute.mock_calls[0][1][2], statement)
+        is_(canary.after_execute.mock_calls[0][1][5], result)
 
 class PGCodeTest(fixtures.TestBase):
     __only_on__ = "postgresql"
@@ -1434,6 +1659,369 @@ $$ LANGUAGE plpgsql;
             )
 
 
+class PsycopgPrepareThresholdTest(fixtures.TestBase):
+    """python-side tests for the psycopg prepare_threshold feature."""
+
+    def _context(self, dialect, compiled, cache_hit, **execution_options):
+        return mock.Mock(
+            dialect=dialect,
+            compiled=compiled,
+            cache_hit=cache_hit,
+            execution_options=execution_options,
+            _is_server_side=False,
+            _psycopg_prepare=None,
+        )
+
+    def _run(self, dialect, contexts):
+        cursor = mock.Mock()
+        for context in contexts:
+            psycopg_dialect.PGExecutionContext_psycopg.pre_exec(context)
+            dialect.do_execute(cursor, "stmt", {}, context)
+        return [c[2] for c in cursor.execute.mock_calls]
+
+    def test_default_leaves_driver_behavior(self):
+        dialect = psycopg_dialect.PGDialect_psycopg()
+        compiled = select(literal(1)).compile(dialect=dialect)
+
+        eq_(
+            self._run(
+                dialect,
+                [self._context(dialect, compiled, CacheStats.CACHE_HIT)] * 3,
+            ),
+            [{}, {}, {}],
+        )
+
+    @testing.combinations((0,), (2,), argnames="threshold")
+    def test_threshold_counts_compiled(self, threshold):
+        dialect = psycopg_dialect.PGDialect_psycopg(
+            prepare_threshold=threshold
+        )
+        compiled = select(literal(1)).compile(dialect=dialect)
+        other = select(literal(2)).compile(dialect=dialect)
+
+        eq_(
+            self._run(
+                dialect,
+                [
+                    self._context(dialect, compiled, CacheStats.CACHE_MISS),
+                    self._context(dialect, compiled, CacheStats.CACHE_HIT),
+                    self._context(dialect, other, CacheStats.CACHE_MISS),
+                    self._context(dialect, compiled, CacheStats.CACHE_HIT),
+                ],
+            ),
+            [
+                {"prepare": threshold < 1},
+                {"prepare": threshold < 2},
+                {"prepare": threshold < 1},
+                {"prepare": threshold < 3},
+            ],
+        )
+
+    def test_uncached_statements_not_prepared(self):
+        dialect = psycopg_dialect.PGDialect_psycopg(prepare_threshold=0)
+        compiled = select(literal(1)).compile(dialect=dialect)
+
+        eq_(
+            self._run(
+                dialect,
+                [
+                    self._context(dialect, compiled, CacheStats.NO_CACHE_KEY),
+                    self._context(
+                        dialect, compiled, CacheStats.CACHING_DISABLED
+                    ),
+                ],
+            ),
+            [{"prepare": False}, {"prepare": False}],
+        )
+
+    @testing.combinations(
+        (None, 0, True),
+        (None, False, False),
+        (5, 0, True),
+        (0, False, False),
+        argnames="engine_threshold, option, expected",
+    )
+    def test_execution_option(self, engine_threshold, option, expected):
+        dialect = psycopg_dialect.PGDialect_psycopg(
+            prepare_threshold=engine_threshold
+        )
+        compiled = select(literal(1)).compile(dialect=dialect)
+
+        eq_(
+            self._run(
+                dialect,
+                [
+                    self._context(
+                        dialect,
+                        compiled,
+                        CacheStats.CACHE_HIT,
+                        prepare_threshold=option,
+                    )
+                ],
+            ),
+            [{"prepare": expected}],
+        )
+
+    @testing.combinations(
+        (None, None),
+        (0, None),
+        (50, 50),
+        argnames="cache_size, prepared_max",
+    )
+    def test_prepared_statement_cache_size(self, cache_size, prepared_max):
+        dialect = psycopg_dialect.PGDialect_psycopg(
+            prepared_statement_cache_size=cache_size
+        )
+        conn = mock.Mock(prepare_threshold=5, prepared_max=100)
+        dialect.on_connect()(conn)
+
+        if cache_size is None:
+            eq_((conn.prepare_threshold, conn.prepared_max), (5, 100))
+        elif cache_size == 0:
+            eq_((conn.prepare_threshold, conn.prepared_max), (None, 100))
+        else:
+            eq_((conn.prepare_threshold, conn.prepared_max), (5, 50))
+
+    @testing.combinations(
+        (0, None), (None, 0), argnames="engine_threshold, option"
+    )
+    def test_not_prepared_when_cache_disabled(self, engine_threshold, option):
+        dialect = psycopg_dialect.PGDialect_psycopg(
+            prepare_threshold=engine_threshold,
+            prepared_statement_cache_size=0,
+        )
+        compiled = select(literal(1)).compile(dialect=dialect)
+        execution_options = (
+            {"prepare_threshold": option} if option is not None else {}
+        )
+
+        eq_(
+            self._run(
+                dialect,
+                [
+                    self._context(
+                        dialect,
+                        compiled,
+                        CacheStats.CACHE_HIT,
+                        **execution_options,
+                    )
+                ]
+                * 2,
+            ),
+            [{"prepare": False}, {"prepare": False}],
+        )
+
+    @testing.combinations(
+        ("26000", "prepared statement \"_pg3_0\" does not exist", True),
+        ("0A000", "cached plan must not change result type", True),
+        ("0A000", "some other unsupported feature", False),
+        ("42P01", "relation does not exist", False),
+        argnames="sqlstate, message, expected",
+    )
+    @testing.combinations((True,), (False,), argnames="autocommit")
+    @testing.combinations((None,), (5,), argnames="threshold")
+    def test_stale_statements_discarded(
+        self, sqlstate, message, expected, autocommit, threshold
+    ):
+        class Error(Exception):
+            pass
+
+        dialect = psycopg_dialect.PGDialect_psycopg(
+            prepare_threshold=threshold
+        )
+        dialect.dbapi = mock.Mock(Error=Error)
+        err = Error(message)
+        err.sqlstate = sqlstate
+
+        cursor = mock.Mock()
+        cursor.execute.side_effect = err
+        driver_conn = cursor.connection
+        driver_conn.autocommit = autocommit
+        driver_conn.closed = False
+
+        with expect_raises(Error):
+            dialect.do_execute(cursor, "stmt", {}, None)
+
+        # in autocommit mode, an empty transaction is rolled back on the
+        # connection which raised the error, so that psycopg discards its
+        # prepared statements; within a transaction, the rollback of the
+        # failed transaction does this.  the pool is not invalidated
+        if expected and autocommit:
+            eq_(
+                driver_conn.mock_calls,
+                [
+                    mock.call.execute("BEGIN", prepare=False),
+                    mock.call.rollback(),
+                ],
+            )
+        else:
+            eq_(driver_conn.mock_calls, [])
+        is_false(
+            dialect.is_disconnect(
+                err, mock.Mock(closed=False, broken=False), None
+            )
+        )
+
+    def test_stale_statements_discard_fails(self):
+        class Error(Exception):
+            pass
+
+        dialect = psycopg_dialect.PGDialect_psycopg()
+        dialect.dbapi = mock.Mock(Error=Error)
+        err = Error("prepared statement does not exist")
+        err.sqlstate = "26000"
+
+        cursor = mock.Mock()
+        cursor.execute.side_effect = err
+        driver_conn = cursor.connection
+        driver_conn.autocommit = True
+        driver_conn.closed = False
+        driver_conn.rollback.side_effect = Error("rollback failed")
+
+        with expect_raises_message(Error, "prepared statement"):
+            dialect.do_execute(cursor, "stmt", {}, None)
+
+        # statements are no longer prepared on this connection
+        is_(driver_conn.prepare_threshold, None)
+
+
+class CopyTest(fixtures.TablesTest):
+    __only_on__ = (
+        "postgresql+psycopg2",
+        "postgresql+psycopg",
+        "postgresql+asyncpg",
+    )
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "copy_data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+            Column("num", Numeric(10, 2)),
+            Column("created", DateTime),
+        )
+
+    def test_copy_from(self, connection):
+        copy_data = self.tables.copy_data
+        now = datetime.datetime(2022, 5, 10, 12, 15, 0)
+
+        result = connection.execute(
+            pg_copy_from(
+                copy_data,
+                (
+                    (i, "d%d\t%%" % i, decimal.Decimal("5.25"), now)
+                    for i in range(1, 101)
+                ),
+            )
+        )
+        eq_(result.rowcount, 100)
+
+        result = connection.execute(
+            pg_copy_from(
+                copy_data,
+                [{"id": 101, "data": None}, {"id": 102, "data": "x"}],
+                columns=["id", "data"],
+            )
+        )
+        eq_(result.rowcount, 2)
+
+        eq_(
+            connection.execute(
+                select(copy_data).order_by(copy_data.c.id).limit(2)
+            ).all(),
+            [
+                (1, "d1\t%", decimal.Decimal("5.25"), now),
+                (2, "d2\t%", decimal.Decimal("5.25"), now),
+            ],
+        )
+        eq_(
+            connection.execute(
+                select(copy_data.c.data, copy_data.c.num).where(
+                    copy_data.c.id > 100
+                )
+            ).all(),
+            [(None, None), ("x", None)],
+        )
+
+    def test_copy_to(self, connection):
+        copy_data = self.tables.copy_data
+        now = datetime.datetime(2022, 5, 10, 12, 15, 0)
+        connection.execute(
+            copy_data.insert(),
+            [
+                {"id": 1, "data": "d1\t%", "num": 5, "created": now},
+                {"id": 2, "data": None, "num": None, "created": None},
+            ],
+        )
+        result = connection.execute(
+            pg_copy_to(
+                select(copy_data)
+                .where(copy_data.c.data.like("%") | (copy_data.c.id == 2))
+                .order_by(copy_data.c.id)
+            )
+        )
+        eq_(result.keys(), ["id", "data", "num", "created"])
+        eq_(
+            result.all(),
+            [
+                (1, "d1\t%", decimal.Decimal("5.00"), now),
+                (2, None, None, None),
+            ],
+        )
+
+    def test_copy_to_types(self, connection, metadata):
+        t = Table(
+            "copy_types",
+            metadata,
+            Column("num", Numeric(10, 2)),
+            Column("uid", UUID(as_uuid=True)),
+            Column("arr", ARRAY(Integer)),
+        )
+        t.create(connection)
+        uid = uuid.uuid4()
+        connection.execute(
+            t.insert(),
+            [
+                {"num": decimal.Decimal("5.25"), "uid": uid, "arr": [1, 2]},
+                {"num": None, "uid": None, "arr": None},
+            ],
+        )
+
+        for cols in [(t.c.num, t.c.uid), (t.c.num, t.c.uid, t.c.arr)]:
+            stmt = select(*cols).order_by(t.c.num)
+            expected = connection.execute(stmt).all()
+            eq_(
+                [tuple(row[0:2]) for row in expected],
+                [(decimal.Decimal("5.25"), uid), (None, None)],
+            )
+
+            # values are the same as those returned by the SELECT
+            result = connection.execute(pg_copy_to(stmt)).all()
+            eq_(result, expected)
+            eq_(
+                [type(value) for value in result[0]],
+                [type(value) for value in expected[0]],
+            )
+
+    def test_copy_to_close_early(self, connection):
+        copy_data = self.tables.copy_data
+        connection.execute(
+            copy_data.insert(),
+            [{"id": i, "data": "d%d" % i} for i in range(1, 5001)],
+        )
+
+        result = connection.execute(
+            pg_copy_to(select(copy_data.c.id).order_by(copy_data.c.id))
+        )
+        eq_(result.fetchmany(2), [(1,), (2,)])
+        result.close()
+
+        eq_(connection.scalar(select(func.count(copy_data.c.id))), 5000)
+
+
 class Psycopg3Test(fixtures.TestBase):
     __only_on__ = ("postgresql+psycopg",)
 
@@ -1488,6 +2076,99 @@ class Psycopg3Test(fixtures.TestBase):
                     with engine.begin() as conn:
                         eq_(conn.scalar(s), {"key": "value", "x": "q"})
 
+    @testing.combinations(
+        (0, True), (3, True), (False, False), argnames="threshold, prepared"
+    )
+    def test_prepare_threshold(self, testing_engine, threshold, prepared):
+        engine = testing_engine(options={"prepare_threshold": threshold})
+        stmt = select(literal_column("'prepare threshold'"))
+
+        with engine.connect() as conn:
+            for i in range(4):
+                eq_(conn.scalar(stmt), "prepare threshold")
+            eq_(
+                conn.exec_driver_sql(
+                    "SELECT count(*) FROM pg_prepared_statements "
+                    "WHERE statement LIKE '%%prepare threshold%%'"
+                ).scalar(),
+                1 if prepared else 0,
+            )
+
+    def test_prepared_statements_disabled(self, testing_engine):
+        engine = testing_engine(
+            options={
+                "prepare_threshold": 0,
+                "prepared_statement_cache_size": 0,
+            }
+        )
+        stmt = select(literal_column("'prepared disabled'"))
+
+        with engine.connect() as conn:
+            for i in range(10):
+                eq_(conn.scalar(stmt), "prepared disabled")
+            eq_(
+                conn.exec_driver_sql(
+                    "SELECT count(*) FROM pg_prepared_statements"
+                ).scalar(),
+                0,
+            )
+
+    def test_stale_prepared_statement(self, testing_engine, metadata):
+        t = Table("stale_t", metadata, Column("x", Integer))
+        engine = testing_engine(options={"prepare_threshold": 0})
+        metadata.create_all(engine)
+
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            eq_(conn.execute(select(t)).all(), [])
+            dbapi_conn = conn.connection.dbapi_connection
+
+            conn.exec_driver_sql(
+                "ALTER TABLE stale_t ALTER COLUMN x TYPE BIGINT"
+            )
+
+            with expect_raises(exc.DBAPIError):
+                conn.execute(select(t))
+
+            # the connection is not invalidated, and the statement is
+            # prepared again
+            eq_(conn.execute(select(t)).all(), [])
+            is_(conn.connection.dbapi_connection, dbapi_conn)
+
+    def test_pipeline(self, testing_engine, metadata):
+        engine = testing_engine(options={"pipeline_mode": True})
+        if not engine.dialect.supports_pipeline:
+            config.skip_test("pipeline mode not supported")
+
+        t = Table(
+            "pipeline_t",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("data", String(50)),
+        )
+        metadata.create_all(engine)
+
+        with engine.begin() as conn:
+            with conn.pipeline():
+                for i in range(5):
+                    conn.execute(t.insert(), {"id": i, "data": "d%d" % i})
+                eq_(
+                    conn.execute(
+                        t.update().where(t.c.id > 2).values(data="x")
+                    ).rowcount,
+                    2,
+                )
+                eq_(
+                    conn.scalars(select(t.c.data).order_by(t.c.id)).all(),
+                    ["d0", "d1", "d2", "x", "x"],
+                )
+
+        with engine.connect() as conn:
+            with expect_raises(exc.IntegrityError):
+                with conn.pipeline():
+                    conn.execute(t.insert(), {"id": 1, "data": "dupe"})
+
     def test_get_dialect(self):
         u = url.URL.create("postgresql://")
         d = psycopg_dialect.PGDialect_psycopg.get_dialect_cls(u)
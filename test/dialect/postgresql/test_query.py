@@ -3,6 +3,7 @@
 import datetime
 
 from sqlalchemy import and_
+from sqlalchemy import bindparam
 from sqlalchemy import cast
 from sqlalchemy import Column
 from sqlalchemy import column
@@ -1141,6 +1142,74 @@ class TupleTest(fixtures.TestBase):
             )
 
 
+class InAsAnyTest(fixtures.TablesTest):
+    __only_on__ = "postgresql"
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+            Column(
+                "e", postgresql.ENUM("one", "two", "three", name="in_any_enum")
+            ),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.data.insert(),
+            [
+                {"id": 1, "x": "a", "e": "one"},
+                {"id": 2, "x": "b", "e": "two"},
+                {"id": 3, "x": "c", "e": "three"},
+                {"id": 4, "x": None, "e": "one"},
+            ],
+        )
+
+    @testing.fixture
+    def any_connection(self, testing_engine):
+        eng = testing_engine(options={"render_in_as_any": True})
+        with eng.connect() as conn:
+            yield conn
+
+    @testing.combinations(
+        (lambda t: t.c.id.in_([1, 3]), [1, 3]),
+        (lambda t: t.c.id.in_([]), []),
+        (lambda t: t.c.id.not_in([1, 3]), [2, 4]),
+        (lambda t: t.c.id.not_in([]), [1, 2, 3, 4]),
+        (lambda t: t.c.x.in_(["b", "c", "q"]), [2, 3]),
+        (lambda t: t.c.x.not_in(["b", "c"]), [1]),
+        (lambda t: t.c.e.in_(["one", "three"]), [1, 3, 4]),
+        argnames="expr, expected",
+    )
+    def test_round_trip(self, any_connection, expr, expected):
+        t = self.tables.data
+        stmt = select(t.c.id).where(testing.resolve_lambda(expr, t=t))
+        assert " IN " not in str(stmt.compile(any_connection))
+        eq_(
+            any_connection.scalars(stmt.order_by(t.c.id)).all(),
+            expected,
+        )
+
+    def test_bindparam(self, any_connection):
+        t = self.tables.data
+        stmt = (
+            select(t.c.id)
+            .where(t.c.id.in_(bindparam("ids")))
+            .order_by(t.c.id)
+        )
+        for ids, expected in [
+            ([1], [1]),
+            ([2, 3, 4], [2, 3, 4]),
+            ([], []),
+        ]:
+            eq_(any_connection.scalars(stmt, {"ids": ids}).all(), expected)
+
+
 class ExtractTest(fixtures.TablesTest):
 
     """The rationale behind this test is that for many years we've had a system
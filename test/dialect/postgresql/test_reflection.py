@@ -1706,6 +1706,63 @@ class ReflectionTest(
             },
         )
 
+    def _multi_reflection_fixture(self, metadata, connection, count):
+        names = ["pgmulti_%d" % i for i in range(count)]
+        for i, name in enumerate(names):
+            cols = [
+                Column("id", Integer, primary_key=True),
+                Column("data", String(30), index=True),
+                Column("x", Integer, unique=True),
+                CheckConstraint("x > 0", name="%s_cc" % name),
+            ]
+            if i:
+                cols.append(
+                    Column("parent_id", ForeignKey("%s.id" % names[i - 1]))
+                )
+            Table(name, metadata, *cols, comment="table %d" % i)
+        metadata.create_all(connection)
+        return names
+
+    def test_multi_reflection_matches_single(self, metadata, connection):
+        names = self._multi_reflection_fixture(metadata, connection, 3)
+
+        insp = inspect(connection)
+        for multi, single in [
+            (insp.get_multi_pk_constraint, insp.get_pk_constraint),
+            (insp.get_multi_foreign_keys, insp.get_foreign_keys),
+            (insp.get_multi_indexes, insp.get_indexes),
+            (
+                insp.get_multi_unique_constraints,
+                insp.get_unique_constraints,
+            ),
+            (insp.get_multi_check_constraints, insp.get_check_constraints),
+            (insp.get_multi_table_options, insp.get_table_options),
+            (insp.get_multi_table_comment, insp.get_table_comment),
+        ]:
+            result = multi(filter_names=names)
+            eq_(set(result), {(None, name) for name in names})
+            for name in names:
+                eq_(result[(None, name)], single(name))
+
+    def test_multi_reflection_query_count(self, metadata, connection):
+        def count_statements(names):
+            statements = []
+
+            @sa.event.listens_for(connection, "before_cursor_execute")
+            def go(conn, cursor, statement, *arg):
+                statements.append(statement)
+
+            try:
+                MetaData().reflect(connection, only=names)
+            finally:
+                sa.event.remove(connection, "before_cursor_execute", go)
+            return len(statements)
+
+        names = self._multi_reflection_fixture(metadata, connection, 6)
+
+        # the number of queries doesn't depend on the number of tables
+        eq_(count_statements(names[0:3]), count_statements(names))
+
     def test_reflect_check_warning(self):
         rows = [("some name", "NOTCHECK foobar")]
         conn = mock.Mock(
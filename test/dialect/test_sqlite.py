@@ -1174,6 +1174,41 @@ class SQLTest(fixtures.TestBase, AssertsCompiledSQL):
             "CREATE TABLE atable (id INTEGER) WITHOUT ROWID",
         )
 
+    @testing.combinations(
+        ("insert",), ("update",), ("delete",), argnames="stmt_type"
+    )
+    def test_returning_no_table_qualifier(self, stmt_type):
+        """RETURNING in SQLite does not accept schema / table qualified
+        column names."""
+
+        t = table("t", column("id"), column("x"), schema="s")
+
+        if stmt_type == "insert":
+            stmt = t.insert().values(x=5)
+            expected = "INSERT INTO s.t (x) VALUES (?)"
+        elif stmt_type == "update":
+            stmt = t.update().values(x=5).where(t.c.id == 7)
+            expected = "UPDATE s.t SET x=? WHERE s.t.id = ?"
+        else:
+            stmt = t.delete().where(t.c.id == 7)
+            expected = "DELETE FROM s.t WHERE s.t.id = ?"
+
+        self.assert_compile(
+            stmt.returning(t.c.id, t.c.x + 5),
+            expected + " RETURNING id, x + ? AS anon_1",
+        )
+
+    def test_executemany_empty_insert_renders_null_pk(self):
+        m = MetaData()
+        t = Table("t", m, Column("id", Integer, primary_key=True))
+
+        self.assert_compile(
+            t.insert().return_defaults(),
+            "INSERT INTO t (id) VALUES (NULL) RETURNING id",
+            params={},
+            for_executemany=True,
+        )
+
 
 class OnConflictDDLTest(fixtures.TestBase, AssertsCompiledSQL):
 
@@ -1379,6 +1414,53 @@ class InsertTest(fixtures.TestBase, AssertsExecutionResults):
             ),
         )
 
+    @testing.requires.insert_executemany_returning
+    def test_executemany_returning_empty_insert(self, metadata, connection):
+        t = Table(
+            "returning_t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+        )
+        t.create(connection)
+
+        result = connection.execute(
+            t.insert().return_defaults(), [{}, {}, {}]
+        )
+        eq_(result.inserted_primary_key_rows, [(1,), (2,), (3,)])
+
+    @testing.requires.full_returning
+    def test_insert_update_delete_returning(self, metadata, connection):
+        t = Table(
+            "returning_t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+        )
+        t.create(connection)
+
+        eq_(
+            connection.execute(
+                t.insert().returning(t.c.id, t.c.data),
+                [{"data": "d1"}, {"data": "d2"}],
+            ).all(),
+            [(1, "d1"), (2, "d2")],
+        )
+        eq_(
+            connection.execute(
+                t.update()
+                .values(data="d3")
+                .where(t.c.id == 2)
+                .returning(t.c.id, t.c.data)
+            ).all(),
+            [(2, "d3")],
+        )
+        eq_(
+            connection.execute(
+                t.delete().where(t.c.id == 1).returning(t.c.data)
+            ).all(),
+            [("d1",)],
+        )
+
     def test_empty_insert_pk2(self, connection):
         # now warns due to [ticket:3216]
 
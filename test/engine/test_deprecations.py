@@ -472,6 +472,14 @@ class ImplicitReturningFlagTest(fixtures.TestBase):
             implicit_returning=False,
         )
 
+        # dialects that can use cursor.lastrowid for a single-row
+        # INSERT will prefer that over RETURNING unless they specify
+        # otherwise
+        uses_returning_for_pk = (
+            e.dialect.favor_returning_over_lastrowid
+            or not e.dialect.postfetch_lastrowid
+        )
+
         with e.connect() as conn:
             stmt = insert(t).values(data="data")
 
@@ -482,12 +490,18 @@ class ImplicitReturningFlagTest(fixtures.TestBase):
                     ):
                         stmt.compile(conn)
                 else:
-                    eq_(stmt.compile(conn).implicit_returning, [t.c.id])
+                    eq_(
+                        stmt.compile(conn).implicit_returning,
+                        [t.c.id] if uses_returning_for_pk else [],
+                    )
             elif (
                 implicit_returning is None
                 and testing.db.dialect.implicit_returning
             ):
-                eq_(stmt.compile(conn).implicit_returning, [t.c.id])
+                eq_(
+                    stmt.compile(conn).implicit_returning,
+                    [t.c.id] if uses_returning_for_pk else [],
+                )
             else:
                 eq_(stmt.compile(conn).implicit_returning, [])
 
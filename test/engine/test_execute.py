@@ -41,6 +41,7 @@ from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql import column
 from sqlalchemy.sql import literal
 from sqlalchemy.sql.elements import literal_column
+from sqlalchemy.sql.expression import ColumnClause
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import config
@@ -1057,6 +1058,113 @@ class CompiledCacheTest(fixtures.TestBase):
         assert len(cache) == 1
         eq_(conn.exec_driver_sql("select count(*) from users").scalar(), 3)
 
+    def test_precompile(self, metadata, connection):
+        users = Table(
+            "users",
+            metadata,
+            Column(
+                "user_id", INT, primary_key=True, test_needs_autoincrement=True
+            ),
+            Column("user_name", VARCHAR(20)),
+        )
+        users.create(connection)
+
+        cache = {}
+        opts = {"compiled_cache": cache}
+        engine = connection.engine
+
+        engine.precompile(
+            users.insert(), {"user_name": "u1"}, execution_options=opts
+        )
+        engine.precompile(
+            users.insert(),
+            [{"user_name": "u1"}, {"user_name": "u2"}],
+            execution_options=opts,
+        )
+        engine.precompile(
+            select(users).where(users.c.user_id == 5), execution_options=opts
+        )
+        eq_(len(cache), 3)
+
+        cached_conn = connection.execution_options(**opts)
+        ins = users.insert()
+        sel = select(users).where(users.c.user_id == 7)
+        with patch.object(
+            ins, "_compiler", Mock(side_effect=ins._compiler)
+        ) as ins_compile, patch.object(
+            sel, "_compiler", Mock(side_effect=sel._compiler)
+        ) as sel_compile:
+            cached_conn.execute(ins, {"user_name": "u1"})
+            cached_conn.execute(
+                ins, [{"user_name": "u2"}, {"user_name": "u3"}]
+            )
+            eq_(cached_conn.execute(sel).all(), [])
+        eq_(ins_compile.call_count, 0)
+        eq_(sel_compile.call_count, 0)
+        eq_(len(cache), 3)
+
+    def test_compiled_cache_stats(self, testing_engine):
+        eng = testing_engine(options={"query_cache_size": 4})
+        misses = []
+        event.listen(
+            eng,
+            "compiled_cache_miss",
+            lambda conn, elem, compiled, cacheable, compile_time: (
+                misses.append((elem, compiled.string, cacheable))
+            ),
+        )
+
+        class NoKey(ColumnClause):
+            inherit_cache = False
+
+        stmts = [select(literal(i).label("x%d" % i)) for i in range(7)]
+        no_key = select(NoKey("1"))
+        with eng.connect() as conn:
+            for stmt in stmts + stmts[-2:]:
+                conn.execute(stmt)
+            conn.execute(no_key)
+            conn.execute(stmts[0], execution_options={"compiled_cache": None})
+
+        stats = eng.compiled_cache_stats(top=2)
+        eq_(
+            stats[0:7],
+            (2, 7, 1, 1, 3, 4, 4),
+        )
+        eq_(sum(count for _, count in stats.compile_time_histogram), 8)
+        eq_(stats.compile_time_histogram[-1][0], float("inf"))
+        eq_(len(stats.top_misses), 2)
+        eq_(stats.top_misses[0][1], 1)
+
+        eq_(
+            [(elem, cacheable) for elem, _, cacheable in misses],
+            [(stmt, True) for stmt in stmts] + [(no_key, False)],
+        )
+
+    def test_compiled_cache_stats_caching_disabled(self, testing_engine):
+        eng = testing_engine(options={"query_cache_size": 0})
+        with eng.connect() as conn:
+            for i in range(3):
+                conn.execute(select(literal(1)))
+            conn.execute(select(literal(1), literal(2)))
+
+        stats = eng.compiled_cache_stats()
+        eq_(stats.caching_disabled, 4)
+        eq_(stats.misses, 0)
+        eq_(stats.capacity, None)
+
+        # only compilations that make use of a cache are tracked
+        eq_(stats.top_misses, ())
+
+        eq_(
+            eng.execution_options(foo="bar").compiled_cache_stats(),
+            stats,
+        )
+
+    def test_precompile_not_executable(self):
+        assert_raises(
+            tsa.exc.ObjectNotExecutableError, testing.db.precompile, "select 1"
+        )
+
     @testing.only_on(
         ["sqlite", "mysql", "postgresql"],
         "uses blob value that is problematic for some DBAPIs",
@@ -4029,3 +4137,91 @@ class DialectDoesntSupportCachingTest(fixtures.TestBase):
                 (2,),
             ],
         )
+
+
+class PipelineTest(fixtures.TestBase):
+    """test the Connection.pipeline() context manager using a mock
+    pipeline."""
+
+    __only_on__ = "sqlite+pysqlite"
+
+    @testing.fixture
+    def pipeline_engine(self, testing_engine):
+        eng = testing_engine()
+        canary = Mock()
+
+        @contextmanager
+        def do_pipeline(dbapi_connection):
+            canary.enter(dbapi_connection.dbapi_connection)
+            try:
+                yield
+            finally:
+                canary.exit(dbapi_connection.dbapi_connection)
+
+        eng.dialect.supports_pipeline = True
+        eng.dialect.do_pipeline = do_pipeline
+        return eng, canary
+
+    def test_pipeline(self, pipeline_engine):
+        eng, canary = pipeline_engine
+
+        with eng.connect() as conn:
+            with conn.pipeline() as pipeline_conn:
+                is_(pipeline_conn, conn)
+                eq_(
+                    canary.mock_calls,
+                    [call.enter(conn.connection.dbapi_connection)],
+                )
+                eq_(conn.scalar(select(1)), 1)
+            eq_(
+                canary.mock_calls,
+                [
+                    call.enter(conn.connection.dbapi_connection),
+                    call.exit(conn.connection.dbapi_connection),
+                ],
+            )
+
+    def test_not_supported(self, testing_engine):
+        eng = testing_engine()
+        is_false(eng.dialect.supports_pipeline)
+
+        with eng.connect() as conn:
+            with mock.patch.object(
+                eng.dialect, "do_pipeline", create=True
+            ) as do_pipeline:
+                with conn.pipeline() as pipeline_conn:
+                    is_(pipeline_conn, conn)
+                    eq_(conn.scalar(select(1)), 1)
+            eq_(do_pipeline.mock_calls, [])
+
+    def test_error_at_end_is_wrapped(self, pipeline_engine):
+        eng, canary = pipeline_engine
+        dbapi = eng.dialect.loaded_dbapi
+
+        @contextmanager
+        def do_pipeline(dbapi_connection):
+            yield
+            raise dbapi.IntegrityError("deferred statement failed")
+
+        eng.dialect.do_pipeline = do_pipeline
+
+        with eng.connect() as conn:
+            with expect_raises_message(
+                tsa.exc.IntegrityError, "deferred statement failed"
+            ):
+                with conn.pipeline():
+                    conn.scalar(select(1))
+
+    def test_non_dbapi_error_propagates(self, pipeline_engine):
+        eng, canary = pipeline_engine
+
+        with eng.connect() as conn:
+            with expect_raises_message(SomeException, "nope"):
+                with conn.pipeline():
+                    raise SomeException("nope")
+
+            dbapi_connection = conn.connection.dbapi_connection
+            eq_(
+                canary.mock_calls,
+                [call.enter(dbapi_connection), call.exit(dbapi_connection)],
+            )
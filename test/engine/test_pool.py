@@ -15,9 +15,11 @@ from sqlalchemy import select
 from sqlalchemy import testing
 from sqlalchemy.engine import default
 from sqlalchemy.pool.base import _AsyncConnDialect
+from sqlalchemy.pool import PoolMetrics
 from sqlalchemy.pool.base import _ConnDialect
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_context_ok
+from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import assert_warns_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises
@@ -229,6 +231,17 @@ class PoolTest(PoolTestBase):
             pool.QueuePool,
             dict(pool_size=8, max_overflow=10, timeout=25, use_lifo=True),
         ),
+        (
+            pool.QueuePool,
+            dict(
+                maintenance_interval=30,
+                min_idle=2,
+                idle_timeout=60,
+                pre_warm=True,
+                recycle_jitter=10,
+                max_connecting=3,
+            ),
+        ),
         (pool.QueuePool, {}),
         (pool.NullPool, {}),
         (pool.SingletonThreadPool, {}),
@@ -262,6 +275,9 @@ class PoolTest(PoolTestBase):
             "_invoke_creator",
             "_pool",
             "_overflow_lock",
+            "_maintenance_lock",
+            "_connect_slots",
+            "_connect_cond",
             "_fairy",
             "_conn",
             "logger",
@@ -379,6 +395,9 @@ class PoolDialectTest(PoolTestBase):
             def get_driver_connection(self, connection):
                 return connection
 
+            def is_dbapi_transaction_active(self, dbapi_connection):
+                return None
+
         return PoolDialect(), canary
 
     def _do_test(self, pool_cls, assertion):
@@ -1880,6 +1899,666 @@ class QueuePoolTest(PoolTestBase):
         pc1.close()
 
 
+class PoolMaintenanceTest(PoolTestBase):
+    @testing.fixture
+    def mock_time(self):
+        with patch("sqlalchemy.pool.base.time.time") as mock_time:
+            mock_time.return_value = 1000
+            yield mock_time
+
+    def _checkout_and_return(self, p, num):
+        conns = [p.connect() for i in range(num)]
+        dbapi_conns = [c.dbapi_connection for c in conns]
+        for c in conns:
+            c.close()
+        return dbapi_conns
+
+    def test_min_idle_exceeds_pool_size(self):
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "min_idle of 6 may not exceed pool_size of 5",
+            pool.QueuePool,
+            Mock(),
+            pool_size=5,
+            min_idle=6,
+        )
+
+    def test_pre_warm(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, pre_warm=True)
+
+        p._run_maintenance(pre_warm=True)
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.checkedin(), 3)
+        eq_(p.overflow(), 0)
+
+        # only done on the first run
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 3)
+
+    def test_min_idle(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=5, min_idle=2)
+
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.checkedin(), 2)
+
+        c1, c2 = p.connect(), p.connect()
+        eq_(p.checkedin(), 0)
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 4)
+        eq_(p.checkedin(), 2)
+        eq_(p.checkedout(), 2)
+
+        c1.close()
+        c2.close()
+        eq_(p.checkedin(), 4)
+
+    def test_min_idle_does_not_overflow(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=2, max_overflow=5, min_idle=2
+        )
+        conns = [p.connect() for i in range(3)]
+        eq_(p.overflow(), 1)
+
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.checkedin(), 0)
+
+        for c in conns:
+            c.close()
+
+    def test_connect_failure(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, min_idle=3)
+        dbapi.shutdown(True)
+
+        p._run_maintenance()
+        eq_(p.checkedin(), 0)
+        eq_(p.overflow(), -3)
+
+        dbapi.shutdown(False)
+        p._run_maintenance()
+        eq_(p.checkedin(), 3)
+        eq_(p.overflow(), 0)
+
+    def test_idle_timeout(self, mock_time):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, min_idle=2, idle_timeout=60
+        )
+        c1, c2, c3, c4 = self._checkout_and_return(p, 4)
+        eq_(p.checkedin(), 4)
+
+        mock_time.return_value = 1030
+        p._run_maintenance()
+        eq_(p.checkedin(), 4)
+
+        # a connection returned recently is not idle
+        p.connect().close()
+
+        mock_time.return_value = 1070
+        p._run_maintenance()
+        eq_(p.checkedin(), 2)
+        eq_(p.overflow(), -3)
+        eq_([c.closed for c in (c1, c2, c3, c4)], [False, True, True, False])
+
+        # min_idle is maintained
+        mock_time.return_value = 2000
+        p._run_maintenance()
+        eq_(p.checkedin(), 2)
+        eq_(dbapi.connect.call_count, 4)
+
+    def test_recycle(self, mock_time):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=5, recycle=30)
+        c1, c2 = self._checkout_and_return(p, 2)
+
+        mock_time.return_value = 1020
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 2)
+
+        mock_time.return_value = 1040
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 4)
+        eq_(p.checkedin(), 2)
+        eq_(p.overflow(), -3)
+        is_true(c1.closed)
+        is_true(c2.closed)
+
+        # new connections are not recycled again at checkout
+        c3 = p.connect()
+        eq_(dbapi.connect.call_count, 4)
+        is_not(c3.dbapi_connection, c1)
+        c3.close()
+
+    def test_recycle_invalidated(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=5)
+        c1 = p.connect()
+        c1.invalidate()
+        c1.close()
+        eq_(p.checkedin(), 1)
+
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.checkedin(), 1)
+
+        c1 = p.connect()
+        eq_(dbapi.connect.call_count, 2)
+        c1.close()
+
+    @testing.combinations((4, True), (1, False), argnames="jitter, recycled")
+    def test_recycle_jitter(self, mock_time, jitter, recycled):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, recycle=30, recycle_jitter=5
+        )
+        self._checkout_and_return(p, 1)
+
+        mock_time.return_value = 1027
+        with patch("sqlalchemy.pool.impl.random.uniform") as uniform:
+            uniform.return_value = jitter
+            p._run_maintenance()
+        eq_(uniform.mock_calls, [call(0, 5)])
+        eq_(dbapi.connect.call_count, 2 if recycled else 1)
+
+    def test_recycle_connect_failure(self, mock_time):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=5, recycle=30)
+        self._checkout_and_return(p, 2)
+
+        dbapi.shutdown(True)
+        mock_time.return_value = 1040
+        p._run_maintenance()
+        eq_(p.checkedin(), 0)
+        eq_(p.overflow(), -5)
+
+    @testing.combinations(True, False, argnames="use_lifo")
+    def test_order_preserved(self, mock_time, use_lifo):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, use_lifo=use_lifo, idle_timeout=60
+        )
+        c1, c2, c3 = self._checkout_and_return(p, 3)
+
+        p._run_maintenance()
+        eq_(p.checkedin(), 3)
+
+        conns = [p.connect() for i in range(3)]
+        eq_(
+            [c.dbapi_connection for c in conns],
+            [c3, c2, c1] if use_lifo else [c1, c2, c3],
+        )
+        for c in conns:
+            c.close()
+
+    def test_recycle_slot_released_before_reconnect(self, mock_time):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, recycle=30
+        )
+        c1, c2, c3 = self._checkout_and_return(p, 3)
+
+        # only the first connection is due for recycle
+        p._pool.queue[0].starttime = 990
+        mock_time.return_value = 1025
+
+        observed = []
+
+        def connect(*arg, **kw):
+            observed.append((p.checkedin(), p.overflow(), p.checkedout()))
+            return Mock()
+
+        dbapi.connect.side_effect = connect
+        p._run_maintenance()
+
+        # the other connections were back in the pool and the slot of the
+        # recycled connection was re-acquired while it reconnected
+        eq_(observed, [(2, 0, 1)])
+        eq_(p.checkedin(), 3)
+        eq_(p.overflow(), 0)
+        is_true(c1.closed)
+
+    def test_recycle_slot_taken(self, mock_time):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=1, max_overflow=0, recycle=30
+        )
+        (c1,) = self._checkout_and_return(p, 1)
+
+        checked_out = []
+
+        # a checkout takes the slot given up by the recycled connection
+        c1.close.side_effect = lambda: checked_out.append(p.connect())
+
+        mock_time.return_value = 1040
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.checkedin(), 0)
+        eq_(p.overflow(), 0)
+        eq_(p.checkedout(), 1)
+
+        checked_out[0].close()
+        eq_(p.checkedin(), 1)
+
+    def test_background_thread(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, maintenance_interval=0.05, pre_warm=True
+        )
+
+        # nothing happens until the pool is started or first used
+        time.sleep(0.1)
+        eq_(dbapi.connect.call_count, 0)
+        is_true(p._maintenance_pending)
+
+        c1 = p.connect()
+        is_(p._maintenance_pending, False)
+
+        deadline = time.time() + join_timeout
+        while p.checkedin() < 2 and time.time() < deadline:
+            time.sleep(0.05)
+        eq_(p.checkedin(), 2)
+        c1.close()
+
+        p.dispose()
+        is_none(p._stop_maintenance)
+        is_true(p._maintenance_pending)
+
+    def test_start(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, maintenance_interval=0.05, pre_warm=True
+        )
+        p.start()
+        is_(p._maintenance_pending, False)
+
+        deadline = time.time() + join_timeout
+        while p.checkedin() < 3 and time.time() < deadline:
+            time.sleep(0.05)
+        eq_(p.checkedin(), 3)
+
+        # calling again has no effect
+        stop = p._stop_maintenance
+        p.start()
+        is_(p._stop_maintenance, stop)
+
+        p.dispose()
+        is_none(p._stop_maintenance)
+
+    def test_start_no_maintenance(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, pre_warm=True)
+        p.start()
+        is_none(p._stop_maintenance)
+        eq_(dbapi.connect.call_count, 0)
+
+    def test_engine_starts_maintenance(self):
+        canary = Mock()
+        e = tsa.create_engine(
+            "sqlite://",
+            poolclass=pool.QueuePool,
+            pool_size=2,
+            pool_maintenance_interval=30,
+            pool_pre_warm=True,
+        )
+        try:
+            is_not_none(e.pool._stop_maintenance)
+
+            deadline = time.time() + join_timeout
+            while e.pool.checkedin() < 2 and time.time() < deadline:
+                time.sleep(0.05)
+            eq_(e.pool.checkedin(), 2)
+
+            # the dialect is initialized by the first pre-warmed connection
+            is_not_none(e.dialect.server_version_info)
+
+            old_pool = e.pool
+            event.listen(old_pool, "connect", canary)
+            e.dispose()
+            is_none(old_pool._stop_maintenance)
+            is_not_none(e.pool._stop_maintenance)
+
+            while e.pool.checkedin() < 2 and time.time() < deadline:
+                time.sleep(0.05)
+            eq_(canary.call_count, 2)
+        finally:
+            e.pool.dispose()
+
+    def test_create_engine_args(self):
+        e = tsa.create_engine(
+            "sqlite://",
+            poolclass=pool.QueuePool,
+            pool_maintenance_interval=30,
+            pool_min_idle=2,
+            pool_idle_timeout=60,
+            pool_pre_warm=True,
+            pool_recycle_jitter=10,
+        )
+        eq_(e.pool._maintenance_interval, 30)
+        eq_(e.pool._min_idle, 2)
+        eq_(e.pool._idle_timeout, 60)
+        is_true(e.pool._pre_warm)
+        eq_(e.pool._recycle_jitter, 10)
+        e.pool.dispose()
+
+
+class MaxConnectingTest(PoolTestBase):
+    @testing.fixture
+    def blocking_pool(self):
+        dbapi = MockDBAPI()
+        state = {"connecting": 0, "max_connecting": 0, "block": False}
+        lock = threading.Lock()
+        proceed = threading.Event()
+
+        def creator():
+            with lock:
+                state["connecting"] += 1
+                state["max_connecting"] = max(
+                    state["max_connecting"], state["connecting"]
+                )
+            try:
+                if state["block"]:
+                    proceed.wait(join_timeout)
+                return dbapi.connect("foo.db")
+            finally:
+                with lock:
+                    state["connecting"] -= 1
+
+        def make_pool(**kw):
+            return pool.QueuePool(creator, **kw)
+
+        yield make_pool, dbapi, state, proceed
+        proceed.set()
+
+    def _wait_for(self, fn):
+        deadline = time.time() + join_timeout
+        while not fn() and time.time() < deadline:
+            time.sleep(0.01)
+        is_true(fn())
+
+    def test_invalid_argument(self):
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "max_connecting must be at least 1",
+            pool.QueuePool,
+            Mock(),
+            max_connecting=0,
+        )
+
+    def test_limit_concurrent_connects(self, blocking_pool):
+        make_pool, dbapi, state, proceed = blocking_pool
+        p = make_pool(pool_size=10, max_connecting=2)
+        state["block"] = True
+
+        conns = []
+
+        def checkout():
+            conns.append(p.connect())
+
+        threads = [threading.Thread(target=checkout) for i in range(6)]
+        for t in threads:
+            t.start()
+
+        self._wait_for(lambda: state["connecting"] == 2)
+        time.sleep(0.1)
+        eq_(state["connecting"], 2)
+
+        proceed.set()
+        for t in threads:
+            t.join(join_timeout)
+
+        eq_(len(conns), 6)
+        eq_(state["max_connecting"], 2)
+        eq_(dbapi.connect.call_count, 6)
+        for c in conns:
+            c.close()
+
+    def test_waiter_receives_returned_connection(self, blocking_pool):
+        make_pool, dbapi, state, proceed = blocking_pool
+        p = make_pool(pool_size=10, max_connecting=1)
+        c1 = p.connect()
+        dbapi_c1 = c1.dbapi_connection
+        state["block"] = True
+
+        conns = {}
+
+        def checkout(name):
+            conns[name] = p.connect()
+
+        t1 = threading.Thread(target=checkout, args=("t1",))
+        t1.start()
+        self._wait_for(lambda: state["connecting"] == 1)
+
+        t2 = threading.Thread(target=checkout, args=("t2",))
+        t2.start()
+        time.sleep(0.1)
+        c1.close()
+        t2.join(join_timeout)
+
+        is_(conns["t2"].dbapi_connection, dbapi_c1)
+        eq_(dbapi.connect.call_count, 1)
+
+        proceed.set()
+        t1.join(join_timeout)
+        eq_(dbapi.connect.call_count, 2)
+        for c in conns.values():
+            c.close()
+
+    def test_waiter_notified_of_released_slot(self, blocking_pool):
+        make_pool, dbapi, state, proceed = blocking_pool
+        p = make_pool(pool_size=10, max_connecting=1)
+        state["block"] = True
+
+        waits = []
+        wait = p._connect_cond.wait
+
+        def spy_wait(timeout):
+            waits.append(timeout)
+            return wait(timeout)
+
+        p._connect_cond.wait = spy_wait
+
+        conns = {}
+
+        def checkout(name):
+            conns[name] = p.connect()
+
+        t1 = threading.Thread(target=checkout, args=("t1",))
+        t1.start()
+        self._wait_for(lambda: state["connecting"] == 1)
+
+        t2 = threading.Thread(target=checkout, args=("t2",))
+        t2.start()
+        self._wait_for(lambda: len(waits) == 1)
+        time.sleep(0.3)
+
+        # the waiter isn't polling, and is woken up once the first
+        # connection attempt completes and releases its slot
+        eq_(len(waits), 1)
+        is_true(waits[0] > 29)
+
+        proceed.set()
+        t1.join(join_timeout)
+        t2.join(join_timeout)
+        eq_(len(waits), 1)
+        eq_(dbapi.connect.call_count, 2)
+        is_not(conns["t1"].dbapi_connection, conns["t2"].dbapi_connection)
+        for c in conns.values():
+            c.close()
+
+    def test_timeout(self, blocking_pool):
+        make_pool, dbapi, state, proceed = blocking_pool
+        p = make_pool(pool_size=10, max_connecting=1, timeout=0.2)
+        state["block"] = True
+
+        t1 = threading.Thread(target=lambda: p.connect().close())
+        t1.start()
+        self._wait_for(lambda: state["connecting"] == 1)
+
+        assert_raises_message(
+            tsa.exc.TimeoutError,
+            "QueuePool limit of 1 concurrent connection attempts reached",
+            p.connect,
+        )
+        eq_(p.overflow(), -9)
+
+        proceed.set()
+        t1.join(join_timeout)
+
+    def test_reconnect_uses_slot(self, blocking_pool):
+        make_pool, dbapi, state, proceed = blocking_pool
+        p = make_pool(pool_size=10, max_connecting=1, timeout=0.2)
+        c1 = p.connect()
+        c1.invalidate()
+        c1.close()
+        state["block"] = True
+
+        t1 = threading.Thread(target=lambda: p.connect().close())
+        t1.start()
+        self._wait_for(lambda: state["connecting"] == 1)
+
+        # re-establishing the invalidated connection in the other thread
+        # occupies the only connect slot
+        assert_raises_message(
+            tsa.exc.TimeoutError,
+            "QueuePool limit of 1 concurrent connection attempts reached",
+            p.connect,
+        )
+
+        proceed.set()
+        t1.join(join_timeout)
+
+    def test_slot_released_on_error(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=10, max_connecting=1, timeout=0.2
+        )
+        dbapi.shutdown(True)
+        for i in range(3):
+            assert_raises_message(Exception, "connect failed", p.connect)
+
+        dbapi.shutdown(False)
+        c1 = p.connect()
+        c2 = p.connect()
+        c1.close()
+        c2.close()
+
+
+class PoolMetricsTest(PoolTestBase):
+    @testing.fixture
+    def mock_perf_counter(self):
+        with patch("sqlalchemy.pool.base.time.perf_counter") as mock_clock:
+            mock_clock.return_value = 100
+            yield mock_clock
+
+    def test_disabled_by_default(self):
+        p = self._queuepool_fixture()
+        is_none(p.metrics)
+        p.connect().close()
+
+    def test_checkout_and_hold(self, mock_perf_counter):
+        p = self._queuepool_fixture(metrics=True)
+
+        c1 = p.connect()
+        mock_perf_counter.return_value = 100.5
+        c1.close()
+
+        c1 = p.connect()
+        mock_perf_counter.return_value = 102
+        c1.close()
+
+        snapshot = p.metrics.snapshot()
+        eq_(snapshot.checkout_wait.count, 2)
+        eq_(snapshot.checkout_wait.sum, 0)
+        eq_(snapshot.hold_time.count, 2)
+        eq_(snapshot.hold_time.sum, 2)
+        eq_(snapshot.hold_time.max, 1.5)
+        eq_(snapshot.connect_time.count, 1)
+
+    def test_buckets(self, mock_perf_counter):
+        metrics = PoolMetrics(buckets=(1, 5))
+        p = self._queuepool_fixture(metrics=metrics)
+        is_(p.metrics, metrics)
+
+        for hold in (0.5, 1, 3, 10):
+            c1 = p.connect()
+            mock_perf_counter.return_value += hold
+            c1.close()
+
+        eq_(
+            metrics.snapshot().hold_time.buckets,
+            ((1, 2), (5, 1), (float("inf"), 1)),
+        )
+
+        metrics.reset()
+        snapshot = metrics.snapshot()
+        eq_(snapshot.hold_time.count, 0)
+        eq_(
+            snapshot.hold_time.buckets,
+            ((1, 0), (5, 0), (float("inf"), 0)),
+        )
+
+    def test_overflow(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=2, metrics=True)
+        conns = [p.connect() for i in range(3)]
+        for c in conns:
+            c.close()
+        eq_(p.metrics.snapshot().overflow_created, 2)
+        eq_(p.metrics.snapshot().connect_time.count, 3)
+
+    def test_timeout(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=0, timeout=0, metrics=True
+        )
+        c1 = p.connect()
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        c1.close()
+
+        snapshot = p.metrics.snapshot()
+        eq_(snapshot.timeouts, 1)
+        eq_(snapshot.checkout_wait.count, 1)
+
+    def test_invalidate(self):
+        p = self._queuepool_fixture(metrics=True)
+        c1 = p.connect()
+        c1.invalidate(soft=True)
+        c1.invalidate()
+        c1.close()
+
+        snapshot = p.metrics.snapshot()
+        eq_(snapshot.invalidations, 1)
+        eq_(snapshot.soft_invalidations, 1)
+
+    def test_pre_ping_failure(self):
+        dbapi = MockDBAPI()
+        dialect = Mock()
+        dialect.do_ping.return_value = False
+        p = pool.QueuePool(
+            creator=lambda: dbapi.connect("foo.db"),
+            pre_ping=True,
+            dialect=dialect,
+            metrics=True,
+        )
+        p.connect().close()
+        p.connect().close()
+
+        snapshot = p.metrics.snapshot()
+        eq_(snapshot.pre_ping_failures, 1)
+        eq_(snapshot.invalidations, 1)
+        eq_(snapshot.connect_time.count, 2)
+
+    def test_async_pool(self):
+        p = self._queuepool_fixture(_is_asyncio=True, metrics=True)
+        c1 = p.connect()
+        c1.close()
+        eq_(p.metrics.snapshot().hold_time.count, 1)
+
+    def test_shared_with_recreate(self):
+        p = self._queuepool_fixture(metrics=True)
+        p.connect().close()
+
+        p2 = p.recreate()
+        is_(p2.metrics, p.metrics)
+        p2.connect().close()
+        eq_(p2.metrics.snapshot().checkout_wait.count, 2)
+
+    def test_create_engine_arg(self):
+        e = tsa.create_engine(
+            "sqlite://", poolclass=pool.QueuePool, pool_metrics=True
+        )
+        with e.connect():
+            pass
+        eq_(e.pool.metrics.snapshot().checkout_wait.count, 1)
+
+
 class ResetOnReturnTest(PoolTestBase):
     def _fixture(self, **kw):
         dbapi = Mock()
@@ -1912,6 +2591,74 @@ class ResetOnReturnTest(PoolTestBase):
         assert not dbapi.connect().rollback.called
         assert not dbapi.connect().commit.called
 
+    @testing.combinations("rollback", "commit", argnames="reset_on_return")
+    @testing.combinations(
+        (False, False), (True, True), (None, True), argnames="active, reset"
+    )
+    def test_dialect_transaction_status(self, reset_on_return, active, reset):
+        dialect = Mock()
+        dialect.is_dbapi_transaction_active.return_value = active
+        dbapi, p = self._fixture(
+            reset_on_return=reset_on_return, dialect=dialect, metrics=True
+        )
+
+        c1 = p.connect()
+        dbapi_conn = c1.dbapi_connection
+        c1.close()
+        eq_(
+            dialect.is_dbapi_transaction_active.mock_calls,
+            [call(dbapi_conn)],
+        )
+        if reset_on_return == "rollback":
+            eq_(dialect.do_rollback.call_count, 1 if reset else 0)
+        else:
+            eq_(dialect.do_commit.call_count, 1 if reset else 0)
+        eq_(p.metrics.snapshot().resets_skipped, 0 if reset else 1)
+
+    def test_close_no_transaction(self):
+        dbapi, p = self._fixture(metrics=True)
+
+        # not known to be clean on first checkout
+        c1 = p.connect()
+        c1._close_no_transaction()
+        eq_(dbapi.connect().rollback.call_count, 1)
+
+        c1 = p.connect()
+        c1._close_no_transaction()
+        eq_(dbapi.connect().rollback.call_count, 1)
+        eq_(p.metrics.snapshot().resets_skipped, 1)
+
+        # connection used without the caller being aware
+        c1 = p.connect()
+        c1.close()
+        eq_(dbapi.connect().rollback.call_count, 2)
+
+        c1 = p.connect()
+        c1._close_no_transaction()
+        eq_(dbapi.connect().rollback.call_count, 2)
+
+    @testing.combinations("checkout", "reset", argnames="event_name")
+    def test_close_no_transaction_events(self, event_name):
+        dbapi, p = self._fixture()
+        event.listen(p, event_name, Mock())
+
+        for i in range(3):
+            c1 = p.connect()
+            c1._close_no_transaction()
+        eq_(dbapi.connect().rollback.call_count, 3)
+
+    def test_close_no_transaction_reconnect(self):
+        dbapi, p = self._fixture()
+        p.connect().close()
+
+        c1 = p.connect()
+        c1.invalidate()
+        c1.close()
+
+        c1 = p.connect()
+        c1._close_no_transaction()
+        eq_(dbapi.connect().rollback.call_count, 2)
+
 
 class SingletonThreadPoolTest(PoolTestBase):
     @testing.requires.threading_with_mock
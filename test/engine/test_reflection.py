@@ -1197,6 +1197,112 @@ class ReflectionTest(fixtures.TestBase, ComparesTables):
         m9.reflect(connection)
         is_false(m9.tables)
 
+    @testing.requires.foreign_key_constraint_reflection
+    def test_get_multi_methods(self, connection, metadata):
+        Table(
+            "rt_a",
+            metadata,
+            Column("id", sa.Integer, primary_key=True),
+            Column("data", sa.String(30), index=True),
+        )
+        Table(
+            "rt_b",
+            metadata,
+            Column("id", sa.Integer, primary_key=True),
+            Column("a_id", sa.Integer, sa.ForeignKey("rt_a.id")),
+        )
+        metadata.create_all(connection)
+
+        insp = inspect(connection)
+        multi_cols = insp.get_multi_columns(filter_names=["rt_a", "rt_b"])
+        eq_(set(multi_cols), {(None, "rt_a"), (None, "rt_b")})
+
+        for multi, single in [
+            (insp.get_multi_pk_constraint, insp.get_pk_constraint),
+            (insp.get_multi_foreign_keys, insp.get_foreign_keys),
+            (insp.get_multi_indexes, insp.get_indexes),
+        ]:
+            result = multi(filter_names=["rt_a", "rt_b"])
+            for name in ("rt_a", "rt_b"):
+                eq_(result[(None, name)], single(name))
+
+        for name in ("rt_a", "rt_b"):
+            eq_(
+                [
+                    (col["name"], col["type"]._type_affinity)
+                    for col in multi_cols[(None, name)]
+                ],
+                [
+                    (col["name"], col["type"]._type_affinity)
+                    for col in insp.get_columns(name)
+                ],
+            )
+
+        all_cols = insp.get_multi_columns()
+        in_((None, "rt_a"), all_cols)
+        in_((None, "rt_b"), all_cols)
+
+    def test_reflect_uses_multi_methods(self, connection, metadata):
+        names = ["rt_%s" % name for name in ("a", "b", "c")]
+        for name in names:
+            Table(name, metadata, Column("id", sa.Integer, primary_key=True))
+        metadata.create_all(connection)
+
+        dialect = connection.dialect
+        with mock.patch.object(
+            dialect, "get_multi_columns", wraps=dialect.get_multi_columns
+        ) as get_multi_columns:
+            m = MetaData()
+            m.reflect(connection, only=names)
+
+        eq_(get_multi_columns.call_count, 1)
+        eq_(get_multi_columns.mock_calls[0][2]["filter_names"], tuple(names))
+        for name in names:
+            eq_(m.tables[name].c.keys(), ["id"])
+
+    def test_reflect_table_w_partial_reflect_info(self, connection, metadata):
+        Table("rt_a", metadata, Column("id", sa.Integer, primary_key=True))
+        Table("rt_b", metadata, Column("id", sa.Integer, primary_key=True))
+        metadata.create_all(connection)
+
+        insp = inspect(connection)
+        reflect_info = insp._get_reflection_info(filter_names=["rt_a"])
+
+        m = MetaData()
+        rt_a = Table("rt_a", m)
+        rt_b = Table("rt_b", m)
+        insp.reflect_table(rt_a, None, _reflect_info=reflect_info)
+
+        # rt_b is not part of the prefetched information and is
+        # reflected individually
+        insp.reflect_table(rt_b, None, _reflect_info=reflect_info)
+        eq_(rt_a.c.keys(), ["id"])
+        eq_(rt_b.c.keys(), ["id"])
+        eq_(list(rt_b.primary_key), [rt_b.c.id])
+
+    def test_reflection_info_loads_lazily(self, connection, metadata):
+        Table("rt_a", metadata, Column("id", sa.Integer, primary_key=True))
+        metadata.create_all(connection)
+
+        insp = inspect(connection)
+        dialect = connection.dialect
+        with mock.patch.object(
+            dialect, "get_multi_columns", wraps=dialect.get_multi_columns
+        ) as get_multi_columns, mock.patch.object(
+            dialect, "get_multi_indexes", wraps=dialect.get_multi_indexes
+        ) as get_multi_indexes:
+            reflect_info = insp._get_reflection_info(filter_names=["rt_a"])
+            eq_(get_multi_columns.call_count, 0)
+            eq_(get_multi_indexes.call_count, 0)
+
+            eq_(
+                [col["name"] for col in reflect_info.columns[(None, "rt_a")]],
+                ["id"],
+            )
+            reflect_info.columns
+            eq_(get_multi_columns.call_count, 1)
+            eq_(get_multi_indexes.call_count, 0)
+
     def test_reflect_all_unreflectable_table(self, connection, metadata):
         names = ["rt_%s" % name for name in ("a", "b", "c", "d", "e")]
 
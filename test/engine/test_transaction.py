@@ -1637,11 +1637,10 @@ class ResetFixture:
 
 
 class ResetAgentTest(ResetFixture, fixtures.TestBase):
-    # many of these tests illustate rollback-on-return being redundant
-    # vs. what the transaction just did, however this is to ensure
-    # even if statements were invoked on the DBAPI connection directly,
-    # the state is cleared.    options to optimize this with clear
-    # docs etc. should be added.
+    # rollback-on-return is skipped when the Connection has ended its
+    # transaction and the DBAPI connection wasn't otherwise used; see
+    # test_reset_agent_dbapi_connection_used for the case where statements
+    # may have been invoked on the DBAPI connection directly.
 
     __backend__ = True
 
@@ -1665,7 +1664,6 @@ class ResetAgentTest(ResetFixture, fixtures.TestBase):
             [
                 mock.call.rollback(connection),
                 mock.call.do_rollback(mock.ANY),
-                mock.call.do_rollback(mock.ANY),
             ],
         )
 
@@ -1679,7 +1677,6 @@ class ResetAgentTest(ResetFixture, fixtures.TestBase):
             [
                 mock.call.commit(connection),
                 mock.call.do_commit(mock.ANY),
-                mock.call.do_rollback(mock.ANY),
             ],
         )
 
@@ -1692,7 +1689,6 @@ class ResetAgentTest(ResetFixture, fixtures.TestBase):
             [
                 mock.call.rollback(connection),
                 mock.call.do_rollback(mock.ANY),
-                mock.call.do_rollback(mock.ANY),
             ],
         )
 
@@ -1872,4 +1868,32 @@ class ResetAgentTest(ResetFixture, fixtures.TestBase):
         with reset_agent.engine.connect():
             pass
 
-        eq_(reset_agent.mock_calls, [mock.call.do_rollback(mock.ANY)])
+        eq_(reset_agent.mock_calls, [])
+
+    def test_reset_agent_dbapi_connection_used(self, reset_agent):
+        with mock.patch.object(
+            reset_agent.engine.dialect,
+            "is_dbapi_transaction_active",
+            return_value=None,
+        ):
+            with reset_agent.engine.connect() as connection:
+                connection.begin().commit()
+                connection.connection.cursor().close()
+
+        eq_(
+            reset_agent.mock_calls,
+            [
+                mock.call.commit(connection),
+                mock.call.do_commit(mock.ANY),
+                mock.call.do_rollback(mock.ANY),
+            ],
+        )
+
+    def test_reset_agent_reset_event(self, reset_agent):
+        canary = mock.Mock()
+        event.listen(reset_agent.engine, "reset", canary)
+
+        with reset_agent.engine.connect() as connection:
+            connection.begin().commit()
+
+        eq_(canary.call_count, 1)
@@ -1,6 +1,7 @@
 import asyncio
 import inspect as stdlib_inspect
 
+from sqlalchemy import bindparam
 from sqlalchemy import Column
 from sqlalchemy import create_engine
 from sqlalchemy import delete
@@ -9,12 +10,14 @@ from sqlalchemy import exc
 from sqlalchemy import func
 from sqlalchemy import inspect
 from sqlalchemy import Integer
+from sqlalchemy import MetaData
 from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy import text
 from sqlalchemy import union_all
+from sqlalchemy.engine import cursor as _cursor
 from sqlalchemy.ext.asyncio import async_engine_from_config
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.ext.asyncio import engine as _async_engine
@@ -40,6 +43,7 @@ from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing import ne_
+from sqlalchemy.util.concurrency import await_only
 from sqlalchemy.util.concurrency import greenlet_spawn
 
 
@@ -747,6 +751,163 @@ class AsyncEventTest(EngineFixture):
                 )
 
 
+class AsyncNativeExecuteTest(EngineFixture):
+    """test the execution of statements without a greenlet, for dialects
+    which support it."""
+
+    __backend__ = True
+
+    @testing.fixture
+    def native_engine(self, async_engine):
+        if not async_engine.dialect._supports_native_async_execute:
+            config.skip_test("dialect doesn't support native execution")
+        return async_engine
+
+    def _spy_sync_execute(self, conn):
+        sync_execute = mock.Mock(side_effect=conn.sync_connection.execute)
+        conn.sync_connection.execute = sync_execute
+        return sync_execute
+
+    @async_test
+    async def test_native_execute(self, native_engine):
+        users = self.tables.users
+
+        async with native_engine.connect() as conn:
+            sync_execute = self._spy_sync_execute(conn)
+
+            result = await conn.execute(
+                select(users.c.user_name).where(users.c.user_id == 5)
+            )
+            eq_(result.all(), [("name5",)])
+
+            result = await conn.execute(
+                users.update()
+                .values(user_name="new name")
+                .where(users.c.user_id == 5)
+            )
+            eq_(result.rowcount, 1)
+
+            eq_(
+                await conn.scalar(
+                    select(users.c.user_name).where(users.c.user_id == 5)
+                ),
+                "new name",
+            )
+            is_true(conn.in_transaction())
+            await conn.rollback()
+
+        eq_(sync_execute.mock_calls, [])
+
+    @testing.combinations(
+        (
+            lambda users: (
+                users.insert(),
+                [{"user_id": 25}, {"user_id": 26}],
+            ),
+        ),
+        (lambda users: (select(users), None, {"stream_results": True}),),
+        argnames="fixture",
+    )
+    @async_test
+    async def test_greenlet_execute(self, native_engine, fixture):
+        users = self.tables.users
+
+        stmt, params, *opts = fixture(users)
+        async with native_engine.connect() as conn:
+            sync_execute = self._spy_sync_execute(conn)
+
+            if opts:
+                result = await conn.stream(
+                    stmt, params, execution_options=opts[0]
+                )
+                await result.close()
+            else:
+                await conn.execute(stmt, params)
+            await conn.rollback()
+
+        eq_(len(sync_execute.mock_calls), 1)
+
+    @async_test
+    async def test_greenlet_execute_events(self, native_engine):
+        canary = mock.Mock()
+
+        async with native_engine.connect() as conn:
+            sync_execute = self._spy_sync_execute(conn)
+
+            event.listen(conn.sync_connection, "before_execute", canary)
+            eq_(await conn.scalar(select(1)), 1)
+
+        eq_(len(sync_execute.mock_calls), 1)
+        eq_(len(canary.mock_calls), 1)
+
+    @async_test
+    async def test_native_execute_error(self, native_engine):
+        users = self.tables.users
+
+        async with native_engine.connect() as conn:
+            sync_execute = self._spy_sync_execute(conn)
+
+            with expect_raises(exc.IntegrityError):
+                await conn.execute(
+                    users.insert(), {"user_id": 1, "user_name": "dupe"}
+                )
+            await conn.rollback()
+
+            eq_(await conn.scalar(select(func.count(users.c.user_id))), 19)
+
+        eq_(sync_execute.mock_calls, [])
+
+    @async_test
+    async def test_prefetch_default_compiles_once(self, native_engine):
+        users = Table(
+            "users",
+            MetaData(),
+            Column("user_id", Integer, primary_key=True),
+            Column("user_name", String(20), default=lambda: "default"),
+        )
+        stmt = users.insert()
+
+        async with native_engine.connect() as conn:
+            sync_execute = self._spy_sync_execute(conn)
+
+            await conn.execute(stmt, {"user_id": 30})
+            await conn.execute(stmt, {"user_id": 31})
+            eq_(
+                (
+                    await conn.execute(
+                        select(users.c.user_name).where(
+                            users.c.user_id.in_([30, 31])
+                        )
+                    )
+                ).all(),
+                [("default",), ("default",)],
+            )
+            await conn.rollback()
+
+        eq_(sync_execute.mock_calls, [])
+
+        stats = native_engine.sync_engine.compiled_cache_stats()
+        eq_(stats.hits, 1)
+        eq_(stats.misses, 2)
+
+    @async_test
+    async def test_statement_error_compiles_once(self, native_engine):
+        users = self.tables.users
+        stmt = select(users).where(users.c.user_id == bindparam("uid"))
+
+        async with native_engine.connect() as conn:
+            for i in range(2):
+                with expect_raises_message(
+                    exc.StatementError,
+                    "A value is required for bind parameter 'uid'",
+                ):
+                    await conn.execute(stmt)
+
+        stats = native_engine.sync_engine.compiled_cache_stats()
+        eq_(stats.hits, 1)
+        eq_(stats.misses, 1)
+
+
 class AsyncInspection(EngineFixture):
     __backend__ = True
 
@@ -1009,6 +1170,186 @@ class AsyncResultTest(EngineFixture):
         eq_(result, list(range(1, 20)))
 
 
+class AsyncPrefetchTest(EngineFixture):
+    def _strategy(self, result):
+        return result._real_result.cursor_strategy
+
+    async def _wait_for_batches(self, strategy, count):
+        # batches are fetched by the background task, which may involve
+        # the driver's own thread or network round trips
+        for i in range(500):
+            if strategy._queue.qsize() >= count:
+                break
+            await asyncio.sleep(0.01)
+
+    @testing.combinations(
+        ("all",), ("aiter",), ("partitions",), ("fetchone",), argnames="meth"
+    )
+    @async_test
+    async def test_prefetch_rows(self, async_engine, meth):
+        users = self.tables.users
+        async with async_engine.connect() as conn:
+            result = await conn.stream(
+                select(users).order_by(users.c.user_id),
+                execution_options={"prefetch": 2, "max_row_buffer": 4},
+            )
+            assert isinstance(
+                self._strategy(result),
+                _cursor.AsyncPrefetchCursorFetchStrategy,
+            )
+
+            if meth == "all":
+                rows = await result.all()
+            elif meth == "aiter":
+                rows = [row async for row in result]
+            elif meth == "partitions":
+                rows = []
+                async for partition in result.partitions(5):
+                    rows.extend(partition)
+            else:
+                rows = []
+                while True:
+                    row = await result.fetchone()
+                    if row is None:
+                        break
+                    rows.append(row)
+
+            eq_(rows, [(i, "name%d" % i) for i in range(1, 20)])
+            is_true(result._real_result._soft_closed)
+
+    @async_test
+    async def test_no_prefetch(self, async_engine):
+        users = self.tables.users
+        async with async_engine.connect() as conn:
+            result = await conn.stream(select(users))
+            assert isinstance(
+                self._strategy(result), _cursor.BufferedRowCursorFetchStrategy
+            )
+            await result.close()
+
+    @async_test
+    async def test_queue_is_bounded(self, async_engine):
+        users = self.tables.users
+        async with async_engine.connect() as conn:
+            result = await conn.stream(
+                select(users).order_by(users.c.user_id),
+                execution_options={"prefetch": 2, "max_row_buffer": 3},
+            )
+            strategy = self._strategy(result)
+
+            await self._wait_for_batches(strategy, 2)
+            await asyncio.sleep(0.05)
+
+            eq_(strategy._queue.qsize(), 2)
+            is_false(strategy._task.done())
+
+            eq_(
+                await result.fetchmany(4),
+                [(i, "name%d" % i) for i in range(1, 5)],
+            )
+
+            await result.close()
+            is_true(strategy._task.done())
+
+    @async_test
+    async def test_batch_size(self, async_engine):
+        users = self.tables.users
+        async with async_engine.connect() as conn:
+            result = await conn.stream(
+                select(users).order_by(users.c.user_id),
+                execution_options={"prefetch": 3, "max_row_buffer": 4},
+            )
+
+            strategy = self._strategy(result)
+            await self._wait_for_batches(strategy, 3)
+
+            eq_(
+                [len(batch) for batch in strategy._queue._queue],
+                [4, 4, 4],
+            )
+            eq_(len(await result.all()), 19)
+
+    @testing.combinations({}, {"prefetch": 2}, argnames="options")
+    @async_test
+    async def test_max_buffer_bytes(self, async_engine, options):
+        users = self.tables.users
+        async with async_engine.connect() as conn:
+            result = await conn.stream(
+                select(users),
+                execution_options=dict(options, max_buffer_bytes=500),
+            )
+
+            rows = []
+            async for row in result:
+                rows.append(row)
+            eq_(len(rows), 19)
+
+            assert result.peak_buffered_bytes > 0
+
+            result = await conn.stream(
+                select(users), execution_options=options
+            )
+            eq_(len(await result.all()), 19)
+            is_none(result.peak_buffered_bytes)
+
+    @async_test
+    async def test_close_early(self, async_engine):
+        users = self.tables.users
+        async with async_engine.connect() as conn:
+            result = await conn.stream(
+                select(users).order_by(users.c.user_id),
+                execution_options={"prefetch": 2, "max_row_buffer": 2},
+            )
+            strategy = self._strategy(result)
+
+            eq_(await result.fetchone(), (1, "name1"))
+            await result.close()
+
+            is_true(strategy._task.done())
+            eq_(strategy._queue.qsize(), 0)
+
+            eq_(
+                await conn.scalar(select(func.count()).select_from(users)),
+                19,
+            )
+
+
+class AsyncPoolMaxConnectingTest(fixtures.TestBase):
+    __requires__ = ("asyncio",)
+
+    @async_test
+    async def test_waiter_notified_of_released_slot(self):
+        proceed = asyncio.Event()
+        connecting = []
+
+        def creator():
+            connecting.append(True)
+            await_only(proceed.wait())
+            return mock.Mock()
+
+        p = AsyncAdaptedQueuePool(creator, pool_size=5, max_connecting=1)
+
+        t1 = asyncio.ensure_future(greenlet_spawn(p.connect))
+        t2 = asyncio.ensure_future(greenlet_spawn(p.connect))
+        await asyncio.sleep(0.1)
+
+        # the second checkout waits on the event loop for the slot held
+        # by the first
+        eq_(len(connecting), 1)
+        is_not(p._connect_waiter, None)
+        is_false(t2.done())
+
+        proceed.set()
+        c1, c2 = await asyncio.wait_for(asyncio.gather(t1, t2), 5)
+        eq_(len(connecting), 2)
+        is_not(c1.dbapi_connection, c2.dbapi_connection)
+        is_none(p._connect_waiter)
+
+        await greenlet_spawn(c1.close)
+        await greenlet_spawn(c2.close)
+        eq_(p.checkedin(), 2)
+
+
 class TextSyncDBAPI(fixtures.TestBase):
     __requires__ = ("asyncio",)
 
@@ -10,11 +10,13 @@ from sqlalchemy import Sequence
 from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy import update
+from sqlalchemy.ext import horizontal_shard
 from sqlalchemy.ext.asyncio import async_object_session
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import exc as async_exc
 from sqlalchemy.ext.asyncio.base import ReversibleProxy
+from sqlalchemy.ext.horizontal_shard import ShardedSession
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
@@ -170,10 +172,23 @@ class AsyncSessionQueryTest(AsyncFixture):
         eq_(u.name, "jack")
         eq_(len(u.__dict__["addresses"]), 1)
 
+    @async_test
+    async def test_stream_peak_buffered_bytes(self, async_session):
+        User = self.classes.User
+
+        result = await async_session.stream(
+            select(User), execution_options={"max_buffer_bytes": 1000}
+        )
+        eq_(len(await result.all()), 4)
+        assert result.peak_buffered_bytes > 0
+
     @async_test
     @testing.requires.independent_cursors
     @testing.combinations(
-        {}, dict(execution_options={"logging_token": "test"}), argnames="kw"
+        {},
+        dict(execution_options={"logging_token": "test"}),
+        dict(execution_options={"prefetch": 2, "yield_per": 2}),
+        argnames="kw",
     )
     async def test_stream_partitions(self, async_session, kw):
         User = self.classes.User
@@ -986,3 +1001,76 @@ class OverrideSyncSession(AsyncFixture):
 
         is_true(not isinstance(ass.sync_session, _MySession))
         is_(ass.sync_session_class, Session)
+
+
+class AsyncShardTest(AsyncFixture):
+    @testing.fixture
+    def shard_engines(self):
+        # distinct engines, so that each shard uses its own connection
+        return {
+            "a": engines.testing_engine(asyncio=True),
+            "b": engines.testing_engine(asyncio=True),
+        }
+
+    @async_test
+    @testing.combinations(
+        (False,), (True,), argnames="merge_as_completed"
+    )
+    @testing.combinations((False,), (True,), argnames="use_stream")
+    async def test_concurrent_shards(
+        self, shard_engines, merge_as_completed, use_stream
+    ):
+        User = self.classes.User
+
+        async_session = AsyncSession(
+            sync_session_class=ShardedSession,
+            shards={
+                shard_id: engine.sync_engine
+                for shard_id, engine in shard_engines.items()
+            },
+            shard_chooser=lambda mapper, instance, clause=None: "a",
+            id_chooser=lambda query, ident: ["a", "b"],
+            execute_chooser=lambda orm_context: ["a", "b"],
+            max_shard_workers=2,
+        )
+
+        with mock.patch.object(
+            horizontal_shard,
+            "_spawn_async",
+            side_effect=horizontal_shard._spawn_async,
+        ) as spawn_async:
+            stmt = select(User).order_by(User.id)
+            execution_options = {
+                "shard_merge_as_completed": merge_as_completed
+            }
+            if use_stream:
+                result = await async_session.stream(
+                    stmt, execution_options=execution_options
+                )
+                users = await result.scalars().all()
+            else:
+                result = await async_session.execute(
+                    stmt, execution_options=execution_options
+                )
+                users = result.scalars().all()
+
+        eq_(spawn_async.call_count, 1)
+
+        # each shard loads the same rows, which are distinct objects per
+        # shard identity token
+        eq_(
+            sorted(
+                (inspect(user).identity_token, user.id) for user in users
+            ),
+            [("a", 7), ("a", 8), ("a", 9), ("a", 10)]
+            + [("b", 7), ("b", 8), ("b", 9), ("b", 10)],
+        )
+        if not merge_as_completed:
+            eq_(
+                [inspect(user).identity_token for user in users],
+                ["a"] * 4 + ["b"] * 4,
+            )
+
+        await async_session.close()
+        for engine in shard_engines.values():
+            await engine.dispose()
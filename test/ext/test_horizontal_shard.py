@@ -1,5 +1,6 @@
 import datetime
 import os
+import threading
 
 from sqlalchemy import Column
 from sqlalchemy import DateTime
@@ -30,6 +31,9 @@ from sqlalchemy.sql import Select
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not
+from sqlalchemy.testing import mock
+from sqlalchemy.testing import not_in
 from sqlalchemy.testing import provision
 from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing.engines import testing_reaper
@@ -294,6 +298,89 @@ class ShardTest:
             {"Tokyo", "London", "Dublin"},
         )
 
+    @testing.combinations(
+        (False,), (True,), argnames="merge_as_completed"
+    )
+    def test_roundtrip_concurrent(self, merge_as_completed):
+        self._fixture_data()
+        sess = sharded_session(max_shard_workers=4)
+
+        result = sess.execute(
+            select(WeatherLocation),
+            execution_options={"shard_merge_as_completed": merge_as_completed},
+        ).scalars()
+        locations = result.all()
+
+        eq_(
+            {loc.city for loc in locations},
+            {
+                "Tokyo",
+                "New York",
+                "Toronto",
+                "London",
+                "Dublin",
+                "Brasila",
+                "Quito",
+            },
+        )
+        if not merge_as_completed:
+            # merged in the order given by execute_chooser
+            eq_(
+                [inspect(loc).identity_token for loc in locations],
+                ["north_america"] * 2
+                + ["asia"]
+                + ["europe"] * 2
+                + ["south_america"] * 2,
+            )
+
+        for loc in locations:
+            eq_(inspect(loc).key[2], inspect(loc).identity_token)
+
+        tokyo = sess.get(WeatherLocation, 1)
+        is_(tokyo, [loc for loc in locations if loc.city == "Tokyo"][0])
+        sess.close()
+
+    def test_concurrent_per_statement_option(self):
+        self._fixture_data()
+        sess = sharded_session()
+
+        eq_(
+            set(
+                row.temperature
+                for row in sess.execute(
+                    select(Report.temperature),
+                    execution_options={"max_shard_workers": 2},
+                )
+            ),
+            {80.0, 75.0, 85.0},
+        )
+
+        # UPDATE is not run concurrently, as synchronizing the session
+        # modifies the identity map
+        threads = set()
+
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            if statement.startswith("UPDATE"):
+                threads.add(threading.get_ident())
+
+        for db in self._dbs:
+            event.listen(db, "before_cursor_execute", before_cursor_execute)
+
+        sess.execute(
+            update(Report)
+            .filter(Report.temperature >= 80)
+            .values(temperature=Report.temperature + 6)
+            .execution_options(
+                synchronize_session="evaluate", max_shard_workers=2
+            )
+        )
+        eq_(threads, {threading.get_ident()})
+        eq_(
+            set(row.temperature for row in sess.query(Report.temperature)),
+            {86.0, 75.0, 91.0},
+        )
+        sess.close()
+
     def test_roundtrip(self):
         sess = self._fixture_data()
         tokyo = sess.query(WeatherLocation).filter_by(city="Tokyo").one()
@@ -695,6 +782,60 @@ class DistinctEngineShardTest(ShardTest, fixtures.MappedTest):
         for i in range(1, 5):
             os.remove("shard%d_%s.db" % (i, provision.FOLLOWER_IDENT))
 
+    def test_concurrent_executor_reused(self):
+        self._fixture_data()
+        sess = sharded_session(max_shard_workers=2)
+
+        eq_(len(sess.execute(select(WeatherLocation)).all()), 7)
+        executor = sess._shard_executors[2]
+
+        eq_(len(sess.execute(select(Report)).all()), 3)
+        is_(sess._shard_executors[2], executor)
+
+        # a statement using more workers doesn't replace the executor
+        # in use by other statements
+        result = sess.execute(
+            select(WeatherLocation),
+            execution_options={"max_shard_workers": 4},
+        )
+        is_(sess._shard_executors[2], executor)
+        is_not(sess._shard_executors[4], executor)
+        eq_(len(result.all()), 7)
+        eq_(len(sess.execute(select(Report)).all()), 3)
+
+        sess.close()
+        eq_(sess._shard_executors, {})
+
+    def test_concurrent_session_used_from_calling_thread(self):
+        self._fixture_data()
+        sess = sharded_session(max_shard_workers=4)
+
+        execute_threads = set()
+        session_threads = set()
+
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            execute_threads.add(threading.get_ident())
+
+        for db in self._dbs:
+            event.listen(db, "before_cursor_execute", before_cursor_execute)
+
+        @event.listens_for(sess, "loaded_as_persistent")
+        def loaded_as_persistent(session, instance):
+            session_threads.add(threading.get_ident())
+
+        with mock.patch.object(
+            sess, "connection", wraps=sess.connection
+        ) as connection:
+            locations = sess.execute(select(WeatherLocation)).scalars().all()
+        eq_(len(locations), 7)
+
+        # only Connection.execute() is run in worker threads; connections
+        # and ORM objects are established in the calling thread
+        eq_(connection.call_count, 4)
+        eq_(session_threads, {threading.get_ident()})
+        not_in(threading.get_ident(), execute_threads)
+        sess.close()
+
     def test_plain_core_textual_lookup_w_shard(self):
         sess = self._fixture_data()
 
@@ -0,0 +1,338 @@
+from sqlalchemy import Column
+from sqlalchemy import event
+from sqlalchemy import exc
+from sqlalchemy import insert
+from sqlalchemy import Integer
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import testing
+from sqlalchemy import text
+from sqlalchemy import update
+from sqlalchemy.ext.read_replicas import ReplicaRouter
+from sqlalchemy.ext.read_replicas import RoutingSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import PoolMetrics
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_true
+from sqlalchemy.testing.engines import testing_engine
+
+
+class RoutingSessionTest(fixtures.DeclarativeMappedTest):
+    __requires__ = ("sqlite",)
+
+    run_create_tables = None
+    run_deletes = None
+
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class User(Base):
+            __tablename__ = "users"
+            id = Column(Integer, primary_key=True)
+            name = Column(String(50))
+
+    @testing.fixture
+    def sessionmaker_fixture(self):
+        User = self.classes.User
+
+        def go(**kw):
+            primary = testing_engine("sqlite://")
+            replicas = [testing_engine("sqlite://") for i in range(2)]
+
+            # each database has a row naming that database, so that
+            # statements reveal where they were routed
+            for name, engine in [
+                ("primary", primary),
+                ("replica1", replicas[0]),
+                ("replica2", replicas[1]),
+            ]:
+                self.tables_test_metadata.create_all(engine)
+                with engine.begin() as conn:
+                    conn.execute(insert(User), {"id": 1, "name": name})
+
+            router = ReplicaRouter(primary, replicas, **kw)
+            return sessionmaker(class_=RoutingSession, router=router)
+
+        return go
+
+    def _name(self, sess, **bind_arguments):
+        User = self.classes.User
+        return sess.scalar(
+            select(User.name).where(User.id == 1),
+            bind_arguments=bind_arguments,
+        )
+
+    def test_select_to_replica(self, sessionmaker_fixture):
+        Session = sessionmaker_fixture(strategy="round_robin")
+
+        names = []
+        for i in range(4):
+            with Session() as sess:
+                names.append(self._name(sess))
+                is_false(sess.pinned)
+
+        eq_(names, ["replica1", "replica2", "replica1", "replica2"])
+
+    def test_orm_get_to_replica(self, sessionmaker_fixture):
+        User = self.classes.User
+        Session = sessionmaker_fixture()
+
+        with Session() as sess:
+            eq_(sess.get(User, 1).name, "replica1")
+
+    def test_pinned_after_flush(self, sessionmaker_fixture):
+        User = self.classes.User
+        Session = sessionmaker_fixture()
+
+        sess = Session()
+        sess.add(User(id=2, name="new"))
+        sess.flush()
+        is_true(sess.pinned)
+
+        eq_(self._name(sess), "primary")
+        eq_(sess.scalar(select(User.name).where(User.id == 2)), "new")
+
+        # remains pinned after the commit, as the replicas may not yet
+        # have the new data
+        sess.commit()
+        eq_(self._name(sess), "primary")
+
+        sess.close()
+        is_false(sess.pinned)
+        eq_(self._name(sess), "replica1")
+
+    def test_autoflush_pins(self, sessionmaker_fixture):
+        User = self.classes.User
+        Session = sessionmaker_fixture()
+
+        with Session() as sess:
+            sess.add(User(id=2, name="new"))
+            eq_(sess.scalar(select(User.name).where(User.id == 2)), "new")
+            is_true(sess.pinned)
+
+    @testing.combinations(
+        (lambda User: update(User).values(name="x"), True, None),
+        (lambda User: text("UPDATE users SET name='x'"), True, None),
+        (
+            lambda User: select(User.name).with_for_update(),
+            False,
+            "primary",
+        ),
+        (
+            lambda User: text("SELECT name FROM users").columns(User.name),
+            False,
+            "replica1",
+        ),
+        argnames="stmt, pins, name",
+    )
+    def test_statement_routing(self, sessionmaker_fixture, stmt, pins, name):
+        User = self.classes.User
+        Session = sessionmaker_fixture()
+
+        with Session() as sess:
+            result = sess.execute(stmt(User))
+            is_(sess.pinned, pins)
+            if name is not None:
+                eq_(result.scalar(), name)
+
+    def test_use_primary(self, sessionmaker_fixture):
+        Session = sessionmaker_fixture()
+
+        with Session() as sess:
+            eq_(self._name(sess, use_primary=True), "primary")
+            is_false(sess.pinned)
+            eq_(self._name(sess), "replica1")
+
+    def test_connection_is_primary(self, sessionmaker_fixture):
+        Session = sessionmaker_fixture()
+
+        with Session() as sess:
+            is_(sess.connection().engine, sess.router.primary)
+
+    def test_same_replica_within_transaction(self, sessionmaker_fixture):
+        Session = sessionmaker_fixture(strategy="round_robin")
+
+        sess = Session()
+        eq_(self._name(sess), "replica1")
+        eq_(self._name(sess), "replica1")
+        sess.commit()
+        eq_(self._name(sess), "replica2")
+        sess.close()
+
+    def test_no_replicas_available(self, sessionmaker_fixture):
+        Session = sessionmaker_fixture()
+
+        with Session() as sess:
+            for replica in sess.router.replicas:
+                sess.router.eject_replica(replica)
+            eq_(self._name(sess), "primary")
+            is_false(sess.pinned)
+
+
+class ReplicaRouterTest(fixtures.TestBase):
+    __requires__ = ("sqlite",)
+
+    def _engines(self, count=2, **options):
+        return testing_engine("sqlite://", options=options), [
+            testing_engine("sqlite://", options=options) for i in range(count)
+        ]
+
+    def _choices(self, router, count):
+        replicas = router.replicas
+        return [
+            replicas.index(router.choose_replica()) for i in range(count)
+        ]
+
+    def test_round_robin_weights(self):
+        primary, replicas = self._engines(3)
+        router = ReplicaRouter(
+            primary, replicas, strategy="round_robin", weights=[4, 2, 1]
+        )
+
+        eq_(
+            self._choices(router, 14),
+            [0, 1, 0, 2, 0, 1, 0] * 2,
+        )
+
+    def test_least_checkouts(self):
+        primary, replicas = self._engines(2, poolclass=QueuePool)
+        router = ReplicaRouter(primary, replicas)
+
+        eq_(self._choices(router, 4), [0, 1, 0, 1])
+
+        with replicas[0].connect():
+            eq_(self._choices(router, 3), [1, 1, 1])
+
+            with replicas[1].connect(), replicas[1].connect():
+                eq_(self._choices(router, 3), [0, 0, 0])
+
+    def test_least_checkouts_weights(self):
+        primary, replicas = self._engines(2, poolclass=QueuePool)
+        router = ReplicaRouter(primary, replicas, weights=[2, 1])
+
+        with replicas[0].connect():
+            eq_(self._choices(router, 2), [1, 1])
+
+            with replicas[1].connect():
+                eq_(self._choices(router, 2), [0, 0])
+
+    def test_eject_restore(self):
+        primary, replicas = self._engines(2)
+        router = ReplicaRouter(primary, replicas, strategy="round_robin")
+
+        router.eject_replica(replicas[0])
+        eq_(router.available_replicas(), [replicas[1]])
+        eq_(self._choices(router, 2), [1, 1])
+
+        router.restore_replica(replicas[0])
+        eq_(router.available_replicas(), replicas)
+
+        router.eject_replica(replicas[1], eject_time=0)
+        eq_(router.available_replicas(), replicas)
+
+        router.eject_replica(replicas[0])
+        router.eject_replica(replicas[1])
+        is_(router.choose_replica(), primary)
+
+    def test_eject_not_a_replica(self):
+        primary, replicas = self._engines(2)
+        router = ReplicaRouter(primary, replicas)
+
+        assert_raises_message(
+            exc.ArgumentError,
+            "is not a replica of this router",
+            router.eject_replica,
+            primary,
+        )
+
+    def test_eject_on_connect_failure(self):
+        primary, replicas = self._engines(2)
+        router = ReplicaRouter(primary, replicas)
+
+        @event.listens_for(replicas[0], "do_connect")
+        def do_connect(dialect, conn_rec, cargs, cparams):
+            raise dialect.loaded_dbapi.OperationalError("unable to connect")
+
+        assert_raises_message(
+            exc.OperationalError, "unable to connect", replicas[0].connect
+        )
+        eq_(router.available_replicas(), [replicas[1]])
+
+    def test_check_replicas(self):
+        primary, replicas = self._engines(2)
+        lags = {replicas[0]: 2, replicas[1]: 10}
+
+        def lag_probe(conn):
+            return lags[conn.engine]
+
+        router = ReplicaRouter(
+            primary, replicas, lag_probe=lag_probe, max_lag=5
+        )
+        eq_(router.available_replicas(), replicas)
+
+        router.check_replicas()
+        eq_(router.available_replicas(), [replicas[0]])
+
+        lags[replicas[1]] = None
+        router.check_replicas()
+        eq_(router.available_replicas(), replicas)
+
+    def test_check_replicas_ping(self):
+        primary, replicas = self._engines(2)
+        router = ReplicaRouter(primary, replicas)
+
+        with testing.mock.patch.object(
+            replicas[1].dialect, "do_ping", return_value=False
+        ):
+            router.check_replicas()
+        eq_(router.available_replicas(), [replicas[0]])
+
+    def test_check_interval(self):
+        primary, replicas = self._engines(2)
+        lag_probe = testing.mock.Mock(return_value=0)
+
+        router = ReplicaRouter(
+            primary, replicas, check_interval=0, lag_probe=lag_probe
+        )
+        router.choose_replica()
+        router.choose_replica()
+        eq_(lag_probe.call_count, 4)
+
+        router = ReplicaRouter(
+            primary, replicas, check_interval=600, lag_probe=lag_probe
+        )
+        router.choose_replica()
+        eq_(lag_probe.call_count, 4)
+
+    def test_metrics(self):
+        primary, replicas = self._engines(2)
+        router = ReplicaRouter(primary, replicas, metrics=True)
+
+        assert isinstance(router.metrics, PoolMetrics)
+        for engine in [primary] + replicas:
+            is_(engine.pool.metrics, router.metrics)
+
+        metrics = PoolMetrics()
+        router = ReplicaRouter(primary, replicas, metrics=metrics)
+        is_(router.metrics, metrics)
+        is_(primary.pool.metrics, metrics)
+
+    @testing.combinations(
+        ({"strategy": "random"}, "Unknown replica strategy 'random'"),
+        ({"weights": [1]}, "Got 1 weights for 2 replicas"),
+        ({"weights": [1, 0]}, "Replica weights must be positive"),
+        ({"max_lag": 5}, "max_lag requires a lag_probe"),
+        argnames="kw, message",
+    )
+    def test_argument_errors(self, kw, message):
+        primary, replicas = self._engines(2)
+
+        assert_raises_message(
+            exc.ArgumentError, message, ReplicaRouter, primary, replicas, **kw
+        )
@@ -2009,7 +2009,10 @@ class JoinedNoFKSortingTest(fixtures.MappedTest):
             sess.flush,
             Conditional(
                 testing.db.dialect.insert_executemany_returning
-                and testing.db.dialect.supports_default_metavalue,
+                and (
+                    testing.db.dialect.supports_default_metavalue
+                    or testing.db.dialect.insert_null_pk_still_autoincrements
+                ),
                 [
                     CompiledSQL(
                         "INSERT INTO a (id) VALUES (DEFAULT)", [{}, {}, {}, {}]
@@ -244,6 +244,56 @@ class FixtureLoadTest(_Polymorphic, testing.AssertsExecutionResults):
         )
         eq_(result, self.all_employees)
 
+    def test_person_selectin_subclasses_chunksize(self):
+        s = fixture_session()
+
+        q = s.query(Person).options(
+            selectin_polymorphic(Person, [Engineer, Manager], chunksize=2)
+        )
+
+        engineers_sql = (
+            "SELECT engineers.person_id AS engineers_person_id, "
+            "people.person_id AS people_person_id, "
+            "people.type AS people_type, "
+            "engineers.status AS engineers_status, "
+            "engineers.engineer_name AS engineers_engineer_name, "
+            "engineers.primary_language AS engineers_primary_language "
+            "FROM people JOIN engineers "
+            "ON people.person_id = engineers.person_id "
+            "WHERE people.person_id IN (__[POSTCOMPILE_primary_keys]) "
+            "ORDER BY people.person_id"
+        )
+        result = self.assert_sql_execution(
+            testing.db,
+            q.all,
+            CompiledSQL(
+                "SELECT people.person_id AS people_person_id, "
+                "people.company_id AS people_company_id, "
+                "people.name AS people_name, "
+                "people.type AS people_type FROM people",
+                {},
+            ),
+            AllOf(
+                EachOf(
+                    CompiledSQL(engineers_sql, {"primary_keys": [1, 2]}),
+                    CompiledSQL(engineers_sql, {"primary_keys": [5]}),
+                ),
+                CompiledSQL(
+                    "SELECT managers.person_id AS managers_person_id, "
+                    "people.person_id AS people_person_id, "
+                    "people.type AS people_type, "
+                    "managers.status AS managers_status, "
+                    "managers.manager_name AS managers_manager_name "
+                    "FROM people JOIN managers "
+                    "ON people.person_id = managers.person_id "
+                    "WHERE people.person_id IN (__[POSTCOMPILE_primary_keys]) "
+                    "ORDER BY people.person_id",
+                    {"primary_keys": [3, 4]},
+                ),
+            ),
+        )
+        eq_(result, self.all_employees)
+
     def test_load_company_plus_employees(self):
         s = fixture_session()
         q = (
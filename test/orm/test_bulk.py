@@ -1,10 +1,17 @@
+from sqlalchemy import event
+from sqlalchemy import exc
 from sqlalchemy import FetchedValue
 from sqlalchemy import ForeignKey
+from sqlalchemy import insert
 from sqlalchemy import Integer
+from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import testing
+from sqlalchemy import update
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.assertsql import Conditional
@@ -71,6 +78,34 @@ class BulkInsertUpdateVersionId(BulkTest, fixtures.MappedTest):
 
         eq_(s.query(Foo).all(), [Foo(version_id=2, value="new value")])
 
+    @testing.emits_warning(r".*versioning cannot be verified")
+    def test_orm_bulk_insert_update_version_id(self):
+        Foo = self.classes.Foo
+
+        s = fixture_session()
+
+        s.execute(insert(Foo), [{"value": "v1"}, {"value": "v2"}])
+        eq_(
+            s.query(Foo).order_by(Foo.id).all(),
+            [Foo(version_id=1, value="v1"), Foo(version_id=1, value="v2")],
+        )
+
+        s.execute(
+            update(Foo),
+            [
+                {"id": 1, "version_id": 1, "value": "v1new"},
+                {"id": 2, "version_id": 1, "value": "v2new"},
+            ],
+        )
+        s.expunge_all()
+        eq_(
+            s.query(Foo).order_by(Foo.id).all(),
+            [
+                Foo(version_id=2, value="v1new"),
+                Foo(version_id=2, value="v2new"),
+            ],
+        )
+
 
 class BulkInsertUpdateTest(BulkTest, _fixtures.FixtureTest):
     @classmethod
@@ -302,6 +337,271 @@ class BulkInsertUpdateTest(BulkTest, _fixtures.FixtureTest):
         )
 
 
+class ORMBulkInsertUpdateTest(BulkTest, _fixtures.FixtureTest):
+    @classmethod
+    def setup_mappers(cls):
+        User, Order = cls.classes("User", "Order")
+        u, o = cls.tables("users", "orders")
+
+        cls.mapper_registry.map_imperatively(User, u)
+        cls.mapper_registry.map_imperatively(Order, o)
+
+    def test_insert(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        with self.sql_execution_asserter() as asserter:
+            result = s.execute(
+                insert(User),
+                [
+                    {"id": 1, "name": "u1"},
+                    {"id": 2, "name": "u2"},
+                    {"id": 3, "name": "u3"},
+                ],
+            )
+
+        asserter.assert_(
+            CompiledSQL(
+                "INSERT INTO users (id, name) VALUES (:id, :name)",
+                [
+                    {"id": 1, "name": "u1"},
+                    {"id": 2, "name": "u2"},
+                    {"id": 3, "name": "u3"},
+                ],
+            )
+        )
+        eq_(result.rowcount, 3)
+        eq_(
+            s.execute(select(User.id, User.name).order_by(User.id)).all(),
+            [(1, "u1"), (2, "u2"), (3, "u3")],
+        )
+
+    def test_insert_rowcount_multiple_batches(self):
+        Order = self.classes.Order
+
+        s = fixture_session()
+        result = s.execute(
+            insert(Order),
+            [
+                {"id": 1, "description": "o1"},
+                {"id": 2, "description": None},
+                {"id": 3, "description": "o3"},
+            ],
+        )
+        eq_(result.rowcount, 3)
+
+    def test_insert_attribute_keys_and_nulls(self):
+        Order = self.classes.Order
+
+        s = fixture_session()
+        with self.sql_execution_asserter() as asserter:
+            s.execute(
+                insert(Order),
+                [
+                    {"id": 1, "description": "o1"},
+                    {"id": 2, "description": None},
+                ],
+            )
+
+        asserter.assert_(
+            CompiledSQL(
+                "INSERT INTO orders (id, description) "
+                "VALUES (:id, :description)",
+                [{"id": 1, "description": "o1"}],
+            ),
+            CompiledSQL(
+                "INSERT INTO orders (id) VALUES (:id)",
+                [{"id": 2}],
+            ),
+        )
+
+    def test_insert_raw_strategy(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        with self.sql_execution_asserter() as asserter:
+            s.execute(
+                insert(User),
+                [{"id": 1, "name": "u1"}, {"id": 2, "name": "u2"}],
+                execution_options={"dml_strategy": "raw"},
+            )
+
+        asserter.assert_(
+            CompiledSQL(
+                "INSERT INTO users (id, name) VALUES (:id, :name)",
+                [{"id": 1, "name": "u1"}, {"id": 2, "name": "u2"}],
+            )
+        )
+
+    def test_insert_bulk_strategy_w_values(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            r"Bulk ORM INSERT does not support the values\(\)",
+        ):
+            s.execute(
+                insert(User).values(name="x"),
+                [{"id": 1}, {"id": 2}],
+                execution_options={"dml_strategy": "bulk"},
+            )
+
+    def test_invalid_strategy(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        with expect_raises_message(
+            exc.ArgumentError,
+            "Valid strategies for ORM insert strategy are",
+        ):
+            s.execute(
+                insert(User),
+                [{"id": 1, "name": "u1"}],
+                execution_options={"dml_strategy": "nope"},
+            )
+
+    def test_insert_do_orm_execute(self):
+        User = self.classes.User
+
+        s = fixture_session()
+
+        canary = []
+
+        @event.listens_for(s, "do_orm_execute")
+        def do_orm_execute(orm_execute_state):
+            canary.append(
+                (
+                    orm_execute_state.is_insert,
+                    orm_execute_state.execution_options.get("dml_strategy"),
+                )
+            )
+
+        s.execute(
+            insert(User).execution_options(dml_strategy="bulk"),
+            [{"id": 1, "name": "u1"}, {"id": 2, "name": "u2"}],
+        )
+        eq_(s.scalar(select(User.name).where(User.id == 2)), "u2")
+        eq_(canary, [(True, "bulk"), (False, None)])
+
+    @testing.requires.insert_executemany_returning
+    def test_insert_returning_objects(self):
+        User = self.classes.User
+
+        s = fixture_session()
+
+        users = s.scalars(
+            insert(User).returning(User),
+            [{"name": "u1"}, {"name": "u2"}, {"name": "u3"}],
+        ).all()
+
+        eq_(
+            [(u.id, u.name) for u in users],
+            [(1, "u1"), (2, "u2"), (3, "u3")],
+        )
+        for user in users:
+            assert user in s
+        is_(s.get(User, 2), users[1])
+
+    @testing.requires.insert_executemany_returning
+    def test_insert_returning_columns(self):
+        User = self.classes.User
+
+        s = fixture_session()
+
+        result = s.execute(
+            insert(User).returning(User.id, User.name),
+            [{"name": "u1"}, {"name": "u2"}],
+        )
+        eq_(result.all(), [(1, "u1"), (2, "u2")])
+
+    def test_update(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        s.execute(
+            insert(User),
+            [
+                {"id": 1, "name": "u1"},
+                {"id": 2, "name": "u2"},
+                {"id": 3, "name": "u3"},
+            ],
+        )
+
+        with self.sql_execution_asserter() as asserter:
+            result = s.execute(
+                update(User),
+                [{"id": 1, "name": "u1new"}, {"id": 3, "name": "u3new"}],
+            )
+
+        asserter.assert_(
+            CompiledSQL(
+                "UPDATE users SET name=:name WHERE users.id = :users_id",
+                [
+                    {"users_id": 1, "name": "u1new"},
+                    {"users_id": 3, "name": "u3new"},
+                ],
+            )
+        )
+        eq_(result.rowcount, 2)
+        eq_(
+            s.execute(select(User.id, User.name).order_by(User.id)).all(),
+            [(1, "u1new"), (2, "u2"), (3, "u3new")],
+        )
+
+    @testing.combinations("evaluate", "fetch", False, argnames="sync")
+    def test_update_synchronize_session(self, sync):
+        User = self.classes.User
+
+        s = fixture_session()
+        s.execute(insert(User), [{"id": 1, "name": "u1"}])
+        u1 = s.get(User, 1)
+
+        s.execute(
+            update(User),
+            [{"id": 1, "name": "u1new"}],
+            execution_options={"synchronize_session": sync},
+        )
+
+        with self.sql_execution_asserter() as asserter:
+            name = u1.name
+
+        if sync is False:
+            eq_(name, "u1")
+        else:
+            eq_(name, "u1new")
+        asserter.assert_()
+
+    def test_update_w_where_is_orm_strategy(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        s.execute(
+            insert(User),
+            [{"id": 1, "name": "u1"}, {"id": 2, "name": "u2"}],
+        )
+
+        s.execute(
+            update(User).where(User.id == 1).values(name="u1new"),
+            execution_options={"dml_strategy": "auto"},
+        )
+        eq_(s.scalar(select(User.name).where(User.id == 1)), "u1new")
+
+    def test_update_bulk_strategy_w_where(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Bulk ORM UPDATE locates rows using the primary key values",
+        ):
+            s.execute(
+                update(User).where(User.name == "x"),
+                [{"id": 1, "name": "u1"}],
+                execution_options={"dml_strategy": "bulk"},
+            )
+
+
 class BulkUDPostfetchTest(BulkTest, fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
@@ -874,6 +1174,155 @@ class BulkInheritanceTest(BulkTest, fixtures.MappedTest):
             ),
         )
 
+    def test_orm_bulk_insert_joined_inh(self):
+        Boss = self.classes.Boss
+
+        s = fixture_session()
+        params = [
+            {"name": "b1", "status": "s1", "golf_swing": "g1"},
+            {"name": "b2", "status": "s2", "golf_swing": "g2"},
+        ]
+        result = s.execute(insert(Boss), params)
+        eq_(result.rowcount, 2)
+
+        # caller's parameter dictionaries are not modified
+        eq_(params[0], {"name": "b1", "status": "s1", "golf_swing": "g1"})
+
+        s.expunge_all()
+        eq_(
+            s.scalars(select(Boss).order_by(Boss.person_id)).all(),
+            [
+                Boss(
+                    person_id=1,
+                    type="boss",
+                    name="b1",
+                    status="s1",
+                    golf_swing="g1",
+                ),
+                Boss(
+                    person_id=2,
+                    type="boss",
+                    name="b2",
+                    status="s2",
+                    golf_swing="g2",
+                ),
+            ],
+        )
+
+    def test_orm_bulk_update_joined_inh(self):
+        Boss = self.classes.Boss
+
+        s = fixture_session()
+        s.execute(
+            insert(Boss),
+            [
+                {"name": "b1", "status": "s1", "golf_swing": "g1"},
+                {"name": "b2", "status": "s2", "golf_swing": "g2"},
+            ],
+        )
+
+        with self.sql_execution_asserter() as asserter:
+            result = s.execute(
+                update(Boss),
+                [
+                    {
+                        "person_id": 1,
+                        "boss_id": 1,
+                        "name": "b1new",
+                        "golf_swing": "g1new",
+                    },
+                    {
+                        "person_id": 2,
+                        "boss_id": 2,
+                        "name": "b2new",
+                        "golf_swing": "g2new",
+                    },
+                ],
+            )
+
+        asserter.assert_(
+            CompiledSQL(
+                "UPDATE people SET name=:name "
+                "WHERE people.person_id = :people_person_id",
+                [
+                    {"name": "b1new", "people_person_id": 1},
+                    {"name": "b2new", "people_person_id": 2},
+                ],
+            ),
+            CompiledSQL(
+                "UPDATE boss SET golf_swing=:golf_swing "
+                "WHERE boss.boss_id = :boss_boss_id",
+                [
+                    {"golf_swing": "g1new", "boss_boss_id": 1},
+                    {"golf_swing": "g2new", "boss_boss_id": 2},
+                ],
+            ),
+        )
+        eq_(result.rowcount, 2)
+
+    def test_orm_bulk_update_joined_inh_rowcount(self):
+        Boss = self.classes.Boss
+
+        s = fixture_session()
+        s.execute(
+            insert(Boss),
+            [
+                {"name": "b1", "status": "s1", "golf_swing": "g1"},
+                {"name": "b2", "status": "s2", "golf_swing": "g2"},
+                {"name": "b3", "status": "s3", "golf_swing": "g3"},
+            ],
+        )
+
+        # the rowcount is that of the first table which received an
+        # UPDATE, here "people"; only the first dictionary has a value for
+        # that table, while all three have a value for "boss"
+        result = s.execute(
+            update(Boss),
+            [
+                {
+                    "person_id": 1,
+                    "boss_id": 1,
+                    "name": "b1new",
+                    "golf_swing": "g1new",
+                },
+                {"person_id": 2, "boss_id": 2, "golf_swing": "g2new"},
+                {"person_id": 3, "boss_id": 3, "golf_swing": "g3new"},
+            ],
+        )
+        eq_(result.rowcount, 1)
+
+        # with no values for "people", the rowcount is that of "boss"
+        result = s.execute(
+            update(Boss),
+            [
+                {"person_id": 1, "boss_id": 1, "golf_swing": "g1"},
+                {"person_id": 2, "boss_id": 2, "golf_swing": "g2"},
+                {"person_id": 3, "boss_id": 3, "golf_swing": "g3"},
+            ],
+        )
+        eq_(result.rowcount, 3)
+
+        s.expunge_all()
+        eq_(
+            s.execute(
+                select(Boss.name, Boss.golf_swing).order_by(Boss.person_id)
+            ).all(),
+            [("b1new", "g1"), ("b2", "g2"), ("b3", "g3")],
+        )
+
+    def test_orm_bulk_insert_joined_inh_returning(self):
+        Boss = self.classes.Boss
+
+        s = fixture_session()
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Bulk ORM INSERT with RETURNING is not supported",
+        ):
+            s.execute(
+                insert(Boss).returning(Boss),
+                [{"name": "b1", "golf_swing": "g1"}],
+            )
+
 
 class BulkIssue6793Test(BulkTest, fixtures.DeclarativeMappedTest):
     @classmethod
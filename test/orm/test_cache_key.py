@@ -211,6 +211,8 @@ class CacheKeyTest(CacheKeyFixture, _fixtures.FixtureTest):
                 defer(Address.id),
                 subqueryload(User.orders),
                 selectinload(User.orders),
+                selectinload(User.orders, chunksize=50),
+                selectinload(User.orders, chunksize="adaptive"),
                 joinedload(User.addresses).defer(Address.id),
                 joinedload(aliased(User).addresses).defer(Address.id),
                 joinedload(User.orders).joinedload(Order.items),
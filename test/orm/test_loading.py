@@ -1,12 +1,24 @@
+from sqlalchemy import event
 from sqlalchemy import exc
+from sqlalchemy import inspect
 from sqlalchemy import select
 from sqlalchemy import testing
+from sqlalchemy.orm import exc as orm_exc
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import loading
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import subqueryload
+from sqlalchemy.orm.state import _committed_state_slot
+from sqlalchemy.orm.state import _DeferredCollectionsInstanceState
+from sqlalchemy.orm.state import _expired_attributes_slot
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import assert_raises_message
 from sqlalchemy.testing.assertions import eq_
+from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.fixtures import fixture_session
 from . import _fixtures
 
@@ -92,6 +104,177 @@ class InstancesTest(_fixtures.FixtureTest):
         )
 
 
+class ReadonlyLoadTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def test_objects_are_detached(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        users = s.scalars(
+            select(User).order_by(User.id).execution_options(
+                readonly_load=True
+            )
+        ).all()
+
+        eq_([u.id for u in users], [7, 8, 9, 10])
+        eq_(len(s.identity_map), 0)
+        for u in users:
+            state = inspect(u)
+            is_true(state.detached)
+            is_(state.session_id, None)
+            is_true(isinstance(state, _DeferredCollectionsInstanceState))
+
+    def test_collections_created_on_demand(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        u1 = s.scalars(
+            select(User)
+            .filter_by(id=7)
+            .execution_options(readonly_load=True)
+        ).one()
+        state = inspect(u1)
+
+        assert_raises(AttributeError, _committed_state_slot.__get__, state)
+        assert_raises(AttributeError, _expired_attributes_slot.__get__, state)
+
+        u1.name = "jack2"
+        eq_(state.committed_state, {"name": "jack"})
+        eq_(state.attrs.name.history, (["jack2"], (), ["jack"]))
+
+    def test_uniqued_within_load(self):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        users = (
+            s.scalars(
+                select(User)
+                .options(
+                    joinedload(User.orders),
+                    selectinload(User.addresses).selectinload(Address.user),
+                )
+                .order_by(User.id)
+                .execution_options(readonly_load=True)
+            )
+            .unique()
+            .all()
+        )
+        eq_(len(users), 4)
+        eq_(len(s.identity_map), 0)
+        eq_([len(u.addresses) for u in users], [1, 3, 1, 0])
+        for u in users:
+            for a in u.addresses:
+                is_(a.user, u)
+                is_true(inspect(a).detached)
+
+    def test_uniqued_within_subqueryload(self):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        users = s.scalars(
+            select(User)
+            .options(subqueryload(User.addresses).joinedload(Address.user))
+            .order_by(User.id)
+            .execution_options(readonly_load=True)
+        ).all()
+        eq_(len(s.identity_map), 0)
+        eq_([len(u.addresses) for u in users], [1, 3, 1, 0])
+        for u in users:
+            for a in u.addresses:
+                is_(a.user, u)
+                is_true(inspect(a).detached)
+
+    def test_identity_map_not_in_execution_options(self):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        canary = mock.Mock()
+
+        @event.listens_for(s, "do_orm_execute")
+        def do_orm_execute(orm_execute_state):
+            canary(
+                orm_execute_state.execution_options.get("readonly_load"),
+                orm_execute_state.load_options._readonly_load,
+            )
+
+        s.scalars(
+            select(User)
+            .options(
+                selectinload(User.addresses),
+                subqueryload(User.orders),
+            )
+            .execution_options(readonly_load=True)
+        ).all()
+
+        # the eager loaders share the identity map of the load through
+        # internal load options; the execution option remains a flag
+        eq_(
+            canary.mock_calls,
+            [
+                mock.call(True, True),
+                mock.call(None, True),
+                mock.call(None, True),
+            ],
+        )
+
+    def test_no_lazyload(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        u1 = s.scalars(
+            select(User)
+            .filter_by(id=7)
+            .execution_options(readonly_load=True)
+        ).one()
+
+        assert_raises(orm_exc.DetachedInstanceError, getattr, u1, "addresses")
+
+    def test_no_persistent_event(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        canary = mock.Mock()
+        event.listen(s, "loaded_as_persistent", canary)
+
+        s.scalars(select(User).execution_options(readonly_load=True)).all()
+        eq_(canary.mock_calls, [])
+
+        s.scalars(select(User)).all()
+        eq_(len(canary.mock_calls), 4)
+
+    def test_add_to_session(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        u1 = s.scalars(
+            select(User)
+            .filter_by(id=7)
+            .execution_options(readonly_load=True)
+        ).one()
+        u1.name = "jack2"
+
+        s.add(u1)
+        is_true(inspect(u1).persistent)
+        is_true(u1 in s.dirty)
+
+        with self.sql_execution_asserter() as asserter:
+            s.flush()
+        asserter.assert_(
+            CompiledSQL(
+                "UPDATE users SET name=:name WHERE users.id = :users_id",
+                [{"name": "jack2", "users_id": 7}],
+            )
+        )
+        s.rollback()
+
+
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"
     run_inserts = "once"
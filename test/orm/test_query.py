@@ -5470,6 +5470,44 @@ class YieldTest(_fixtures.FixtureTest):
         result = sess.execute(stmt)
         eq_(len(result.all()), 4)
 
+    def test_yield_per_max_buffer_bytes(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+
+        sess = fixture_session()
+
+        stmt = (
+            select(User)
+            .order_by(User.id)
+            .execution_options(yield_per=15, max_buffer_bytes=1)
+        )
+
+        from sqlalchemy.engine import cursor as _cursor
+
+        # buffer rows as is done for server side cursors, which measures
+        # the size of rows as they are fetched
+        def post_exec(ctx):
+            ctx.cursor_fetch_strategy = (
+                _cursor.BufferedRowCursorFetchStrategy(
+                    ctx.cursor, ctx.execution_options
+                )
+            )
+
+        with mock.patch.object(
+            testing.db.dialect.execution_ctx_cls, "post_exec", post_exec
+        ), mock.patch.object(
+            _cursor.CursorResult,
+            "fetchmany",
+            autospec=True,
+            side_effect=_cursor.CursorResult.fetchmany,
+        ) as fetchmany:
+            eq_([u.id for u in sess.scalars(stmt)], [7, 8, 9, 10])
+
+        # each raw fetch is limited to the one row that fits within
+        # max_buffer_bytes, rather than the yield_per size of 15
+        eq_({c[0][1] for c in fetchmany.call_args_list}, {1})
+
     def test_no_joinedload_opt(self):
         self._eagerload_mappings()
 
@@ -2391,9 +2391,7 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
         session = fixture_session()
 
         def go():
-            with mock.patch(
-                "sqlalchemy.orm.strategies.SelectInLoader._chunksize", 47
-            ):
+            with mock.patch("sqlalchemy.orm.loading._SELECTIN_CHUNKSIZE", 47):
                 q = session.query(A).options(selectinload(A.bs)).order_by(A.id)
 
                 for a in q:
@@ -2423,6 +2421,135 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
             ),
         )
 
+    def _assert_a_bs_chunks(self, go, sizes):
+        eq_(sum(sizes), 100)
+        statements = [CompiledSQL("SELECT a.id FROM a ORDER BY a.id", {})]
+        start = 1
+        for size in sizes:
+            statements.append(
+                CompiledSQL(
+                    "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                    "FROM b WHERE b.a_id IN "
+                    "(__[POSTCOMPILE_primary_keys]) ORDER BY b.id",
+                    {"primary_keys": list(range(start, start + size))},
+                )
+            )
+            start += size
+        self.assert_sql_execution(testing.db, go, *statements)
+
+    def test_chunksize_option(self):
+        A, B = self.classes("A", "B")
+
+        session = fixture_session()
+
+        def go():
+            for a in session.scalars(
+                select(A)
+                .options(selectinload(A.bs, chunksize=30))
+                .order_by(A.id)
+            ):
+                a.bs
+
+        self._assert_a_bs_chunks(go, [30, 30, 30, 10])
+
+    def test_chunksize_execution_option(self):
+        A, B = self.classes("A", "B")
+
+        session = fixture_session()
+
+        def go():
+            for a in session.scalars(
+                select(A)
+                .options(selectinload(A.bs))
+                .order_by(A.id)
+                .execution_options(selectin_chunksize=40)
+            ):
+                a.bs
+
+        self._assert_a_bs_chunks(go, [40, 40, 20])
+
+    def test_chunksize_engine_execution_option(self):
+        A, B = self.classes("A", "B")
+
+        session = fixture_session(
+            bind=testing.db.execution_options(selectin_chunksize=40)
+        )
+
+        def go():
+            for a in session.scalars(
+                select(A)
+                .options(selectinload(A.bs, chunksize=60))
+                .order_by(A.id)
+            ):
+                a.bs
+
+        # the loader option takes precedence
+        self._assert_a_bs_chunks(go, [60, 40])
+
+    @testing.combinations(
+        ("max_bind_parameters",), ("max_in_list_elements",), argnames="attr"
+    )
+    def test_chunksize_limited_by_dialect(self, attr):
+        A, B = self.classes("A", "B")
+
+        session = fixture_session()
+
+        def go():
+            with mock.patch.object(testing.db.dialect, attr, 45):
+                for a in session.scalars(
+                    select(A)
+                    .options(selectinload(A.bs, chunksize=5000))
+                    .order_by(A.id)
+                ):
+                    a.bs
+
+        self._assert_a_bs_chunks(go, [45, 45, 10])
+
+    def test_adaptive_chunksize(self):
+        A, B = self.classes("A", "B")
+
+        session = fixture_session()
+
+        def timings():
+            # first chunk is fast, so the next one doubles; the second
+            # is slow, so the one after is halved
+            yield from (0, 0.05, 1, 2)
+            now = 3
+            while True:
+                yield now
+                yield now + 0.25
+                now += 1
+
+        def go():
+            with mock.patch(
+                "sqlalchemy.orm.loading._SELECTIN_CHUNKSIZE", 10
+            ), mock.patch(
+                "sqlalchemy.orm.loading._ADAPTIVE_MIN_CHUNKSIZE", 5
+            ), mock.patch(
+                "sqlalchemy.orm.loading.perf_counter",
+                mock.Mock(side_effect=timings()),
+            ):
+                for a in session.scalars(
+                    select(A)
+                    .options(selectinload(A.bs, chunksize="adaptive"))
+                    .order_by(A.id)
+                ):
+                    a.bs
+
+        self._assert_a_bs_chunks(go, [10, 20, 10, 10, 10, 10, 10, 10, 10])
+
+    @testing.combinations(0, -5, "fast", True, 10.5, argnames="chunksize")
+    def test_invalid_chunksize(self, chunksize):
+        A = self.classes.A
+
+        assert_raises_message(
+            sa.exc.ArgumentError,
+            "chunksize must be a positive integer or the string 'adaptive'",
+            selectinload,
+            A.bs,
+            chunksize=chunksize,
+        )
+
     @testing.requires.independent_cursors
     def test_yield_per(self):
         # the docs make a lot of guarantees about yield_per
@@ -2464,9 +2591,7 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
         session = fixture_session()
 
         def go():
-            with mock.patch(
-                "sqlalchemy.orm.strategies.SelectInLoader._chunksize", 47
-            ):
+            with mock.patch("sqlalchemy.orm.loading._SELECTIN_CHUNKSIZE", 47):
                 q = session.query(B).options(selectinload(B.a)).order_by(B.id)
 
                 for b in q:
@@ -1,3 +1,5 @@
+import contextlib
+from unittest.mock import call
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -804,6 +806,91 @@ class RudimentaryFlushTest(UOWTest):
             self._assert_uow_size(sess, 6)
 
 
+class FlushPipelineTest(UOWTest):
+    """test that the flush places its connections in pipeline mode, using
+    a mock pipeline."""
+
+    @testing.fixture
+    def pipeline_canary(self, connection):
+        canary = Mock()
+
+        @contextlib.contextmanager
+        def do_pipeline(dbapi_connection):
+            canary.enter()
+            yield
+            canary.exit()
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            canary.execute(statement.split(" ")[0])
+
+        with patch.object(
+            connection.dialect, "supports_pipeline", True
+        ), patch.object(
+            connection.dialect, "do_pipeline", do_pipeline, create=True
+        ):
+            yield canary
+
+    def test_flush_uses_pipeline(self, connection, pipeline_canary):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        self.mapper_registry.map_imperatively(
+            User, users, properties={"addresses": relationship(Address)}
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+        sess = Session(connection)
+
+        u1 = User(name="u1", addresses=[Address(email_address="a1")])
+        sess.add(u1)
+        sess.flush()
+
+        u1.name = "u2"
+        sess.delete(u1.addresses[0])
+        sess.flush()
+
+        eq_(
+            pipeline_canary.mock_calls,
+            [
+                call.enter(),
+                call.execute("INSERT"),
+                call.execute("INSERT"),
+                call.exit(),
+                call.enter(),
+                call.execute("UPDATE"),
+                call.execute("DELETE"),
+                call.exit(),
+            ],
+        )
+
+    def test_pipeline_not_used_outside_flush(
+        self, connection, pipeline_canary
+    ):
+        users, User = self.tables.users, self.classes.User
+
+        self.mapper_registry.map_imperatively(User, users)
+        sess = Session(connection)
+        sess.add(User(name="u1"))
+        sess.flush()
+        sess.expire_all()
+
+        sess.execute(select(User)).all()
+
+        eq_(
+            pipeline_canary.mock_calls,
+            [
+                call.enter(),
+                call.execute("INSERT"),
+                call.exit(),
+                call.execute("SELECT"),
+            ],
+        )
+
+
 class RaiseLoadIgnoredTest(
     fixtures.DeclarativeMappedTest,
     testing.AssertsExecutionResults,
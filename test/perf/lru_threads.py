@@ -0,0 +1,105 @@
+"""Measure LRUCache throughput as the number of threads sharing a
+single cache goes up.
+
+Each worker performs a mix of get() calls and insertions against one
+shared :class:`.LRUCache`, in the proportion given by ``--hit-ratio``;
+this approximates the compiled cache of an :class:`_engine.Engine` that
+is shared by a thread pool.   The legacy algorithm, which advanced a
+shared counter on every read, is run alongside for comparison.
+
+    python test/perf/lru_threads.py --threads 1 2 4 8 16 32 64
+
+"""
+import argparse
+import random
+import threading
+import time
+
+from sqlalchemy.util import LRUCache
+
+
+class LegacyLRUCache(LRUCache):
+    """LRUCache as it was before reads stopped advancing the counter."""
+
+    __slots__ = ()
+
+    def get(self, key, default=None):
+        item = self._data.get(key, default)
+        if item is not default and item is not None:
+            item[2][0] = self._inc_counter()
+            return item[1]
+        else:
+            return default
+
+    def __getitem__(self, key):
+        item = self._data[key]
+        item[2][0] = self._inc_counter()
+        return item[1]
+
+
+def run(cache_cls, num_threads, ops, capacity, keyspace, hit_ratio):
+    cache = cache_cls(capacity)
+    for i in range(capacity):
+        cache[("stmt", i)] = i
+
+    barrier = threading.Barrier(num_threads + 1)
+
+    def worker(seed):
+        rnd = random.Random(seed)
+        hot = [("stmt", rnd.randrange(capacity)) for _ in range(1000)]
+        cold = [("stmt", rnd.randrange(keyspace)) for _ in range(1000)]
+        barrier.wait()
+        for i in range(ops):
+            if rnd.random() < hit_ratio:
+                key = hot[i % 1000]
+            else:
+                key = cold[i % 1000]
+            if cache.get(key) is None:
+                cache[key] = i
+
+    threads = [
+        threading.Thread(target=worker, args=(seed,))
+        for seed in range(num_threads)
+    ]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    now = time.perf_counter()
+    for t in threads:
+        t.join()
+    return (num_threads * ops) / (time.perf_counter() - now)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64]
+    )
+    parser.add_argument(
+        "--ops", type=int, default=100000, help="operations per thread"
+    )
+    parser.add_argument("--capacity", type=int, default=500)
+    parser.add_argument("--keyspace", type=int, default=2000)
+    parser.add_argument("--hit-ratio", type=float, default=0.95)
+    args = parser.parse_args()
+
+    print(
+        "%8s %16s %16s" % ("threads", "LRUCache ops/s", "legacy ops/s")
+    )
+    for num_threads in args.threads:
+        results = [
+            run(
+                cls,
+                num_threads,
+                args.ops,
+                args.capacity,
+                args.keyspace,
+                args.hit_ratio,
+            )
+            for cls in (LRUCache, LegacyLRUCache)
+        ]
+        print("%8d %16d %16d" % (num_threads, *results))
+
+
+if __name__ == "__main__":
+    main()
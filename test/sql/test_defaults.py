@@ -1454,8 +1454,14 @@ class ServerDefaultsOnPKTest(fixtures.TestBase):
 
         metadata.create_all(connection)
         r = connection.execute(t.insert(), dict(data="data"))
-        eq_(r.inserted_primary_key, (5,))
-        eq_(list(connection.execute(t.select())), [(5, "data")])
+        if testing.against("sqlite"):
+            # INTEGER PRIMARY KEY is the rowid; the server default
+            # is not used
+            eq_(r.inserted_primary_key, (1,))
+            eq_(list(connection.execute(t.select())), [(1, "data")])
+        else:
+            eq_(r.inserted_primary_key, (5,))
+            eq_(list(connection.execute(t.select())), [(5, "data")])
 
 
 class InsertFromSelectTest(fixtures.TablesTest):
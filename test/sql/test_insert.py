@@ -26,6 +26,7 @@ from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 
 
 class ORMExpr:
@@ -1051,6 +1052,36 @@ class InsertImplicitReturningTest(
             checkparams={"othername": "foo"},
         )
 
+    @testing.combinations(
+        (default.StrCompileDialect, True),
+        (sqlite.dialect, False),
+        argnames="dialect_cls, uses_returning",
+    )
+    def test_single_row_pk_returning_vs_lastrowid(
+        self, dialect_cls, uses_returning
+    ):
+        metadata = MetaData()
+        table = Table(
+            "sometable",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String),
+        )
+
+        dialect = dialect_cls()
+        dialect.implicit_returning = True
+        eq_(dialect.postfetch_lastrowid, True)
+
+        compiled = table.insert().compile(
+            dialect=dialect, column_keys=["data"]
+        )
+        if uses_returning:
+            eq_(compiled.implicit_returning, [table.c.id])
+            eq_(compiled.postfetch_lastrowid, False)
+        else:
+            eq_(compiled.implicit_returning, [])
+            eq_(compiled.postfetch_lastrowid, True)
+
 
 class EmptyTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
     __dialect__ = "default"
@@ -1471,8 +1502,11 @@ class MultirowTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
             Column("data", String),
         )
 
+        dialect = sqlite.dialect()
+        dialect.implicit_returning = False
+
         stmt = table.insert().return_defaults().values(id=func.foobar())
-        compiled = stmt.compile(dialect=sqlite.dialect(), column_keys=["data"])
+        compiled = stmt.compile(dialect=dialect, column_keys=["data"])
         eq_(compiled.postfetch, [])
         eq_(compiled.implicit_returning, [])
 
@@ -1481,7 +1515,7 @@ class MultirowTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
             "INSERT INTO sometable (id, data) VALUES " "(foobar(), ?)",
             checkparams={"data": "foo"},
             params={"data": "foo"},
-            dialect=sqlite.dialect(),
+            dialect=dialect,
         )
 
     def test_sql_expression_pk_autoinc_returning(self):
@@ -1706,3 +1740,192 @@ class MultirowTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
             "SQL expression is required",
             table.insert().values(values).compile,
         )
+
+
+class InsertManyValuesTest(_InsertTestBase, fixtures.TablesTest):
+    """test the compiler-level rewriting of an INSERT into batches of
+    multi-row VALUES for the "insertmanyvalues" feature.
+
+    """
+
+    def _dialect(self, paramstyle=None):
+        dialect = default.DefaultDialect(paramstyle=paramstyle)
+        dialect.supports_multivalues_insert = True
+        dialect.use_insertmanyvalues = True
+        dialect.implicit_returning = True
+        dialect.insert_executemany_returning = True
+        dialect.statement_compiler = postgresql.dialect.statement_compiler
+        return dialect
+
+    def _compile(self, stmt, dialect, column_keys):
+        return stmt.compile(
+            dialect=dialect, column_keys=column_keys, for_executemany=True
+        )
+
+    def test_named_batches(self):
+        table1 = self.tables.mytable
+        compiled = self._compile(
+            table1.insert().returning(table1.c.myid),
+            self._dialect(),
+            ["myid", "name"],
+        )
+
+        batches = list(
+            compiled._deliver_insertmanyvalues_batches(
+                compiled.string,
+                [{"myid": i, "name": "n%d" % i} for i in range(5)],
+                2,
+            )
+        )
+        eq_(
+            batches,
+            [
+                (
+                    "INSERT INTO mytable (myid, name) VALUES "
+                    "(:myid__0, :name__0), (:myid__1, :name__1) "
+                    "RETURNING mytable.myid",
+                    {
+                        "myid__0": 0,
+                        "name__0": "n0",
+                        "myid__1": 1,
+                        "name__1": "n1",
+                    },
+                    1,
+                    3,
+                ),
+                (
+                    "INSERT INTO mytable (myid, name) VALUES "
+                    "(:myid__0, :name__0), (:myid__1, :name__1) "
+                    "RETURNING mytable.myid",
+                    {
+                        "myid__0": 2,
+                        "name__0": "n2",
+                        "myid__1": 3,
+                        "name__1": "n3",
+                    },
+                    2,
+                    3,
+                ),
+                (
+                    "INSERT INTO mytable (myid, name) VALUES "
+                    "(:myid__0, :name__0) RETURNING mytable.myid",
+                    {"myid__0": 4, "name__0": "n4"},
+                    3,
+                    3,
+                ),
+            ],
+        )
+
+    def test_positional_batches(self):
+        table1 = self.tables.mytable
+        compiled = self._compile(
+            table1.insert().returning(table1.c.myid),
+            self._dialect("qmark"),
+            ["myid", "name"],
+        )
+
+        batches = list(
+            compiled._deliver_insertmanyvalues_batches(
+                compiled.string,
+                [(i, "n%d" % i) for i in range(3)],
+                2,
+            )
+        )
+        eq_(
+            batches,
+            [
+                (
+                    "INSERT INTO mytable (myid, name) VALUES "
+                    "(?, ?), (?, ?) RETURNING mytable.myid",
+                    (0, "n0", 1, "n1"),
+                    1,
+                    2,
+                ),
+                (
+                    "INSERT INTO mytable (myid, name) VALUES "
+                    "(?, ?) RETURNING mytable.myid",
+                    (2, "n2"),
+                    2,
+                    2,
+                ),
+            ],
+        )
+
+    def test_max_parameters_limits_batch(self):
+        table1 = self.tables.mytable
+        compiled = self._compile(
+            table1.insert().returning(table1.c.myid),
+            self._dialect("qmark"),
+            ["myid", "name", "description"],
+        )
+
+        batches = list(
+            compiled._deliver_insertmanyvalues_batches(
+                compiled.string,
+                [(i, "n", "d") for i in range(10)],
+                1000,
+                max_parameters=10,
+            )
+        )
+        eq_([len(params) for _, params, _, _ in batches], [9, 9, 9, 3])
+
+    def test_default_values(self):
+        table = self.tables.myothertable
+        dialect = self._dialect()
+        dialect.supports_default_metavalue = True
+        compiled = self._compile(table.insert().return_defaults(), dialect, [])
+        assert compiled._insertmanyvalues.is_default_expr
+
+        batches = list(
+            compiled._deliver_insertmanyvalues_batches(
+                compiled.string, [{}, {}, {}], 5
+            )
+        )
+        eq_(len(batches), 1)
+        stmt, params, _, _ = batches[0]
+        eq_(params, {})
+        assert "VALUES (DEFAULT), (DEFAULT), (DEFAULT)" in stmt
+
+    @testing.combinations("named", "qmark", argnames="paramstyle")
+    def test_not_used_without_returning(self, paramstyle):
+        table1 = self.tables.mytable
+        compiled = self._compile(
+            table1.insert(), self._dialect(paramstyle), ["myid", "name"]
+        )
+        is_(compiled._insertmanyvalues, None)
+
+    @testing.combinations("named", "qmark", argnames="paramstyle")
+    def test_not_used_for_single_execute(self, paramstyle):
+        table1 = self.tables.mytable
+        compiled = (
+            table1.insert()
+            .returning(table1.c.myid)
+            .compile(
+                dialect=self._dialect(paramstyle),
+                column_keys=["myid", "name"],
+            )
+        )
+        is_(compiled._insertmanyvalues, None)
+
+    @testing.combinations("named", "qmark", argnames="paramstyle")
+    def test_not_used_for_binds_outside_values(self, paramstyle):
+        table1 = self.tables.mytable
+        compiled = self._compile(
+            table1.insert().returning(
+                table1.c.myid, func.foo(bindparam("q", "x"))
+            ),
+            self._dialect(paramstyle),
+            ["myid", "name"],
+        )
+        is_(compiled._insertmanyvalues, None)
+
+    def test_not_used_for_dialect_wo_insertmanyvalues(self):
+        table1 = self.tables.mytable
+        dialect = self._dialect()
+        dialect.use_insertmanyvalues = False
+        compiled = self._compile(
+            table1.insert().returning(table1.c.myid),
+            dialect,
+            ["myid", "name"],
+        )
+        is_(compiled._insertmanyvalues, None)
@@ -1,10 +1,12 @@
 from sqlalchemy import and_
+from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import INT
 from sqlalchemy import Integer
 from sqlalchemy import literal
+from sqlalchemy import select
 from sqlalchemy import Sequence
 from sqlalchemy import sql
 from sqlalchemy import String
@@ -684,3 +686,166 @@ class TableInsertTest(fixtures.TablesTest):
             table=t,
             parameters=dict(id=None, data="data", x=5),
         )
+
+
+class InsertManyValuesTest(fixtures.RemovesEvents, fixtures.TablesTest):
+    """test INSERT..RETURNING with many parameter sets as rewritten
+    into batched multi-row VALUES statements.
+
+    """
+
+    __backend__ = True
+    __requires__ = ("insertmanyvalues",)
+
+    run_create_tables = "each"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+            Column("y", Integer),
+            Column("z", Integer, server_default="5"),
+        )
+
+    def test_insert_returning_values(self, connection):
+        t = self.tables.data
+
+        result = connection.execute(
+            t.insert().returning(t.c.x, t.c.y, t.c.z),
+            [{"x": "x%d" % i, "y": i} for i in range(1, 11)],
+        )
+        eq_(result.all(), [("x%d" % i, i, 5) for i in range(1, 11)])
+
+    @testing.combinations(1, 3, 10, 50, argnames="page_size")
+    def test_page_size(self, connection, page_size):
+        t = self.tables.data
+
+        stmts = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            stmts.append((statement, executemany))
+
+        connection.execution_options(insertmanyvalues_page_size=page_size)
+        result = connection.execute(
+            t.insert().returning(t.c.x, t.c.y),
+            [{"x": "x%d" % i, "y": i} for i in range(1, 11)],
+        )
+        eq_(result.all(), [("x%d" % i, i) for i in range(1, 11)])
+
+        eq_(len(stmts), -(-10 // page_size))
+        eq_([executemany for _, executemany in stmts], [False] * len(stmts))
+
+    def test_return_defaults(self, connection):
+        t = self.tables.data
+
+        result = connection.execute(
+            t.insert().return_defaults(),
+            [{"x": "x%d" % i, "y": i} for i in range(1, 6)],
+        )
+        pks = [row[0] for row in result.inserted_primary_key_rows]
+        eq_(len(set(pks)), 5)
+        eq_(
+            [row._mapping["z"] for row in result.returned_defaults_rows],
+            [5] * 5,
+        )
+
+        eq_(
+            connection.execute(select(t.c.id, t.c.x).order_by(t.c.id)).all(),
+            [(pk, "x%d" % i) for pk, i in zip(pks, range(1, 6))],
+        )
+
+
+class MultiValuesSplitTest(fixtures.RemovesEvents, fixtures.TablesTest):
+    """test a multi-row INSERT..VALUES invoked as several statements to
+    stay within the dialect's bound parameter limit.
+
+    """
+
+    __backend__ = True
+    __requires__ = ("multivalues_inserts",)
+
+    run_create_tables = "each"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+            Column("y", Integer),
+        )
+
+    @testing.fixture
+    def statements(self, connection):
+        stmts = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            stmts.append((statement, parameters))
+
+        return stmts
+
+    @testing.combinations(
+        (7, 5), (10, 4), (20, 2), (40, 1), argnames="max_params, expected"
+    )
+    def test_split(self, connection, statements, max_params, expected):
+        t = self.tables.data
+
+        with mock.patch.object(
+            connection.dialect, "max_bind_parameters", max_params
+        ):
+            result = connection.execute(
+                t.insert().values(
+                    [{"id": i, "x": "x%d" % i, "y": i} for i in range(1, 11)]
+                )
+            )
+        if testing.db.dialect.supports_sane_rowcount:
+            eq_(result.rowcount, 10)
+        eq_(len(statements), expected)
+        for _, parameters in statements:
+            assert len(parameters) <= max_params
+
+        eq_(
+            connection.execute(select(t).order_by(t.c.id)).all(),
+            [(i, "x%d" % i, i) for i in range(1, 11)],
+        )
+
+    def test_sql_expression_values(self, connection, statements):
+        t = self.tables.data
+
+        with mock.patch.object(connection.dialect, "max_bind_parameters", 5):
+            connection.execute(
+                t.insert().values(
+                    [
+                        {"id": i, "x": func.lower("X%d" % i), "y": i}
+                        for i in range(1, 6)
+                    ]
+                )
+            )
+        eq_(len(statements), 5)
+        eq_(
+            connection.execute(select(t).order_by(t.c.id)).all(),
+            [(i, "x%d" % i, i) for i in range(1, 6)],
+        )
+
+    @testing.requires.full_returning
+    def test_split_returning(self, connection, statements):
+        t = self.tables.data
+
+        with mock.patch.object(connection.dialect, "max_bind_parameters", 6):
+            result = connection.execute(
+                t.insert()
+                .values([{"id": i, "x": "x%d" % i} for i in range(1, 11)])
+                .returning(t.c.id, t.c.x)
+            )
+            eq_(result.all(), [(i, "x%d" % i) for i in range(1, 11)])
+        eq_(len(statements), 4)
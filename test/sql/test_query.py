@@ -4,6 +4,7 @@ from sqlalchemy import bindparam
 from sqlalchemy import cast
 from sqlalchemy import desc
 from sqlalchemy import exc
+from sqlalchemy import event
 from sqlalchemy import except_
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
@@ -32,6 +33,7 @@ from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from sqlalchemy.testing.util import resolve_lambda
@@ -1895,3 +1897,173 @@ class OperatorTest(fixtures.TablesTest):
             ).fetchall(),
             [(13, 1), (5, 2)],
         )
+
+
+class ParameterLimitSplitTest(fixtures.RemovesEvents, fixtures.TablesTest):
+    """test statements with large IN lists invoked as several statements
+    to stay within dialect parameter limits."""
+
+    __backend__ = True
+
+    run_deletes = "each"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", Integer),
+            Column("y", String(20)),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        data = cls.tables.data
+        connection.execute(
+            data.insert(),
+            [{"id": i, "x": i % 3, "y": "y%d" % i} for i in range(1, 21)],
+        )
+
+    @testing.fixture
+    def statements(self, connection):
+        stmts = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            stmts.append(statement)
+
+        return stmts
+
+    @testing.fixture(params=["max_in_list_elements", "max_bind_parameters"])
+    def limited(self, request, connection):
+        with mock.patch.object(connection.dialect, request.param, 5):
+            yield request.param
+
+    def test_select_rows_merged(self, connection, limited, statements):
+        data = self.tables.data
+
+        result = connection.execute(
+            select(data.c.id, data.c.y).where(
+                data.c.id.in_(list(range(1, 16))), data.c.x != 0
+            )
+        )
+        eq_(
+            sorted(result.all()),
+            [(i, "y%d" % i) for i in range(1, 16) if i % 3],
+        )
+
+        # the bound parameter for "x" counts against max_bind_parameters
+        eq_(len(statements), 4 if limited == "max_bind_parameters" else 3)
+
+    def test_duplicate_values(self, connection, limited, statements):
+        data = self.tables.data
+
+        result = connection.execute(
+            select(data.c.id).where(data.c.id.in_([1, 2, 3, 1, 2, 3, 4]))
+        )
+        eq_(sorted(result.scalars().all()), [1, 2, 3, 4])
+        eq_(len(statements), 1)
+
+    @testing.requires.tuple_in
+    def test_tuple_in(self, connection, statements):
+        data = self.tables.data
+
+        with mock.patch.object(connection.dialect, "max_in_list_elements", 3):
+            result = connection.execute(
+                select(data.c.id).where(
+                    tuple_(data.c.id, data.c.x).in_(
+                        [(i, i % 3) for i in range(1, 9)]
+                    )
+                )
+            )
+            eq_(sorted(result.scalars().all()), list(range(1, 9)))
+        eq_(len(statements), 3)
+
+    @testing.combinations(
+        (lambda data: select(data.c.id).order_by(data.c.id),),
+        (lambda data: select(data.c.id).limit(20),),
+        (lambda data: select(func.count(data.c.id)),),
+        (lambda data: select(data.c.id).distinct(),),
+        (lambda data: select(data.c.id).group_by(data.c.id),),
+        (
+            lambda data: select(data.c.id).where(
+                or_(data.c.id.in_(list(range(1, 16))), data.c.x == 5)
+            ),
+        ),
+        (
+            lambda data: select(data.c.id).where(
+                data.c.id.not_in(list(range(1, 16)))
+            ),
+        ),
+        argnames="stmt",
+    )
+    def test_not_split(self, connection, statements, stmt):
+        data = self.tables.data
+        stmt = resolve_lambda(stmt, data=data)
+        if stmt.whereclause is None:
+            stmt = stmt.where(data.c.id.in_(list(range(1, 16))))
+
+        with mock.patch.object(connection.dialect, "max_in_list_elements", 5):
+            connection.execute(stmt).all()
+        eq_(len(statements), 1)
+
+    def test_update_not_split(self, connection, statements):
+        """an UPDATE is not split, as the SET clause could otherwise
+        cause rows updated by one batch to match a following batch"""
+
+        data = self.tables.data
+
+        with mock.patch.object(connection.dialect, "max_in_list_elements", 2):
+            result = connection.execute(
+                data.update()
+                .where(data.c.id.in_([1, 2, 3, 4]))
+                .values(id=data.c.id + 100)
+            )
+        eq_(result.rowcount, 4)
+        eq_(len(statements), 1)
+        eq_(
+            connection.scalars(
+                select(data.c.id).where(data.c.id > 100).order_by(data.c.id)
+            ).all(),
+            [101, 102, 103, 104],
+        )
+
+    def test_multiple_in_lists_split(self, connection, limited, statements):
+        data = self.tables.data
+
+        result = connection.execute(
+            select(data.c.id).where(
+                data.c.id.in_(list(range(1, 16))),
+                data.c.y.in_(["y%d" % i for i in range(3, 21)]),
+            )
+        )
+        eq_(sorted(result.scalars().all()), list(range(3, 16)))
+
+        # each IN list is split; with max_bind_parameters, both lists are
+        # reduced to two values per statement
+        eq_(len(statements), 72 if limited == "max_bind_parameters" else 12)
+    def test_delete_rowcount(self, connection, limited, statements):
+        data = self.tables.data
+
+        result = connection.execute(
+            data.delete().where(data.c.id.in_(list(range(5, 20))))
+        )
+        eq_(result.rowcount, 15)
+        eq_(len(statements), 3)
+        eq_(connection.scalar(select(func.count(data.c.id))), 5)
+
+    @testing.requires.full_returning
+    def test_delete_returning_not_split(self, connection, statements):
+        data = self.tables.data
+
+        with mock.patch.object(connection.dialect, "max_in_list_elements", 5):
+            result = connection.execute(
+                data.delete()
+                .where(data.c.id.in_(list(range(5, 20))))
+                .returning(data.c.id)
+            )
+            eq_(sorted(result.scalars().all()), list(range(5, 20)))
+        eq_(len(statements), 1)
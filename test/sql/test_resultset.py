@@ -1,3 +1,4 @@
+from array import array
 import collections
 import collections.abc as collections_abc
 from contextlib import contextmanager
@@ -5,6 +6,7 @@ import csv
 from io import StringIO
 import operator
 import pickle
+import time
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -42,6 +44,7 @@ from sqlalchemy.sql import LABEL_STYLE_TABLENAME_PLUS_COL
 from sqlalchemy.sql.selectable import LABEL_STYLE_NONE
 from sqlalchemy.sql.selectable import TextualSelect
 from sqlalchemy.sql.sqltypes import NULLTYPE
+from sqlalchemy.sql.sqltypes import NullType
 from sqlalchemy.sql.util import ClauseAdapter
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
@@ -53,6 +56,7 @@ from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import in_
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import le_
 from sqlalchemy.testing import mock
@@ -3039,6 +3043,94 @@ class AlternateCursorResultTest(fixtures.TablesTest):
 
                 r.close()
 
+    @testing.fixture
+    def wide_row_fixture(self):
+        with self._proxy_fixture(_cursor.BufferedRowCursorFetchStrategy):
+            with self.engine.begin() as conn:
+                conn.execute(
+                    self.table.insert(),
+                    [{"x": i, "y": "s"} for i in range(1000, 1100)]
+                    + [{"x": i, "y": "w" * 10000} for i in range(1100, 1200)],
+                )
+                yield conn
+
+    def test_buffered_row_max_buffer_bytes(self, wide_row_fixture):
+        table = self.tables.test
+
+        result = wide_row_fixture.execution_options(
+            max_buffer_bytes=100000
+        ).execute(select(table).where(table.c.x >= 1100))
+
+        row_size = result.cursor_strategy._row_size
+        assert 10000 < row_size < 11000
+
+        count = 0
+        for row in result:
+            count += 1
+            le_(len(result.cursor_strategy._rowbuffer), 100000 // row_size)
+        eq_(count, 100)
+
+        eq_(result.peak_buffered_bytes, row_size * (100000 // row_size))
+
+    def test_buffered_row_max_buffer_bytes_adapts(self, wide_row_fixture):
+        table = self.tables.test
+
+        result = wide_row_fixture.execution_options(
+            max_buffer_bytes=100000
+        ).execute(select(table).where(table.c.x >= 1000).order_by(table.c.x))
+
+        strategy = result.cursor_strategy
+
+        sizes = []
+        for row in result:
+            sizes.append(len(strategy._rowbuffer))
+
+        # buffer grows as usual for the narrow rows, then is limited once
+        # the wide rows are measured; the batch spanning both kinds of
+        # rows is sized from the narrow rows only
+        eq_(max(sizes[0:100]), 124)
+        eq_(max(sizes[180:]), 100000 // strategy._row_size - 1)
+
+    def test_buffered_row_max_buffer_bytes_fetchmany(self, wide_row_fixture):
+        table = self.tables.test
+
+        result = wide_row_fixture.execution_options(
+            max_buffer_bytes=100000
+        ).execute(select(table).where(table.c.x >= 1100))
+
+        # explicit sizes are not limited
+        eq_(len(result.fetchmany(20)), 20)
+        row_size = result.cursor_strategy._row_size
+        eq_(result.peak_buffered_bytes, row_size * 20)
+
+        eq_(len(result.fetchall()), 80)
+        eq_(result.peak_buffered_bytes, row_size * 80)
+
+    def test_buffered_row_max_buffer_bytes_capped(self, wide_row_fixture):
+        table = self.tables.test
+
+        result = wide_row_fixture.execution_options(
+            max_buffer_bytes=100000
+        ).execute(select(table).where(table.c.x >= 1100))
+
+        # sizes used by ORM yield_per are limited by the measured row size;
+        # explicit sizes passed to fetchmany() are not
+        limit = 100000 // result.cursor_strategy._row_size
+        assert limit < 50
+        eq_(result.cursor_strategy.capped_fetch_size(50), limit)
+        eq_(result.cursor_strategy.capped_fetch_size(0), limit)
+        eq_(result.cursor_strategy.capped_fetch_size(2), 2)
+
+        eq_(len(result._fetchmany_capped(50)), limit)
+        eq_(len(result.fetchmany(50)), 50)
+
+    def test_buffered_row_no_max_buffer_bytes(self, wide_row_fixture):
+        table = self.tables.test
+
+        result = wide_row_fixture.execute(select(table))
+        eq_(len(result.all()), 211)
+        is_(result.peak_buffered_bytes, None)
+
     def test_buffered_row_close_error_during_fetchone(self):
         def raise_(**kw):
             raise IOError("random non-DBAPI error during cursor operation")
@@ -3055,6 +3147,269 @@ class AlternateCursorResultTest(fixtures.TablesTest):
                 r.close()
 
 
+class ThreadedPrefetchTest(fixtures.TablesTest):
+    __requires__ = ("sqlite",)
+
+    @classmethod
+    def setup_bind(cls):
+        # rows are fetched on a worker thread
+        cls.engine = engine = engines.testing_engine(
+            "sqlite://",
+            options={
+                "scope": "class",
+                "connect_args": {"check_same_thread": False},
+            },
+        )
+        return engine
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test",
+            metadata,
+            Column("x", Integer, primary_key=True),
+            Column("y", String(50)),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.test.insert(),
+            [{"x": i, "y": "t_%d" % i} for i in range(1, 101)],
+        )
+
+    @testing.fixture
+    def stream_connection(self):
+        """Run statements with stream_results using a "server side"
+        cursor that wraps the pysqlite cursor, recording the sizes passed
+        to fetchmany() and raising errors for given fetchmany() calls."""
+
+        fetches = []
+        fetch_errors = {}
+
+        class Cursor:
+            def __init__(self, cursor):
+                self.cursor = cursor
+
+            def __getattr__(self, key):
+                return getattr(self.cursor, key)
+
+            def fetchmany(self, size=None):
+                fetches.append(size)
+                if len(fetches) in fetch_errors:
+                    raise fetch_errors[len(fetches)]
+                return self.cursor.fetchmany(size)
+
+        class ExcCtx(self.engine.dialect.execution_ctx_cls):
+            def create_server_side_cursor(self):
+                return Cursor(self.create_default_cursor())
+
+        # pysqlite reports threadsafety 1 on older Python versions
+        # regardless of check_same_thread
+        with patch.object(
+            self.engine.dialect, "execution_ctx_cls", ExcCtx
+        ), patch.object(
+            self.engine.dialect, "supports_server_side_cursors", True
+        ), patch.object(
+            self.engine.dialect.dbapi, "threadsafety", 2
+        ):
+            with self.engine.connect() as conn:
+                conn.fetches = fetches
+                conn.fetch_errors = fetch_errors
+                yield conn.execution_options(stream_results=True)
+
+    def _wait_for_batches(self, strategy, count):
+        for i in range(500):
+            if strategy._queue.qsize() >= count:
+                break
+            time.sleep(0.01)
+
+    def test_strategy(self, stream_connection):
+        table = self.tables.test
+
+        result = stream_connection.execute(select(table))
+        assert isinstance(
+            result.cursor_strategy, _cursor.BufferedRowCursorFetchStrategy
+        )
+        result.close()
+
+        result = stream_connection.execution_options(prefetch=2).execute(
+            select(table)
+        )
+        assert isinstance(
+            result.cursor_strategy, _cursor.ThreadedPrefetchCursorFetchStrategy
+        )
+        result.close()
+
+    def test_strategy_not_threadsafe(self, stream_connection):
+        table = self.tables.test
+
+        with patch.object(self.engine.dialect.dbapi, "threadsafety", 1):
+            result = stream_connection.execution_options(
+                prefetch=2, max_row_buffer=7
+            ).execute(select(table).order_by(table.c.x))
+
+        assert isinstance(
+            result.cursor_strategy, _cursor.BufferedRowCursorFetchStrategy
+        )
+        assert not isinstance(
+            result.cursor_strategy, _cursor.ThreadedPrefetchCursorFetchStrategy
+        )
+        eq_(len(result.all()), 100)
+
+    @testing.combinations(
+        "iterate",
+        "fetchone",
+        "fetchmany",
+        "partitions",
+        "all",
+        argnames="meth",
+    )
+    def test_rows(self, stream_connection, meth):
+        table = self.tables.test
+
+        result = stream_connection.execution_options(
+            prefetch=2, max_row_buffer=7
+        ).execute(select(table).order_by(table.c.x))
+        strategy = result.cursor_strategy
+
+        if meth == "iterate":
+            rows = list(result)
+        elif meth == "fetchone":
+            rows = []
+            while True:
+                row = result.fetchone()
+                if row is None:
+                    break
+                rows.append(row)
+        elif meth == "fetchmany":
+            rows = []
+            while True:
+                chunk = result.fetchmany(10)
+                if not chunk:
+                    break
+                rows.extend(chunk)
+        elif meth == "partitions":
+            rows = [
+                row for partition in result.partitions(9) for row in partition
+            ]
+        else:
+            rows = result.all()
+
+        eq_(rows, [(i, "t_%d" % i) for i in range(1, 101)])
+        is_true(result._soft_closed)
+        is_false(strategy._thread.is_alive())
+
+        # one row fetched up front, then batches of seven rows until
+        # an empty batch is received
+        eq_(stream_connection.fetches, [1] + [7] * 16)
+
+    def test_queue_is_bounded(self, stream_connection):
+        table = self.tables.test
+
+        result = stream_connection.execution_options(
+            prefetch=2, max_row_buffer=10
+        ).execute(select(table).order_by(table.c.x))
+        strategy = result.cursor_strategy
+
+        self._wait_for_batches(strategy, 2)
+        time.sleep(0.05)
+
+        eq_(strategy._queue.qsize(), 2)
+        is_true(strategy._thread.is_alive())
+
+        eq_(result.fetchmany(15), [(i, "t_%d" % i) for i in range(1, 16)])
+
+        result.close()
+        is_false(strategy._thread.is_alive())
+        eq_(strategy._queue.qsize(), 0)
+
+        eq_(
+            stream_connection.scalar(select(func.count()).select_from(table)),
+            100,
+        )
+
+    def test_yield_per(self, stream_connection):
+        table = self.tables.test
+
+        result = stream_connection.execution_options(
+            prefetch=1, max_row_buffer=10
+        ).execute(select(table).order_by(table.c.x))
+        strategy = result.cursor_strategy
+
+        self._wait_for_batches(strategy, 1)
+        result = result.yield_per(30)
+
+        eq_(len(result.all()), 100)
+
+        # the first batch was already requested before yield_per() was
+        # called, and a second may have been in progress
+        fetches = stream_connection.fetches
+        eq_(fetches[0:2], [1, 10])
+        eq_(set(fetches[3:]), {30})
+
+    def test_no_rows(self, stream_connection):
+        table = self.tables.test
+
+        result = stream_connection.execution_options(prefetch=2).execute(
+            select(table).where(table.c.x > 500)
+        )
+        is_(result.cursor_strategy._thread, None)
+        eq_(result.all(), [])
+
+    def test_max_buffer_bytes(self, stream_connection):
+        table = self.tables.test
+
+        stream_connection.execute(
+            table.insert(),
+            [{"x": i, "y": "w" * 10000} for i in range(101, 201)],
+        )
+        fetches = stream_connection.fetches
+        del fetches[:]
+
+        result = stream_connection.execution_options(
+            prefetch=2, max_row_buffer=50, max_buffer_bytes=100000
+        ).execute(select(table).where(table.c.x > 100))
+        strategy = result.cursor_strategy
+        row_size = strategy._row_size
+
+        eq_(len(list(result)), 100)
+
+        limit = 100000 // row_size
+        eq_(fetches[0:2], [1, limit])
+        eq_(set(fetches[1:]), {limit})
+
+        # the first row, one batch being consumed and two batches queued
+        le_(result.peak_buffered_bytes, row_size * (1 + limit * 3))
+
+    @testing.combinations("fetchone", "fetchmany", "all", argnames="meth")
+    def test_error_in_fetch(self, stream_connection, meth):
+        table = self.tables.test
+
+        # error raised by the second fetch on the worker thread
+        stream_connection.fetch_errors[3] = IOError("random non-DBAPI error")
+
+        result = stream_connection.execution_options(
+            prefetch=2, max_row_buffer=10
+        ).execute(select(table).order_by(table.c.x))
+        strategy = result.cursor_strategy
+
+        eq_(result.fetchmany(5), [(i, "t_%d" % i) for i in range(1, 6)])
+
+        with expect_raises_message(IOError, "random non-DBAPI error"):
+            if meth == "fetchone":
+                while True:
+                    result.fetchone()
+            elif meth == "fetchmany":
+                while True:
+                    result.fetchmany(5)
+            else:
+                result.all()
+
+        result.close()
+        is_false(strategy._thread.is_alive())
+
+
 class MergeCursorResultTest(fixtures.TablesTest):
     __backend__ = True
 
@@ -3301,3 +3656,117 @@ class GenerativeResultTest(fixtures.TablesTest):
             start += 20
 
         assert result._soft_closed
+
+    def test_partitions_columnar(self, connection):
+        users = self.tables.users
+        connection.execute(
+            users.insert(),
+            [
+                {"user_id": i, "user_name": "user %s" % i, "x": i * 5}
+                for i in range(50)
+            ],
+        )
+
+        class Upper(TypeDecorator):
+            impl = String
+            cache_ok = True
+
+            def process_result_value(self, value, dialect):
+                return value.upper() if value is not None else None
+
+        result = connection.execute(
+            select(
+                users.c.user_id,
+                type_coerce(users.c.user_name, Upper),
+                users.c.x,
+                users.c.y,
+            ).order_by(users.c.user_id)
+        )
+
+        start = 0
+        for ids, names, ys in result.columns(0, 1, 3).partitions_columnar(
+            20
+        ):
+            end = min(start + 20, 50)
+            eq_(list(ids), list(range(start, end)))
+            eq_(names, ["USER %s" % i for i in range(start, end)])
+            eq_(ys, [None] * (end - start))
+            start = end
+        eq_(start, 50)
+
+        assert result._soft_closed
+
+    def test_columns_as_arrays(self, connection):
+        users = self.tables.users
+        connection.execute(
+            users.insert(),
+            [
+                {"user_id": 7, "user_name": "jack", "x": 1, "y": 2},
+                {"user_id": 8, "user_name": "ed", "x": 2, "y": 3},
+            ],
+        )
+
+        result = connection.execute(select(users).order_by(users.c.user_id))
+        user_id, user_name, x, y = result.columns_as_arrays()
+
+        # NOT NULL integer columns are arrays, nullable columns are lists
+        eq_(user_id, array("q", [7, 8]))
+        eq_(user_name, ["jack", "ed"])
+        eq_(x, [1, 2])
+        eq_(y, [2, 3])
+
+        assert result._soft_closed
+
+    def test_partitions_columnar_consistent(self, connection):
+        users = self.tables.users
+        connection.execute(
+            users.insert(),
+            [
+                {"user_id": i, "user_name": "u%d" % i, "x": i}
+                for i in range(1, 8)
+            ],
+        )
+        connection.execute(
+            users.insert(), {"user_id": 8, "user_name": "u8", "x": None}
+        )
+
+        result = connection.execute(
+            select(users.c.user_id.label("id"), users.c.x).order_by(
+                users.c.user_id
+            )
+        )
+        eq_(
+            list(result.partitions_columnar(4)),
+            [
+                (array("q", [1, 2, 3, 4]), [1, 2, 3, 4]),
+                (array("q", [5, 6, 7, 8]), [5, 6, 7, None]),
+            ],
+        )
+
+    def test_columns_as_arrays_outer_join_null(self, connection):
+        users = self.tables.users
+        connection.execute(
+            users.insert(), {"user_id": 7, "user_name": "jack"}
+        )
+        ua = users.alias()
+
+        stmt = (
+            select(users.c.user_id, ua.c.user_id)
+            .outerjoin(ua, users.c.user_id != ua.c.user_id)
+            .order_by(users.c.user_id)
+        )
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Column 'user_id_1' received a NULL value",
+        ):
+            connection.execute(stmt).columns_as_arrays()
+
+        stmt = (
+            select(users.c.user_id, type_coerce(ua.c.user_id, NullType))
+            .outerjoin(ua, users.c.user_id != ua.c.user_id)
+            .order_by(users.c.user_id)
+        )
+        eq_(
+            connection.execute(stmt).columns_as_arrays(),
+            (array("q", [7]), [None]),
+        )
@@ -455,7 +455,7 @@ class ReturningTest(fixtures.TablesTest, AssertsExecutionResults):
             "inserted_primary_key",
         )
 
-    @testing.fails_on_everything_except("postgresql")
+    @testing.fails_on_everything_except("postgresql", "sqlite")
     def test_literal_returning(self, connection):
         if testing.against("postgresql"):
             literal_true = "true"